@@ -0,0 +1,154 @@
+"""Decoded audio cache with a byte budget.
+
+`pygame.mixer.Sound` holds the whole decoded clip in memory, so every sound
+the app has played used to stay resident in `App._sound_cache` and
+`App._muffled_sound_cache` (plain dicts), while `_play_pitched_sound` and
+the combat reload helpers decoded the file again on every call. This is the
+one cache for all of them:
+
+    get(key)            the cached sound, decoding `key` (a path) on a miss
+    get(key, load)      same, with `load()` producing the sound on a miss
+    peek(key) / put()   for derived sounds (muffled variants) made elsewhere
+    preload(paths)      decode ahead of time; returns how many were loaded
+
+Entries are evicted least recently used first once their total size passes
+`budget` bytes. Keys are paths for decoded files and tuples such as
+("muffled", path) for derived sounds. `stats()` feeds the dev panel.
+
+A sound that is evicted while playing keeps playing: the mixer channel holds
+its own reference.
+
+Stdlib only; the decoder and the sizer are passed in.
+"""
+import collections
+import logging
+import threading
+import time
+
+
+class AudioCache:
+    """LRU cache of decoded sounds bounded by `budget` bytes. Thread-safe."""
+
+    def __init__(self, budget, loader, sizer):
+        self.budget = int(budget)
+        self._loader = loader      # path -> sound
+        self._sizer = sizer        # sound -> decoded bytes
+        self._entries = collections.OrderedDict()  # key -> (sound, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "loads": 0, "evictions": 0, "preloaded": 0, "load_ms": 0.0}
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"]+= 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"]+= 1
+            return entry[0]
+
+    def peek(self, key):
+        """The cached sound for `key`, or None. Counts as a hit or a miss."""
+        return self._lookup(key)
+
+    def get(self, key, load = None):
+        """The sound for `key`, loaded with `load()` (default: decode the path
+        `key`) on a miss. Load errors propagate."""
+        sound = self._lookup(key)
+        if sound is None:
+            start = time.perf_counter()
+            sound = load()if load is not None else self._loader(key)
+            with self._lock:
+                self._stats["loads"]+= 1
+                self._stats["load_ms"]+=(time.perf_counter()-start)*1000
+            self.put(key, sound)
+        return sound
+
+    def put(self, key, sound):
+        try:
+            nbytes = int(self._sizer(sound))
+        except Exception:
+            nbytes = 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key]=(sound, nbytes)
+            self._bytes += nbytes
+            self._evict()
+        return sound
+
+    def _evict(self):
+        # The entry just added stays even when it alone is over budget.
+        while self._bytes >self.budget and len(self._entries)>1:
+            _, (_, nbytes)= self._entries.popitem(last = False)
+            self._bytes -= nbytes
+            self._stats["evictions"]+= 1
+
+    def discard(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def contains(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def preload(self, paths, stop = None):
+        """Decode the `paths` not cached yet, in order, until they fill the
+        budget (older entries are evicted to make room, earlier paths of the
+        same call are not) or `stop`, a threading.Event, is set. Returns the
+        number loaded."""
+        loaded = 0
+        preloaded_bytes = 0
+        for path in paths:
+            if stop is not None and stop.is_set():
+                break
+            with self._lock:
+                cached = self._entries.get(path)
+                if cached is not None:
+                    self._entries.move_to_end(path)
+            if cached is not None:
+                preloaded_bytes += cached[1]
+                continue
+            try:
+                start = time.perf_counter()
+                sound = self._loader(path)
+            except Exception as e:
+                logging.warning(f"Failed to preload sound '{path}': {e}")
+                continue
+            with self._lock:
+                self._stats["loads"]+= 1
+                self._stats["load_ms"]+=(time.perf_counter()-start)*1000
+            try:
+                nbytes = int(self._sizer(sound))
+            except Exception:
+                nbytes = 0
+            if loaded and preloaded_bytes +nbytes >self.budget:
+                break
+            self.put(path, sound)
+            preloaded_bytes += nbytes
+            loaded += 1
+            with self._lock:
+                self._stats["preloaded"]+= 1
+        return loaded
+
+    def items(self):
+        """Snapshot of (key, sound) pairs, least recently used first."""
+        with self._lock:
+            return[(key, entry[0])for key, entry in self._entries.items()]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            out = dict(self._stats, entries = len(self._entries), bytes = self._bytes, budget = self.budget)
+        out["load_ms"]= round(out["load_ms"], 1)
+        lookups = out["hits"]+out["misses"]
+        out["hit_rate"]= round(out["hits"]/lookups, 3)if lookups else None
+        return out
@@ -0,0 +1,383 @@
+"""Content-addressed, deduplicated character backup store.
+
+Every save used to copy the whole previous file to
+backups/<char>/backup_<timestamp>.sldsv and zip 50 of them at a time into
+archive/. Consecutive backups are nearly identical, so almost all of that was
+the same bytes over and over.
+
+A store lives in the character's backup folder:
+
+    blobs/ab/<sha256>         zlib-compressed chunk, named by its content hash
+    snapshots/<id>.json       manifest: the chunk list that rebuilds one backup
+    index.json                one line per snapshot, for listing without
+                              opening manifests
+    pending/                  previous save files waiting to be added (the app
+                              parks them there and adds them in the background)
+
+A signed v2 save is split into chunks over its decoded JSON body (not the
+base85 text, where one inserted byte changes everything after it). Cut
+points are content-defined: a cut is made after a closing bracket between
+two JSON values when a hash of the bytes before it matches, so an edit only
+changes the chunks around it and all other chunks are shared with earlier
+snapshots. Other files (v1 envelopes) are split into fixed-size chunks.
+Restoring rebuilds the file byte for byte, so the signature is checked as
+for any other save.
+
+`Retention` decides which snapshots survive a prune: the newest N, plus the
+newest of each of the last hours and days that have snapshots. Blobs no
+manifest references any more are deleted with them. Adding never prunes;
+the caller prunes after a batch (see `prune`).
+
+Stdlib only, like savepack.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+
+if __package__:
+    from . import envelope as _envelope
+else:  # loaded by path from scripts/
+    import importlib.util as _importlib_util
+    _spec = _importlib_util.spec_from_file_location("envelope", os.path.join(os.path.dirname(os.path.abspath(__file__)), "envelope.py"))
+    _envelope = _importlib_util.module_from_spec(_spec)
+    _spec.loader.exec_module(_envelope)
+
+INDEX_NAME = "index.json"
+BLOBS_DIR = "blobs"
+SNAPSHOTS_DIR = "snapshots"
+PENDING_DIR = "pending"              # saves parked for the app's archiver to ingest
+_INDEX_VERSION = 1
+
+MIN_CHUNK = 2 * 1024
+MAX_CHUNK = 64 * 1024
+_CUT_WINDOW = 48
+_CUT_MASK = 0x7                      # one candidate in 8 past MIN_CHUNK becomes a cut
+# Between two sibling values in compact JSON: "},{", "},\"", "],[", "],\"" ...
+_CANDIDATE = re.compile(rb"[}\]],[{\[\"]")
+
+
+def chunk_spans(body, content_defined = True):
+    """(start, end) spans covering `body`."""
+    spans = []
+    start = 0
+    if content_defined:
+        for match in _CANDIDATE.finditer(body):
+            cut = match.start() + 1
+            size = cut - start
+            if size < MIN_CHUNK:
+                continue
+            if size >= MAX_CHUNK or not zlib.crc32(body[cut - _CUT_WINDOW:cut]) & _CUT_MASK:
+                spans.append((start, cut))
+                start = cut
+    spans.append((start, len(body)))
+    out = []
+    for start, end in spans:
+        while end - start > MAX_CHUNK:
+            out.append((start, start + MAX_CHUNK))
+            start += MAX_CHUNK
+        if end > start or not out:
+            out.append((start, end))
+    return out
+
+
+class Retention:
+    """Which snapshots a prune keeps: the `recent` newest, and the newest of
+    each of the last `hourly` hours and `daily` days that have snapshots."""
+
+    def __init__(self, recent = 25, hourly = 24, daily = 30):
+        self.recent = recent
+        self.hourly = hourly
+        self.daily = daily
+
+    def keep(self, snapshots):
+        """Ids to keep out of `snapshots` (index entries, any order)."""
+        ordered = sorted(snapshots, key = lambda s: s["created"], reverse = True)
+        keep = {s["id"] for s in ordered[:self.recent]}
+        for fmt, count in (("%Y%m%d%H", self.hourly), ("%Y%m%d", self.daily)):
+            seen = set()
+            for snap in ordered:
+                if len(seen) >= count:
+                    break
+                bucket = time.strftime(fmt, time.localtime(snap["created"]))
+                if bucket not in seen:
+                    seen.add(bucket)
+                    keep.add(snap["id"])
+        return keep
+
+
+def _write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class BackupStore:
+    """The backup store in directory `root`. Thread-safe."""
+
+    def __init__(self, root, retention = None):
+        self.root = root
+        self.retention = retention or Retention()
+        self._lock = threading.RLock()
+        self._index = None
+        self._index_stamp = None
+        self.stats = {"snapshots_added": 0, "unchanged_skipped": 0, "blobs_written": 0,
+                      "bytes_in": 0, "bytes_written": 0, "pruned": 0, "blobs_removed": 0}
+
+    # ── Paths ────────────────────────────────────────────────────────────
+
+    def _index_path(self):
+        return os.path.join(self.root, INDEX_NAME)
+
+    def _manifest_path(self, snap_id):
+        return os.path.join(self.root, SNAPSHOTS_DIR, snap_id + ".json")
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, BLOBS_DIR, digest[:2], digest)
+
+    # ── Index ────────────────────────────────────────────────────────────
+
+    def _stat_index(self):
+        try:
+            st = os.stat(self._index_path())
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _load_index(self):
+        """The snapshot list, re-read when index.json changed on disk (a cloud
+        restore, another process) and rebuilt from the manifests when it is
+        missing or unreadable."""
+        stamp = self._stat_index()
+        if self._index is not None and stamp == self._index_stamp:
+            return self._index
+        entries = None
+        if stamp is not None:
+            try:
+                with open(self._index_path(), "r", encoding = "utf-8") as f:
+                    parsed = json.load(f)
+                if parsed.get("version") == _INDEX_VERSION and isinstance(parsed.get("snapshots"), list):
+                    entries = parsed["snapshots"]
+            except (OSError, ValueError, AttributeError):
+                entries = None
+        if entries is None:
+            entries = self._rebuild_index()
+        self._index = entries
+        self._index_stamp = self._stat_index()
+        return entries
+
+    def _rebuild_index(self):
+        entries = []
+        folder = os.path.join(self.root, SNAPSHOTS_DIR)
+        if not os.path.isdir(folder):
+            return entries
+        for name in os.listdir(folder):
+            if not name.endswith(".json"):
+                continue
+            manifest = self._read_manifest(name[:-len(".json")])
+            if manifest is not None:
+                entries.append(self._index_entry(manifest))
+        entries.sort(key = lambda s: s["created"])
+        if entries:
+            self._save_index(entries)
+        return entries
+
+    def _save_index(self, entries):
+        os.makedirs(self.root, exist_ok = True)
+        payload = {"version": _INDEX_VERSION, "snapshots": entries}
+        _write_atomic(self._index_path(), json.dumps(payload, separators = (",", ":")).encode("utf-8"))
+        self._index = entries
+        self._index_stamp = self._stat_index()
+
+    @staticmethod
+    def _index_entry(manifest):
+        return {"id": manifest["id"], "created": manifest["created"], "size": manifest["size"],
+                "kind": manifest["kind"], "chunks": len(manifest["chunks"])}
+
+    def snapshots(self):
+        """Index entries ({id, created, size, kind, chunks}), newest first."""
+        with self._lock:
+            return [dict(entry) for entry in reversed(self._load_index())]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._load_index())
+
+    # ── Adding ───────────────────────────────────────────────────────────
+
+    def _read_manifest(self, snap_id):
+        try:
+            with open(self._manifest_path(snap_id), "r", encoding = "utf-8") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and isinstance(manifest.get("chunks"), list):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _new_id(self, created, taken):
+        base = time.strftime("%Y%m%d_%H%M%S", time.localtime(created)) + f"_{int(created % 1 * 1e6):06d}"
+        snap_id = base
+        n = 1
+        while snap_id in taken or os.path.exists(self._manifest_path(snap_id)):
+            snap_id = f"{base}-{n}"
+            n += 1
+        return snap_id
+
+    def _put_chunks(self, data, content_defined):
+        digests = []
+        for start, end in chunk_spans(data, content_defined):
+            chunk = data[start:end]
+            digest = hashlib.sha256(chunk).hexdigest()
+            path = self._blob_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok = True)
+                packed = zlib.compress(chunk, 6)
+                _write_atomic(path, packed)
+                self.stats["blobs_written"] += 1
+                self.stats["bytes_written"] += len(packed)
+            digests.append(digest)
+        return digests
+
+    def _same_snapshot(self, entry, digests, extra):
+        manifest = self._read_manifest(entry["id"])
+        return (manifest is not None and manifest["chunks"] == digests
+                and all(manifest.get(k) == v for k, v in extra.items()))
+
+    def _add(self, kind, data, extra, created):
+        with self._lock:
+            entries = self._load_index()
+            digests = self._put_chunks(data, kind == "v2")
+            self.stats["bytes_in"] += len(data)
+            # Unchanged since the newest snapshot, or the same backup imported
+            # twice (an import interrupted and run again): nothing to add.
+            same = [e for e in entries if created is not None and e["created"] == created and e["size"] == len(data)]
+            if entries:
+                same.append(entries[-1])
+            for entry in same:
+                if self._same_snapshot(entry, digests, extra):
+                    self.stats["unchanged_skipped"] += 1
+                    return entry["id"]
+            created = time.time() if created is None else created
+            snap_id = self._new_id(created, {e["id"] for e in entries})
+            manifest = {"id": snap_id, "created": created, "kind": kind, "size": len(data), "chunks": digests}
+            manifest.update(extra)
+            os.makedirs(os.path.join(self.root, SNAPSHOTS_DIR), exist_ok = True)
+            _write_atomic(self._manifest_path(snap_id), json.dumps(manifest, separators = (",", ":")).encode("utf-8"))
+            entries = entries + [self._index_entry(manifest)]
+            entries.sort(key = lambda s: s["created"])
+            self._save_index(entries)
+            self.stats["snapshots_added"] += 1
+            return snap_id
+
+    def add_signed(self, body, sig, comment_lines = None, created = None):
+        """Snapshot of a v2 save given as its signed body and signature."""
+        return self._add("v2", bytes(body), {"sig": sig, "comments": list(comment_lines or [])}, created)
+
+    def add_bytes(self, raw, created = None):
+        """Snapshot of a save file given as its bytes."""
+        decoded = _envelope.read(io.BytesIO(raw))
+        if decoded.version == 2 and decoded.sig is not None:
+            return self.add_signed(decoded.body, decoded.sig, decoded.comment_lines, created)
+        return self._add("raw", bytes(raw), {}, created)
+
+    def add_file(self, path, created = None):
+        """Snapshot of the save file at `path` as it is on disk."""
+        with open(path, "rb") as f:
+            return self.add_bytes(f.read(), created)
+
+    def import_files(self, paths, remove = True):
+        """Add loose backup files (oldest first, dated by mtime), then prune;
+        with `remove`, delete each once it is stored. Returns the number imported."""
+        dated = []
+        for path in paths:
+            try:
+                dated.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        imported = 0
+        for mtime, path in sorted(dated):
+            try:
+                self.add_file(path, created = mtime)
+                if remove:
+                    os.remove(path)
+                imported += 1
+            except Exception as e:
+                logging.warning(f"Failed to import backup '{path}' into the backup store: {e}")
+        self.prune()
+        return imported
+
+    # ── Reading ──────────────────────────────────────────────────────────
+
+    def read_bytes(self, snap_id):
+        """The backed-up file, byte for byte."""
+        with self._lock:
+            manifest = self._read_manifest(snap_id)
+        if manifest is None:
+            raise KeyError(snap_id)
+        data = bytearray()
+        for digest in manifest["chunks"]:
+            with open(self._blob_path(digest), "rb") as f:
+                chunk = zlib.decompress(f.read())
+            if hashlib.sha256(chunk).hexdigest() != digest:
+                raise ValueError(f"Backup blob {digest} is corrupt")
+            data += chunk
+        if manifest["kind"] != "v2":
+            return bytes(data)
+        out = io.BytesIO()
+        _envelope.write_body(out, data, manifest["sig"], manifest.get("comments"))
+        return out.getvalue()
+
+    def restore_to(self, snap_id, path):
+        """Write the backed-up file to `path`."""
+        _write_atomic(path, self.read_bytes(snap_id))
+        return path
+
+    # ── Retention ────────────────────────────────────────────────────────
+
+    def prune(self):
+        """Drop the snapshots the retention policy does not keep, then the
+        blobs nothing references any more. Returns the number dropped."""
+        with self._lock:
+            entries = self._load_index()
+            keep = self.retention.keep(entries)
+            dropped = [e for e in entries if e["id"] not in keep]
+            if not dropped:
+                return 0
+            self._save_index([e for e in entries if e["id"] in keep])
+            for entry in dropped:
+                try:
+                    os.remove(self._manifest_path(entry["id"]))
+                except OSError:
+                    logging.exception("Suppressed exception")
+            self.stats["pruned"] += len(dropped)
+            self._collect_garbage()
+            return len(dropped)
+
+    def _collect_garbage(self):
+        # Every manifest on disk counts, indexed or not, so a crash between
+        # writing a manifest and the index never loses its blobs.
+        referenced = set()
+        folder = os.path.join(self.root, SNAPSHOTS_DIR)
+        for name in os.listdir(folder) if os.path.isdir(folder) else ():
+            if name.endswith(".json"):
+                manifest = self._read_manifest(name[:-len(".json")])
+                if manifest is None:
+                    return  # unreadable manifest: keep every blob
+                referenced.update(manifest["chunks"])
+        blobs = os.path.join(self.root, BLOBS_DIR)
+        for prefix in os.listdir(blobs) if os.path.isdir(blobs) else ():
+            prefix_dir = os.path.join(blobs, prefix)
+            for name in os.listdir(prefix_dir):
+                if name not in referenced and not name.endswith(".tmp"):
+                    try:
+                        os.remove(os.path.join(prefix_dir, name))
+                        self.stats["blobs_removed"] += 1
+                    except OSError:
+                        logging.exception("Suppressed exception")
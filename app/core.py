@@ -2,13 +2,10 @@
 from app.foundation import *
 from app import fonts as _app_fonts
 from app.mixins.bugreport import BugreportMixin
-from app.mixins.casino import CasinoMixin
 from app.mixins.characters import CharactersMixin
 from app.mixins.cloud import CloudMixin
 from app.mixins.combat import CombatMixin
-from app.mixins.combatmode import CombatmodeMixin
 from app.mixins.dev import DevMixin
-from app.mixins.dmtools import DmtoolsMixin
 from app.mixins.gameplay import GameplayMixin
 from app.mixins.inspect import InspectMixin
 from app.mixins.inventory import InventoryMixin
@@ -16,15 +13,17 @@ from app.mixins.items import ItemsMixin
 from app.mixins.loot import LootMixin
 from app.mixins.marking import MarkingMixin
 from app.mixins.popups import PopupsMixin
-from app.mixins.reports import ReportsMixin
 from app.mixins.saves import SavesMixin
 from app.mixins.settings import SettingsMixin
 from app.mixins.sound import SoundMixin
-from app.mixins.store import StoreMixin
 from app.mixins.ui import UiMixin
 from app.mixins.updates import UpdatesMixin
 from app.mixins.weapons import WeaponsMixin
+import importlib
 import logging
+import re
+
+_startup.mark("core: feature mixins imported")
 
 
 class _ToastLogHandler(logging.Handler):
@@ -99,13 +98,158 @@ class _ToastLogHandler(logging.Handler):
                 continue
 
 
-class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin, CombatmodeMixin, DevMixin, DmtoolsMixin, GameplayMixin, InspectMixin, InventoryMixin, ItemsMixin, LootMixin, MarkingMixin, PopupsMixin, ReportsMixin, SavesMixin, SettingsMixin, SoundMixin, StoreMixin, UiMixin, UpdatesMixin, WeaponsMixin):
+class _LazyMixins:
+    """Feature mixins that are only imported when one of their methods is first
+    used: the big screens that are opened from a menu button (casino, store,
+    combat mode, DM tools, combat reports).
+
+    Which methods each one defines is read from its source with a regex (one
+    `def` per method at class indent) and kept in a small cache next to its
+    bytecode, keyed by the file's stat, so startup costs a few stats. Until a
+    mixin is loaded, App.__getattr__ hands out a stand-in for its methods that
+    loads the mixin when called, so building a button with `command =
+    self._open_dm_tools` does not import the DM tools. Loading appends the
+    mixin to App's bases in the order below. No method name is defined by
+    more than one mixin, so the MRO resolves every name as it would with all
+    mixins listed in the class statement.
+
+    Without sources to read (a frozen build) every lazy mixin is imported
+    along with app.core."""
+
+    MIXINS = (
+    ("app.mixins.casino", "CasinoMixin"),
+    ("app.mixins.combatmode", "CombatmodeMixin"),
+    ("app.mixins.dmtools", "DmtoolsMixin"),
+    ("app.mixins.reports", "ReportsMixin"),
+    ("app.mixins.store", "StoreMixin"),
+    )
+    _METHOD_RE = re.compile(r"^    def (\w+)\(", re.M)
+    _CACHE_NAME = "lazy_mixin_methods.json"
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._owner = {}
+        self._loaded = set()
+        self._cls = None
+
+    def _source(self, module_name):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), *module_name.split(".")[1:])+ ".py"
+        return path if os.path.isfile(path)else None
+
+    def _scan(self):
+        cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mixins", "__pycache__", self._CACHE_NAME)
+        try:
+            with open(cache_path, "r", encoding = "utf-8")as f:
+                cache = json.load(f)
+        except Exception:
+            cache = {}
+        owner = {}
+        changed = False
+        for module_name, _ in self.MIXINS:
+            path = self._source(module_name)
+            if path is None:
+                return None
+            st = os.stat(path)
+            stamp =[st.st_mtime_ns, st.st_size]
+            entry = cache.get(module_name)
+            if not entry or entry.get("stamp")!= stamp:
+                with open(path, "r", encoding = "utf-8")as f:
+                    entry = {"stamp":stamp, "methods":self._METHOD_RE.findall(f.read())}
+                cache[module_name]= entry
+                changed = True
+            for name in entry["methods"]:
+                owner[name]= module_name
+        if changed:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok = True)
+                with open(cache_path + ".tmp", "w", encoding = "utf-8")as f:
+                    json.dump(cache, f)
+                os.replace(cache_path + ".tmp", cache_path)
+            except OSError:
+                logging.debug("Could not write the lazy mixin method cache", exc_info = True)
+        return owner
+
+    def install(self, cls):
+        """Set up lazy loading for `cls`; loads everything when sources are missing."""
+        self._cls = cls
+        try:
+            owner = self._scan()
+        except Exception:
+            logging.exception("Failed to read lazy mixin methods; loading them all")
+            owner = None
+        if owner is None:
+            self.load_all()
+            return
+        self._owner = owner
+
+    def owner(self, name):
+        return self._owner.get(name)if self._owner else None
+
+    def load(self, module_name):
+        with self._lock:
+            if module_name in self._loaded:
+                return
+            with _startup.phase(f"load {module_name.rsplit('.', 1)[-1]} mixin"):
+                module = importlib.import_module(module_name)
+                self._loaded.add(module_name)
+                mixins = tuple(getattr(importlib.import_module(m), c)for m, c in self.MIXINS if m in self._loaded)
+                eager = tuple(b for b in self._cls.__bases__ if b not in mixins)
+                self._cls.__bases__ = eager + mixins
+            for name in [n for n, m in self._owner.items()if m == module_name]:
+                del self._owner[name]
+            logging.info(f"Loaded feature mixin {module.__name__}")
+
+    def load_all(self):
+        for module_name, _ in self.MIXINS:
+            self.load(module_name)
+
+    def preload(self, root, delay_ms = 3000):
+        """Import the lazy mixins on a background thread once the app is idle,
+        then attach them on the Tk thread, so the first click on a feature
+        does not wait for its import."""
+        def _import_all():
+            try:
+                for module_name, _ in self.MIXINS:
+                    importlib.import_module(module_name)
+                root.after(0, self.load_all)
+            except Exception:
+                logging.exception("Failed to preload feature mixins")
+
+        def _start():
+            threading.Thread(target = _import_all, name = "mixin-preload", daemon = True).start()
+
+        root.after(delay_ms, _start)
+
+    def deferred(self, instance, name, module_name):
+        def _call(*args, **kwargs):
+            self.load(module_name)
+            return getattr(instance, name)(*args, **kwargs)
+        _call.__name__ = name
+        _call.__qualname__ = f"{type(instance).__name__}.{name}"
+        return _call
+
+_lazy_mixins = _LazyMixins()
+
+
+class App(BugreportMixin, CharactersMixin, CloudMixin, CombatMixin, DevMixin, GameplayMixin, InspectMixin, InventoryMixin, ItemsMixin, LootMixin, MarkingMixin, PopupsMixin, SavesMixin, SettingsMixin, SoundMixin, UiMixin, UpdatesMixin, WeaponsMixin):
 
     PLATFORM_DEFAULTS = {
     "M203":{"ammo_type":"40mm_grenade", "capacity":1, "reload_sound_folder":"m203"}
     }
     currentsave = None
-    def __init__(self):
+
+    def __getattr__(self, name):
+        # Only reached for names normal lookup misses: methods of a feature
+        # mixin that has not been loaded yet (see _LazyMixins).
+        module_name = _lazy_mixins.owner(name)
+        if module_name is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return _lazy_mixins.deferred(self, name, module_name)
+
+    def __init__(self, run = True):
+        """Build the main window and, unless `run` is False (the startup
+        benchmark), enter the Tk main loop; the process exits when it ends."""
+        _startup.mark("App created")
         # Register this instance in the foundation module's globals so module-level
         # helpers (e.g. the dev console command loop) can reach the live App.
         try:
@@ -114,6 +258,20 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
         except Exception:
             logging.exception("Failed to register App instance on foundation module")
 
+        # Flashbang deafness and its fade back in reach gunfire already in the
+        # combat mixer's stream, not just sounds started afterwards.
+        try:
+            _combat_mixer.set_master(self._combat_mix_gain)
+        except Exception:
+            logging.exception("Suppressed exception")
+
+        # Deferred saves copy the live save dicts on this thread, once per
+        # coalesced write, rather than on every submit.
+        try:
+            _save_manager.set_dispatcher(lambda fn:self.root.after(0, fn))
+        except Exception:
+            logging.exception("Suppressed exception")
+
         # Diagnostic: record cloud-saves config so release-vs-local issues are
         # visible in the log (frozen builds set sys._MEIPASS; source mode does not).
         try:
@@ -185,6 +343,7 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
             logging.exception("Suppressed exception")
 
         self.root = customtkinter.CTk()
+        _startup.mark("root window created")
         # Adopt the desktop's UI font before any widget is built, so bare
         # CTkFont(size=...) calls inherit it. Linux only and best-effort: on
         # Windows/macOS this returns immediately and CustomTkinter's own
@@ -250,7 +409,7 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
         except Exception:
             logging.exception("Suppressed exception")
 
-        self._sound_cache = {}
+        _startup.mark("window configured")
 
         self._load_file(None)
         if persistentdata.get("last_loaded_save"):
@@ -294,7 +453,14 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
                         logging.info(f"Automatically loaded last save: {save_filename}")
                 else:
                     logging.warning(f"Failed to load last save: {save_filename}")
+        _startup.mark("last save loaded")
         self._build_main_menu()
+        _startup.mark("main menu built")
+        try:
+            self.root.after_idle(_startup.first_window_shown)
+            _lazy_mixins.preload(self.root)
+        except Exception:
+            logging.exception("Suppressed exception")
 
         try:
             self.root.after(600, self._maybe_prompt_cloud_restore)
@@ -315,6 +481,10 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
             self.root.after(800, self._maybe_prompt_reporter_name)
         except Exception:
             logging.exception("Suppressed exception")
+        try:
+            start_deferred_table_validation(self.root)
+        except Exception:
+            logging.exception("Failed to schedule deferred table validation")
 
         try:
             if global_variables.get("devmode", {}).get("value"):
@@ -375,12 +545,20 @@ class App(BugreportMixin, CasinoMixin, CharactersMixin, CloudMixin, CombatMixin,
         except Exception:
             logging.exception("Suppressed exception")
 
+        if not run:
+            return
+        _startup.mark("mainloop entered")
         self.root.mainloop()
         # mainloop() returned — either _safe_exit() already called os._exit(0),
         # or something caused mainloop to exit without it.  In either case, skip
         # Python's thread finalization (fatal on free-threaded Python 3.13 with
         # daemon threads blocked in C calls like time.sleep / input / network IO).
+        # os._exit skips atexit, so write deferred saves first.
+        flush_pending_saves()
         try:
             os._exit(0)
         except Exception:
             logging.exception("Suppressed exception")
+
+
+_lazy_mixins.install(App)
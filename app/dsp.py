@@ -0,0 +1,181 @@
+"""Pitch-shifted and muffled variants of sounds, rendered off the UI thread.
+
+`_play_pitched_sound` used to resample every channel with np.interp on each
+call, and the bang muffle ran an FFT low-pass plus a convolution per channel
+on the caller's thread the first time a sound was muffled. Both now go
+through a `VariantRenderer`:
+
+    ready(path, effect, params)     the rendered variant, or None
+    request(path, effect, params)   queue it for the worker (deduplicated)
+    nearest_pitch(path, pitch)      the closest pitch variant already rendered
+
+Variants live in the audio cache (app/audiocache.py) under the key
+(path, effect, params), so they share its byte budget and LRU eviction.
+Pitches are quantized to `PITCH_STEP` buckets, so a random pitch in
+0.97-1.03 is at most four variants of a clip. Callers play what is ready
+and fall back to the plain sound (or the nearest pitch) while the worker
+renders the rest; nothing is computed on the caller's thread.
+
+The effects operate on whole (frames,) or (frames, channels) arrays at once.
+numpy is imported on first render; pygame is reached through the callables
+passed in.
+"""
+import logging
+import queue
+import threading
+import time
+
+PITCH_STEP = 0.02
+PITCH_MIN = 0.5
+PITCH_MAX = 2.0
+MUFFLE_TAIL_SECONDS = 0.03
+
+
+def quantize_pitch(pitch, step = PITCH_STEP):
+    """`pitch` clamped to [PITCH_MIN, PITCH_MAX] and rounded to a bucket."""
+    pitch = min(PITCH_MAX, max(PITCH_MIN, float(pitch)))
+    return round(round(pitch /step)*step, 4)
+
+
+def _as_dtype(samples, dtype):
+    import numpy as np
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        samples = np.clip(samples, info.min, info.max)
+    else:
+        samples = np.clip(samples, -1.0, 1.0)
+    return samples.astype(dtype)
+
+
+def pitch_shift(samples, pitch):
+    """Resample `samples` by `pitch` (2.0 = an octave up, half as long), all
+    channels in one pass of linear interpolation."""
+    import numpy as np
+    frames = int(samples.shape[0])
+    target = max(1, int(round(frames /pitch)))
+    pos = np.linspace(0, frames -1, target)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo +1, frames -1)
+    frac =(pos -lo).astype(np.float32)
+    if samples.ndim >1:
+        frac = frac[:, None]
+    source = samples.astype(np.float32)
+    return _as_dtype(source[lo]*(1.0 -frac)+source[hi]*frac, samples.dtype)
+
+
+def low_pass(samples, sample_rate, cutoff, tail_seconds = MUFFLE_TAIL_SECONDS):
+    """Cut everything above `cutoff` Hz, then smear with a short exponential
+    tail: the "heard through ear protection" muffle. All channels at once."""
+    import numpy as np
+    frames = int(samples.shape[0])
+    source = samples.astype(np.float32)
+    spectrum = np.fft.rfft(source, axis = 0)
+    spectrum[np.fft.rfftfreq(frames, 1.0 /sample_rate)>cutoff]= 0
+    out = np.fft.irfft(spectrum, n = frames, axis = 0)
+    tail = int(tail_seconds *sample_rate)
+    if tail >1:
+        ir = np.exp(-np.linspace(0, 4, tail))
+        ir = ir /(ir.sum()+1e-9)
+        # Same-length convolution, done in the frequency domain.
+        size = frames +tail -1
+        ir_spectrum = np.fft.rfft(ir, size)
+        if out.ndim >1:
+            ir_spectrum = ir_spectrum[:, None]
+        full = np.fft.irfft(np.fft.rfft(out, size, axis = 0)*ir_spectrum, size, axis = 0)
+        start =(tail -1)//2
+        out = full[start:start +frames]
+    return _as_dtype(out, samples.dtype)
+
+
+EFFECTS = {
+    "pitch": lambda samples, sample_rate, params: pitch_shift(samples, *params),
+    "muffle": lambda samples, sample_rate, params: low_pass(samples, sample_rate, *params),
+}
+
+
+class VariantRenderer:
+    """Renders effect variants of cached sounds on one daemon worker."""
+
+    def __init__(self, cache, to_array, from_array, sample_rate):
+        self._cache = cache
+        self._to_array = to_array        # sound -> samples
+        self._from_array = from_array    # samples -> sound
+        self._sample_rate = sample_rate  # () -> Hz
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._failed = set()             # keys not retried
+        self._rendered = {}              # (path, effect) -> set of params rendered
+        self._lock = threading.Lock()
+        self._thread = None
+        self.stats = {"requested": 0, "rendered": 0, "failed": 0, "render_ms": 0.0}
+
+    @staticmethod
+    def key(path, effect, params):
+        return(path, effect, tuple(params))
+
+    def ready(self, path, effect, params):
+        key = self.key(path, effect, params)
+        if not self._cache.contains(key):
+            return None
+        return self._cache.peek(key)
+
+    def request(self, path, effect, params):
+        """Queue the variant unless it is ready, queued or failed before. Returns
+        True if queued."""
+        key = self.key(path, effect, params)
+        with self._lock:
+            if key in self._pending or key in self._failed or self._cache.contains(key):
+                return False
+            self._pending.add(key)
+            self.stats["requested"]+= 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target = self._work, name = "dsp-variants", daemon = True)
+                self._thread.start()
+        self._queue.put(key)
+        return True
+
+    def nearest_pitch(self, path, pitch):
+        """(bucket, sound) of the rendered pitch variant of `path` closest to
+        `pitch`, or None."""
+        with self._lock:
+            buckets = sorted(self._rendered.get((path, "pitch"), ()), key = lambda params: abs(params[0]-pitch))
+        for params in buckets:
+            sound = self.ready(path, "pitch", params)
+            if sound is not None:
+                return params[0], sound
+            with self._lock:
+                self._rendered.get((path, "pitch"), set()).discard(params)  # evicted
+        return None
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _work(self):
+        while True:
+            key = self._queue.get()
+            path, effect, params = key
+            try:
+                start = time.perf_counter()
+                base = self._cache.get(path)
+                samples = self._to_array(base)
+                sound = self._from_array(EFFECTS[effect](samples, self._sample_rate(), params))
+                self._cache.put(key, sound)
+                with self._lock:
+                    self._rendered.setdefault((path, effect), set()).add(params)
+                    self.stats["rendered"]+= 1
+                    self.stats["render_ms"]+=(time.perf_counter()-start)*1000
+            except Exception:
+                with self._lock:
+                    self._failed.add(key)
+                    self.stats["failed"]+= 1
+                logging.exception(f"Failed to render {effect}{list(params)} of '{path}'")
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+    def summary(self):
+        with self._lock:
+            out = dict(self.stats, pending = len(self._pending))
+        out["render_ms"]= round(out["render_ms"], 1)
+        return out
@@ -0,0 +1,253 @@
+"""Signed-envelope codec for .sldsv and the other signed data files.
+
+v1 (still read): base85(json({"_sig": hmac(json(data, sort_keys)), "_data": data})).
+Signing and verifying both re-serialize the data with sort_keys, and the whole
+file is held as text, envelope string and decoded bytes at once.
+
+v2 (written): base85(MAGIC + body + b"\\n" + hex hmac(body)), where body is the
+UTF-8 JSON of the data as written. The HMAC covers exactly the bytes on disk,
+so writing serializes once and reading verifies the raw bytes before the one
+json parse. base85 is produced and consumed in chunks straight to and from the
+file. Either format may be preceded by `//` comment lines.
+
+`b85encode` / `b85decode` give the same output as the base64 module's, but
+work on every 4-byte group of a chunk at once: each group gets its own
+fixed-width lane in one big integer, so the per-group arithmetic runs as a
+handful of C-level int and bytes-slice operations instead of a Python loop.
+
+Stdlib only: scripts/decrypt_save.py and scripts/convert_legacy_saves.py load
+it by path.
+"""
+import base64
+import hashlib
+import hmac
+import io
+import json
+
+MAGIC = b"SLD2"
+_SIG_LEN = 64                      # hex sha256
+_TRAILER_LEN = 1 + _SIG_LEN        # b"\n" + signature
+_ENCODE_CHUNK = 1 << 16            # bytes; a multiple of 4 keeps base85 groups intact
+_DECODE_CHUNK = 5 * (1 << 14)      # characters; a multiple of 5 for the same reason
+_WHITESPACE = b" \t\r\n"
+
+# ─── base85 ──────────────────────────────────────────────────────────────────
+
+_ALPHABET = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz!#$%&()*+-;<=>?@^_`{|}~"
+_DIGIT_OF = bytes(_ALPHABET.index(c) if c in _ALPHABET else 0xFF for c in range(256))
+_CHAR_OF = _ALPHABET + bytes(256 - len(_ALPHABET))
+# v // 85 == (v * _DIV85) >> 40 for every v < 2**32.
+_DIV85 = -(-(1 << 40) // 85)
+_LANE_MASKS = {}
+
+
+def _lane_mask(n):
+    """The low 32 bits of each of `n` 9-byte lanes."""
+    mask = _LANE_MASKS.get(n)
+    if mask is None:
+        mask = _LANE_MASKS[n] = int.from_bytes(b"\0\0\0\0\0\xff\xff\xff\xff" * n, "big")
+    return mask
+
+
+def b85encode(data):
+    """base64.b85encode(data)."""
+    data = memoryview(data).cast("B")
+    n = len(data) // 4
+    if not n:
+        return base64.b85encode(data)
+    # One 9-byte lane per group: wide enough that v * _DIV85 never carries into
+    # the next lane.
+    width = 9 * n
+    lanes = bytearray(width)
+    for k in range(4):
+        lanes[5 + k::9] = data[k:4 * n:4]
+    value = int.from_bytes(lanes, "big")
+    mask = _lane_mask(n)
+    out = bytearray(5 * n)
+    for pos in range(4, 0, -1):
+        quotient = ((value * _DIV85) >> 40) & mask
+        out[pos::5] = (value - 85 * quotient).to_bytes(width, "big")[8::9]
+        value = quotient
+    out[0::5] = value.to_bytes(width, "big")[8::9]
+    return bytes(out.translate(_CHAR_OF)) + base64.b85encode(data[4 * n:])
+
+
+def b85decode(text):
+    """base64.b85decode(text), for bytes input."""
+    text = bytes(text)
+    n = len(text) // 5
+    if not n:
+        return base64.b85decode(text)
+    digits = text[:5 * n].translate(_DIGIT_OF)
+    if b"\xff" in digits:
+        return base64.b85decode(text)  # raises, naming the bad character
+    # One 5-byte lane per group; 85**5 < 2**40, so lanes never carry.
+    width = 5 * n
+    lanes = bytearray(width)
+    value = 0
+    for k in range(5):
+        lanes[4::5] = digits[k::5]
+        value = value * 85 + int.from_bytes(lanes, "big")
+    packed = value.to_bytes(width, "big")
+    if packed[0::5].strip(b"\0"):
+        return base64.b85decode(text)  # a group above 2**32 - 1: raises
+    out = bytearray(4 * n)
+    for k in range(4):
+        out[k::4] = packed[k + 1::5]
+    return bytes(out) + base64.b85decode(text[5 * n:])
+
+
+# ─── v2 envelope ─────────────────────────────────────────────────────────────
+
+def _mac(key, body):
+    """HMAC-SHA256 of `body` under `key`: raw key bytes, or a prepared hmac
+    object (left untouched; a copy is fed)."""
+    if isinstance(key, (bytes, bytearray)):
+        return hmac.new(key, body, hashlib.sha256)
+    mac = key.copy()
+    mac.update(body)
+    return mac
+
+
+def _normalize_comment(line):
+    return line if line.endswith("\n") else line + "\n"
+
+
+def _body(data):
+    return json.dumps(data, ensure_ascii = False, separators = (",", ":")).encode("utf-8")
+
+
+def sign(data, key):
+    """(body, hex signature) of `data` as a v2 envelope stores them."""
+    body = _body(data)
+    return body, _mac(key, body).hexdigest()
+
+
+def write_body(f, body, sig, comment_lines = None):
+    """Write an already signed body to the binary file object `f`."""
+    if comment_lines:
+        for line in comment_lines:
+            f.write(_normalize_comment(line).encode("utf-8"))
+    view = memoryview(body)
+    # MAGIC is one base85 group, so the body starts on a group boundary too.
+    f.write(b85encode(MAGIC))
+    full = len(body) - len(body) % 4
+    for start in range(0, full, _ENCODE_CHUNK):
+        f.write(b85encode(view[start:min(start + _ENCODE_CHUNK, full)]))
+    f.write(b85encode(bytes(view[full:]) + b"\n" + sig.encode("ascii")))
+
+
+def write(f, data, key, comment_lines = None):
+    """Write `data` as a v2 envelope to the binary file object `f`, signed with
+    `key` (raw bytes or a prepared hmac object)."""
+    body, sig = sign(data, key)
+    write_body(f, body, sig, comment_lines)
+
+
+def encode(data, key, comment_lines = None):
+    """v2 file text for `data` (for tools that build the text themselves)."""
+    out = io.BytesIO()
+    write(out, data, key, comment_lines)
+    return out.getvalue().decode("utf-8")
+
+
+class Decoded:
+    """What `read` found in a file.
+
+    `version` is 2 for a v2 envelope, 1 for anything else (whose payload text is
+    in `payload` for the v1 reader). For v2, `body` holds the signed JSON bytes
+    and `sig` the stored signature (None when the payload is corrupt)."""
+
+    __slots__ = ("version", "comment_lines", "payload", "body", "sig")
+
+    def __init__(self, version, comment_lines, payload = None, body = None, sig = None):
+        self.version = version
+        self.comment_lines = comment_lines
+        self.payload = payload
+        self.body = body
+        self.sig = sig
+
+    def verify(self, keys):
+        """Whether the v2 signature matches under any of `keys` (raw bytes or
+        prepared hmac objects)."""
+        if self.sig is None:
+            return False
+        for key in keys:
+            expected = _mac(key, self.body).hexdigest()
+            if hmac.compare_digest(expected, self.sig):
+                return True
+        return False
+
+    def data(self):
+        return json.loads(self.body)
+
+
+def _read_comments(f):
+    """Comment lines from the top of binary file `f`, and the start of the payload.
+
+    Lines are read with a length limit, so a single-line payload is not pulled
+    into memory whole here."""
+    comment_lines = []
+    while True:
+        line = f.readline(_DECODE_CHUNK)
+        if not line:
+            return comment_lines, b""
+        stripped = line.strip()
+        if stripped.startswith(b"//") or not stripped:
+            while not line.endswith(b"\n"):
+                more = f.readline(_DECODE_CHUNK)
+                if not more:
+                    break
+                line += more
+            comment_lines.append(line.decode("utf-8", errors = "replace"))
+            continue
+        return comment_lines, line
+
+
+def read(f):
+    """Decode the binary file object `f` (see `Decoded`)."""
+    comment_lines, first = _read_comments(f)
+    pending = first.translate(None, _WHITESPACE)
+    while len(pending) < 5:
+        more = f.read(_DECODE_CHUNK)
+        if not more:
+            break
+        first += more
+        pending += more.translate(None, _WHITESPACE)
+    try:
+        is_v2 = len(pending) >= 5 and b85decode(pending[:5]) == MAGIC
+    except ValueError:
+        is_v2 = False
+    if not is_v2:
+        payload = (first + f.read()).decode("utf-8", errors = "replace").strip()
+        return Decoded(1, comment_lines, payload = payload)
+
+    buf = bytearray()
+    pending = pending[5:]
+    try:
+        while True:
+            usable = len(pending) - len(pending) % 5
+            if usable:
+                buf += b85decode(pending[:usable])
+                pending = pending[usable:]
+            more = f.read(_DECODE_CHUNK)
+            if not more:
+                break
+            pending += more.translate(None, _WHITESPACE)
+        if pending:
+            buf += b85decode(pending)
+    except ValueError:  # corrupted payload: reported as unverifiable
+        return Decoded(2, comment_lines, body = bytes(buf), sig = None)
+    if len(buf) < _TRAILER_LEN or buf[-_TRAILER_LEN] != 0x0A:
+        return Decoded(2, comment_lines, body = bytes(buf), sig = None)
+    try:
+        sig = bytes(buf[-_SIG_LEN:]).decode("ascii")
+    except UnicodeDecodeError:  # hmac.compare_digest only takes ASCII strings
+        return Decoded(2, comment_lines, body = bytes(buf), sig = None)
+    del buf[-_TRAILER_LEN:]
+    return Decoded(2, comment_lines, body = buf, sig = sig)
+
+
+def read_path(path):
+    with open(path, "rb") as f:
+        return read(f)
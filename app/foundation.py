@@ -1,5 +1,6 @@
 import os
 import json
+from app import startup as _startup
 
 
 def _load_local_app_version(default="0.0.0"):
@@ -23,7 +24,7 @@ from datetime import datetime
 from datetime import timezone, timedelta
 import zipfile
 import glob
-import requests
+requests = _startup.lazy_import("requests")
 import platform
 import pygame
 import customtkinter
@@ -41,11 +42,12 @@ import secrets
 import ctypes
 import threading
 import queue
-import pyperclip
+import contextlib
+pyperclip = _startup.lazy_import("pyperclip")
 import sys
 import inspect
-import distro
-import numpy as np
+np = _startup.lazy_import("numpy")
+_startup.mark("foundation: library imports")
 
 def _sanitize_log(s):
     if not isinstance(s, str):
@@ -54,6 +56,7 @@ def _sanitize_log(s):
 
 import hashlib as _hashlib
 import hmac as _hmac
+from app import envelope as _envelope
 
 def _get_shared_key_dir():
     # Single machine-wide location for the save signing key, independent of
@@ -116,12 +119,17 @@ def _get_save_key():
 
 _PORTABLE_KEY = _hashlib.sha256(b"DOOM-Tools-portable-transfer-signing-key-v1").digest()
 
-def _candidate_save_keys():
+_PORTABLE_HMAC = _hmac.new(_PORTABLE_KEY, digestmod = _hashlib.sha256)
+
+def _read_save_keys():
     # The shared key (used for new signatures) plus any legacy per-folder keys,
     # so saves signed before the key was unified still verify on this machine.
+    # Returns (signing key or None, candidate keys).
     keys = []
+    signing_key = None
     try:
-        keys.append(_get_save_key())
+        signing_key = _get_save_key()
+        keys.append(signing_key)
     except Exception:
         logging.exception("Suppressed exception")
     for legacy_path in _legacy_save_key_paths():
@@ -136,7 +144,7 @@ def _candidate_save_keys():
     # Signing key imported from cloud restore, so saves created on another
     # machine still verify here.
     try:
-        cloud_key_path = os.path.join(_get_shared_key_dir(), ".cloud_save_key")
+        cloud_key_path = _cloud_imported_key_path()
         if os.path.exists(cloud_key_path):
             with open(cloud_key_path, 'rb') as f:
                 cloud_key = f.read()
@@ -144,69 +152,164 @@ def _candidate_save_keys():
                 keys.append(cloud_key)
     except Exception:
         logging.exception("Suppressed exception")
-    return keys
+    return signing_key, keys
+
+class _SigningKeyRing:
+    """The save signing keys, read once and kept as prepared HMAC objects.
+
+    Signing and verifying used to read every key file from disk each time;
+    now the files are only stat'ed, at most once per `recheck` seconds, and
+    re-read when one was created, removed or changed (mtime or size). Code
+    that writes a key file calls `invalidate` so the next use sees it at once.
+
+    `signer()` and `verifiers()` hand out the prepared objects themselves:
+    callers `.copy()` them before feeding data (the envelope codec does)."""
+
+    def __init__(self, recheck = 1.0):
+        self.recheck = recheck
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._checked = 0.0
+        self._keys = []
+        self._verifiers = []
+        self._signer = None
+        self.loads = 0
+
+    def _files_stamp(self):
+        stamp = []
+        for path in (_get_save_key_path(), *_legacy_save_key_paths(), _cloud_imported_key_path()):
+            try:
+                st = os.stat(path)
+                stamp.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append((path, None, None))
+        return tuple(stamp)
+
+    def _current(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._stamp is not None and now - self._checked < self.recheck:
+                return self._keys, self._verifiers, self._signer
+            stamp = self._files_stamp()
+            if stamp != self._stamp:
+                signing_key, self._keys = _read_save_keys()
+                self._verifiers = [_hmac.new(key, digestmod = _hashlib.sha256) for key in self._keys]
+                self._signer = self._verifiers[0] if signing_key is not None else None
+                self.loads += 1
+                # Reading may have created or adopted the shared key file.
+                stamp = self._files_stamp()
+            self._stamp = stamp
+            self._checked = now
+            return self._keys, self._verifiers, self._signer
+
+    def invalidate(self):
+        with self._lock:
+            self._stamp = None
+
+    def keys(self):
+        """Raw candidate keys, the signing key first."""
+        return list(self._current()[0])
+
+    def verifiers(self):
+        return list(self._current()[1])
+
+    def signer(self):
+        signer = self._current()[2]
+        if signer is None:
+            _get_save_key()  # raises the reason the key is unavailable
+            self.invalidate()
+            signer = self._current()[2]
+        return signer
+
+_key_ring = _SigningKeyRing()
+
+def _candidate_save_keys():
+    return _key_ring.keys()
 
 def _sign_data(payload_str, *, portable = False):
-    key = _PORTABLE_KEY if portable else _get_save_key()
-    return _hmac.new(key, payload_str.encode('utf-8'), _hashlib.sha256).hexdigest()
+    mac = (_PORTABLE_HMAC if portable else _key_ring.signer()).copy()
+    mac.update(payload_str.encode('utf-8'))
+    return mac.hexdigest()
 
 def _verify_signature(payload_str, signature, *, portable = False):
-    if portable:
-        expected = _hmac.new(_PORTABLE_KEY, payload_str.encode('utf-8'), _hashlib.sha256).hexdigest()
-        return _hmac.compare_digest(expected, signature)
-    for key in _candidate_save_keys():
-        expected = _hmac.new(key, payload_str.encode('utf-8'), _hashlib.sha256).hexdigest()
-        if _hmac.compare_digest(expected, signature):
+    payload = payload_str.encode('utf-8')
+    for template in ([_PORTABLE_HMAC] if portable else _key_ring.verifiers()):
+        mac = template.copy()
+        mac.update(payload)
+        if _hmac.compare_digest(mac.hexdigest(), signature):
             return True
     return False
 
+def _replace_signed_file(tmp_path, filepath):
+    for attempt in range(5):
+        try:
+            os.replace(tmp_path, filepath)
+            return
+        except PermissionError:
+            # Windows refuses the swap while another process (a virus scanner,
+            # a cloud client) briefly holds the target open.
+            if attempt == 4:
+                raise
+            time.sleep(0.05 *(attempt +1))
+
 def _signed_json_write(filepath, data, *, binary_mode = False, comment_lines = None, portable = False):
+    # Written to a temp file, fsynced and swapped in, so a crash or a full disk
+    # mid-write leaves the previous file intact instead of a torn one.
+    tmp_path = filepath + ".tmp"
+    if portable:
+        # Transfer files keep the v1 envelope so older installs can import them.
+        _signed_json_write_v1(tmp_path, data, binary_mode = binary_mode, comment_lines = comment_lines)
+    else:
+        with open(tmp_path, 'wb') as f:
+            _envelope.write(f, data, _key_ring.signer(), comment_lines)
+            f.flush()
+            os.fsync(f.fileno())
+    _replace_signed_file(tmp_path, filepath)
+
+def _signed_json_write_v1(tmp_path, data, *, binary_mode = False, comment_lines = None):
     payload_str = json.dumps(data, ensure_ascii = False, sort_keys = True)
-    sig = _sign_data(payload_str, portable = portable)
+    sig = _sign_data(payload_str, portable = True)
     envelope = json.dumps({"_sig": sig, "_data": data}, ensure_ascii = False)
-    encoded = base64.b85encode(envelope.encode('utf-8')).decode('ascii')
+    encoded = _envelope.b85encode(envelope.encode('utf-8')).decode('ascii')
     if binary_mode:
-        with open(filepath, 'wb') as f:
+        with open(tmp_path, 'wb') as f:
             if comment_lines:
                 for cl in comment_lines:
                     line = cl if cl.endswith("\n") else cl + "\n"
                     f.write(line.encode('utf-8'))
             f.write(encoded.encode('ascii'))
+            f.flush()
+            os.fsync(f.fileno())
     else:
-        with open(filepath, 'w', encoding = 'utf-8') as f:
+        with open(tmp_path, 'w', encoding = 'utf-8') as f:
             if comment_lines:
                 for cl in comment_lines:
                     f.write(cl if cl.endswith("\n") else cl + "\n")
             f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
 
 def _signed_json_read(filepath, *, allow_unsigned = False, portable = False):
-    try:
-        with open(filepath, 'r', encoding = 'utf-8') as f:
-            text = f.read()
-    except UnicodeDecodeError:
-        with open(filepath, 'rb') as f:
-            text = f.read().decode('utf-8', errors = 'replace')
-
-    lines = text.splitlines(True)
-    comment_lines = []
-    data_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("//"):
-            comment_lines.append(line)
-        elif stripped == "" and not data_lines:
-            comment_lines.append(line)
-        else:
-            data_lines.append(line)
-    payload = "".join(data_lines).strip()
+    with open(filepath, 'rb') as f:
+        decoded = _envelope.read(f)
+    if decoded.version == 2:
+        keys = [_PORTABLE_HMAC] if portable else _key_ring.verifiers()
+        if not decoded.verify(keys):
+            return None, decoded.comment_lines, "tampered"
+        try:
+            return decoded.data(), decoded.comment_lines, "ok"
+        except (json.JSONDecodeError, ValueError):
+            return None, decoded.comment_lines, "incompatible_format"
+    return _signed_json_read_v1(decoded.payload, decoded.comment_lines, allow_unsigned = allow_unsigned, portable = portable)
 
+def _signed_json_read_v1(payload, comment_lines, *, allow_unsigned = False, portable = False):
     if not payload:
         return None, comment_lines, "incompatible_format"
 
-    # Try base85 decode first (current format)
+    # Try base85 decode first (v1 envelope)
     decoded_json = None
     try:
-        decoded_bytes = base64.b85decode(payload.encode('ascii'))
+        decoded_bytes = _envelope.b85decode(payload.encode('ascii'))
         decoded_json = decoded_bytes.decode('utf-8')
     except Exception:
         logging.exception("Suppressed exception")
@@ -244,6 +347,178 @@ def _signed_json_read(filepath, *, allow_unsigned = False, portable = False):
     else:
         return None, comment_lines, "invalid_structure"
 
+class _SaveManager:
+    """Write-behind writer for save files.
+
+    `submit` marks a file dirty and returns at once, without copying anything;
+    once no further save for that path has arrived for `window` seconds (or
+    `max_delay` after the first one) the job is sealed: the data is copied in
+    one go, on the thread `set_dispatcher` names (the Tk thread, which owns
+    the save dicts), and the worker thread encodes and writes that copy. A
+    burst of saves from combat, reloads or the store costs one copy and one
+    write. A save submitted after its path was sealed is simply sealed and
+    written again, so the last submitted state always reaches the disk.
+
+    `flush` seals and writes pending saves on the calling thread: reads of a
+    path flush it first, and exit and crash handlers flush all. Direct writes
+    of a path run inside `exclusive`."""
+
+    def __init__(self, window = 0.75, max_delay = 3.0):
+        self.window = window
+        self.max_delay = max_delay
+        self._pending = {}    # key -> job holding the live data
+        self._ready = {}      # key -> job holding a sealed copy
+        self._dispatch = None
+        self._sealing = False
+        self._cond = threading.Condition()
+        self._io_lock = threading.RLock()
+        self._thread = None
+        self.stats = {"submitted":0, "written":0, "coalesced":0, "failed":0}
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def set_dispatcher(self, dispatch):
+        """Seal jobs through `dispatch(fn)`, which runs `fn` on the thread that
+        owns the saved data (e.g. `root.after(0, fn)`). Without one the worker
+        seals them itself."""
+        self._dispatch = dispatch
+
+    def submit(self, path, data, writer):
+        """Queue `writer(path, copy)` for a copy of `data` taken when the job is
+        sealed; replaces a pending save of the same path."""
+        now = time.monotonic()
+        with self._cond:
+            key = self._key(path)
+            job = self._pending.get(key)
+            if job is None:
+                self._pending[key]= {"path":path, "data":data, "writer":writer, "first":now, "last":now}
+            else:
+                job.update(path = path, data = data, writer = writer, last = now)
+                self.stats["coalesced"]+=1
+            self.stats["submitted"]+=1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target = self._run, name = "save-writer", daemon = True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self, path = None):
+        with self._cond:
+            if path is None:
+                return bool(self._pending or self._ready)
+            key = self._key(path)
+            return key in self._pending or key in self._ready
+
+    def _due(self):
+        now = time.monotonic()
+        return [k for k, j in self._pending.items()
+        if now -j["last"]>=self.window or now -j["first"]>=self.max_delay]
+
+    def _next_wait(self):
+        now = time.monotonic()
+        return max(0.01, min(min(j["last"]+self.window, j["first"]+self.max_delay)-now
+        for j in self._pending.values()))
+
+    def _seal(self):
+        """Copy the data of the due jobs and hand them to the worker."""
+        # Under the I/O lock, so a flush never sees a job in neither queue.
+        with self._io_lock:
+            with self._cond:
+                self._sealing = False
+                jobs =[self._pending.pop(k)for k in self._due()]
+            for job in jobs:
+                job["data"]= self._snapshot(job["data"])
+            with self._cond:
+                for job in jobs:
+                    self._ready[self._key(job["path"])]= job
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            seal = False
+            with self._cond:
+                while not self._ready:
+                    if self._pending and self._due()and not self._sealing:
+                        self._sealing = seal = True
+                        break
+                    if not self._pending:
+                        self._cond.wait()
+                    else:
+                        self._cond.wait(0.25 if self._sealing else self._next_wait())
+                if not seal:
+                    # Hold the I/O lock from taking a job until it is written, so a
+                    # concurrent flush never overtakes an older copy.
+                    if not self._io_lock.acquire(blocking = False):
+                        self._cond.wait(0.05)
+                        continue
+                    jobs = list(self._ready.values())
+                    self._ready.clear()
+            if seal:
+                try:
+                    self._dispatch(self._seal)
+                except Exception:
+                    # No dispatcher, or its thread is gone (e.g. at exit).
+                    self._seal()
+                continue
+            try:
+                for job in jobs:
+                    self._write(job)
+            finally:
+                self._io_lock.release()
+
+    @staticmethod
+    def _snapshot(data):
+        # Taken when a job is sealed. A combat worker may still resize a nested
+        # dict mid-copy; retry until the copy goes through.
+        for attempt in range(10):
+            try:
+                return json.loads(json.dumps(data, ensure_ascii = False))
+            except RuntimeError:
+                time.sleep(0.01)
+        return json.loads(json.dumps(data, ensure_ascii = False))
+
+    def _write(self, job):
+        try:
+            job["writer"](job["path"], job["data"])
+            self.stats["written"]+=1
+        except Exception:
+            self.stats["failed"]+=1
+            logging.exception(f"Deferred save of {job['path']} failed")
+
+    @contextlib.contextmanager
+    def exclusive(self, path):
+        """For a direct write of `path`: drops its pending save (the direct
+        write supersedes it) and keeps the worker out until the block ends."""
+        with self._io_lock:
+            with self._cond:
+                key = self._key(path)
+                self._pending.pop(key, None)
+                self._ready.pop(key, None)
+            yield
+
+    def flush(self, path = None):
+        """Seal and write pending saves (all, or only `path`) now, on this thread."""
+        with self._io_lock:
+            with self._cond:
+                keys = set(self._pending)|set(self._ready)if path is None else {self._key(path)}
+                # A pending save is newer than a sealed one of the same path.
+                jobs =[(self._pending.pop(key, None), self._ready.pop(key, None))for key in keys]
+            for job, ready in jobs:
+                if job is not None:
+                    job["data"]= self._snapshot(job["data"])
+                    self._write(job)
+                elif ready is not None:
+                    self._write(ready)
+
+_save_manager = _SaveManager()
+
+def flush_pending_saves():
+    try:
+        _save_manager.flush()
+    except Exception:
+        logging.exception("Suppressed exception")
+
 # ============================================================
 # Optional cloud saves (Google Drive)
 # ------------------------------------------------------------
@@ -701,10 +976,14 @@ def _format_bytes(num):
         num /= 1024.0
     return f"{num:.1f} PB"
 
-pygame.init()
+with _startup.phase("pygame and mixer init"):
+    pygame.init()
 
-pygame.mixer.init(channels = 2)
-pygame.mixer.set_num_channels(512)
+    pygame.mixer.init(channels = 2)
+    pygame.mixer.set_num_channels(512)
+    # Channel 0 carries the combat mixer's stream (app/mixer.py). Sound.play() skips it;
+    # pick channels with _find_channel(), pygame's find_channel() does not.
+    pygame.mixer.set_reserved(1)
 
 try:
     import platform as _platform_mod
@@ -1102,6 +1381,7 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     "Uncaught exception",
     exc_info =(exc_type, exc_value, exc_traceback)
     )
+    flush_pending_saves()
     try:
         _app = globals().get("app")
         if _app is not None and hasattr(_app, "_report_exception"):
@@ -1119,6 +1399,7 @@ def _thread_exception_handler(args):
     except Exception:
         logging.exception("Suppressed exception")
     logging.critical("Uncaught thread exception", exc_info =(args.exc_type, args.exc_value, args.exc_traceback))
+    flush_pending_saves()
 
 try:
     threading.excepthook = _thread_exception_handler
@@ -1156,13 +1437,109 @@ except Exception:
         logging.exception("Suppressed exception")
 
 logging.info(f"DOOM Tools, version {version}")
+_startup.mark("foundation: logging and log view")
+
 try:
-    response = requests.get("https://uselessfacts.jsph.pl/random.json?language=en", timeout=5)
-    response.raise_for_status()
-    fact = response.json().get("text", "No fact retrieved")
-    logging.info(f"{fact}")
-except requests.RequestException as e:
-    logging.warning(f"Failed to fetch random fact: {e}")
+    import argparse
+    _net_parser = argparse.ArgumentParser(add_help=False)
+    _net_parser.add_argument('--offline', action='store_true', help='Never touch the network (no table sync, facts or other startup downloads)')
+    _net_parser.add_argument('--table-url', default=None, help='Base URL remote tables are synced from (e.g. a local scripts/table_server.py)')
+    _net_parser.add_argument('--theme-pack-url', default=None, help='URL of the CTkThemesPack zip the theme cache refreshes from')
+    _net_args, _ = _net_parser.parse_known_args()
+    _offline_flag = bool(_net_args.offline)
+    _table_url_override = _net_args.table_url
+    _theme_pack_url_override = _net_args.theme_pack_url
+except Exception:
+    _offline_flag = False
+    _table_url_override = None
+    _theme_pack_url_override = None
+_offline_flag = _offline_flag or os.environ.get("DOOMTOOLS_OFFLINE", "").strip().lower() in("1", "true", "yes")
+_table_url_override = _table_url_override or os.environ.get("DOOMTOOLS_TABLE_URL") or None
+_theme_pack_url_override = _theme_pack_url_override or os.environ.get("DOOMTOOLS_THEME_PACK_URL") or None
+
+def offline_mode():
+    """True when the app must not touch the network: --offline, DOOMTOOLS_OFFLINE=1
+    or the "offline" setting."""
+    if _offline_flag:
+        return True
+    try:
+        return bool(global_variables.get("offline", {}).get("value"))
+    except Exception:
+        return False
+
+class _BackgroundTasks:
+    """Startup work that must not hold up the UI (network checks, downloads).
+
+    Tasks run one at a time, in order, on two daemon threads: one for network
+    tasks and one for local disk work (the sound catalog, the music index), so
+    a slow request never holds up the indexes. Nothing runs before `start()`,
+    which is called once the settings are loaded, so the offline setting is
+    known; network tasks are skipped while offline_mode() is on. Tasks must not touch Tk; results that change what the app is using
+    are staged and applied at a safe point (see _apply_pending_table_updates)."""
+
+    def __init__(self):
+        self._queues = {False:queue.Queue(), True:queue.Queue()}
+        self._started = False
+        self._lock = threading.Lock()
+        self._tasks =[]
+
+    def submit(self, name, fn, network = False):
+        task = {"name":name, "network":network, "state":"queued", "error":None, "seconds":None, "done":threading.Event()}
+        with self._lock:
+            self._tasks.append(task)
+            del self._tasks[:-32]
+        self._queues[bool(network)].put((task, fn))
+        return task
+
+    def start(self):
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(target = self._run, args =(self._queues[False], ), name = "background-tasks", daemon = True).start()
+        threading.Thread(target = self._run, args =(self._queues[True], ), name = "background-tasks-network", daemon = True).start()
+
+    def _run(self, tasks):
+        while True:
+            task, fn = tasks.get()
+            if task["network"]and offline_mode():
+                task["state"]= "skipped (offline)"
+                logging.info(f"Offline mode: skipped {task['name']}")
+                task["done"].set()
+                continue
+            task["state"]= "running"
+            started = time.perf_counter()
+            try:
+                fn()
+                task["state"]= "done"
+            except Exception as e:
+                task["state"]= "failed"
+                task["error"]= str(e)
+                logging.exception(f"Background task {task['name']} failed")
+            finally:
+                task["seconds"]= round(time.perf_counter()-started, 2)
+                task["done"].set()
+
+    def stats(self):
+        with self._lock:
+            tasks = list(self._tasks)
+        states = [t["state"]for t in tasks]
+        return {"queued":states.count("queued"), "running":states.count("running"), "done":states.count("done"),
+        "failed":states.count("failed"), "skipped":sum(1 for st in states if st.startswith("skipped")),
+        "current":next((t["name"]for t in tasks if t["state"]== "running"), None)}
+
+_background_tasks = _BackgroundTasks()
+
+def _log_random_fact():
+    try:
+        response = requests.get("https://uselessfacts.jsph.pl/random.json?language=en", timeout=5)
+        response.raise_for_status()
+        fact = response.json().get("text", "No fact retrieved")
+        logging.info(f"{fact}")
+    except requests.RequestException as e:
+        logging.warning(f"Failed to fetch random fact: {e}")
+
+_background_tasks.submit("random fact", _log_random_fact, network = True)
 
 logging.info("Start system information dump")
 logging.info(f"Platform: {platform.platform()}")
@@ -1208,9 +1585,11 @@ logging.info(f"Available RAM: {round(psutil.virtual_memory().available /(1024 **
 logging.info(f"Python executable: {sys.executable}")
 logging.info(f"Current working directory: {os.getcwd()}")
 logging.info("End system information dump")
+_startup.mark("foundation: system information")
 
 global_variables = {
 "devmode":{"value":False, "forced":False},
+"offline":{"value":False, "forced":False},
 "dmmode":{"value":False, "forced":False},
 "debugmode":{"value":False, "forced":False},
 "current_table":None,
@@ -1240,6 +1619,347 @@ def get_current_table_path():
         return table_files[0]
     return None
 
+import pickle as _pickle
+from app import tablepack as _tablepack
+from app import savepack as _savepack
+from app import roundpack as _roundpack
+from app import backupstore as _backupstore
+from app import savecatalog as _savecatalog
+from app import themepack as _themepack
+from app import soundcatalog as _soundcatalog
+from app import audiocache as _audiocache
+from app import dsp as _dsp
+from app import mixer as _mixer
+from app import musicindex as _musicindex
+
+class _TableCache:
+    """Process-wide cache of parsed table files.
+
+    Entries are keyed by absolute path and validated against the file's
+    mtime/size on every lookup, so an edited or re-synced table is re-parsed
+    on next use. Besides the shared parsed structure, each entry keeps a pickled
+    snapshot so callers that mutate what they load can get a private copy
+    without touching the disk or the JSON parser again.
+
+    A replaced or invalidated entry's compiled table is retired: views still
+    in use (table_data among them) decode what they lack and its sidecar is
+    unmapped, so the sidecar can be rebuilt."""
+
+    def __init__(self):
+        self._entries = {}
+        self._compiling = set()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _entry(self, path):
+        key = os.path.abspath(path)
+        try:
+            sig = self._signature(key)
+        except OSError:
+            with self._lock:
+                self._retire(self._entries.pop(key, None))
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["sig"] == sig:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            self._retire(self._entries.pop(key, None))
+            started = time.perf_counter()
+            compiled = _tablepack.open_compiled(key, rebuild = False)
+            if compiled is not None:
+                # Decoded lazily: by _data() for whole-table readers, or one
+                # subtable at a time through view().
+                data = None
+                source = "mapped"
+            else:
+                with open(key, 'r', encoding = 'utf-8-sig')as f:
+                    data = json.load(f)
+                source = "parsed"
+                self._compile_later(key, sig)
+            entry = {"sig":sig, "data":data, "view":None, "snapshot":None, "derived":{}, "compiled":compiled}
+            self._entries[key]= entry
+            logging.debug(f"Table cache: {source} {os.path.basename(key)} in {(time.perf_counter() - started) * 1000:.1f} ms")
+            return entry
+
+    @staticmethod
+    def _retire(entry):
+        if entry is not None and entry["compiled"]is not None:
+            entry["compiled"].retire()
+
+    def _compile_later(self, key, sig):
+        """Build the sidecar off the UI thread so the next start skips the JSON parse."""
+        if key in self._compiling:
+            return
+        self._compiling.add(key)
+
+        def _worker():
+            try:
+                if self._signature(key) == sig:
+                    _tablepack.compile_table(key)
+            except Exception as e:
+                logging.warning(f"Table cache: could not compile {os.path.basename(key)}: {e}")
+            finally:
+                with self._lock:
+                    self._compiling.discard(key)
+
+        threading.Thread(target = _worker, name = "TableCompile", daemon = True).start()
+
+    def _data(self, entry):
+        with self._lock:
+            if entry["data"] is None:
+                entry["data"]= entry["compiled"].materialize()
+            return entry["data"]
+
+    # Lookups hold the lock from validating an entry to reading it, so the
+    # entry cannot be retired in between.
+
+    def get(self, path):
+        with self._lock:
+            entry = self._entry(path)
+            return self._data(entry)if entry is not None else None
+
+    def view(self, path):
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if entry["view"] is None:
+                entry["view"]= entry["compiled"].view()if entry["compiled"]is not None else self._data(entry)
+            return entry["view"]
+
+    def compiled(self, path):
+        """mmap-backed CompiledTable for the current version of `path`, if one
+        exists. It is closed when the table changes; prefer `view`."""
+        with self._lock:
+            entry = self._entry(path)
+            return entry["compiled"] if entry is not None else None
+
+    def load(self, path):
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if entry["snapshot"] is None:
+                entry["snapshot"]= _pickle.dumps(self._data(entry), protocol = _pickle.HIGHEST_PROTOCOL)
+            snapshot = entry["snapshot"]
+        return _pickle.loads(snapshot)
+
+    def derived(self, path, name, builder):
+        """Value computed by `builder(data)` once per version of the table at `path`."""
+        with self._lock:
+            entry = self._entry(path)
+            if entry is None:
+                return None
+            if name not in entry["derived"]:
+                entry["derived"][name]= builder(self._data(entry))
+            return entry["derived"][name]
+
+    def entry_for_data(self, data):
+        with self._lock:
+            for entry in self._entries.values():
+                if entry["data"] is data or entry["view"] is data:
+                    return entry
+        return None
+
+    def invalidate(self, path = None):
+        with self._lock:
+            if path is None:
+                entries = list(self._entries.values())
+                self._entries.clear()
+            else:
+                entries =[self._entries.pop(os.path.abspath(path), None)]
+            for entry in entries:
+                self._retire(entry)
+
+    def stats(self):
+        with self._lock:
+            compiled = sum(1 for entry in self._entries.values()if entry.get("compiled")is not None)
+            return {"entries":len(self._entries), "compiled":compiled, "hits":self.hits, "misses":self.misses}
+
+_table_cache = _TableCache()
+
+def get_table_data(path = None):
+    """Shared parsed table for `path` (default: the current table).
+
+    The returned structure is shared by every caller and must be treated as
+    read-only; use `load_table_data` when the result will be modified.
+    Returns None when there is no such table; parse errors propagate."""
+    path = path or get_current_table_path()
+    if not path:
+        return None
+    return _table_cache.get(path)
+
+def open_table(path = None):
+    """Shared, read-only table for `path` (default: the current table) whose
+    subtables are decoded only when first read.
+
+    It has the same shape as `get_table_data`'s result, so code that reads
+    `additional_settings` or a single subtable such as `stores` only pays for
+    what it touches. Without a compiled sidecar this is the parsed table."""
+    path = path or get_current_table_path()
+    if not path:
+        return None
+    return _table_cache.view(path)
+
+def load_table_data(path = None):
+    """Private, mutable copy of the table at `path` (default: the current table)."""
+    path = path or get_current_table_path()
+    if not path:
+        return None
+    return _table_cache.load(path)
+
+def get_compiled_table(path = None):
+    """mmap-backed compiled view of the table at `path`, or None when no current
+    sidecar exists yet. Items are decoded individually on first access."""
+    path = path or get_current_table_path()
+    if not path:
+        return None
+    return _table_cache.compiled(path)
+
+def invalidate_table_cache(path = None):
+    _table_cache.invalidate(path)
+
+def _index_key(value):
+    return str(value).strip().lower()
+
+def _index_values(value):
+    if isinstance(value, (list, tuple, set)):
+        return [_index_key(v) for v in value if v is not None and str(v).strip()]
+    if value is None or not str(value).strip():
+        return []
+    return [_index_key(value)]
+
+class _TableIndex:
+    """Lookup maps over one parsed table, built in a single pass.
+
+    Keys for slot, caliber, magazinesystem and platform maps are normalized
+    (stripped, lower-cased) and list-valued fields are indexed under every
+    entry, so callers that need exact matching should still filter the
+    (much shorter) candidate list. Values are the table's own item dicts, and
+    every lookup returns them in table order."""
+
+    FIREARM_TABLES = ("civilian_firearms", "military_firearms", "historical_firearms")
+
+    def __init__(self, table_data):
+        self.by_id = {}
+        self.subtable_of = {}
+        self.by_subtable = {}
+        self.by_slot = {}
+        self.ammo_by_caliber = {}
+        self.magazines_by_caliber = {}
+        self.firearms_by_caliber = {}
+        self.magazines_by_system = {}
+        self.parts_by_platform = {}
+        self._position = {}
+        tables = (table_data or {}).get("tables", {})if isinstance(table_data, dict)else {}
+        if not isinstance(tables, dict):
+            return
+        for subtable, items in tables.items():
+            if not isinstance(items, list):
+                continue
+            bucket = self.by_subtable.setdefault(subtable, [])
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                bucket.append(item)
+                self._position[id(item)]= len(self._position)
+                if "id"in item:
+                    self.by_id[item["id"]]= item
+                    self.subtable_of[item["id"]]= subtable
+                for key in _index_values(item.get("slot")):
+                    self.by_slot.setdefault(key, []).append(item)
+                calibers = _index_values(item.get("caliber"))
+                if subtable =="ammunition":
+                    target = self.ammo_by_caliber
+                elif subtable =="magazines":
+                    target = self.magazines_by_caliber
+                    for key in _index_values(item.get("magazinesystem")):
+                        self.magazines_by_system.setdefault(key, []).append(item)
+                elif item.get("firearm"):
+                    target = self.firearms_by_caliber
+                else:
+                    target = None
+                if target is not None:
+                    for key in calibers:
+                        target.setdefault(key, []).append(item)
+                if subtable =="parts":
+                    for key in _index_values(item.get("platform")):
+                        self.parts_by_platform.setdefault(key, []).append(item)
+
+    def _lookup(self, mapping, value):
+        keys = _index_values(value)
+        if len(keys)==1:
+            return list(mapping.get(keys[0], ()))
+        found = {}
+        for key in keys:
+            for item in mapping.get(key, ()):
+                found[id(item)]= item
+        return sorted(found.values(), key = lambda it:self._position.get(id(it), 0))
+
+    def item(self, item_id, default = None):
+        try:
+            return self.by_id.get(item_id, default)
+        except TypeError:
+            return default
+
+    def items_for_slot(self, slot, subtables = None):
+        items = self._lookup(self.by_slot, slot)
+        if subtables is not None:
+            items = [it for it in items if self.subtable_of.get(it.get("id"))in subtables]
+        return items
+
+    def ammo_for_caliber(self, caliber):
+        return self._lookup(self.ammo_by_caliber, caliber)
+
+    def magazines_for_caliber(self, caliber):
+        return self._lookup(self.magazines_by_caliber, caliber)
+
+    def firearms_for_caliber(self, caliber):
+        return self._lookup(self.firearms_by_caliber, caliber)
+
+    def magazines_for_system(self, magazinesystem):
+        return self._lookup(self.magazines_by_system, magazinesystem)
+
+    def parts_for_platform(self, platform):
+        return self._lookup(self.parts_by_platform, platform)
+
+_private_table_indexes = []
+_private_table_indexes_lock = threading.Lock()
+
+def get_table_index(table = None):
+    """`_TableIndex` for a table path (default: the current table) or an
+    already-loaded table dict. Indexes over cached tables are built once per
+    table version; a private copy from `load_table_data` gets its own index,
+    kept for the last few copies so repeated lookups during one operation
+    (a loot roll, a store restock) don't rebuild it."""
+    if isinstance(table, dict):
+        entry = _table_cache.entry_for_data(table)
+        if entry is not None:
+            with _table_cache._lock:
+                if "index"not in entry["derived"]:
+                    entry["derived"]["index"]= _TableIndex(table)
+                return entry["derived"]["index"]
+        with _private_table_indexes_lock:
+            for data, index in _private_table_indexes:
+                if data is table:
+                    return index
+            index = _TableIndex(table)
+            _private_table_indexes.append((table, index))
+            del _private_table_indexes[:-4]
+            return index
+    path = table or get_current_table_path()
+    if not path:
+        return _TableIndex(None)
+    return _table_cache.derived(path, "index", _TableIndex)or _TableIndex(None)
+
 _currency_cache = {"rates": {}, "last_fetched": 0, "lock": threading.Lock()}
 _table_currency_cache = {"path": None, "mtime": None, "currency": "USD", "lock": threading.Lock()}
 
@@ -1284,8 +2004,7 @@ def _get_table_currency():
                 if _table_currency_cache["path"] == table_path and _table_currency_cache["mtime"] == mtime:
                     return _table_currency_cache["currency"] or 'USD'
             try:
-                with open(table_path, 'r', encoding='utf-8') as tf:
-                    td = json.load(tf)
+                td = open_table(table_path)
                 cur = ((td or {}).get('additional_settings') or {}).get('currency', 'USD') or 'USD'
                 with _table_currency_cache["lock"]:
                     _table_currency_cache["path"] = table_path
@@ -1381,7 +2100,7 @@ def parse_display_price_to_usd(value, default = None, round_to_int = False):
 
     return int(round(usd_amount)) if round_to_int else float(usd_amount)
 
-threading.Thread(target=_fetch_exchange_rates, daemon=True).start()
+_background_tasks.submit("exchange rates", _fetch_exchange_rates, network=True)
 
 # Python 3.13 free-threaded (no-GIL) builds crash with PyEval_RestoreThread(NULL)
 # if daemon threads are alive in C-level blocking calls when the interpreter
@@ -1389,18 +2108,8 @@ threading.Thread(target=_fetch_exchange_rates, daemon=True).start()
 # finalization never reaches the daemon-thread cleanup phase.
 import atexit as _atexit
 _atexit.register(os._exit, 0)
-
-try:
-    tfiles = sorted(glob.glob(os.path.join(os.getcwd(), 'tables', f"*{global_variables.get('table_extension', '.sldtbl')}")))
-    if tfiles:
-        with open(tfiles[0], 'r', encoding = 'utf-8')as _tf:
-            _td = json.load(_tf)
-        globals()['table_data']= _td
-        global_variables['current_table']= os.path.basename(tfiles[0])
-        logging.info(f"Loaded global table_data from {os.path.basename(tfiles[0])}")
-except Exception:
-
-    logging.exception("Suppressed exception")
+# atexit runs handlers last-in first-out, so deferred saves are written before os._exit.
+_atexit.register(flush_pending_saves)
 
 def show_error_dialog(title, message):
 
@@ -1453,8 +2162,7 @@ def show_table_selection_dialog():
         table_info =[]
         for tpath in tfiles:
             try:
-                with open(tpath, 'r', encoding = 'utf-8')as f:
-                    tdata = json.load(f)
+                tdata = open_table(tpath)
                 prettyname = tdata.get('prettyname', os.path.basename(tpath))
                 table_info.append({'path':tpath, 'filename':os.path.basename(tpath), 'prettyname':prettyname})
             except Exception:
@@ -1507,8 +2215,7 @@ def show_table_selection_dialog():
 
         if selected_table[0]:
             try:
-                with open(selected_table[0]['path'], 'r', encoding = 'utf-8')as f:
-                    globals()['table_data']= json.load(f)
+                globals()['table_data']= open_table(selected_table[0]['path'])
                 global_variables['current_table']= selected_table[0]['filename']
                 logging.info(f"User selected table: {selected_table[0]['filename']}")
             except Exception as e:
@@ -1582,49 +2289,119 @@ folders =[
 themes_dir = "themes"
 os.makedirs(themes_dir, exist_ok = True)
 
-tmp_zip = None
-extract_dir = None
+THEME_PACK_URL = "https://github.com/a13xe/CTkThemesPack/archive/refs/heads/main.zip"
+_theme_pack = _themepack.ThemePack(themes_dir, _theme_pack_url_override or THEME_PACK_URL)
 
-try:
-    if not any(os.scandir(themes_dir)):
-        logging.info("Themes folder is empty.Downloading CTkThemesPack...")
-        tmp_zip = "CTkThemesPack.zip"
-        extract_dir = "CTkThemesPack_src"
+def _theme_pack_get(url, headers):
+    response = requests.get(url, headers = headers, timeout = 30)
+    return response.status_code, dict(response.headers), response.content
 
-        response = requests.get("https://github.com/a13xe/CTkThemesPack/archive/refs/heads/main.zip", timeout = 30)
-        response.raise_for_status()
-        with open(tmp_zip, "wb")as f:
-            f.write(response.content)
-
-        os.makedirs(extract_dir, exist_ok = True)
-        import pathlib as _pathlib
-        _extract_dest = _pathlib.Path(extract_dir).resolve()
-        with zipfile.ZipFile(tmp_zip, "r")as zip_ref:
-            for member in zip_ref.infolist():
-                member_target = (_extract_dest / member.filename).resolve()
-                if not str(member_target).startswith(str(_extract_dest)):
-                    raise ValueError(f"Zip slip detected: {member.filename}")
-                zip_ref.extract(member, extract_dir)
-
-        extracted_roots =[d for d in os.listdir(extract_dir)if os.path.isdir(os.path.join(extract_dir, d))]
-        if extracted_roots:
-            src_theme_dir = os.path.join(extract_dir, extracted_roots[0], "themes")
-            if os.path.isdir(src_theme_dir):
-                for entry in os.listdir(src_theme_dir):
-                    src_path = os.path.join(src_theme_dir, entry)
-                    dst_path = os.path.join(themes_dir, entry)
-                    if os.path.isdir(src_path):
-                        shutil.copytree(src_path, dst_path, dirs_exist_ok = True)
-                    else:
-                        shutil.copy2(src_path, dst_path)
-                logging.info("Themes downloaded and installed successfully.")
-            else:
-                logging.warning("No 'themes' directory found in downloaded package.")
-        else:
-            logging.warning("Failed to locate extracted CTkThemesPack directory.")
+def _refresh_theme_pack():
+    result = _theme_pack.refresh(_theme_pack_get)
+    if result == "updated":
+        logging.info("New themes are available in Settings.")
 
+try:
+    _theme_pack.install_cached()
 except Exception as e:
-    logging.error(f"Failed to populate themes: {e}")
+    logging.error(f"Failed to restore themes from the theme pack cache: {e}")
+_background_tasks.submit("theme pack refresh", _refresh_theme_pack, network = True)
+
+_sound_catalog = _soundcatalog.SoundCatalog("sounds")
+_background_tasks.submit("sound catalog", _sound_catalog.warm)
+
+AUDIO_CACHE_BUDGET_MB = 192
+
+def _decoded_sound_bytes(sound):
+    """Memory a decoded pygame Sound (or a samples array) holds, from its
+    length and the mixer format."""
+    if hasattr(sound, "nbytes"):
+        return int(sound.nbytes)
+    freq, fmt, channels = pygame.mixer.get_init()or(44100, -16, 2)
+    return int(sound.get_length()*freq *channels *(abs(fmt)//8))
+
+try:
+    _audio_cache_budget_mb = float(os.environ.get("DOOMTOOLS_AUDIO_CACHE_MB")or AUDIO_CACHE_BUDGET_MB)
+except ValueError:
+    _audio_cache_budget_mb = AUDIO_CACHE_BUDGET_MB
+_audio_cache = _audiocache.AudioCache(_audio_cache_budget_mb *1024 *1024, pygame.mixer.Sound, _decoded_sound_bytes)
+_dsp_variants = _dsp.VariantRenderer(
+_audio_cache,
+lambda sound:pygame.sndarray.array(sound),
+lambda samples:pygame.sndarray.make_sound(np.ascontiguousarray(samples)),
+lambda:(pygame.mixer.get_init()or(44100, ))[0],
+)
+
+COMBAT_MIXER_CHANNEL = 0
+
+_forced_channel = COMBAT_MIXER_CHANNEL
+
+def _find_channel(force = False):
+    """pygame.mixer.find_channel(force) that never returns the combat mixer's
+    channel: set_reserved() only keeps Sound.play() off it. Forcing takes the
+    other channels in turn."""
+    global _forced_channel
+    count = pygame.mixer.get_num_channels()
+    for i in range(COMBAT_MIXER_CHANNEL +1, count):
+        channel = pygame.mixer.Channel(i)
+        if not channel.get_busy():
+            return channel
+    if not force or count <=COMBAT_MIXER_CHANNEL +1:
+        return None
+    _forced_channel = _forced_channel +1 if _forced_channel +1 <count else COMBAT_MIXER_CHANNEL +1
+    return pygame.mixer.Channel(_forced_channel)
+
+def _mixer_samples(key):
+    """float32 (frames, channels) samples of the sound `key` (a path or a
+    rendered variant's key), cached next to the decoded sound."""
+    def _load():
+        sound = _audio_cache.get(key)if isinstance(key, str)else _audio_cache.peek(key)
+        if sound is None:
+            raise KeyError(key)
+        samples = pygame.sndarray.array(sound).astype(np.float32)
+        return samples.reshape(samples.shape[0], -1)
+    return _audio_cache.get((key, "samples", ()), _load)
+
+_combat_mixer = _mixer.Mixer(
+_mixer_samples,
+lambda:pygame.mixer.Channel(COMBAT_MIXER_CHANNEL),
+lambda samples:pygame.sndarray.make_sound(samples),
+pygame.mixer.get_init,
+)
+
+def _probe_music_track(path):
+    """Duration, artist and title of a music file. mutagen reads them from the
+    headers; the file is decoded with pygame only when mutagen has no length."""
+    meta = {}
+    try:
+        from mutagen._file import File as MutagenFile
+        mf = MutagenFile(path)
+        if mf is not None:
+            meta["duration"]= getattr(getattr(mf, "info", None), "length", None)
+            tags = getattr(mf, "tags", {})or {}
+            def _get_tag(keys):
+                for k in keys:
+                    v = tags.get(k)
+                    if v:
+                        try:
+                            if isinstance(v, (list, tuple)):
+                                return str(v[0])
+                            return str(v)
+                        except Exception:
+                            return str(v)
+                return None
+            meta["artist"]= _get_tag(["artist", "ARTIST", "TPE1", "IART"])
+            meta["title"]= _get_tag(["title", "TITLE", "TIT2", "INAM"])
+    except ImportError:
+        pass
+    except Exception:
+        logging.exception("Suppressed exception")
+    if not meta.get("duration"):
+        meta["duration"]= pygame.mixer.Sound(path).get_length()
+    return meta
+
+_music_index = _musicindex.MusicIndex(os.path.join("sounds", "music"), _probe_music_track)
+_background_tasks.submit("music index", _music_index.warm)
 
 ide_indicators =[
 'PYCHARM_HOSTED',
@@ -1789,48 +2566,67 @@ try:
 except Exception as e:
     logging.warning(f"Failed to load global settings: {e}")
 
-def _sync_remote_table():
+_REMOTE_TABLE_BASE = "https://raw.githubusercontent.com/soli-dstate/DOOM-Tools/master/tables/"
+PENDING_TABLE_SUFFIX = ".pending"
+
+def _parse_table_version(value):
     try:
-        def _parse_table_version(value):
-            try:
-                parts = re.findall(r"\d+", str(value))
-                return tuple(int(part)for part in parts)
-            except Exception:
-                return ()
-
-        def _pad_version_parts(left, right):
-            left_parts = list(left)
-            right_parts = list(right)
-            length = max(len(left_parts), len(right_parts))
-            while len(left_parts)<length:
-                left_parts.append(0)
-            while len(right_parts)<length:
-                right_parts.append(0)
-            return tuple(left_parts), tuple(right_parts)
+        parts = re.findall(r"\d+", str(value))
+        return tuple(int(part)for part in parts)
+    except Exception:
+        return ()
+
+def _pad_version_parts(left, right):
+    left_parts = list(left)
+    right_parts = list(right)
+    length = max(len(left_parts), len(right_parts))
+    while len(left_parts)<length:
+        left_parts.append(0)
+    while len(right_parts)<length:
+        right_parts.append(0)
+    return tuple(left_parts), tuple(right_parts)
+
+def _table_text_version(text):
+    """(version string, parts) of a table's JSON text, or ("0.0.0", ()) when unreadable."""
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            version = data.get("version", "0.0.0")
+            return version, _parse_table_version(version)
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        logging.warning(f"Failed to parse table JSON for version check: {e}")
+    return "0.0.0", ()
+
+def _sync_target_table():
+    local_tables = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
+    if not local_tables:
+        return None
+    cur_tbl = global_variables.get("current_table")
+    if cur_tbl:
+        for table_file in local_tables:
+            if os.path.abspath(table_file).endswith(cur_tbl)or os.path.basename(table_file)==cur_tbl:
+                return table_file
+    return local_tables[0]
 
+def _sync_remote_table():
+    """Check the remote copy of the current table and stage a newer, verified one
+    as tables/<name>.pending. Runs as a background task; the table in use is
+    never touched here (see _apply_pending_table_updates)."""
+    try:
         table_dir = os.path.join(os.getcwd(), "tables")
         if not os.path.isdir(table_dir):
             logging.info("No tables directory present; skipping remote table sync")
             return
 
-        local_tables = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
-        if not local_tables:
+        target_local = _sync_target_table()
+        if not target_local:
             logging.info("No local table files found; skipping remote table sync")
             return
 
-        target_local = None
-        cur_tbl = global_variables.get("current_table")
-        if cur_tbl:
-            for table_file in local_tables:
-                if os.path.abspath(table_file).endswith(cur_tbl)or os.path.basename(table_file)==cur_tbl:
-                    target_local = table_file
-                    break
-
-        if not target_local:
-            target_local = local_tables[0]
-
         basename = os.path.basename(target_local)
-        raw_base = "https://raw.githubusercontent.com/soli-dstate/DOOM-Tools/master/tables/"
+        raw_base = _table_url_override or _REMOTE_TABLE_BASE
+        if not raw_base.endswith("/"):
+            raw_base += "/"
         remote_url = raw_base + basename
 
         logging.info(f"Checking remote table for updates: {remote_url}")
@@ -1841,14 +2637,12 @@ def _sync_remote_table():
 
         remote_text = resp.text
 
-        import hashlib as _hl
         hash_url = raw_base + basename + ".sha256"
         try:
             hash_resp = requests.get(hash_url, timeout = 15, verify = True)
             if hash_resp.status_code == 200:
-                import hmac as _hmac
                 expected_hash = hash_resp.text.strip().split()[0].lower()
-                actual_hash = _hl.sha256(resp.content).hexdigest().lower()
+                actual_hash = _hashlib.sha256(resp.content).hexdigest().lower()
                 if not _hmac.compare_digest(actual_hash, expected_hash):
                     logging.error(f"Remote table integrity check failed for {remote_url} (expected {expected_hash}, got {actual_hash})")
                     return
@@ -1861,7 +2655,7 @@ def _sync_remote_table():
         try:
             remote_data = json.loads(remote_text)
         except (json.JSONDecodeError, ValueError):
-            logging.error("Remote table is not valid JSON — refusing to overwrite local table")
+            logging.error("Remote table is not valid JSON — refusing to stage it")
             return
 
         remote_version = remote_data.get("version", "0.0.0")if isinstance(remote_data, dict)else "0.0.0"
@@ -1874,56 +2668,94 @@ def _sync_remote_table():
             logging.warning(f"Failed to read local table {target_local}: {e}")
             local_text = None
 
-        local_version = "0.0.0"
-        local_version_parts = ()
-        if local_text is not None:
-            try:
-                local_data = json.loads(local_text)
-                if isinstance(local_data, dict):
-                    local_version = local_data.get("version", "0.0.0")
-                    local_version_parts = _parse_table_version(local_version)
-            except (json.JSONDecodeError, ValueError) as e:
-                logging.warning(f"Failed to parse local table JSON for version check: {e}")
-
+        local_version, local_version_parts = _table_text_version(local_text)if local_text is not None else("0.0.0", ())
         local_version_parts, remote_version_parts = _pad_version_parts(local_version_parts, remote_version_parts)
 
-        if remote_version_parts <=local_version_parts:
+        if remote_version_parts <=local_version_parts or local_text == remote_text:
             if local_text is not None and local_text !=remote_text:
                 logging.info(f"Remote table version {remote_version} is not newer than local version {local_version}; skipping update")
             else:
                 logging.info("Local table matches remote; no update needed")
             return
 
-        if local_text is None or local_text !=remote_text:
-            if global_variables.get("devmode", {}).get("value", False):
-                logging.info("Devmode enabled: remote table differs but will not replace local file")
-                return
+        pending_path = target_local + PENDING_TABLE_SUFFIX
+        tmp_path = pending_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding = 'utf-8')as f:
+                f.write(remote_text)
+            os.replace(tmp_path, pending_path)
+            logging.info(f"Staged newer remote table version {remote_version} (local is {local_version}): {pending_path}; it is applied on next launch")
+        except Exception as e:
+            logging.error(f"Failed to stage remote table update: {e}")
+    except Exception as e:
+        logging.error(f"Error during remote table sync: {e}")
 
-            name_root, _ = os.path.splitext(basename)
-            backup_name = name_root + ".backup"
-            backup_path = os.path.join(table_dir, backup_name)
+def _apply_pending_table_updates():
+    """Move staged remote tables (tables/*.pending) into place, backing up the
+    table they replace. Called at startup before the global table_data is
+    opened, which is the one point where swapping a table cannot pull it out
+    from under a loaded character or a live table view."""
+    applied =[]
+    for pending_path in sorted(glob.glob(os.path.join("tables", "*" + PENDING_TABLE_SUFFIX))):
+        target_local = pending_path[:-len(PENDING_TABLE_SUFFIX)]
+        try:
+            with open(pending_path, 'r', encoding = 'utf-8')as f:
+                remote_text = f.read()
+            remote_data = json.loads(remote_text)
+            remote_version, remote_parts = _table_text_version(remote_text)
+            local_version = "0.0.0"
+            if os.path.exists(target_local):
+                with open(target_local, 'r', encoding = 'utf-8')as f:
+                    local_version, local_parts = _table_text_version(f.read())
+                local_parts, remote_parts = _pad_version_parts(local_parts, remote_parts)
+                if remote_parts <=local_parts:
+                    logging.info(f"Discarding staged table {pending_path}: version {remote_version} is not newer than {local_version}")
+                    os.remove(pending_path)
+                    continue
+                name_root, _ = os.path.splitext(os.path.basename(target_local))
+                backup_path = os.path.join(os.path.dirname(target_local), name_root + ".backup")
+                shutil.copy2(target_local, backup_path)
+                logging.info(f"Backed up local table {target_local} -> {backup_path}")
+            os.replace(pending_path, target_local)
+            logging.info(f"Applied staged remote table version {remote_version} (local was {local_version}): {target_local}")
+            invalidate_table_cache(target_local)
             try:
-                if os.path.exists(target_local):
-                    shutil.move(target_local, backup_path)
-                    logging.info(f"Backed up local table {target_local} -> {backup_path}")
-
-                with open(target_local, 'w', encoding = 'utf-8')as f:
-                    f.write(remote_text)
-                logging.info(f"Replaced local table with newer remote version {remote_version} (local was {local_version}): {target_local}")
+                _tablepack.compile_table(target_local, table_data = remote_data)
             except Exception as e:
-                logging.error(f"Failed to replace local table with remote version: {e}")
-        else:
-            logging.info("Local table matches remote; no update needed")
-    except Exception as e:
-        logging.error(f"Error during remote table sync: {e}")
+                logging.warning(f"Failed to compile synced table {target_local}: {e}")
+            applied.append(target_local)
+        except Exception as e:
+            logging.error(f"Failed to apply staged table {pending_path}: {e}")
+    return applied
 
 if not global_variables.get("devmode", {}).get("value", False):
-    logging.info("Remote table sync active, syncing...")
-    _sync_remote_table()
-    logging.info("Remote table sync complete.")
+    _apply_pending_table_updates()
+    if offline_mode():
+        logging.info("Offline mode: remote table sync and other network tasks are disabled.")
+    else:
+        logging.info("Remote table sync queued in the background.")
+    _background_tasks.submit("remote table sync", _sync_remote_table, network = True)
 else:
     logging.info("Remote table sync active, skipped due to devmode.")
 
+# Read only after the staged updates above are in place, so this session
+# starts on the new table and no view of the replaced one is in use.
+try:
+    tfiles = sorted(glob.glob(os.path.join(os.getcwd(), 'tables', f"*{global_variables.get('table_extension', '.sldtbl')}")))
+    if tfiles:
+        _td = open_table(tfiles[0])
+        globals()['table_data']= _td
+        # Settings loaded above may already name the table in use.
+        if not global_variables.get('current_table'):
+            global_variables['current_table']= os.path.basename(tfiles[0])
+        logging.info(f"Loaded global table_data from {os.path.basename(tfiles[0])}")
+except Exception:
+
+    logging.exception("Suppressed exception")
+
+_background_tasks.start()
+_startup.mark("foundation: settings and table sync")
+
 def _platforms_compatible(fplat, tplat, secondary=None):
     try:
         lf = str(fplat).strip().lower() if fplat is not None else ""
@@ -1956,818 +2788,560 @@ def _platforms_compatible(fplat, tplat, secondary=None):
         return False
 
 
-def validate_table_ids(secondary_platform=None):
+TABLE_VALIDATION_CACHE_NAME = "table_validation.json"
+# Bump when a check changes so cached results from older builds are discarded.
+_TABLE_VALIDATION_VERSION = 1
+_table_validation_lock = threading.Lock()
+_table_validation_deferred = False
 
-    tables_dir = "tables"
+def _table_validation_cache_path():
+    return os.path.join(saves_folder or "saves", TABLE_VALIDATION_CACHE_NAME)
+
+def _read_table_validation_cache():
+    try:
+        with open(_table_validation_cache_path(), 'r', encoding = 'utf-8')as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable table validation cache: {e}")
+        return {}
+    if not isinstance(cache, dict)or cache.get("version")!=_TABLE_VALIDATION_VERSION:
+        return {}
+    return cache
+
+def _write_table_validation_cache(cache):
+    path = _table_validation_cache_path()
+    tmp_path = path +".tmp"
+    try:
+        with open(tmp_path, 'w', encoding = 'utf-8')as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logging.warning(f"Failed to write table validation cache: {e}")
+
+def _table_content_hash(table_path):
+    h = _hashlib.sha256()
+    with open(table_path, 'rb')as f:
+        for chunk in iter(lambda:f.read(1 <<20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _table_validation_fingerprint(hashes, secondary_platform):
+    """Identity of one complete validation run: every table's content plus the options."""
+    return _hashlib.sha256(json.dumps([sorted(hashes.items()), secondary_platform]).encode('utf-8')).hexdigest()
+
+def _list_validation_tables(tables_dir):
     if not os.path.isdir(tables_dir):
-        logging.warning(f"Tables directory '{tables_dir}' not found, skipping validation.")
-        return
+        return None
+    return[f for f in os.listdir(tables_dir)if f.endswith(".sldtbl") or f.endswith(".disabled")]
 
-    table_files =[f for f in os.listdir(tables_dir)if f.endswith(".sldtbl") or f.endswith(".disabled")]
-    if not table_files:
-        logging.info("No table files found to validate.")
-        return
+def _validate_table_file(table_file, table_data, secondary_platform=None):
+    """Run every check that only needs `table_file` itself.
 
-    disabled_files = {f for f in table_files if f.endswith(".disabled")}
+    The result is plain JSON so validate_table_ids can cache it by content
+    hash: error messages per category, the log lines to replay, and the
+    summaries its cross-table checks need (IDs, ammunition present, firearm
+    ammunition references and weapon platforms)."""
+    log_lines =[]
 
-    global_id_map = {}
+    def _log(level, msg, highlight = None):
+        if highlight is None:
+            logging.log(level, msg)
+        else:
+            log_with_colored_substring(logging.getLogger(), level, msg, highlight, 'blue')
+        log_lines.append([level, msg, highlight])
 
     magazine_errors =[]
-    magazine_errors_details =[]
-    magazine_errors_files =[]
+    ammo_errors =[]
     table_sequence_errors =[]
     table_sequence_details =[]
-    table_sequence_errors_files =[]
-    ammo_errors =[]
-    ammo_errors_details =[]
-    ammo_errors_files =[]
-    sound_warnings =[]
-
-    referenced_slots = set()
-    referenced_slots_by_table = {}
-    table_pretty_names = {}
-    all_table_items =[]
-    table_hardcore = {}
-
-    for table_file in sorted(table_files):
-        table_path = os.path.join(tables_dir, table_file)
-        try:
-            with open(table_path, 'r', encoding = 'utf-8')as f:
-                table_data = json.load(f)
-
-            table_name = table_data.get("prettyname", table_file)
-            try:
-                table_pretty_names[table_file]= table_name
-            except Exception:
-                logging.exception("Suppressed exception")
-            tables = table_data.get("tables", {})
+    hardcore_errors =[]
 
-            try:
-                table_hardcore[table_file]= bool((table_data.get('additional_settings')or {}).get('hardcore_mode'))
-            except Exception:
-                table_hardcore[table_file]= False
+    table_name = table_data.get("prettyname", table_file)
+    tables = table_data.get("tables", {})
+    table_hardcore = bool((table_data.get('additional_settings')or {}).get('hardcore_mode'))
 
-            try:
-                magazine_items =[]
-                clip_items = []
-                if isinstance(tables, dict):
-                    magazine_items = tables.get("magazines", [])or[]
-                    clip_items = [m for m in magazine_items if isinstance(m, dict) and m.get("clip_type") and not m.get("firearm")]
-
-                magazine_systems = set()
-                for mag in magazine_items:
-                    if isinstance(mag, dict):
-                        ms = mag.get("magazinesystem")
-                        if ms is None:
-                            continue
-                        if isinstance(ms, list):
-                            for m in ms:
-                                magazine_systems.add(str(m))
-                        else:
-                            magazine_systems.add(str(ms))
+    try:
+        magazine_items =[]
+        clip_items = []
+        if isinstance(tables, dict):
+            magazine_items = tables.get("magazines", [])or[]
+            clip_items = [m for m in magazine_items if isinstance(m, dict) and m.get("clip_type") and not m.get("firearm")]
+
+        magazine_systems = set()
+        for mag in magazine_items:
+            if isinstance(mag, dict):
+                ms = mag.get("magazinesystem")
+                if ms is None:
+                    continue
+                if isinstance(ms, list):
+                    for m in ms:
+                        magazine_systems.add(str(m))
+                else:
+                    magazine_systems.add(str(ms))
 
-                for subtable_name_check, items_check in tables.items():
-                    if not isinstance(items_check, list):
-                        continue
-                    for item_check in items_check:
-                        if not isinstance(item_check, dict):
-                            continue
-                        mag_type_check = str(item_check.get("magazinetype", "") or "").strip().lower()
-                        subtype_check = str(item_check.get("subtype", "") or "").strip().lower()
-                        is_musket = subtype_check == "musket" or "muzzle" in mag_type_check
-                        is_en_bloc = "en bloc" in mag_type_check
-                        item_calibers = set()
-                        for _cal_source in (item_check.get("musket_caliber"), item_check.get("caliber")):
-                            if isinstance(_cal_source, list):
-                                for _cal in _cal_source:
-                                    if _cal is not None and str(_cal).strip():
-                                        item_calibers.add(str(_cal).strip().lower())
-                            elif _cal_source is not None and str(_cal_source).strip():
-                                item_calibers.add(str(_cal_source).strip().lower())
-
-                        if is_musket:
-                            if not item_calibers:
-                                msg = f"Table '{table_name}': Musket '{item_check.get('name')}'(ID {item_check.get('id')}) is missing 'musket_caliber' or 'caliber'"
-                                ammo_errors.append(msg)
-                                ammo_errors_files.append(table_file)
-                            if "muzzle" not in mag_type_check:
-                                msg = f"Table '{table_name}': Musket '{item_check.get('name')}'(ID {item_check.get('id')}) must use a muzzle-loading magazinetype"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-
-                        if item_check.get('accepts_clips'):
-                            clip_type = str(item_check.get('clip_type') or '').strip()
-                            if not clip_type:
-                                msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has 'accepts_clips' but is missing 'clip_type'"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                            try:
-                                clip_cap = int(item_check.get('capacity', 0) or 0)
-                            except Exception:
-                                clip_cap = 0
-                            if 'detachable box' not in mag_type_check and clip_cap <= 0:
-                                msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has 'accepts_clips' but is missing a positive 'capacity'"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                            if clip_type:
-                                compatible_clip_found = False
-                                for clip_item in clip_items:
-                                    if str(clip_item.get('clip_type') or '').strip() != clip_type:
-                                        continue
-                                    clip_cal_raw = clip_item.get('caliber')
-                                    clip_calibers = set()
-                                    if isinstance(clip_cal_raw, list):
-                                        for _clip_cal in clip_cal_raw:
-                                            if _clip_cal is not None and str(_clip_cal).strip():
-                                                clip_calibers.add(str(_clip_cal).strip().lower())
-                                    elif clip_cal_raw is not None and str(clip_cal_raw).strip():
-                                        clip_calibers.add(str(clip_cal_raw).strip().lower())
-                                    if item_calibers and clip_calibers and not item_calibers.intersection(clip_calibers):
-                                        continue
-                                    compatible_clip_found = True
-                                    break
-                                if not compatible_clip_found:
-                                    msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) requires clip type '{clip_type}' but no compatible clip item exists in the magazines table"
-                                    magazine_errors.append(msg)
-                                    magazine_errors_files.append(table_file)
-
-                        if is_en_bloc:
-                            f_ms = item_check.get('magazinesystem')
-                            if f_ms is None or (isinstance(f_ms, str) and not f_ms.strip()):
-                                msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) missing 'magazinesystem' field"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                            try:
-                                en_bloc_cap = int(item_check.get('capacity', 0) or 0)
-                            except Exception:
-                                en_bloc_cap = 0
-                            if en_bloc_cap <= 0:
-                                msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) is missing a positive 'capacity'"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                            if 'bolt_catch' not in item_check:
-                                msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) is missing 'bolt_catch'"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                            needed_en_bloc = [str(f_ms)] if f_ms is not None and not isinstance(f_ms, list) else [str(n) for n in (f_ms or []) if str(n).strip()]
-                            if needed_en_bloc:
-                                compatible_en_bloc = False
-                                for mag in magazine_items:
-                                    if not isinstance(mag, dict) or mag.get('firearm'):
-                                        continue
-                                    ms = mag.get('magazinesystem')
-                                    mag_system_values = [str(ms)] if ms is not None and not isinstance(ms, list) else [str(n) for n in (ms or []) if str(n).strip()]
-                                    if not any(n in mag_system_values for n in needed_en_bloc):
-                                        continue
-                                    mag_cal_raw = mag.get('caliber')
-                                    mag_calibers = set()
-                                    if isinstance(mag_cal_raw, list):
-                                        for _mag_cal in mag_cal_raw:
-                                            if _mag_cal is not None and str(_mag_cal).strip():
-                                                mag_calibers.add(str(_mag_cal).strip().lower())
-                                    elif mag_cal_raw is not None and str(mag_cal_raw).strip():
-                                        mag_calibers.add(str(mag_cal_raw).strip().lower())
-                                    if item_calibers and mag_calibers and not item_calibers.intersection(mag_calibers):
-                                        continue
-                                    compatible_en_bloc = True
-                                    break
-                                if not compatible_en_bloc:
-                                    msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has no compatible en-bloc clip item for magazinesystem(s): {needed_en_bloc}"
-                                    magazine_errors.append(msg)
-                                    magazine_errors_files.append(table_file)
-
-                        if item_check.get("firearm")and str(item_check.get("magazinetype", "")).lower()=="detachable box":
-                            f_ms = item_check.get("magazinesystem")
-                            friendly = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')})"
-
-                            if item_check.get('has_magazine_in_pool')is False:
+        for subtable_name_check, items_check in tables.items():
+            if not isinstance(items_check, list):
+                continue
+            for item_check in items_check:
+                if not isinstance(item_check, dict):
+                    continue
+                mag_type_check = str(item_check.get("magazinetype", "") or "").strip().lower()
+                subtype_check = str(item_check.get("subtype", "") or "").strip().lower()
+                is_musket = subtype_check == "musket" or "muzzle" in mag_type_check
+                is_en_bloc = "en bloc" in mag_type_check
+                item_calibers = set()
+                for _cal_source in (item_check.get("musket_caliber"), item_check.get("caliber")):
+                    if isinstance(_cal_source, list):
+                        for _cal in _cal_source:
+                            if _cal is not None and str(_cal).strip():
+                                item_calibers.add(str(_cal).strip().lower())
+                    elif _cal_source is not None and str(_cal_source).strip():
+                        item_calibers.add(str(_cal_source).strip().lower())
+
+                if is_musket:
+                    if not item_calibers:
+                        msg = f"Table '{table_name}': Musket '{item_check.get('name')}'(ID {item_check.get('id')}) is missing 'musket_caliber' or 'caliber'"
+                        ammo_errors.append(msg)
+                    if "muzzle" not in mag_type_check:
+                        msg = f"Table '{table_name}': Musket '{item_check.get('name')}'(ID {item_check.get('id')}) must use a muzzle-loading magazinetype"
+                        magazine_errors.append(msg)
+
+                if item_check.get('accepts_clips'):
+                    clip_type = str(item_check.get('clip_type') or '').strip()
+                    if not clip_type:
+                        msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has 'accepts_clips' but is missing 'clip_type'"
+                        magazine_errors.append(msg)
+                    try:
+                        clip_cap = int(item_check.get('capacity', 0) or 0)
+                    except Exception:
+                        clip_cap = 0
+                    if 'detachable box' not in mag_type_check and clip_cap <= 0:
+                        msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has 'accepts_clips' but is missing a positive 'capacity'"
+                        magazine_errors.append(msg)
+                    if clip_type:
+                        compatible_clip_found = False
+                        for clip_item in clip_items:
+                            if str(clip_item.get('clip_type') or '').strip() != clip_type:
                                 continue
-
-                            if f_ms is None:
-                                msg = f"{friendly} missing 'magazinesystem' field"
-                                logging.error(msg)
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                                try:
-                                    magazine_errors_details.append({'table':table_name, 'weapon':item_check, 'reason':'missing_magazinesystem', 'message':msg})
-                                except Exception:
-                                    logging.exception("Suppressed exception")
+                            clip_cal_raw = clip_item.get('caliber')
+                            clip_calibers = set()
+                            if isinstance(clip_cal_raw, list):
+                                for _clip_cal in clip_cal_raw:
+                                    if _clip_cal is not None and str(_clip_cal).strip():
+                                        clip_calibers.add(str(_clip_cal).strip().lower())
+                            elif clip_cal_raw is not None and str(clip_cal_raw).strip():
+                                clip_calibers.add(str(clip_cal_raw).strip().lower())
+                            if item_calibers and clip_calibers and not item_calibers.intersection(clip_calibers):
                                 continue
+                            compatible_clip_found = True
+                            break
+                        if not compatible_clip_found:
+                            msg = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')}) requires clip type '{clip_type}' but no compatible clip item exists in the magazines table"
+                            magazine_errors.append(msg)
+
+                if is_en_bloc:
+                    f_ms = item_check.get('magazinesystem')
+                    if f_ms is None or (isinstance(f_ms, str) and not f_ms.strip()):
+                        msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) missing 'magazinesystem' field"
+                        magazine_errors.append(msg)
+                    try:
+                        en_bloc_cap = int(item_check.get('capacity', 0) or 0)
+                    except Exception:
+                        en_bloc_cap = 0
+                    if en_bloc_cap <= 0:
+                        msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) is missing a positive 'capacity'"
+                        magazine_errors.append(msg)
+                    if 'bolt_catch' not in item_check:
+                        msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) is missing 'bolt_catch'"
+                        magazine_errors.append(msg)
+                    needed_en_bloc = [str(f_ms)] if f_ms is not None and not isinstance(f_ms, list) else [str(n) for n in (f_ms or []) if str(n).strip()]
+                    if needed_en_bloc:
+                        compatible_en_bloc = False
+                        for mag in magazine_items:
+                            if not isinstance(mag, dict) or mag.get('firearm'):
+                                continue
+                            ms = mag.get('magazinesystem')
+                            mag_system_values = [str(ms)] if ms is not None and not isinstance(ms, list) else [str(n) for n in (ms or []) if str(n).strip()]
+                            if not any(n in mag_system_values for n in needed_en_bloc):
+                                continue
+                            mag_cal_raw = mag.get('caliber')
+                            mag_calibers = set()
+                            if isinstance(mag_cal_raw, list):
+                                for _mag_cal in mag_cal_raw:
+                                    if _mag_cal is not None and str(_mag_cal).strip():
+                                        mag_calibers.add(str(_mag_cal).strip().lower())
+                            elif mag_cal_raw is not None and str(mag_cal_raw).strip():
+                                mag_calibers.add(str(mag_cal_raw).strip().lower())
+                            if item_calibers and mag_calibers and not item_calibers.intersection(mag_calibers):
+                                continue
+                            compatible_en_bloc = True
+                            break
+                        if not compatible_en_bloc:
+                            msg = f"Table '{table_name}': En-bloc firearm '{item_check.get('name')}'(ID {item_check.get('id')}) has no compatible en-bloc clip item for magazinesystem(s): {needed_en_bloc}"
+                            magazine_errors.append(msg)
 
-                            needed =[f_ms]if not isinstance(f_ms, list)else f_ms
-
-                            needed =[str(n)for n in needed]
-                            compatible = any(n in magazine_systems for n in needed)
-                            if not compatible:
-                                msg = f"{friendly} has no magazines matching magazinesystem(s): {needed}"
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                                try:
-                                    magazine_errors_details.append({'table':table_name, 'weapon':item_check, 'reason':'no_compatible_magazines', 'message':msg})
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-
-                        if item_check.get("firearm")and item_check.get("dualfeed")and item_check.get("submagazinesystem"):
-                            sub_ms = item_check.get("submagazinesystem")
-                            friendly = f"Table '{table_name}': Dualfeed firearm '{item_check.get('name')}'(ID {item_check.get('id')})"
-                            sub_needed =[sub_ms]if not isinstance(sub_ms, list)else sub_ms
-                            sub_needed =[str(n)for n in sub_needed]
-                            sub_compatible = any(n in magazine_systems for n in sub_needed)
-                            if not sub_compatible:
-                                msg = f"{friendly} has no magazines matching submagazinesystem(s): {sub_needed}"
-                                logging.warning(msg)
-                                magazine_errors.append(msg)
-                                magazine_errors_files.append(table_file)
-                                try:
-                                    magazine_errors_details.append({'table':table_name, 'weapon':item_check, 'reason':'no_compatible_submagazines', 'message':msg})
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-            except Exception as e:
-                logging.warning(f"Failed to perform magazine compatibility check for '{table_file}': {e}")
-
-            file_ids =[]
-
-            for subtable_name, items in tables.items():
-                if not isinstance(items, list):
-                    continue
-                for idx, item in enumerate(items):
-                    if isinstance(item, dict)and "id"in item:
-                        item_id = item["id"]
-                        file_ids.append(item_id)
-
-                        entry =(table_file, subtable_name, item.get("name")or f"index_{idx}")
-                        global_id_map.setdefault(item_id, []).append(entry)
-
-                    if isinstance(item, dict):
-                        all_table_items.append((item, table_file, subtable_name))
-
-                        try:
-                            accs = item.get('accessories')or[]
-                            if isinstance(accs, list):
-                                for a in accs:
-                                    if isinstance(a, dict)and a.get('slot'):
-                                                slot_name = str(a.get('slot')).strip()
-                                                referenced_slots.add(slot_name)
-                                                try:
-                                                    referenced_slots_by_table.setdefault(table_file, set()).add(slot_name)
-                                                except Exception:
-                                                    logging.exception("Suppressed exception")
-                        except Exception:
-                            logging.exception("Suppressed exception")
-
-                        try:
-                            subs = item.get('subslots')or[]
-                            if isinstance(subs, list):
-                                for s in subs:
-                                    if isinstance(s, dict)and s.get('slot'):
-                                        slot_name = str(s.get('slot')).strip()
-                                        referenced_slots.add(slot_name)
-                                        try:
-                                            referenced_slots_by_table.setdefault(table_file, set()).add(slot_name)
-                                        except Exception:
-                                            logging.exception("Suppressed exception")
-                        except Exception:
-                            logging.exception("Suppressed exception")
+                if item_check.get("firearm")and str(item_check.get("magazinetype", "")).lower()=="detachable box":
+                    f_ms = item_check.get("magazinesystem")
+                    friendly = f"Table '{table_name}': Firearm '{item_check.get('name')}'(ID {item_check.get('id')})"
 
-            if not file_ids:
-                logging.info(f"Table '{table_name}': No items with IDs found.")
-                continue
+                    if item_check.get('has_magazine_in_pool')is False:
+                        continue
 
-            file_ids.sort()
-            min_id = file_ids[0]
-            max_id = file_ids[-1]
-            next_id = max_id +1
+                    if f_ms is None:
+                        msg = f"{friendly} missing 'magazinesystem' field"
+                        _log(logging.ERROR, msg)
+                        magazine_errors.append(msg)
+                        continue
 
-            expected_ids = set(range(min_id, max_id +1))
-            actual_ids = set(file_ids)
-            if expected_ids ==actual_ids:
-                plain = f"Table '{table_name}': IDs valid(sequential from {min_id} to {max_id}).Next ID: {next_id}"
-                log_with_colored_substring(logging.getLogger(), logging.INFO, plain, str(next_id), 'blue')
-            else:
-                missing_ids = sorted(expected_ids -actual_ids)
+                    needed =[f_ms]if not isinstance(f_ms, list)else f_ms
+
+                    needed =[str(n)for n in needed]
+                    compatible = any(n in magazine_systems for n in needed)
+                    if not compatible:
+                        msg = f"{friendly} has no magazines matching magazinesystem(s): {needed}"
+                        magazine_errors.append(msg)
+
+                if item_check.get("firearm")and item_check.get("dualfeed")and item_check.get("submagazinesystem"):
+                    sub_ms = item_check.get("submagazinesystem")
+                    friendly = f"Table '{table_name}': Dualfeed firearm '{item_check.get('name')}'(ID {item_check.get('id')})"
+                    sub_needed =[sub_ms]if not isinstance(sub_ms, list)else sub_ms
+                    sub_needed =[str(n)for n in sub_needed]
+                    sub_compatible = any(n in magazine_systems for n in sub_needed)
+                    if not sub_compatible:
+                        msg = f"{friendly} has no magazines matching submagazinesystem(s): {sub_needed}"
+                        _log(logging.WARNING, msg)
+                        magazine_errors.append(msg)
+    except Exception as e:
+        logging.warning(f"Failed to perform magazine compatibility check for '{table_file}': {e}")
 
-                logging.error(f"Table '{table_name}': ID sequence broken(details collected for dialog).")
+    id_locations = {}
+    table_items =[]
+    referenced_slots = set()
+    for subtable_name, items in tables.items():
+        if not isinstance(items, list):
+            continue
+        for idx, item in enumerate(items):
+            if isinstance(item, dict)and "id"in item:
+                id_locations.setdefault(item["id"], []).append([table_file, subtable_name, item.get("name")or f"index_{idx}"])
 
-                try:
-                    file_entries =[]
-                    for iid in sorted(actual_ids):
-                        locs = global_id_map.get(iid, [])
-                        for f, sub, name in locs:
-                            if f ==table_file:
-                                file_entries.append((iid, sub, name))
-                                break
-                    suggested_lines =[]
-                    new_id = min_id
-                    for old_id, sub, name in file_entries:
-                        if old_id !=new_id:
-                            suggested_lines.append(f"Change ID {old_id}({sub}:{name}) -> {new_id}")
-                        new_id +=1
-                except Exception:
-                    suggested_lines =["Unable to build suggested ID changes."]
-
-                id_msg_lines =[
-                f"Table: {table_name}",
-                "ID sequence broken:",
-                f" Missing IDs: {missing_ids}",
-                f" Last ID: {max_id}",
-                f" Next ID: {next_id}",
-                ]
-                if suggested_lines:
-                    id_msg_lines.append("")
-                    id_msg_lines.append("Suggested changes to fix IDs:")
-                    id_msg_lines.extend([f" {l}"for l in suggested_lines])
-
-                seq_msg = "\n".join(id_msg_lines)
-                table_sequence_errors.append(seq_msg)
-                table_sequence_errors_files.append(table_file)
-                try:
-                    table_sequence_details.append({'table':table_name, 'missing_ids':missing_ids, 'last_id':max_id, 'next_id':next_id, 'suggested_changes':suggested_lines})
-                except Exception:
-                    table_sequence_details.append({'table':table_name, 'message':seq_msg})
-                logging.error("Table '%s': ID sequence error detected(collected, continuing checks).", table_name)
+            if isinstance(item, dict):
+                table_items.append((item, subtable_name))
 
-        except Exception as e:
-            logging.error(f"Failed to validate table '{table_file}': {e}")
+                for key in('accessories', 'subslots'):
+                    try:
+                        slots = item.get(key)or[]
+                        if isinstance(slots, list):
+                            for s in slots:
+                                if isinstance(s, dict)and s.get('slot'):
+                                    referenced_slots.add(str(s.get('slot')).strip())
+                    except Exception:
+                        logging.exception("Suppressed exception")
 
-    ammo_names_present = set()
-    ammo_calibers_present = set()
-    try:
-        for item, tf, sub in all_table_items:
-            try:
-                if isinstance(sub, str)and sub.lower()in('ammunition', 'ammo'):
-                    name = item.get('name')
-                    if name:
-                        ammo_names_present.add(str(name).strip().lower())
-                    for calib_src in (item.get('caliber'), item.get('musket_caliber')):
-                        if isinstance(calib_src, list):
-                            for calib in calib_src:
-                                if calib is not None and str(calib).strip():
-                                    ammo_calibers_present.add(str(calib).strip().lower())
-                        elif calib_src is not None and str(calib_src).strip():
-                            ammo_calibers_present.add(str(calib_src).strip().lower())
-            except Exception:
-                logging.exception("Suppressed exception")
-                continue
-    except Exception:
-        logging.exception("Suppressed exception")
+    file_ids = sorted(iid for iid, locs in id_locations.items()for _ in locs)
+    if not file_ids:
+        _log(logging.INFO, f"Table '{table_name}': No items with IDs found.")
+    else:
+        min_id = file_ids[0]
+        max_id = file_ids[-1]
+        next_id = max_id +1
+
+        expected_ids = set(range(min_id, max_id +1))
+        actual_ids = set(file_ids)
+        if expected_ids ==actual_ids:
+            plain = f"Table '{table_name}': IDs valid(sequential from {min_id} to {max_id}).Next ID: {next_id}"
+            _log(logging.INFO, plain, str(next_id))
+        else:
+            missing_ids = sorted(expected_ids -actual_ids)
 
-    hardcore_errors =[]
-    hardcore_errors_details =[]
-    hardcore_errors_files =[]
-    try:
-        import copy as _copy
+            _log(logging.ERROR, f"Table '{table_name}': ID sequence broken(details collected for dialog).")
 
-        id_to_item_by_table = {}
-        for it, tf, sub in all_table_items:
             try:
-                if isinstance(it, dict)and 'id'in it:
-                    if tf not in id_to_item_by_table:
-                        id_to_item_by_table[tf]= {}
-                    id_to_item_by_table[tf][it['id']]= it
+                file_entries =[]
+                for iid in sorted(actual_ids):
+                    _f, sub, name = id_locations[iid][0]
+                    file_entries.append((iid, sub, name))
+                suggested_lines =[]
+                new_id = min_id
+                for old_id, sub, name in file_entries:
+                    if old_id !=new_id:
+                        suggested_lines.append(f"Change ID {old_id}({sub}:{name}) -> {new_id}")
+                    new_id +=1
             except Exception:
-                logging.exception("Suppressed exception")
+                suggested_lines =["Unable to build suggested ID changes."]
+
+            id_msg_lines =[
+            f"Table: {table_name}",
+            "ID sequence broken:",
+            f" Missing IDs: {missing_ids}",
+            f" Last ID: {max_id}",
+            f" Next ID: {next_id}",
+            ]
+            if suggested_lines:
+                id_msg_lines.append("")
+                id_msg_lines.append("Suggested changes to fix IDs:")
+                id_msg_lines.extend([f" {l}"for l in suggested_lines])
+
+            seq_msg = "\n".join(id_msg_lines)
+            table_sequence_errors.append(seq_msg)
+            table_sequence_details.append({'table':table_name, 'missing_ids':missing_ids, 'last_id':max_id, 'next_id':next_id, 'suggested_changes':suggested_lines})
+            _log(logging.ERROR, f"Table '{table_name}': ID sequence error detected(collected, continuing checks).")
 
+    ammo_names_present = set()
+    ammo_calibers_present = set()
+    firearm_ammo_refs =[]
+    weapon_platforms =[]
+    for item, sub in table_items:
         try:
-            for item, tf, sub in all_table_items:
-                try:
-                    if not isinstance(item, dict):
-                        continue
-                    if not table_hardcore.get(tf):
-                        continue
-                    if not item.get('firearm'):
-                        continue
-
-                    fname = item.get('name')or '<unnamed>'
-                    fplat = item.get('platform')or ''
-                    parts = item.get('parts')or[]
-                    for p in parts:
-                        try:
-                            if not isinstance(p, dict):
-                                continue
-                            cur = p.get('current')
-                            if cur is None:
-                                continue
-
-                            target_id = None
-                            if isinstance(cur, int):
-                                target_id = cur
-                            elif isinstance(cur, dict)and 'id'in cur:
-                                target_id = cur.get('id')
-
-                            if target_id is None or(isinstance(target_id, str)and str(target_id).strip().lower()=='null'):
-                                msg = f"Table '{table_pretty_names.get(tf, tf)}': Firearm '{fname}' has part '{p.get('name')}' with invalid 'current' id: {target_id}"
-                                hardcore_errors.append(msg)
-                                hardcore_errors_files.append(tf)
-                                try:
-                                    hardcore_errors_details.append({'table':tf, 'weapon':item, 'part':p, 'reason':'invalid_part_current_id', 'id':target_id})
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-                                continue
-
-                            table_id_map = id_to_item_by_table.get(tf, {})
-                            if target_id not in table_id_map:
-                                msg = f"Table '{table_pretty_names.get(tf, tf)}': Firearm '{fname}' has part '{p.get('name')}' referencing missing item ID {target_id}"
-                                hardcore_errors.append(msg)
-                                hardcore_errors_files.append(tf)
-                                try:
-                                    hardcore_errors_details.append({'table':tf, 'weapon':item, 'part':p, 'reason':'missing_referenced_part', 'id':target_id})
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-                                continue
-
-                            target = table_id_map.get(target_id)or {}
-                            tplat =(target.get('platform')or '')
-                            try:
-                                # Use per-item secondary_platform when available
-                                item_secondary = item.get('secondary_platform') if isinstance(item, dict) else None
-                                item_secondary = item_secondary or secondary_platform
-                                if str(fplat).strip() and str(tplat).strip() and not _platforms_compatible(fplat, tplat, item_secondary):
-                                    msg = f"Table '{table_pretty_names.get(tf, tf)}': Firearm '{fname}' part '{p.get('name')}' references item ID {target_id} with platform '{tplat}' which does not match firearm platform '{fplat}'"
-                                    hardcore_errors.append(msg)
-                                    hardcore_errors_files.append(tf)
-                                    try:
-                                        hardcore_errors_details.append({'table':tf, 'weapon':item, 'part':p, 'reason':'platform_mismatch', 'weapon_platform':fplat, 'part_platform':tplat, 'id':target_id})
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
-                            except Exception:
-                                logging.exception("Suppressed exception")
-                        except Exception:
-                            logging.exception("Suppressed exception")
-                except Exception:
-                    logging.exception("Suppressed exception")
+            if isinstance(sub, str)and sub.lower()in('ammunition', 'ammo'):
+                name = item.get('name')
+                if name:
+                    ammo_names_present.add(str(name).strip().lower())
+                for calib_src in (item.get('caliber'), item.get('musket_caliber')):
+                    if isinstance(calib_src, list):
+                        for calib in calib_src:
+                            if calib is not None and str(calib).strip():
+                                ammo_calibers_present.add(str(calib).strip().lower())
+                    elif calib_src is not None and str(calib_src).strip():
+                        ammo_calibers_present.add(str(calib_src).strip().lower())
+            if item.get('firearm'):
+                calib = item.get('musket_caliber') or item.get('caliber')
+                ammo_type = item.get('ammo_type')or item.get('ammunition')
+                if calib or ammo_type:
+                    firearm_ammo_refs.append([item.get('name')or '<unnamed>', calib if isinstance(calib, list) else ([calib] if calib else []), str(ammo_type) if ammo_type else None])
+                if item.get('platform') and not item.get('ignore_weaponsound_in_log'):
+                    weapon_platforms.append([item.get('name'), str(item.get('platform'))])
         except Exception:
             logging.exception("Suppressed exception")
+            continue
 
-        def _resolve_current(obj, id_map):
-            if not isinstance(obj, dict):
-                return
+    if table_hardcore:
+        id_to_item = {it['id']:it for it, sub in table_items if 'id'in it}
+        for item, sub in table_items:
+            try:
+                if not item.get('firearm'):
+                    continue
 
-            accs = obj.get('accessories')or[]
-            if isinstance(accs, list):
-                for acc in accs:
+                fname = item.get('name')or '<unnamed>'
+                fplat = item.get('platform')or ''
+                parts = item.get('parts')or[]
+                for p in parts:
                     try:
-                        cur = acc.get('current')
+                        if not isinstance(p, dict):
+                            continue
+                        cur = p.get('current')
                         if cur is None:
                             continue
 
                         target_id = None
-                        sub_attachment = None
-                        overrides = {}
-
                         if isinstance(cur, int):
                             target_id = cur
                         elif isinstance(cur, dict)and 'id'in cur:
                             target_id = cur.get('id')
-                            sub_attachment = cur.get('sub_attachment')
-                            for k, v in cur.items():
-                                if k not in('id', 'sub_attachment'):
-                                    overrides[k]= v
-
-                        if target_id is None:
-
-                            if isinstance(cur, dict):
-                                _resolve_current(cur, id_map)
-                            continue
-
-                        target = id_map.get(target_id)
-                        if not target:
-                            continue
-
-                        # Skip resolving to obvious ammunition/magazine entries when
-                        # resolving accessories/parts. Ammo entries commonly have
-                        # a 'caliber' field and lack 'type'/'slot', which indicates
-                        # an ID collision rather than a valid part.
-                        try:
-                            if isinstance(target, dict) and 'caliber' in target and not target.get('type') and not target.get('slot'):
-                                continue
-                        except Exception:
-                            logging.exception("Suppressed exception")
-
-                        new_installed = _copy.deepcopy(target)
-
-                        for k, v in overrides.items():
-                            try:
-                                new_installed[k]= v
-                            except Exception:
-                                logging.exception("Suppressed exception")
-
-                        acc['current']= new_installed
-
-                        if sub_attachment:
-                            sub_target = id_map.get(sub_attachment)
-                            # don't place ammo into subslots
-                            try:
-                                if isinstance(sub_target, dict) and 'caliber' in sub_target and not sub_target.get('type') and not sub_target.get('slot'):
-                                    sub_target = None
-                            except Exception:
-                                logging.exception("Suppressed exception")
-                            if sub_target and isinstance(new_installed.get('subslots'), list):
-                                placed = False
-                                for ss in new_installed['subslots']:
-                                    try:
-                                        ss_slot = ss.get('slot')
-                                        if ss_slot ==sub_target.get('slot')or ss.get('current')is None:
-                                            ss['current']= _copy.deepcopy(sub_target)
-                                            placed = True
-                                            break
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
-                                if not placed:
-                                    try:
-                                        new_installed['subslots'][0]['current']= _copy.deepcopy(sub_target)
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
-
-                        try:
-                            _resolve_current(new_installed, id_map)
-                        except Exception:
-                            logging.exception("Suppressed exception")
-                    except Exception:
-                        logging.exception("Suppressed exception")
 
-            subs = obj.get('subslots')or[]
-            if isinstance(subs, list):
-                for s in subs:
-                    try:
-                        cur = s.get('current')
-                        if cur is None:
+                        if target_id is None or(isinstance(target_id, str)and str(target_id).strip().lower()=='null'):
+                            hardcore_errors.append(f"Table '{table_name}': Firearm '{fname}' has part '{p.get('name')}' with invalid 'current' id: {target_id}")
                             continue
-                        if isinstance(cur, int)or(isinstance(cur, dict)and 'id'in cur):
 
-                            tmp = {'accessories':[{'current':cur}]}
-                            _resolve_current(tmp, id_map)
-
-                            try:
-                                s['current']= tmp['accessories'][0].get('current')
-                            except Exception:
-                                logging.exception("Suppressed exception")
-                        elif isinstance(cur, dict):
-                            _resolve_current(cur, id_map)
-                    except Exception:
-                        logging.exception("Suppressed exception")
-
-            parts_list = obj.get('parts')or[]
-            if isinstance(parts_list, list):
-                for p in parts_list:
-                    try:
-                        if not isinstance(p, dict):
-                            continue
-                        cur = p.get('current')
-                        if cur is None:
-                            continue
-                        target_id = None
-                        overrides = {}
-                        if isinstance(cur, int):
-                            target_id = cur
-                        elif isinstance(cur, dict)and 'id'in cur and 'name'not in cur:
-                            target_id = cur.get('id')
-                            for k, v in cur.items():
-                                if k != 'id':
-                                    overrides[k]= v
-                        if target_id is None:
-                            continue
-                        target = id_map.get(target_id)
-                        if not target:
+                        if target_id not in id_to_item:
+                            hardcore_errors.append(f"Table '{table_name}': Firearm '{fname}' has part '{p.get('name')}' referencing missing item ID {target_id}")
                             continue
 
-                        try:
-                            if isinstance(target, dict) and 'caliber' in target and not target.get('type') and not target.get('slot'):
-                                continue
-                        except Exception:
-                            logging.exception("Suppressed exception")
-
-                        import copy as _copy_p
-                        new_part = _copy_p.deepcopy(target)
-                        for k, v in overrides.items():
-                            try:
-                                new_part[k]= v
-                            except Exception:
-                                logging.exception("Suppressed exception")
-                        p['current']= new_part
+                        target = id_to_item.get(target_id)or {}
+                        tplat =(target.get('platform')or '')
+                        # Use per-item secondary_platform when available
+                        item_secondary = item.get('secondary_platform')or secondary_platform
+                        if str(fplat).strip() and str(tplat).strip() and not _platforms_compatible(fplat, tplat, item_secondary):
+                            hardcore_errors.append(f"Table '{table_name}': Firearm '{fname}' part '{p.get('name')}' references item ID {target_id} with platform '{tplat}' which does not match firearm platform '{fplat}'")
                     except Exception:
                         logging.exception("Suppressed exception")
-
-        for item, tf, sub in all_table_items:
-            try:
-                _resolve_current(item, id_to_item_by_table.get(tf, {}))
             except Exception:
                 logging.exception("Suppressed exception")
-    except Exception:
-        logging.exception("Suppressed exception")
-
-    try:
-        for item, tf, sub in all_table_items:
-            try:
-                if not isinstance(item, dict):
-                    continue
-                if item.get('firearm'):
-                    name = item.get('name')or '<unnamed>'
-
-                    calib = item.get('musket_caliber') or item.get('caliber')
-                    if calib:
-                        calibs = calib if isinstance(calib, list) else [calib]
-                        missing = [c for c in calibs if str(c).strip().lower() not in ammo_calibers_present]
-                        if missing:
-                            msg = f"Firearm '{name}' in table '{tf}' references caliber '{missing}' but no ammunition with that caliber found."
-                            ammo_errors.append(msg)
-                            ammo_errors_files.append(tf)
-                            try:
-                                ammo_errors_details.append({'table':tf, 'weapon':item, 'reason':'missing_ammo_caliber', 'caliber':missing})
-                            except Exception:
-                                logging.exception("Suppressed exception")
-
-                    ammo_type = item.get('ammo_type')or item.get('ammunition')
-                    if ammo_type:
-                        if str(ammo_type).strip().lower()not in ammo_names_present:
-                            msg = f"Firearm '{name}' in table '{tf}' references ammunition '{ammo_type}' but no matching ammunition entry found."
-                            ammo_errors.append(msg)
-                            ammo_errors_files.append(tf)
-                            try:
-                                ammo_errors_details.append({'table':tf, 'weapon':item, 'reason':'missing_ammo_name', 'ammo':ammo_type})
-                            except Exception:
-                                logging.exception("Suppressed exception")
-            except Exception:
-                logging.exception("Suppressed exception")
-                continue
-    except Exception:
-        logging.exception("Suppressed exception")
-
-    duplicates = {}
-    for item_id, locations in global_id_map.items():
-        by_file = {}
-        for f, sub, name in locations:
-            by_file.setdefault(f, []).append((f, sub, name))
-        for file_locs in by_file.values():
-            if len(file_locs)>1:
-                duplicates.setdefault(item_id, []).extend(file_locs)
-    duplicate_errors =[]
-    duplicate_errors_files =[]
-
-    duplicate_suggestions =[]
-    if duplicates:
-        for dup_id, locations in duplicates.items():
-            loc_str = "; ".join([f"{f}:{sub}:{name}"for f, sub, name in locations])
-            msg = f"Duplicate ID detected: {dup_id} used in: {loc_str}"
-            duplicate_errors.append(msg)
-            duplicate_errors_files.append(locations[0][0] if locations else '')
-            try:
-
-                max_id = max(global_id_map.keys())if global_id_map else dup_id
-                for idx, (f, sub, name)in enumerate(locations):
-                    if idx ==0:
-
-                        continue
-                    max_id +=1
-                    duplicate_suggestions.append(f"Change ID {dup_id}({f}:{sub}:{name}) -> {max_id}")
-            except Exception:
-                duplicate_suggestions.append(f"Unable to suggest fixes for duplicate ID {dup_id}.")
-
-    try:
-        missing_slots =[]
 
+    def item_matches_slot(item, slot_name):
         try:
-            sound_root = os.path.join('sounds', 'firearms', 'weaponsounds')
-            for item, tf, sub in all_table_items:
-                try:
-                    if not isinstance(item, dict):
-                        continue
-                    if not item.get('firearm'):
-                        continue
-                    if item.get('ignore_weaponsound_in_log'):
-                        continue
-                    plat = item.get('platform')
-                    if not plat:
-                        continue
-                    plat_key = str(plat).strip().lower().replace('/', '_')
-                    if not plat_key:
-                        continue
-                    folder = os.path.join(sound_root, plat_key)
-                    if not os.path.isdir(folder):
-                        msg = f"Table '{table_pretty_names.get(tf, tf)}': Firearm '{item.get('name')}' platform '{plat}' missing weaponsound folder '{folder}'"
-                        logging.warning(msg)
-                        sound_warnings.append(msg)
-                except Exception:
-                    logging.exception("Suppressed exception")
+            for v in item.values():
+                if isinstance(v, str)and v.strip().lower()==slot_name.lower():
+                    return True
+                if isinstance(v, (list, tuple)):
+                    for e in v:
+                        if isinstance(e, str)and e.strip().lower()==slot_name.lower():
+                            return True
         except Exception:
             logging.exception("Suppressed exception")
+        return False
 
-        def item_matches_slot(item, slot_name):
-            try:
-                if isinstance(item, (list, tuple))and item:
-                    item = item[0]
-                if not isinstance(item, dict):
-                    return False
+    for slot in sorted(referenced_slots):
+        if slot.strip().lower()=='weapon_slot':
+            continue
+        if not any(item_matches_slot(it, slot)for it, sub in table_items):
+            _log(logging.WARNING, f"Table '{table_name}' references slot '{slot}' but no items are available in that table to populate it.")
 
-                for v in item.values():
-                    if isinstance(v, str)and v.strip().lower()==slot_name.lower():
-                        return True
-                    if isinstance(v, (list, tuple)):
-                        for e in v:
-                            try:
-                                if isinstance(e, str)and e.strip().lower()==slot_name.lower():
-                                    return True
-                            except Exception:
-                                logging.exception("Suppressed exception")
-                                continue
+    try:
+        stores_sc = tables.get("stores", []) or []
+        store_item_ids = set()
+        store_table_names = set()
+        for store_sc in stores_sc:
+            if not isinstance(store_sc, dict):
+                continue
+            for inv_entry in store_sc.get("inventory", []) or []:
+                if not isinstance(inv_entry, dict):
+                    continue
+                if inv_entry.get("type") == "table":
+                    tname = inv_entry.get("table")
+                    if tname:
+                        store_table_names.add(tname)
+                elif inv_entry.get("type") == "id":
+                    iid = inv_entry.get("id")
+                    if iid is not None:
+                        store_item_ids.add(iid)
+        if stores_sc:
+            for item_sc, sub_name in table_items:
+                in_store = sub_name in store_table_names or item_sc.get("id") in store_item_ids
+                if in_store and not item_sc.get("shop_category"):
+                    item_name_sc = item_sc.get("name") or f"ID {item_sc.get('id', '?')}"
+                    _log(logging.WARNING, f"Table '{table_name}': Item '{item_name_sc}' in subtable '{sub_name}' is referenced by a store but missing 'shop_category' field.")
+    except Exception:
+        logging.exception("Suppressed exception")
 
-                if isinstance(item.get('slot'), str)and item.get('slot').strip().lower()==slot_name.lower():
-                    return True
-            except Exception:
-                logging.exception("Suppressed exception")
-            return False
+    skip_subtables = {
+        'stores', 'armories', 'businesses', 'settings', 'additional_settings',
+        'lootcrates', 'enemyloot', 'loot_crates', 'enemy_loot'
+    }
+    for item_cat, sub_cat in table_items:
+        if sub_cat and str(sub_cat).lower() in skip_subtables:
+            continue
+        if not item_cat.get("armory_category") and not item_cat.get("shop_category"):
+            item_name_cat = item_cat.get("name") or f"ID {item_cat.get('id', '?')}"
+            _log(logging.WARNING, f"Table '{table_name}': Item '{item_name_cat}' in subtable '{sub_cat}' is missing both 'armory_category' and 'shop_category' fields.")
+
+    return {
+    "pretty_name":table_name,
+    "errors":{"magazine":magazine_errors, "ammo":ammo_errors, "sequence":table_sequence_errors, "hardcore":hardcore_errors},
+    "sequence_details":table_sequence_details,
+    "log":log_lines,
+    "duplicates":[[iid, locs]for iid, locs in id_locations.items()if len(locs)>1],
+    "max_id":max((iid for iid in id_locations if isinstance(iid, (int, float))), default = None),
+    "ammo_names":sorted(ammo_names_present),
+    "ammo_calibers":sorted(ammo_calibers_present),
+    "firearm_ammo":firearm_ammo_refs,
+    "weapon_platforms":weapon_platforms,
+    }
 
-        for table_file, slots in referenced_slots_by_table.items():
-            try:
-                if not slots:
-                    continue
-                table_pretty = None
-                try:
+def validate_table_ids(secondary_platform=None):
+    """Validate every table, reusing cached per-table results for tables whose
+    content hash is unchanged. Aborts startup (SystemExit) on errors in an
+    enabled table, as before."""
 
-                    table_pretty = None
-                except Exception:
-                    table_pretty = None
+    tables_dir = "tables"
+    table_files = _list_validation_tables(tables_dir)
+    if table_files is None:
+        logging.warning(f"Tables directory '{tables_dir}' not found, skipping validation.")
+        return
+    if not table_files:
+        logging.info("No table files found to validate.")
+        return
 
-                for slot in sorted(slots):
-                    try:
-                        if isinstance(slot, str)and slot.strip().lower()=='weapon_slot':
-                            continue
-                    except Exception:
-                        logging.exception("Suppressed exception")
+    with _table_validation_lock:
+        _validate_table_files(tables_dir, sorted(table_files), secondary_platform)
 
-                    found = any(item_matches_slot(it, slot)for it, tf, sub in all_table_items if tf ==table_file)
-                    if not found:
+def _validate_table_files(tables_dir, table_files, secondary_platform):
+    disabled_files = {f for f in table_files if f.endswith(".disabled")}
+    cache = _read_table_validation_cache()
+    cached_results = cache.get("tables")if isinstance(cache.get("tables"), dict)else {}
 
-                        display_table = table_pretty_names.get(table_file, table_file)
-                        logging.warning(f"Table '{display_table}' references slot '{slot}' but no items are available in that table to populate it.")
-            except Exception:
-                logging.exception("Suppressed exception")
-    except Exception:
-        logging.exception("Suppressed exception")
+    results = {}
+    hashes = {}
+    revalidated = 0
+    for table_file in table_files:
+        table_path = os.path.join(tables_dir, table_file)
+        try:
+            content_hash = _table_content_hash(table_path)
+            cached = cached_results.get(table_file)
+            if isinstance(cached, dict)and cached.get("sha256")==content_hash and cached.get("secondary_platform")==secondary_platform:
+                result = cached["result"]
+                for level, msg, highlight in result.get("log", []):
+                    if highlight is None:
+                        logging.log(level, msg)
+                    else:
+                        log_with_colored_substring(logging.getLogger(), level, msg, highlight, 'blue')
+            else:
+                result = _validate_table_file(table_file, get_table_data(table_path), secondary_platform)
+                revalidated +=1
+            hashes[table_file]= content_hash
+            results[table_file]= result
+        except Exception as e:
+            logging.error(f"Failed to validate table '{table_file}': {e}")
+    logging.info(f"Table validation: {revalidated} of {len(table_files)} table(s) re-validated, the rest reused from cache.")
 
-    try:
-        for table_file in sorted(table_files):
+    duplicate_errors =[]
+    duplicate_errors_files =[]
+    duplicate_suggestions =[]
+    magazine_errors =[]
+    magazine_errors_files =[]
+    ammo_errors =[]
+    ammo_errors_files =[]
+    table_sequence_errors =[]
+    table_sequence_errors_files =[]
+    table_sequence_details =[]
+    hardcore_errors =[]
+    hardcore_errors_files =[]
+    for table_file, result in results.items():
+        errors = result.get("errors", {})
+        magazine_errors.extend(errors.get("magazine", []))
+        magazine_errors_files.extend([table_file]*len(errors.get("magazine", [])))
+        ammo_errors.extend(errors.get("ammo", []))
+        ammo_errors_files.extend([table_file]*len(errors.get("ammo", [])))
+        table_sequence_errors.extend(errors.get("sequence", []))
+        table_sequence_errors_files.extend([table_file]*len(errors.get("sequence", [])))
+        table_sequence_details.extend(result.get("sequence_details", []))
+        hardcore_errors.extend(errors.get("hardcore", []))
+        hardcore_errors_files.extend([table_file]*len(errors.get("hardcore", [])))
+
+    ids_max =[r.get("max_id")for r in results.values()if r.get("max_id")is not None]
+    for table_file, result in results.items():
+        for dup_id, locations in result.get("duplicates", []):
+            loc_str = "; ".join([f"{f}:{sub}:{name}"for f, sub, name in locations])
+            duplicate_errors.append(f"Duplicate ID detected: {dup_id} used in: {loc_str}")
+            duplicate_errors_files.append(table_file)
             try:
-                table_path_sc = os.path.join(tables_dir, table_file)
-                with open(table_path_sc, 'r', encoding = 'utf-8') as f_sc:
-                    table_data_sc = json.load(f_sc)
-                tables_sc = table_data_sc.get("tables", {})
-                stores_sc = tables_sc.get("stores", []) or []
-                if not stores_sc:
-                    continue
-                display_table_sc = table_pretty_names.get(table_file, table_file)
-                store_item_ids = set()
-                store_table_names = set()
-                for store_sc in stores_sc:
-                    if not isinstance(store_sc, dict):
-                        continue
-                    for inv_entry in store_sc.get("inventory", []) or []:
-                        if not isinstance(inv_entry, dict):
-                            continue
-                        if inv_entry.get("type") == "table":
-                            tname = inv_entry.get("table")
-                            if tname:
-                                store_table_names.add(tname)
-                        elif inv_entry.get("type") == "id":
-                            iid = inv_entry.get("id")
-                            if iid is not None:
-                                store_item_ids.add(iid)
-                for sub_name, sub_items in tables_sc.items():
-                    if not isinstance(sub_items, list):
+                max_id = max(ids_max)if ids_max else dup_id
+                for idx, (f, sub, name)in enumerate(locations):
+                    if idx ==0:
                         continue
-                    in_store_table = sub_name in store_table_names
-                    for item_sc in sub_items:
-                        if not isinstance(item_sc, dict):
-                            continue
-                        in_store = in_store_table or item_sc.get("id") in store_item_ids
-                        if in_store and not item_sc.get("shop_category"):
-                            item_name_sc = item_sc.get("name") or f"ID {item_sc.get('id', '?')}"
-                            logging.warning(f"Table '{display_table_sc}': Item '{item_name_sc}' in subtable '{sub_name}' is referenced by a store but missing 'shop_category' field.")
+                    max_id +=1
+                    duplicate_suggestions.append(f"Change ID {dup_id}({f}:{sub}:{name}) -> {max_id}")
             except Exception:
-                logging.exception("Suppressed exception")
-    except Exception:
-        logging.exception("Suppressed exception")
+                duplicate_suggestions.append(f"Unable to suggest fixes for duplicate ID {dup_id}.")
 
-    try:
-        skip_subtables = {
-            'stores', 'armories', 'businesses', 'settings', 'additional_settings',
-            'lootcrates', 'enemyloot', 'loot_crates', 'enemy_loot'
-        }
-        for item_cat, tf_cat, sub_cat in all_table_items:
-            try:
-                if not isinstance(item_cat, dict):
-                    continue
-                if sub_cat and str(sub_cat).lower() in skip_subtables:
-                    continue
-                has_armory = bool(item_cat.get("armory_category"))
-                has_shop = bool(item_cat.get("shop_category"))
-                if not has_armory and not has_shop:
-                    item_name_cat = item_cat.get("name") or f"ID {item_cat.get('id', '?')}"
-                    display_table_cat = table_pretty_names.get(tf_cat, tf_cat)
-                    logging.warning(f"Table '{display_table_cat}': Item '{item_name_cat}' in subtable '{sub_cat}' is missing both 'armory_category' and 'shop_category' fields.")
-            except Exception:
-                logging.exception("Suppressed exception")
-    except Exception:
-        logging.exception("Suppressed exception")
+    # Ammunition may come from any table, so these references are checked
+    # against the union of every table's summary on each run.
+    ammo_names_present = set()
+    ammo_calibers_present = set()
+    for result in results.values():
+        ammo_names_present.update(result.get("ammo_names", []))
+        ammo_calibers_present.update(result.get("ammo_calibers", []))
+    for table_file, result in results.items():
+        for name, calibs, ammo_type in result.get("firearm_ammo", []):
+            missing = [c for c in calibs if str(c).strip().lower() not in ammo_calibers_present]
+            if missing:
+                ammo_errors.append(f"Firearm '{name}' in table '{table_file}' references caliber '{missing}' but no ammunition with that caliber found.")
+                ammo_errors_files.append(table_file)
+            if ammo_type and str(ammo_type).strip().lower()not in ammo_names_present:
+                ammo_errors.append(f"Firearm '{name}' in table '{table_file}' references ammunition '{ammo_type}' but no matching ammunition entry found.")
+                ammo_errors_files.append(table_file)
+
+    # Sound folders live outside the tables, so they are never cached.
+    sound_root = os.path.join('sounds', 'firearms', 'weaponsounds')
+    for table_file, result in results.items():
+        for name, plat in result.get("weapon_platforms", []):
+            plat_key = str(plat).strip().lower().replace('/', '_')
+            if not plat_key:
+                continue
+            folder = os.path.join(sound_root, plat_key)
+            if not os.path.isdir(folder):
+                logging.warning(f"Table '{result.get('pretty_name', table_file)}': Firearm '{name}' platform '{plat}' missing weaponsound folder '{folder}'")
 
     all_errors_with_source = (
         [(e, f) for e, f in zip(duplicate_errors, duplicate_errors_files)] +
@@ -2779,6 +3353,14 @@ def validate_table_ids(secondary_platform=None):
     active_errors = [e for e, f in all_errors_with_source if f not in disabled_files]
     disabled_table_errors = [e for e, f in all_errors_with_source if f in disabled_files]
 
+    fingerprint = _table_validation_fingerprint(hashes, secondary_platform)
+    _write_table_validation_cache({
+    "version":_TABLE_VALIDATION_VERSION,
+    "tables":{tf:{"sha256":hashes[tf], "secondary_platform":secondary_platform, "result":results[tf]}for tf in results},
+    # Set only when the whole run was clean; lets the next start defer validation.
+    "clean":fingerprint if not active_errors and not disabled_table_errors and len(results)==len(table_files)else None,
+    })
+
     if disabled_table_errors:
         for err in disabled_table_errors:
             logging.error(f"[Disabled table] {err}")
@@ -2847,7 +3429,49 @@ try:
 except Exception:
     _secondary_platform = None
 
-validate_table_ids(secondary_platform=_secondary_platform)
+def _table_validation_cached_clean(secondary_platform=None):
+    """True when the tables on disk are exactly the set that last validated clean."""
+    table_files = _list_validation_tables("tables")
+    if not table_files:
+        return False
+    clean = _read_table_validation_cache().get("clean")
+    if not clean:
+        return False
+    try:
+        hashes = {tf:_table_content_hash(os.path.join("tables", tf))for tf in table_files}
+    except OSError:
+        return False
+    return clean ==_table_validation_fingerprint(hashes, secondary_platform)
+
+def start_deferred_table_validation(root = None, delay_ms = 1500):
+    """Run the validation skipped at import on a background thread once the
+    main window is up. Does nothing when validation already ran at import."""
+    global _table_validation_deferred
+    if not _table_validation_deferred:
+        return
+    _table_validation_deferred = False
+
+    def _worker():
+        try:
+            validate_table_ids(secondary_platform=_secondary_platform)
+        except SystemExit:
+            logging.critical("Table validation failed after startup; fix the table(s) and restart.")
+        except Exception:
+            logging.exception("Deferred table validation failed")
+
+    def _start():
+        threading.Thread(target = _worker, name = "TableValidation", daemon = True).start()
+
+    if root is not None:
+        root.after(delay_ms, _start)
+    else:
+        _start()
+
+if _table_validation_cached_clean(_secondary_platform):
+    _table_validation_deferred = True
+    logging.info("Tables unchanged since the last clean validation; validating in the background after startup.")
+else:
+    validate_table_ids(secondary_platform=_secondary_platform)
 
 currentsave = None
 
@@ -2898,173 +3522,270 @@ emptysave = {
 "money":0
 }
 
-def populate_equipment_with_subslots(save_data, secondary_platform=None):
+class _LoadStage:
+    """One fixer of the save load pipeline (see run_load_pipeline).
+
+    `prepare(save_data)` runs first and returns False to skip the stage for
+    this save (no table, nothing to do). During the walk `equipment(slot,
+    value)` is called for every equipment slot, and `hands(item)` /
+    `storage(item)` for every held / stored item; these may return a new
+    object to put in the item's place. `finish(save_data)` runs after the
+    walk, for whole-save work. Every hook is optional."""
+
+    def __init__(self, name, prepare = None, equipment = None, hands = None, storage = None, finish = None):
+        self.name = name
+        self.prepare = prepare
+        self.equipment = equipment
+        self.hands = hands
+        self.storage = storage
+        self.finish = finish
+        self.seconds = 0.0
+
+    def call(self, hook, *args):
+        """Run one hook, timed; a failure is logged and skips only this call."""
+        fn = getattr(self, hook)
+        if fn is None:
+            return None
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        except Exception:
+            logging.exception(f"Load stage '{self.name}' failed in {hook}")
+            return False if hook == "prepare"else None
+        finally:
+            self.seconds +=time.perf_counter()-started
+
+_last_load_report = {}
+
+def run_load_pipeline(save_data, stages, label = None):
+    """Run `stages` over `save_data` in one walk of its equipment, hands and
+    storage.
+
+    Each item gets every stage in order before the walk moves to the next
+    item, which is the same as running the stages one after another over the
+    whole save because each one only looks at the item it is given (and the
+    table). Returns save_data. With a `label` (a full load), the per-stage
+    timings are logged and kept in `_last_load_report` for the dev panel."""
+    if not isinstance(save_data, dict):
+        return save_data
+    started = time.perf_counter()
+    active =[stage for stage in stages if stage.call("prepare", save_data)is not False]
+    counts = {"equipment":0, "hands":0, "storage":0}
+    clock = time.perf_counter
+
+    hooks = {where:[(stage, getattr(stage, where))for stage in active if getattr(stage, where)is not None]
+    for where in counts}
+
+    equipment = save_data.get("equipment")
+    if isinstance(equipment, dict)and hooks["equipment"]:
+        for slot_name, value in list(equipment.items()):
+            counts["equipment"]+=1
+            last = clock()
+            for stage, fn in hooks["equipment"]:
+                try:
+                    fn(slot_name, value)
+                except Exception:
+                    logging.exception(f"Load stage '{stage.name}' failed on equipment slot {slot_name}")
+                # One clock read per hook: each stage is charged the time since the last.
+                now = clock()
+                stage.seconds +=now -last
+                last = now
+
+    for where in("hands", "storage"):
+        if where == "hands":
+            holder = save_data.get("hands")
+            items = holder.get("items")if isinstance(holder, dict)else None
+        else:
+            items = save_data.get("storage")
+        if not isinstance(items, list)or not hooks[where]:
+            continue
+        for index, item in enumerate(items):
+            counts[where]+=1
+            last = clock()
+            for stage, fn in hooks[where]:
+                try:
+                    replacement = fn(item)
+                except Exception:
+                    logging.exception(f"Load stage '{stage.name}' failed on a {where} item")
+                    replacement = None
+                if replacement is not None:
+                    item = items[index]= replacement
+                now = clock()
+                stage.seconds +=now -last
+                last = now
+
+    for stage in active:
+        stage.call("finish", save_data)
+
+    if label is not None:
+        report = {
+        "label":label,
+        "total_ms":round((time.perf_counter()-started)*1000, 2),
+        "items":counts,
+        "stages":{stage.name:round(stage.seconds *1000, 2)for stage in stages},
+        "skipped":[stage.name for stage in stages if stage not in active],
+        }
+        # Updated in place: other modules hold this dict through `import *`.
+        _last_load_report.clear()
+        _last_load_report.update(report)
+        logging.info(f"Load pipeline for {label}: {report['total_ms']} ms over "
+        f"{counts['equipment']} slots, {counts['hands']} held, {counts['storage']} stored items — "
+        +", ".join(f"{name} {ms} ms"for name, ms in report["stages"].items()))
+    return save_data
 
-    if secondary_platform is None:
-        secondary_platform = globals().get('_secondary_platform')
+_EQUIPMENT_SUBTABLES =("equipment", "civilian_equipment", "military_equipment")
 
-    try:
+def _populate_subslots_stage(secondary_platform = None):
+    """Load stage: give equipped, held and stored items the subslots their
+    table entries define, and the accessory entries those subslots imply."""
+    state = {}
+
+    def prepare(save_data):
         tbl_path = get_current_table_path()
         if not tbl_path or not os.path.exists(tbl_path):
-            return save_data
-
-        with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-            table_data = json.load(f)
-
-        tables = table_data.get("tables", {})
-        equipment_items = (
-            (tables.get("equipment") or []) +
-            (tables.get("civilian_equipment") or []) +
-            (tables.get("military_equipment") or [])
-        )
-        equipment_map = {item.get("id"): item for item in equipment_items}
+            return False
+        table_index = get_table_index(tbl_path)
+        equipment_map = {}
+        for subtable in _EQUIPMENT_SUBTABLES:
+            for item in table_index.by_subtable.get(subtable, []):
+                equipment_map[item.get("id")]= item
+        state["index"]= table_index
+        state["equipment_map"]= equipment_map
+        # Listed once here rather than for every item without subslots.
+        state["indexes"]= _subslot_table_indexes()
+        return True
 
-        for slot_name, equipped_item in save_data.get("equipment", {}).items():
-            items_to_process = []
-            if isinstance(equipped_item, dict):
-                items_to_process = [equipped_item]
-            elif isinstance(equipped_item, list):
-                items_to_process = [it for it in equipped_item if isinstance(it, dict)]
+    def equipment(slot_name, equipped_item):
+        table_index = state["index"]
+        equipment_map = state["equipment_map"]
+        indexes = state["indexes"]
+        items_to_process = []
+        if isinstance(equipped_item, dict):
+            items_to_process = [equipped_item]
+        elif isinstance(equipped_item, list):
+            items_to_process = [it for it in equipped_item if isinstance(it, dict)]
+
+        for eq in items_to_process:
+            try:
+                item_id = eq.get("id")
+                if item_id is not None and item_id in equipment_map:
+                    table_item = equipment_map[item_id]
+                    if "subslots" in table_item and "subslots" not in eq:
+                        eq["subslots"] = [{
+                            "name": subslot.get("name"),
+                            "slot": subslot.get("slot"),
+                            "current": None
+                        } for subslot in table_item["subslots"]]
+                        logging.debug(f"Added {len(eq['subslots'])} subslots to equipped item ID {item_id} in slot {slot_name}")
+
+                    for sub in eq.get("subslots", []):
+                        try:
+                            cur = sub.get("current")
+                            if isinstance(cur, dict):
+                                add_subslots_to_item(cur, indexes)
+                        except Exception:
+                            logging.exception("Suppressed exception")
 
-            for eq in items_to_process:
-                try:
-                    item_id = eq.get("id")
-                    if item_id is not None and item_id in equipment_map:
-                        table_item = equipment_map[item_id]
-                        if "subslots" in table_item and "subslots" not in eq:
-                            eq["subslots"] = [{
-                                "name": subslot.get("name"),
-                                "slot": subslot.get("slot"),
-                                "current": None
-                            } for subslot in table_item["subslots"]]
-                            logging.debug(f"Added {len(eq['subslots'])} subslots to equipped item ID {item_id} in slot {slot_name}")
-
-                        for sub in eq.get("subslots", []):
+                    try:
+                        for sub in eq.get("subslots", []) or []:
                             try:
-                                cur = sub.get("current")
-                                if isinstance(cur, dict):
-                                    add_subslots_to_item(cur)
-                            except Exception:
-                                logging.exception("Suppressed exception")
+                                s_slot = sub.get('slot')
 
-                        try:
-                            for sub in eq.get("subslots", []) or []:
-                                try:
-                                    s_slot = sub.get('slot')
+                                for candidate in table_index.items_for_slot(s_slot, _EQUIPMENT_SUBTABLES):
+                                    try:
+                                        if isinstance(candidate, dict) and candidate.get('slot') == s_slot and 'subslots' in candidate:
+                                            nested = []
+                                            for ss in candidate.get('subslots', []) or []:
+                                                try:
+                                                    nested.append({'name': ss.get('name'), 'slot': ss.get('slot'), 'current': None})
+                                                except Exception:
+                                                    logging.exception("Suppressed exception")
+                                            if nested:
+                                                sub.setdefault('subslots', nested)
+                                                logging.debug(f"Added {len(nested)} nested subslots to subslot '{sub.get('name')}' on item ID {item_id}")
 
-                                    for candidate in equipment_items:
-                                        try:
-                                            if isinstance(candidate, dict) and candidate.get('slot') == s_slot and 'subslots' in candidate:
-                                                nested = []
-                                                for ss in candidate.get('subslots', []) or []:
+                                                for nsub in sub.get('subslots', []) or []:
                                                     try:
-                                                        nested.append({'name': ss.get('name'), 'slot': ss.get('slot'), 'current': None})
+                                                        cur2 = nsub.get('current')
+                                                        if isinstance(cur2, dict):
+                                                            add_subslots_to_item(cur2, indexes)
                                                     except Exception:
                                                         logging.exception("Suppressed exception")
-                                                if nested:
-                                                    sub.setdefault('subslots', nested)
-                                                    logging.debug(f"Added {len(nested)} nested subslots to subslot '{sub.get('name')}' on item ID {item_id}")
-
-                                                    for nsub in sub.get('subslots', []) or []:
-                                                        try:
-                                                            cur2 = nsub.get('current')
-                                                            if isinstance(cur2, dict):
-                                                                add_subslots_to_item(cur2)
-                                                        except Exception:
-                                                            logging.exception("Suppressed exception")
-                                                break
-                                        except Exception:
-                                            logging.exception("Suppressed exception")
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-                        except Exception:
-                            logging.exception("Suppressed exception")
-
-                        for acc in eq.get("accessories", []) or []:
-                            try:
-                                cur = acc.get("current")
-                                if isinstance(cur, dict):
-                                    add_subslots_to_item(cur)
+                                            break
+                                    except Exception:
+                                        logging.exception("Suppressed exception")
                             except Exception:
                                 logging.exception("Suppressed exception")
-
-                        try:
-                            eq.setdefault('accessories', [])
-                            for sub in eq.get('subslots', []) or []:
-                                try:
-                                    s_slot = sub.get('slot')
-                                    s_name = sub.get('name') or s_slot
-                                    exists = False
-                                    for a in eq.get('accessories', []) or []:
-                                        try:
-                                            if a and isinstance(a, dict) and (a.get('slot') == s_slot or a.get('name') == s_name):
-                                                exists = True
-                                                break
-                                        except Exception:
-                                            logging.exception("Suppressed exception")
-                                    if not exists:
-                                        try:
-                                            eq['accessories'].append({'name': s_name, 'slot': s_slot, 'current': sub.get('current'), 'attachment': True})
-                                        except Exception:
-                                            logging.exception("Suppressed exception")
-                                except Exception:
-                                    logging.exception("Suppressed exception")
-                        except Exception:
-                            logging.exception("Suppressed exception")
-                except Exception:
-                    logging.exception("Suppressed exception")
-
-        for item in save_data.get("storage", []):
-            if isinstance(item, dict):
-                add_subslots_to_item(item)
-                for acc in item.get("accessories", [])or[]:
-                    try:
-                        cur = acc.get("current")
-                        if isinstance(cur, dict):
-                            _add_attachment_subslots_to_weapon(item, acc, cur)
                     except Exception:
                         logging.exception("Suppressed exception")
 
-        if "hands"in save_data and "items"in save_data["hands"]:
-            for item in save_data["hands"]["items"]:
-                if isinstance(item, dict):
-                    add_subslots_to_item(item)
-                    for acc in item.get("accessories", [])or[]:
+                    for acc in eq.get("accessories", []) or []:
                         try:
                             cur = acc.get("current")
                             if isinstance(cur, dict):
-                                _add_attachment_subslots_to_weapon(item, acc, cur)
+                                add_subslots_to_item(cur, indexes)
                         except Exception:
                             logging.exception("Suppressed exception")
 
-        for slot_name, equipped_item in save_data.get("equipment", {}).items():
-            if equipped_item and isinstance(equipped_item, dict):
-                for acc in equipped_item.get("accessories", [])or[]:
                     try:
-                        cur = acc.get("current")
-                        if isinstance(cur, dict):
-                            add_subslots_to_item(cur)
-                            _add_attachment_subslots_to_weapon(equipped_item, acc, cur)
-                    except Exception:
-                        logging.exception("Suppressed exception")
-
-        for slot_name, equipped_item in save_data.get("equipment", {}).items():
-            if equipped_item and isinstance(equipped_item, dict)and "items"in equipped_item:
-                for item in equipped_item["items"]:
-                    if isinstance(item, dict):
-                        add_subslots_to_item(item)
-                        for acc in item.get("accessories", [])or[]:
+                        eq.setdefault('accessories', [])
+                        for sub in eq.get('subslots', []) or []:
                             try:
-                                cur = acc.get("current")
-                                if isinstance(cur, dict):
-                                    _add_attachment_subslots_to_weapon(item, acc, cur)
+                                s_slot = sub.get('slot')
+                                s_name = sub.get('name') or s_slot
+                                exists = False
+                                for a in eq.get('accessories', []) or []:
+                                    try:
+                                        if a and isinstance(a, dict) and (a.get('slot') == s_slot or a.get('name') == s_name):
+                                            exists = True
+                                            break
+                                    except Exception:
+                                        logging.exception("Suppressed exception")
+                                if not exists:
+                                    try:
+                                        eq['accessories'].append({'name': s_name, 'slot': s_slot, 'current': sub.get('current'), 'attachment': True})
+                                    except Exception:
+                                        logging.exception("Suppressed exception")
                             except Exception:
                                 logging.exception("Suppressed exception")
+                    except Exception:
+                        logging.exception("Suppressed exception")
+            except Exception:
+                logging.exception("Suppressed exception")
 
-    except Exception as e:
-        logging.warning(f"Failed to populate equipment subslots: {e}")
+        if equipped_item and isinstance(equipped_item, dict):
+            for acc in equipped_item.get("accessories", [])or[]:
+                try:
+                    cur = acc.get("current")
+                    if isinstance(cur, dict):
+                        add_subslots_to_item(cur, indexes)
+                        _add_attachment_subslots_to_weapon(equipped_item, acc, cur)
+                except Exception:
+                    logging.exception("Suppressed exception")
 
-    return save_data
+            contained = equipped_item.get("items")
+            if isinstance(contained, list):
+                for item in contained:
+                    loose_item(item)
+
+    def loose_item(item):
+        indexes = state["indexes"]
+        if isinstance(item, dict):
+            add_subslots_to_item(item, indexes)
+            for acc in item.get("accessories", [])or[]:
+                try:
+                    cur = acc.get("current")
+                    if isinstance(cur, dict):
+                        _add_attachment_subslots_to_weapon(item, acc, cur)
+                except Exception:
+                    logging.exception("Suppressed exception")
+
+    return _LoadStage("populate_subslots", prepare, equipment = equipment, hands = loose_item, storage = loose_item)
+
+def populate_equipment_with_subslots(save_data, secondary_platform=None):
+    if secondary_platform is None:
+        secondary_platform = globals().get('_secondary_platform')
+    return run_load_pipeline(save_data, [_populate_subslots_stage(secondary_platform)])
 
 def _resolve_adapter_output_slot(parent_slot, attachment):
     try:
@@ -3156,15 +3877,29 @@ def _add_attachment_subslots_to_weapon(weapon, parent_accessory, attachment):
     except Exception:
         logging.exception("Suppressed exception")
 
-def add_subslots_to_item(item):
+def _subslot_table_indexes():
+    """Indexes of every table file, in file order, for looking up the
+    subslots of items from any table."""
+    indexes =[]
+    for tf in sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}"))):
+        try:
+            indexes.append(get_table_index(tf))
+        except Exception:
+            logging.exception("Suppressed exception")
+    return indexes
 
+def add_subslots_to_item(item, indexes = None):
+    """Give `item` (and the items inside it) the subslots of its table entry.
+    `indexes` (from _subslot_table_indexes) saves listing the tables again
+    when many items are done at once."""
     try:
-        return _add_subslots_to_item_recursive(item, seen = None)
+        return _add_subslots_to_item_recursive(item, seen = None, indexes = indexes)
     except Exception as e:
         logging.warning(f"Failed to add subslots to item: {e}")
         return item
 
-def _add_subslots_to_item_recursive(item, seen = None):
+def _add_subslots_to_item_recursive(item, seen = None, indexes = None):
+    import copy as _copy
     if not item or not isinstance(item, dict):
         return item
 
@@ -3179,99 +3914,71 @@ def _add_subslots_to_item_recursive(item, seen = None):
     try:
 
         if "subslots"not in item:
-            table_files = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
-            if table_files:
+            if indexes is None:
+                indexes = _subslot_table_indexes()
+            if indexes:
                 item_id = item.get("id")
                 if item_id is not None:
-                    found = False
-                    for tf in table_files:
-                        try:
-                            with open(tf, 'r', encoding = 'utf-8')as f:
-                                table_data = json.load(f)
-                        except Exception:
-                            logging.exception("Suppressed exception")
+                    for table_index in indexes:
+                        table_item = table_index.item(item_id)
+                        if not isinstance(table_item, dict):
                             continue
-                        tables = table_data.get("tables", {})
-                        for tbl_items in tables.values():
-                            if not isinstance(tbl_items, list):
-                                continue
-                            for it in tbl_items:
-                                try:
-                                    if isinstance(it, dict)and it.get("id")==item_id:
-                                        table_item = it
-                                        if "subslots"in table_item:
-
-                                            resolved_subslots =[]
-                                            for subslot in table_item["subslots"]:
-                                                cur = subslot.get("current", None)
-                                                resolved_cur = cur
-                                                if cur is not None and(isinstance(cur, int)or(isinstance(cur, str)and str(cur).isdigit())):
-                                                    try:
-                                                        iid = int(cur)
-
-                                                        for _tf in table_files:
-                                                            try:
-                                                                with open(_tf, 'r', encoding = 'utf-8')as _f:
-                                                                    _td = json.load(_f)
-                                                            except Exception:
-                                                                logging.exception("Suppressed exception")
-                                                                continue
-                                                            for arr in _td.get('tables', {}).values():
-                                                                if isinstance(arr, list):
-                                                                    for candidate in arr:
-                                                                        if isinstance(candidate, dict)and candidate.get('id')==iid:
-                                                                            resolved_cur = candidate.copy()
-                                                                            break
-                                                                    if isinstance(resolved_cur, dict):
-                                                                        break
-                                                            if isinstance(resolved_cur, dict):
-                                                                break
-                                                    except Exception:
-                                                        resolved_cur = cur
+                        try:
+                            if "subslots"in table_item:
+
+                                resolved_subslots =[]
+                                for subslot in table_item["subslots"]:
+                                    cur = subslot.get("current", None)
+                                    resolved_cur = cur
+                                    if cur is not None and(isinstance(cur, int)or(isinstance(cur, str)and str(cur).isdigit())):
+                                        try:
+                                            iid = int(cur)
+
+                                            for _index in indexes:
+                                                candidate = _index.item(iid)
+                                                if isinstance(candidate, dict):
+                                                    resolved_cur = _copy.deepcopy(candidate)
+                                                    break
+                                        except Exception:
+                                            resolved_cur = cur
 
-                                                current_val = resolved_cur if isinstance(resolved_cur, dict)else None
+                                    current_val = resolved_cur if isinstance(resolved_cur, dict)else None
 
-                                                resolved_subslots.append({
-                                                "name":subslot.get("name"),
-                                                "slot":subslot.get("slot"),
-                                                "current":current_val
-                                                })
+                                    resolved_subslots.append({
+                                    "name":subslot.get("name"),
+                                    "slot":subslot.get("slot"),
+                                    "current":current_val
+                                    })
 
+                                try:
+                                    if isinstance(item, dict):
+                                        item.setdefault('accessories', [])
+                                        for sub in resolved_subslots:
                                             try:
-                                                if isinstance(item, dict):
-                                                    item.setdefault('accessories', [])
-                                                    for sub in resolved_subslots:
-                                                        try:
-                                                            s_slot = sub.get('slot')
-                                                            s_name = sub.get('name')or s_slot
-                                                            found = False
-                                                            for a in item.get('accessories', [])or[]:
-                                                                try:
-                                                                    if a and isinstance(a, dict)and(a.get('slot')==s_slot or a.get('name')==s_name):
-                                                                        found = True
-                                                                        break
-                                                                except Exception:
-                                                                    logging.exception("Suppressed exception")
-                                                            if not found:
-                                                                try:
-                                                                    item['accessories'].append({'name':s_name, 'slot':s_slot, 'current':None, 'attachment':True})
-                                                                except Exception:
-                                                                    logging.exception("Suppressed exception")
-                                                        except Exception:
-                                                            logging.exception("Suppressed exception")
+                                                s_slot = sub.get('slot')
+                                                s_name = sub.get('name')or s_slot
+                                                found = False
+                                                for a in item.get('accessories', [])or[]:
+                                                    try:
+                                                        if a and isinstance(a, dict)and(a.get('slot')==s_slot or a.get('name')==s_name):
+                                                            found = True
+                                                            break
+                                                    except Exception:
+                                                        logging.exception("Suppressed exception")
+                                                if not found:
+                                                    try:
+                                                        item['accessories'].append({'name':s_name, 'slot':s_slot, 'current':None, 'attachment':True})
+                                                    except Exception:
+                                                        logging.exception("Suppressed exception")
                                             except Exception:
                                                 logging.exception("Suppressed exception")
-                                            item["subslots"]= resolved_subslots
-                                            logging.debug(f"Added {len(item['subslots'])} subslots to item ID {item_id}({item.get('name')})")
-                                        found = True
-                                        break
                                 except Exception:
                                     logging.exception("Suppressed exception")
-                                    continue
-                            if found:
-                                break
-                        if found:
-                            break
+                                item["subslots"]= resolved_subslots
+                                logging.debug(f"Added {len(item['subslots'])} subslots to item ID {item_id}({item.get('name')})")
+                        except Exception:
+                            logging.exception("Suppressed exception")
+                        break
     except Exception:
         logging.exception("Suppressed exception")
 
@@ -3280,7 +3987,7 @@ def _add_subslots_to_item_recursive(item, seen = None):
         for sub in item.get("items", [])or[]:
             try:
                 if isinstance(sub, dict):
-                    _add_subslots_to_item_recursive(sub, seen)
+                    _add_subslots_to_item_recursive(sub, seen, indexes)
             except Exception:
                 logging.exception("Suppressed exception")
 
@@ -3288,7 +3995,7 @@ def _add_subslots_to_item_recursive(item, seen = None):
             try:
                 cur = subslot.get("current")
                 if isinstance(cur, dict):
-                    _add_subslots_to_item_recursive(cur, seen)
+                    _add_subslots_to_item_recursive(cur, seen, indexes)
             except Exception:
                 logging.exception("Suppressed exception")
 
@@ -3296,7 +4003,7 @@ def _add_subslots_to_item_recursive(item, seen = None):
             try:
                 cur = acc.get("current")
                 if isinstance(cur, dict):
-                    _add_subslots_to_item_recursive(cur, seen)
+                    _add_subslots_to_item_recursive(cur, seen, indexes)
             except Exception:
                 logging.exception("Suppressed exception")
     except Exception:
@@ -3304,120 +4011,339 @@ def _add_subslots_to_item_recursive(item, seen = None):
 
     return item
 
-def update_item_keys_from_table(save_data):
+def _save_items_table_path():
+    """Table that save items are synced against (and, for v2 saves, hydrated
+    from): the current table, else the first table file."""
+    table_files = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
+    if not table_files:
+        return None
+
+    cur_tbl = global_variables.get("current_table")
+    if cur_tbl:
+        for fpath in table_files:
+            if os.path.abspath(fpath).endswith(cur_tbl)or os.path.basename(fpath)==cur_tbl:
+                return fpath
 
+    return table_files[0]
+
+def _save_table_items():
+    path = _save_items_table_path()
+    if not path:
+        return None
     try:
-        table_files = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
-        if not table_files:
-            logging.warning("No table files found for item key update")
-            return save_data
-
-        cur_tbl = global_variables.get("current_table")
-        target_file = None
-        if cur_tbl:
-            for fpath in table_files:
-                if os.path.abspath(fpath).endswith(cur_tbl)or os.path.basename(fpath)==cur_tbl:
-                    target_file = fpath
-                    break
+        return get_table_index(path).by_id
+    except Exception as e:
+        logging.error(f"Failed to load table file for save items: {path}: {e}")
+        return None
 
-        if not target_file:
-            target_file = table_files[0]
+def compact_save_items(save_data):
+    """Copy of `save_data` in save format v2 (items stored as {id, overrides}),
+    for writing to disk. Without a readable table the items are written in full
+    (v1), dropping any v2 marker left from hydration."""
+    if not isinstance(save_data, dict):
+        return save_data
+    table_items = _save_table_items()
+    if table_items is None:
+        return {k: v for k, v in save_data.items() if k != _savepack.SAVE_FORMAT_KEY}
+    return _savepack.compact_save(save_data, table_items)
+
+def hydrate_save_items(save_data):
+    """Expand the item references of a v2 save in place; v1 saves pass through."""
+    if not _savepack.is_v2(save_data):
+        return save_data
+    table_items = _save_table_items()
+    if table_items is None:
+        logging.warning("No table available to hydrate save items; keeping their saved keys only")
+        table_items = {}
+    return _savepack.hydrate_save(save_data, table_items)
+
+_backup_stores = {}
+_backup_stores_lock = threading.Lock()
+
+def _backup_folder_for(char_name):
+    safe_char_name = "".join(c if c.isalnum()or c in " _-"else "_"for c in str(char_name)).strip()
+    return os.path.join(saves_folder or "saves", "backups", safe_char_name or "Unknown")
+
+def _backup_store(folder):
+    """The backup store of one character's backup folder. Backups waiting
+    to be added to it (parked saves, files from older versions) are handed
+    to the archiver."""
+    key = os.path.abspath(folder)
+    with _backup_stores_lock:
+        store = _backup_stores.get(key)
+        if store is None:
+            store = _backup_stores[key] = _backupstore.BackupStore(folder)
+            _backup_archiver.submit(folder)
+    return store
+
+class _BackupArchiver:
+    """Low-priority worker that adds backups to the character backup stores.
+
+    Saving only parks the previous save file in the character's pending/
+    folder (a hard link, or a copy where links are unsupported) and calls
+    `submit`; this thread adds parked files to the store and prunes it, and
+    moves backups left by older versions (loose backup files, archive/*.zip)
+    into the store one file at a time. It reads at most `rate` bytes per
+    second and waits while deferred saves are queued, so it never holds up a
+    save. `stats()` is shown in the dev panel."""
+
+    def __init__(self, rate = 2 *1024 *1024):
+        self.rate = rate
+        self._queue =[]
+        self._cond = threading.Condition()
+        self._thread = None
+        self._current = None
+        self._progress =(0, 0)
+        self._throughput = 0.0
+        self._totals = {"files":0, "bytes_read":0, "bytes_written":0, "zips":0, "failed":0}
+
+    def park(self, path, folder):
+        """Keep the save file at `path` as it is now for the store in `folder`."""
+        pending = os.path.join(folder, _backupstore.PENDING_DIR)
+        os.makedirs(pending, exist_ok = True)
+        target = os.path.join(pending, f"{time.time_ns()}.sldsv")
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copy2(path, target)
+        self.submit(folder)
+        return target
+
+    def submit(self, folder):
+        with self._cond:
+            if folder not in self._queue:
+                self._queue.append(folder)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target = self._run, name = "backup-archiver", daemon = True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                folder = self._queue.pop(0)
+                self._current = folder
+            try:
+                self._archive_folder(folder)
+            except Exception:
+                self._totals["failed"]+=1
+                logging.exception(f"Backup archiving of {folder} failed")
+            finally:
+                with self._cond:
+                    self._current = None
+                    self._progress =(0, 0)
+
+    @staticmethod
+    def _work(folder):
+        """(kind, path) steps for one folder, oldest backups first."""
+        steps =[]
+        pending = sorted(glob.glob(os.path.join(folder, _backupstore.PENDING_DIR, "*.sldsv")))
+        steps.extend(("file", p)for p in pending)
+        steps.extend(("file", p)for p in sorted(glob.glob(os.path.join(folder, "*.sldsv"))))
+        steps.extend(("zip", p)for p in sorted(glob.glob(os.path.join(folder, "archive", "*.zip"))))
+        return steps
+
+    def _throttle(self, nbytes, started):
+        # Stay under `rate` and out of the way of queued saves.
+        delay = nbytes /self.rate -(time.monotonic()-started)
+        if delay >0:
+            time.sleep(delay)
+        while _save_manager.pending():
+            time.sleep(0.1)
+
+    def _account(self, nbytes, started, written):
+        elapsed = max(time.monotonic()-started, 1e-6)
+        self._throughput = 0.7 *self._throughput +0.3 *(nbytes /elapsed)
+        self._totals["bytes_read"]+=nbytes
+        self._totals["bytes_written"]+=written
+
+    def _archive_folder(self, folder):
+        store = _backup_store(folder)
+        steps = self._work(folder)
+        if not steps:
+            return
+        self._progress =(0, len(steps))
+        for done, (kind, path) in enumerate(steps, 1):
+            if kind == "file":
+                started = time.monotonic()
+                written_before = store.stats["bytes_written"]
+                try:
+                    size = os.path.getsize(path)
+                    store.add_file(path, created = os.path.getmtime(path))
+                    os.remove(path)
+                    self._totals["files"]+=1
+                except Exception as e:
+                    size = 0
+                    self._totals["failed"]+=1
+                    logging.warning(f"Failed to archive backup '{path}': {e}")
+                self._account(size, started, store.stats["bytes_written"]-written_before)
+                self._throttle(size, started)
+            else:
+                self._archive_zip(store, path)
+            self._progress =(done, len(steps))
+        store.prune()
+        logging.info(f"Archived {len(steps)} backup item(s) into {folder}")
+
+    def _archive_zip(self, store, path):
+        """Add each backup in a zip from earlier versions, then delete the zip.
+        Backups already in the store (an interrupted run) are skipped by it."""
+        try:
+            with zipfile.ZipFile(path)as zf:
+                for info in zf.infolist():
+                    if info.is_dir()or not info.filename.lower().endswith(".sldsv"):
+                        continue
+                    started = time.monotonic()
+                    written_before = store.stats["bytes_written"]
+                    store.add_bytes(zf.read(info), created = time.mktime(info.date_time +(0, 0, -1)))
+                    self._totals["files"]+=1
+                    self._account(info.file_size, started, store.stats["bytes_written"]-written_before)
+                    self._throttle(info.file_size, started)
+            os.remove(path)
+            self._totals["zips"]+=1
+        except Exception as e:
+            self._totals["failed"]+=1
+            logging.warning(f"Failed to archive backup zip '{path}': {e}")
+
+    def stats(self):
+        with self._cond:
+            queued = len(self._queue)
+            current = self._current
+        done, total = self._progress
+        return dict(self._totals, queued = queued, current = os.path.basename(current)if current else None,
+        progress = f"{done}/{total}", throughput_kbs = round(self._throughput /1024, 1))
+
+_backup_archiver = _BackupArchiver()
+
+# .sldsv files in the saves folder that are not character saves.
+RESERVED_SAVE_NAMES = frozenset({"persistent_data.sldsv", "settings.sldsv", "appearance_settings.sldsv", "dm_settings.sldsv"})
+
+_save_catalogs = {}
+_save_catalogs_lock = threading.Lock()
+
+def _save_summary(data):
+    """What the save catalog keeps about one character save (see _save_catalog)."""
+    if not isinstance(data, dict):
+        return {}
+    char_name = data.get("charactername", "Unknown")
+    stats = data.get("stats")
+    return {
+    "character_name":char_name,
+    "uuid":data.get("uuid"),
+    "table":data.get('_table')or data.get('table'),
+    "money":data.get("money", 0),
+    "stats":dict(stats)if isinstance(stats, dict)else {},
+    "equipment_count":len(data.get("equipment")or {}),
+    "backup_folder":os.path.basename(_backup_folder_for(char_name)),
+    }
 
+def _summarize_save(path):
+    # Items stay compacted: the summary needs none of them hydrated.
+    data, _, status = _signed_json_read(path, allow_unsigned = False)
+    return _save_summary(data if status == "ok" else None), status
+
+def _save_catalog():
+    """The catalog of the character saves in saves_folder (metadata for the
+    pickers without decoding every save; see app/savecatalog.py)."""
+    folder = saves_folder or "saves"
+    key = os.path.abspath(folder)
+    with _save_catalogs_lock:
+        catalog = _save_catalogs.get(key)
+        if catalog is None:
+            catalog = _save_catalogs[key] = _savecatalog.SaveCatalog(
+            folder, _summarize_save, lambda path:len(_backup_store(path)),
+            _key_ring.signer, _key_ring.verifiers, reserved = RESERVED_SAVE_NAMES)
+    return catalog
+
+def _update_item_keys_stage():
+    """Load stage: copy table-owned keys of every item from the table (v1 saves
+    store whole items, which go stale when the table changes)."""
+    import copy as _copy
+    state = {"changed_any":False}
+    variable_keys = _savepack.VARIABLE_KEYS
+
+    def prepare(save_data):
+        target_file = _save_items_table_path()
+        if not target_file:
+            logging.warning("No table files found for item key update")
+            return False
         try:
-            with open(target_file, 'r', encoding = 'utf-8')as f:
-                table_data = json.load(f)
+            state["items"]= get_table_index(target_file).by_id
         except Exception as e:
             logging.error(f"Failed to load table file for item key update: {target_file}: {e}")
-            return save_data
-
-        all_items_map = {}
-        for table_name, items in table_data.get("tables", {}).items():
-            if isinstance(items, list):
-                for item in items:
-                    if isinstance(item, dict)and "id"in item:
-                        all_items_map[item["id"]]= item
-
-        variable_keys = {
-        "quantity", "current", "items", "subslots", "uses_left", "hits_left",
-        "battery_life", "loaded", "chambered", "rounds",
-        "accessories", "attachment", "parts", "current_durability", "spring_durability"
-        }
-
-        changed_any = False
-
-        def update_item(item):
-            nonlocal changed_any
-            """Update a single item's keys from table"""
-            if not isinstance(item, dict)or "id"not in item:
-                return item
-
-            item_id = item.get("id")
-            if item_id not in all_items_map:
-                return item
-
-            table_item = all_items_map[item_id]
-
-            preserved_data = {key:item[key]for key in variable_keys if key in item}
-
-            synced_keys =[]
-            for key, value in table_item.items():
-                if key in variable_keys:
-                    continue
-                if isinstance(key, str)and key.startswith("_"):
-                    continue
-
-                local_val = item.get(key, None)
-                try:
-                    different = local_val !=value
-                except Exception:
-                    different = True
-
-                if different:
-                    item[key]= value
-                    synced_keys.append(key)
-
-            if synced_keys:
-                logging.info(f"Updated item id={item_id} name={item.get('name', '<unknown>')} keys_synced={synced_keys}")
-                changed_any = True
-
-            for key, value in preserved_data.items():
-                item[key]= value
-
-            if item.get("subslots"):
-                for subslot in item["subslots"]:
-                    if isinstance(subslot, dict)and subslot.get("current"):
-                        update_item(subslot["current"])
+            return False
+        state["file"]= target_file
+        return True
 
-            if "items"in item and isinstance(item["items"], list):
-                for contained_item in item["items"]:
-                    update_item(contained_item)
+    def update_item(item):
+        """Update a single item's keys from table"""
+        all_items_map = state["items"]
+        if not isinstance(item, dict)or "id"not in item:
+            return
 
-            return item
+        item_id = item.get("id")
+        if item_id not in all_items_map:
+            return
 
-        for item in save_data.get("storage", []):
-            update_item(item)
+        table_item = all_items_map[item_id]
 
-        if "hands"in save_data and "items"in save_data["hands"]:
-            for item in save_data["hands"]["items"]:
-                update_item(item)
+        preserved_data = {key:item[key]for key in variable_keys if key in item}
 
-        for slot_name, equipped_item in save_data.get("equipment", {}).items():
-            if isinstance(equipped_item, dict):
-                update_item(equipped_item)
-            elif isinstance(equipped_item, list):
-                for it in equipped_item:
-                    if isinstance(it, dict):
-                        update_item(it)
+        synced_keys =[]
+        for key, value in table_item.items():
+            if key in variable_keys:
+                continue
+            if isinstance(key, str)and key.startswith("_"):
+                continue
 
-        if changed_any:
+            local_val = item.get(key, None)
+            try:
+                different = local_val !=value
+            except Exception:
+                different = True
+
+            if different:
+                # The table is shared through the table cache, so never
+                # alias its containers into the save.
+                item[key]= _copy.deepcopy(value)if isinstance(value, (dict, list))else value
+                synced_keys.append(key)
+
+        if synced_keys:
+            logging.info(f"Updated item id={item_id} name={item.get('name', '<unknown>')} keys_synced={synced_keys}")
+            state["changed_any"]= True
+
+        for key, value in preserved_data.items():
+            item[key]= value
+
+        if item.get("subslots"):
+            for subslot in item["subslots"]:
+                if isinstance(subslot, dict)and subslot.get("current"):
+                    update_item(subslot["current"])
+
+        if "items"in item and isinstance(item["items"], list):
+            for contained_item in item["items"]:
+                update_item(contained_item)
+
+    def equipment(slot_name, equipped_item):
+        if isinstance(equipped_item, dict):
+            update_item(equipped_item)
+        elif isinstance(equipped_item, list):
+            for it in equipped_item:
+                if isinstance(it, dict):
+                    update_item(it)
+
+    def finish(save_data):
+        target_file = state["file"]
+        if state["changed_any"]:
             logging.info(f"Item keys successfully synced from table {os.path.join('tables', os.path.basename(target_file))}")
         else:
             logging.info(f"Item keys updated from table data: no changes detected in {os.path.join('tables', os.path.basename(target_file))}")
 
-    except Exception as e:
-        logging.error(f"Failed to update item keys from table: {e}")
+    return _LoadStage("update_item_keys", prepare, equipment = equipment, hands = update_item, storage = update_item, finish = finish)
 
-    return save_data
+def update_item_keys_from_table(save_data):
+    return run_load_pipeline(save_data, [_update_item_keys_stage()])
 
 persistentdata = {
 "last_loaded_save":None,
@@ -4108,6 +5034,7 @@ def _get_ammo_variant_labels(variant_info):
     return labels
 
 def _apply_ammo_variant_data(item_obj, ammo_def = None, variant_info = None):
+    import copy as _copy
     if not isinstance(item_obj, dict) or not isinstance(variant_info, dict):
         return item_obj
 
@@ -4116,7 +5043,8 @@ def _apply_ammo_variant_data(item_obj, ammo_def = None, variant_info = None):
         "price_modifier", "usable_casing_chance", "dirtiness_modifier"
     ]:
         if key in variant_info:
-            item_obj[key] = variant_info.get(key)
+            value = variant_info.get(key)
+            item_obj[key] = _copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     if variant_info.get("pressure_override"):
         item_obj["pressure"] = variant_info.get("pressure_override")
@@ -5101,36 +6029,49 @@ def _get_weapon_condition_label(item):
     else:
         return "Worn Out", "#ff4444"
 
-def _resolve_unset_durability(save_data):
-    if not isinstance(save_data, dict):
-        return save_data
-    def _fix_item(item):
-        if not isinstance(item, dict):
-            return
-        parts = item.get("parts")
-        if parts and isinstance(parts, list):
-            for p in parts:
-                if not isinstance(p, dict):
-                    continue
-                if p.get("durability") == "set_by_looting" and p.get("current_durability") is None:
-                    p["current_durability"] = random.uniform(PART_DURABILITY_MAX * 0.15, PART_DURABILITY_MAX)
-                    logging.warning(f"Resolved unset durability for part '{p.get('name', 'Unknown')}' on '{item.get('name', 'Unknown')}' to {p['current_durability']:.1f}")
-        if item.get("spring_durability") == "set_by_looting":
-            item["spring_durability"] = random.uniform(100, PART_DURABILITY_MAX)
-            logging.warning(f"Resolved unset spring_durability for '{item.get('name', 'Unknown')}' to {item['spring_durability']:.1f}")
-    for slot_name, eq in save_data.get("equipment", {}).items():
-        if isinstance(eq, dict):
-            _fix_item(eq)
+def _fix_unset_durability(item):
+    if not isinstance(item, dict):
+        return
+    parts = item.get("parts")
+    if parts and isinstance(parts, list):
+        for p in parts:
+            if not isinstance(p, dict):
+                continue
+            if p.get("durability") == "set_by_looting" and p.get("current_durability") is None:
+                p["current_durability"] = random.uniform(PART_DURABILITY_MAX * 0.15, PART_DURABILITY_MAX)
+                logging.warning(f"Resolved unset durability for part '{p.get('name', 'Unknown')}' on '{item.get('name', 'Unknown')}' to {p['current_durability']:.1f}")
+    if item.get("spring_durability") == "set_by_looting":
+        item["spring_durability"] = random.uniform(100, PART_DURABILITY_MAX)
+        logging.warning(f"Resolved unset spring_durability for '{item.get('name', 'Unknown')}' to {item['spring_durability']:.1f}")
+
+def _resolve_durability_stage(slots_synced = False):
+    """Load stage: roll durability for parts and springs still marked
+    "set_by_looting". With `slots_synced`, equipment slots the slot sync will
+    move to the hands are treated as held items already, as they would be if
+    this ran after the sync."""
+    state = {"moved":frozenset()}
+
+    def prepare(save_data):
+        if slots_synced:
+            empty_equip = emptysave.get('equipment', {})if isinstance(emptysave, dict)else {}
+            state["moved"]= frozenset(slot for slot in(save_data.get("equipment")or {})if slot not in empty_equip)
+        return True
+
+    def equipment(slot_name, eq):
+        if slot_name in state["moved"]:
+            for it in(eq if isinstance(eq, list)else[eq]):
+                _fix_unset_durability(it)
+        elif isinstance(eq, dict):
+            _fix_unset_durability(eq)
             for sub in eq.get("subslots", []) or []:
                 if isinstance(sub, dict):
                     for si in sub.get("items", []) or []:
-                        _fix_item(si)
-    if "hands" in save_data and "items" in save_data.get("hands", {}):
-        for item in save_data["hands"]["items"]:
-            _fix_item(item)
-    for item in save_data.get("storage", []):
-        _fix_item(item)
-    return save_data
+                        _fix_unset_durability(si)
+
+    return _LoadStage("resolve_durability", prepare, equipment = equipment, hands = _fix_unset_durability, storage = _fix_unset_durability)
+
+def _resolve_unset_durability(save_data):
+    return run_load_pipeline(save_data, [_resolve_durability_stage()])
 
 def _check_weapon_can_fire(weapon):
     parts = weapon.get("parts")
@@ -5427,6 +6368,8 @@ def _get_battery_percentage(attachment):
     except (ValueError, TypeError, ZeroDivisionError):
         return None
 
+_startup.mark("foundation: module loaded")
+
 # Auto-generated by refactor_main.py: re-export every module-level symbol
 # (including underscore-prefixed and conditionally-assigned names) so that
 # `from app.foundation import *` exposes everything the App mixins reference.
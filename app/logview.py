@@ -168,6 +168,32 @@ class LogViewApp(App):
             table.add_row("Tables/Items", f"{snap.get('tbl_count', 0)}/{snap.get('total_items', 0)}")
             dup = snap.get('duplicate_ids', 0)
             table.add_row("IDs/Dup", Text(f"{snap.get('total_ids', 0)}/{dup}", style="bold red" if dup else None))
+            tcache = snap.get('tbl_cache') or {}
+            table.add_row("Tbl cache h/m", f"{tcache.get('hits', 0)}/{tcache.get('misses', 0)}")
+            load = snap.get('load') or {}
+            if load:
+                slowest = max(load.get('stages', {}).items(), key=lambda kv: kv[1], default=("-", 0))
+                table.add_row("Last load ms", f"{load.get('total_ms', 0)} ({slowest[0][:14]} {slowest[1]})")
+            backup = snap.get('backup') or {}
+            table.add_row("Backups q/done", f"{backup.get('queued', 0)}/{backup.get('files', 0)} {backup.get('progress', '')}")
+            table.add_row("Backup KB/s", Text(str(backup.get('throughput_kbs', 0)), style="bold red" if backup.get('failed') else None))
+            startup = snap.get('startup') or {}
+            if startup.get('first_window_ms') is not None:
+                lazy = ", ".join(name for name, _ in startup.get('lazy_imports') or []) or "none"
+                table.add_row("First window ms", f"{startup['first_window_ms']:.0f} (lazy: {lazy[:18]})")
+            sounds = snap.get('sounds') or {}
+            table.add_row("Sound idx h/m", f"{sounds.get('hits', 0)}/{sounds.get('misses', 0)} ({sounds.get('folders') or 0} dirs)")
+            audio = snap.get('audio') or {}
+            table.add_row("Audio h/m/ev", f"{audio.get('hits', 0)}/{audio.get('misses', 0)}/{audio.get('evictions', 0)}")
+            table.add_row("Audio MB", f"{audio.get('bytes', 0) / 1048576:.0f}/{audio.get('budget', 0) / 1048576:.0f} ({audio.get('entries', 0)})")
+            dsp = snap.get('dsp') or {}
+            table.add_row("DSP done/pend", Text(f"{dsp.get('rendered', 0)}/{dsp.get('pending', 0)} ({dsp.get('render_ms', 0):.0f} ms)", style="bold red" if dsp.get('failed') else None))
+            mixer = snap.get('mixer') or {}
+            table.add_row("Mixer v/peak/stolen", Text(f"{mixer.get('voices', 0)}/{mixer.get('peak_voices', 0)}/{mixer.get('stolen', 0)} ({mixer.get('underruns', 0)} xrun)", style="bold red" if mixer.get('underruns') else None))
+            music = snap.get('music') or {}
+            table.add_row("Music trk/probe", Text(f"{music.get('tracks', 0)}/{music.get('probes', 0)} ({music.get('probe_ms', 0):.0f} ms)", style="bold red" if music.get('failed') else None))
+            tasks = snap.get('tasks') or {}
+            table.add_row("Bg tasks q/done", Text(f"{tasks.get('queued', 0)}/{tasks.get('done', 0)} {tasks.get('current') or ''}", style="bold red" if tasks.get('failed') else None))
         else:
             table.add_row(Text("(warming up...)", style="dim"), "")
         self.query_one("#devtools-stats", Static).update(table)
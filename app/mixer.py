@@ -0,0 +1,251 @@
+"""Software mixer for gunfire: many overlapping shots on one mixer channel.
+
+Full-auto fire and the dungeon generator's background gunfights used to
+start one `Sound.play()` per shot, each hunting for a free channel among
+the 512, and the dungeon scheduled every shot with its own `root.after`
+timer. The `Mixer` instead keeps a list of voices (a clip, a start frame, a
+gain) and a daemon thread that mixes them block by block into a stream it
+keeps queued on one reserved pygame channel:
+
+    play(key, gain, delay, tag)                  one shot
+    burst(keys, shots, interval, gain, .., tag)  a whole burst from its cyclic schedule
+    cancel(tag)                                  drop a source's voices, e.g. when
+                                                 the window that scheduled them closes
+
+`cyclic_schedule` turns a weapon's cyclic rate into the frame offsets of a
+whole burst up front and rotates through the clip variants so consecutive
+shots differ. At most `max_voices` sound at once: when more are due in a
+block, the ones that started earliest are stolen. Voices scheduled for later
+do not count, so a long burst is not cut short. When nothing is playing the
+thread sleeps and the channel drains.
+
+A voice's gain is fixed when it is scheduled; `set_master(fn)` adds a gain
+read every block, so a mute or a volume ramp reaches voices already playing.
+
+numpy is imported by the mixer thread; pygame is reached through the
+callables passed in, and `samples(key)` turns a sound key into a float32
+(frames, channels) array.
+"""
+import logging
+import random
+import threading
+import time
+
+BLOCK_FRAMES = 1024
+MAX_VOICES = 32
+
+
+def cyclic_schedule(variants, shots, interval_frames, jitter_frames = 0, rng = random):
+    """[(frame offset, variant index)] for `shots` shots `interval_frames`
+    apart, cycling through a shuffled order of the `variants` clips."""
+    order = list(range(variants))
+    rng.shuffle(order)
+    schedule =[]
+    for shot in range(shots):
+        offset = shot *interval_frames
+        if jitter_frames and shot:
+            offset += rng.randint(-jitter_frames, jitter_frames)
+        schedule.append((max(0, offset), order[shot %variants]))
+    return schedule
+
+
+class _Voice:
+    __slots__ =("data", "start", "pos", "gain", "seq", "tag")
+
+    def __init__(self, data, start, gain, seq, tag = None):
+        self.data = data
+        self.start = start
+        self.pos = 0
+        self.gain = gain
+        self.seq = seq
+        self.tag = tag
+
+
+class Mixer:
+    """Mixes scheduled clips into a stream on one pygame channel. Thread-safe."""
+
+    def __init__(self, samples, channel, from_array, mixer_format, block_frames = BLOCK_FRAMES, max_voices = MAX_VOICES):
+        self._samples = samples            # key -> float32 (frames, channels)
+        self._channel = channel            # () -> the reserved pygame Channel
+        self._from_array = from_array      # samples in the mixer dtype -> Sound
+        self._mixer_format = mixer_format  # () -> (rate, format, channels) or None
+        self.block_frames = block_frames
+        self.max_voices = max_voices
+        self._master = None                # () -> gain applied while mixing
+        self._voices =[]
+        self._frame = 0                    # first frame of the next block to render
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stop = False
+        self.stats = {"voices": 0, "peak_voices": 0, "scheduled": 0, "stolen": 0, "cancelled": 0, "blocks": 0, "underruns": 0, "mix_ms": 0.0}
+
+    def available(self):
+        return self._mixer_format()is not None
+
+    # ── Scheduling ───────────────────────────────────────────────────────
+
+    def _rate(self):
+        fmt = self._mixer_format()
+        return int(fmt[0])if fmt else 44100
+
+    def set_master(self, gain):
+        """Use `gain()` (0.0-1.0), read once per block, as the master gain."""
+        self._master = gain
+
+    def _add(self, data, start, gain, tag = None):
+        """Add a voice (caller holds the lock)."""
+        self._seq += 1
+        self._voices.append(_Voice(data, start, gain, self._seq, tag))
+        self.stats["scheduled"]+= 1
+
+    def _due(self, frame0, frames):
+        """Voices sounding in the block at `frame0` (caller holds the lock),
+        after stealing the earliest started ones beyond `max_voices`."""
+        due =[v for v in self._voices if v.start -frame0 <frames]
+        if len(due)>self.max_voices:
+            due.sort(key = lambda v:(v.start, v.seq))
+            stolen = due[:len(due)-self.max_voices]
+            due = due[len(stolen):]
+            self._voices =[v for v in self._voices if v not in stolen]
+            self.stats["stolen"]+= len(stolen)
+        self.stats["peak_voices"]= max(self.stats["peak_voices"], len(due))
+        return due
+
+    def play(self, key, gain = 1.0, delay = 0.0, tag = None):
+        """Mix the clip `key` in `delay` seconds from now."""
+        data = self._samples(key)
+        with self._cond:
+            self._add(data, self._frame +int(delay *self._rate()), float(gain), tag)
+            self._wake()
+
+    def burst(self, keys, shots, interval, gain = 1.0, delay = 0.0, jitter = 0.0, tag = None):
+        """Schedule `shots` shots `interval` seconds apart, starting in `delay`
+        seconds, picking among the clips `keys`. Returns the burst's length in
+        seconds (start of the first shot to the start of the last)."""
+        keys = list(keys)
+        if not keys or shots <=0:
+            return 0.0
+        rate = self._rate()
+        clips =[self._samples(k)for k in keys]
+        schedule = cyclic_schedule(len(clips), shots, int(interval *rate), int(jitter *rate))
+        with self._cond:
+            start = self._frame +int(delay *rate)
+            for offset, variant in schedule:
+                self._add(clips[variant], start +offset, float(gain), tag)
+            self._wake()
+        return schedule[-1][0]/rate
+
+    def cancel(self, tag):
+        """Drop every voice scheduled with `tag`, playing or not. Returns how many."""
+        with self._cond:
+            kept =[v for v in self._voices if v.tag !=tag]
+            dropped = len(self._voices)-len(kept)
+            self._voices = kept
+            self.stats["cancelled"]+= dropped
+        return dropped
+
+    def _wake(self):
+        # Caller holds the lock. The thread clears `_thread` under the same
+        # lock when it exits, so a stop() racing with this never strands voices.
+        self._stop = False
+        if self._thread is None:
+            self._thread = threading.Thread(target = self._run, name = "combat-mixer", daemon = True)
+            self._thread.start()
+        self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._voices.clear()
+            self._stop = True
+            self._cond.notify()
+
+    # ── Mixing thread ────────────────────────────────────────────────────
+
+    def _render(self, np, dtype, channels):
+        frames = self.block_frames
+        out = np.zeros((frames, channels), dtype = np.float32)
+        with self._cond:
+            frame0 = self._frame
+            self._frame += frames
+            voices = self._due(frame0, frames)
+        master = 1.0
+        if self._master is not None:
+            try:
+                master = max(0.0, min(1.0, float(self._master())))
+            except Exception:
+                master = 1.0
+        finished =[]
+        for v in voices:
+            offset = v.start -frame0
+            if offset <0:
+                offset = 0
+            n = min(frames -offset, v.data.shape[0]-v.pos)
+            if n >0:
+                if v.gain *master >0:
+                    out[offset:offset +n]+= v.data[v.pos:v.pos +n]*(v.gain *master)
+                v.pos += n
+            if v.pos >=v.data.shape[0]:
+                finished.append(v)
+        if finished:
+            with self._cond:
+                self._voices =[v for v in self._voices if v not in finished]
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            block = np.clip(out, info.min, info.max).astype(dtype)
+        else:
+            block = np.clip(out, -1.0, 1.0).astype(dtype)
+        return block[:, 0]if channels ==1 else block
+
+    def _run(self):
+        try:
+            self._loop()
+        finally:
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _loop(self):
+        import numpy as np
+        block_seconds = None
+        streaming = False
+        while True:
+            with self._cond:
+                if not self._voices:
+                    streaming = False
+                while not self._voices and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    self._thread = None
+                    return
+                self.stats["voices"]= len(self._voices)
+            try:
+                rate, fmt, channels = self._mixer_format()
+                dtype = {-8:np.int8, 8:np.uint8, -16:np.int16, 16:np.uint16, -32:np.int32, 32:np.float32}.get(fmt, np.int16)
+                block_seconds = self.block_frames /float(rate)
+                channel = self._channel()
+                # One block playing and one queued behind it.
+                if channel.get_queue()is None:
+                    start = time.perf_counter()
+                    sound = self._from_array(np.ascontiguousarray(self._render(np, dtype, channels)))
+                    self.stats["mix_ms"]+=(time.perf_counter()-start)*1000
+                    self.stats["blocks"]+= 1
+                    if channel.get_busy():
+                        channel.queue(sound)
+                    else:
+                        if streaming:
+                            self.stats["underruns"]+= 1
+                        channel.play(sound)
+                        streaming = True
+                time.sleep(block_seconds /4)
+            except Exception:
+                logging.exception("Combat mixer failed; dropping its voices")
+                with self._cond:
+                    self._voices.clear()
+                time.sleep(block_seconds or 0.05)
+
+    def summary(self):
+        with self._cond:
+            out = dict(self.stats, voices = len(self._voices))
+        out["mix_ms"]= round(out["mix_ms"], 1)
+        return out
@@ -140,43 +140,7 @@ class CasinoMixin:
         marquee_job:list[object]=[None]
 
         def _get_track_info(track_path):
-            artist = None
-            title = None
-            length = None
-            try:
-                try:
-                    sound = pygame.mixer.Sound(track_path)
-                    length = float(sound.get_length())
-                except Exception:
-                    length = None
-                try:
-                    from mutagen._file import File as MutagenFile
-                    mf = MutagenFile(track_path)
-                    if mf is not None:
-                        tags = getattr(mf, 'tags', {})or {}
-                        def _get_tag(keys):
-                            for k in keys:
-                                v = tags.get(k)
-                                if v:
-                                    try:
-                                        if isinstance(v, (list, tuple)):
-                                            return str(v[0])
-                                        return str(v)
-                                    except Exception:
-                                        return str(v)
-                            return None
-                        artist = _get_tag(["artist", "ARTIST", "TPE1", "IART"])
-                        title = _get_tag(["title", "TITLE", "TIT2", "INAM"])
-                except Exception:
-                    logging.exception("Suppressed exception")
-            except Exception:
-                logging.exception("Suppressed exception")
-            if not title:
-                try:
-                    title = os.path.basename(track_path or "")
-                except Exception:
-                    title = "Unknown"
-            return {"artist":artist, "title":title, "length":length}
+            return self._get_business_music_track_info(track_path)
 
         def stop_ui_music():
             try:
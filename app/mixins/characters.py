@@ -16,10 +16,7 @@ class CharactersMixin:
         width = 500,
         height = 50,
         font = customtkinter.CTkFont(size = 16),
-        state = "disabled"if not os.listdir(saves_folder)or all(
-        f in["persistent_data.sldsv", "settings.sldsv", "appearance_settings.sldsv", "dm_settings.sldsv"]or f.endswith(".sldsv.sldsv")or f =="backups"
-        for f in os.listdir(saves_folder)
-        )else "normal"
+        state = "normal"if _save_catalog().has_saves()else "disabled"
         )
         load_existing_character_button.pack(pady = 20)
 
@@ -251,10 +248,9 @@ class CharactersMixin:
         try:
             tbl_path = get_current_table_path()
             if tbl_path and os.path.exists(tbl_path):
-                with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                    table_data = json.load(f)
-                    stat_clamp = table_data.get("additional_settings", {}).get("stat_clamp", 20)
-                    slot_disable_points = table_data.get("additional_settings", {}).get("slot_disable_points", 1)
+                table_data = open_table(tbl_path)
+                stat_clamp = table_data.get("additional_settings", {}).get("stat_clamp", 20)
+                slot_disable_points = table_data.get("additional_settings", {}).get("slot_disable_points", 1)
         except Exception:
             logging.exception("Suppressed exception")
 
@@ -410,17 +406,16 @@ class CharactersMixin:
         try:
             tbl_path = get_current_table_path()
             if tbl_path and os.path.exists(tbl_path):
-                with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                    table_data = json.load(f)
-                    stat_clamp = table_data.get("additional_settings", {}).get("stat_clamp", 20)
-                    slot_disable_points = table_data.get("additional_settings", {}).get("slot_disable_points", 1)
-                    equipment_editor = bool(table_data.get("additional_settings", {}).get("equipment_editor", False))
-                    starting_budget = int(table_data.get("additional_settings", {}).get("starting_budget", 0))
-                    free_points = int(table_data.get("additional_settings", {}).get("free_points", 0))
-                    logging.info(f"Loaded stat_clamp from table: {stat_clamp}")
-                    logging.info(f"Loaded slot_disable_points from table: {slot_disable_points}")
-                    logging.info(f"equipment_editor={equipment_editor}, starting_budget={starting_budget}")
-                    logging.info(f"Loaded free_points from table: {free_points}")
+                table_data = load_table_data(tbl_path)
+                stat_clamp = table_data.get("additional_settings", {}).get("stat_clamp", 20)
+                slot_disable_points = table_data.get("additional_settings", {}).get("slot_disable_points", 1)
+                equipment_editor = bool(table_data.get("additional_settings", {}).get("equipment_editor", False))
+                starting_budget = int(table_data.get("additional_settings", {}).get("starting_budget", 0))
+                free_points = int(table_data.get("additional_settings", {}).get("free_points", 0))
+                logging.info(f"Loaded stat_clamp from table: {stat_clamp}")
+                logging.info(f"Loaded slot_disable_points from table: {slot_disable_points}")
+                logging.info(f"equipment_editor={equipment_editor}, starting_budget={starting_budget}")
+                logging.info(f"Loaded free_points from table: {free_points}")
         except Exception as e:
             logging.warning(f"Failed to load table settings, using default clamp: {e}")
         self.root.grid_rowconfigure(0, weight = 1)
@@ -1276,7 +1271,7 @@ class CharactersMixin:
                         sound_path = os.path.join("sounds", "firearms", "universal", f"{sn}.ogg")
                         if os.path.exists(sound_path):
                             sound = pygame.mixer.Sound(sound_path)
-                            ch = pygame.mixer.find_channel()
+                            ch = _find_channel()
                             if ch:
                                 ch.play(sound)
                     except Exception:
@@ -2767,7 +2762,6 @@ class CharactersMixin:
         display_catalog_page(0)
 
     def _load_existing_character(self):
-        import json
         import os
 
         logging.info("Load Existing Character definition called")
@@ -2776,36 +2770,32 @@ class CharactersMixin:
         current_table = global_variables.get('current_table')
         incompatible_saves =[]
         try:
-            for filename in os.listdir(saves_folder):
-                if filename.endswith(".sldsv.sldsv"):
+            # From the save catalog: only saves changed since it was last read are decoded.
+            for entry in _save_catalog().saves():
+                filename = entry["filename"]
+                if entry.get("status")!="ok":
+                    logging.warning(f"Skipping save file {filename}: {entry.get('status')}")
                     continue
-                if filename.endswith(".sldsv")and filename not in["persistent_data.sldsv", "settings.sldsv", "appearance_settings.sldsv", "dm_settings.sldsv"]:
-                    save_path = os.path.join(saves_folder or "saves", filename)
-                    try:
-                        save_data = self._read_save_from_path(save_path)
-                        if save_data is None:
-                            char_name = "Unknown"
-                        else:
-                            char_name = save_data.get("charactername", "Unknown")
-                            save_table = save_data.get('_table')or save_data.get('table')
-
-                            if current_table and save_table:
-                                current_table_base = os.path.splitext(current_table)[0]
-                                save_table_base = os.path.splitext(save_table)[0]
-                                if current_table_base !=save_table_base and current_table !=save_table:
-                                    incompatible_saves.append({'filename':filename, 'character_name':char_name, 'save_table':save_table})
-                                    continue
-
-                            uuid_part = filename.replace(".sldsv", "").split("_")[-1]
-                            save_files.append({
-                            "filename":filename,
-                            "character_name":char_name,
-                            "uuid":uuid_part,
-                            "data":save_data,
-                            "save_table":save_table
-                            })
-                    except Exception as e:
-                        logging.warning(f"Failed to load save file {filename}: {e}")
+                char_name = entry.get("character_name", "Unknown")
+                save_table = entry.get("table")
+
+                if current_table and save_table:
+                    current_table_base = os.path.splitext(current_table)[0]
+                    save_table_base = os.path.splitext(save_table)[0]
+                    if current_table_base !=save_table_base and current_table !=save_table:
+                        incompatible_saves.append({'filename':filename, 'character_name':char_name, 'save_table':save_table})
+                        continue
+
+                uuid_part = filename.replace(".sldsv", "").split("_")[-1]
+                save_files.append({
+                "filename":filename,
+                "character_name":char_name,
+                "uuid":uuid_part,
+                "stats":entry.get("stats")or {},
+                "equipment_count":entry.get("equipment_count", 0),
+                "backup_count":entry.get("backup_count", 0),
+                "save_table":save_table
+                })
         except Exception as e:
             logging.error(f"Failed to read saves folder: {e}")
             self._popup_show_info("Error", f"Failed to read saves folder: {e}", sound = "error")
@@ -2862,7 +2852,7 @@ class CharactersMixin:
             )
             name_label.grid(row = 0, column = 0, sticky = "w", padx = 15, pady =(10, 5))
 
-            stats = save_info["data"].get("stats", {})
+            stats = save_info["stats"]
             stats_text = " | ".join([f"{stat}: {value:+d}"for stat, value in stats.items()])
             stats_label = customtkinter.CTkLabel(
             char_frame,
@@ -2873,7 +2863,7 @@ class CharactersMixin:
             )
             stats_label.grid(row = 1, column = 0, sticky = "w", padx = 15, pady =(0, 5))
 
-            equipment_count = len(save_info["data"].get("equipment", {}))
+            equipment_count = save_info["equipment_count"]
             equipment_label = customtkinter.CTkLabel(
             char_frame,
             text = f"Equipment Slots: {equipment_count}",
@@ -2896,7 +2886,7 @@ class CharactersMixin:
             file_name = save_info["filename"]
             file_name_label = customtkinter.CTkLabel(
             char_frame,
-            text = f"Filename: {file_name}",
+            text = f"Filename: {file_name} | Backups: {save_info['backup_count']}",
             font = customtkinter.CTkFont(size = 11),
             text_color = "gray",
             anchor = "w"
@@ -2947,17 +2937,13 @@ class CharactersMixin:
         backup_base = os.path.join(saves_folder or "saves", "backups")
 
         character_folders =[]
-        if os.path.exists(backup_base):
-            for folder_name in os.listdir(backup_base):
-                folder_path = os.path.join(backup_base, folder_name)
-                if os.path.isdir(folder_path)and folder_name !="archive":
-                    backup_files = glob.glob(os.path.join(folder_path, "*.sldsv"))
-                    if backup_files:
-                        character_folders.append({
-                        "name":folder_name,
-                        "path":folder_path,
-                        "backup_count":len(backup_files)
-                        })
+        for folder_name, backup_count in sorted(_save_catalog().backup_counts().items()):
+            if backup_count:
+                character_folders.append({
+                "name":folder_name,
+                "path":os.path.join(backup_base, folder_name),
+                "backup_count":backup_count
+                })
 
         self.root.grid_rowconfigure(0, weight = 1)
         self.root.grid_columnconfigure(0, weight = 1)
@@ -3032,36 +3018,15 @@ class CharactersMixin:
         self._clear_window()
         self._play_ui_sound("whoosh1")
 
+        # Listed from the store's index; no backup is opened until one is restored.
         backup_files =[]
-        for backup_path in glob.glob(os.path.join(char_folder["path"], "*.sldsv")):
-            try:
-                filename = os.path.basename(backup_path)
-                mtime = os.path.getmtime(backup_path)
-                mtime_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-
-                timestamp_part = filename.replace("backup_", "").replace(".sldsv", "")
-                try:
-                    if "_"in timestamp_part:
-                        parts = timestamp_part.split("_")
-                        if len(parts)>=2:
-                            date_str = f"{parts[0][:4]}-{parts[0][4:6]}-{parts[0][6:8]}"
-                            time_str = f"{parts[1][:2]}:{parts[1][2:4]}:{parts[1][4:6]}"
-                            display_time = f"{date_str} {time_str}"
-                        else:
-                            display_time = mtime_str
-                    else:
-                        display_time = mtime_str
-                except Exception:
-                    display_time = mtime_str
-
-                backup_files.append({
-                "path":backup_path,
-                "filename":filename,
-                "mtime":mtime,
-                "display_time":display_time
-                })
-            except Exception as e:
-                logging.warning(f"Failed to read backup file info: {e}")
+        for snapshot in _backup_store(char_folder["path"]).snapshots():
+            backup_files.append({
+            "id":snapshot["id"],
+            "filename":f"backup_{snapshot['id']}",
+            "mtime":snapshot["created"],
+            "display_time":datetime.fromtimestamp(snapshot["created"]).strftime("%Y-%m-%d %H:%M:%S")
+            })
 
         backup_files.sort(key = lambda x:x["mtime"], reverse = True)
 
@@ -3086,7 +3051,7 @@ class CharactersMixin:
 
         def load_backup(backup_info):
             try:
-                backup_data = self._read_save_from_path(backup_info["path"])
+                backup_data = self._read_backup(char_folder["path"], backup_info["id"])
                 if backup_data is None:
                     self._popup_show_info("Error", "Failed to read backup file.", sound = "error")
                     return
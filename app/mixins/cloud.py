@@ -9,8 +9,9 @@ class CloudMixin:
     def _cloud_sync_file_set(self):
         """(local_path, remote_name) pairs to push.
 
-        Includes top-level .sldsv saves and the per-character backup saves under
-        backups/<char>/, but NOT the zipped backup archives in backups/<char>/archive/.
+        Includes top-level .sldsv saves and the per-character backup stores under
+        backups/<char>/ (index, snapshot manifests and blobs), but NOT the zipped
+        backup archives in backups/<char>/archive/.
         Backup files use their saves-relative path (posix) as the remote name so
         they restore back into the right subfolder; the signing key is also pushed.
         """
@@ -29,8 +30,12 @@ class CloudMixin:
             for root, dirs, fnames in os.walk(backups_root):
                 # Don't descend into archive/ folders -> excludes the backup archives.
                 dirs[:] = [d for d in dirs if d.lower() != "archive"]
+                in_store = os.path.basename(root) in (_backupstore.BLOBS_DIR, _backupstore.SNAPSHOTS_DIR) or \
+                    os.path.basename(os.path.dirname(root)) == _backupstore.BLOBS_DIR
                 for fname in fnames:
-                    if not fname.lower().endswith(".sldsv"):
+                    if fname.endswith(".tmp"):
+                        continue
+                    if not (fname.lower().endswith(".sldsv") or fname == _backupstore.INDEX_NAME or in_store):
                         continue
                     full = os.path.join(root, fname)
                     rel = os.path.relpath(full, folder).replace(os.sep, "/")
@@ -42,13 +47,8 @@ class CloudMixin:
         return pairs
 
     def _cloud_local_has_character_saves(self):
-        folder = saves_folder or "saves"
-        reserved = {"settings.sldsv", "appearance_settings.sldsv",
-                    "persistent_data.sldsv", "dm_settings.sldsv"}
         try:
-            for fname in os.listdir(folder):
-                if fname.lower().endswith(".sldsv") and fname not in reserved:
-                    return True
+            return _save_catalog().has_saves()
         except Exception:
             logging.exception("Suppressed exception")
         return False
@@ -60,6 +60,7 @@ class CloudMixin:
         on_total(zip_bytes) fires once the zip is built (so a progress UI can set
         its upload denominator); on_chunk(n) fires as the zip streams to Drive.
         """
+        flush_pending_saves()
         import tempfile
         log = logger or (lambda m: logging.info(m))
         pairs = self._cloud_sync_file_set()
@@ -128,9 +129,12 @@ class CloudMixin:
                 shutil.copy2(_cloud_imported_key_path(), primary)
             except Exception:
                 logging.exception("Suppressed exception")
+        _key_ring.invalidate()
 
     def _cloud_restore_all(self, logger=None):
         import tempfile
+        # Restored files must not be overwritten by saves still waiting to be written.
+        flush_pending_saves()
         log = logger or (lambda m: logging.info(m))
         folder_id = _cloud_get_folder_id(create=False)
         if not folder_id:
@@ -294,7 +294,7 @@ class CombatMixin:
                     logging.exception("Suppressed exception")
                 return
 
-            rounds_collected =[]
+            rounds_collected = _roundpack.RoundRuns()
 
             def round_matches(r, calib_list):
                 try:
@@ -377,7 +377,7 @@ class CombatMixin:
                             else:
                                 keep.append(r)
                         for r in take:
-                            rounds_collected.append(r)
+                            rounds_collected.push(r)
                             need -=1
                         itm['rounds']= keep
                         if not itm.get('rounds'):
@@ -390,10 +390,8 @@ class CombatMixin:
                     qty = int(itm.get('quantity')or 0)if isinstance(itm.get('quantity'), (int, float))else 0
                     if qty >0 and('caliber'in itm or 'name'in itm)and item_cal_matches(itm.get('caliber'), calibers)and variant_matches(itm):
                         take_n = min(need, qty)
-                        for _ in range(take_n):
-                            r = {k:v for k, v in itm.items()if k !='quantity'}
-                            rounds_collected.append(r)
-                            need -=1
+                        rounds_collected.push({k:v for k, v in itm.items()if k !='quantity'}, take_n)
+                        need -=take_n
                         itm['quantity']= qty -take_n
                         if itm['quantity']<=0:
                             try:
@@ -405,7 +403,7 @@ class CombatMixin:
                     if itm.get('caliber')and item_cal_matches(itm.get('caliber'), calibers)and variant_matches(itm):
                         try:
                             hands.pop(hi)
-                            rounds_collected.append(itm)
+                            rounds_collected.push(itm)
                             need -=1
                         except Exception:
                             logging.exception("Suppressed exception")
@@ -432,7 +430,7 @@ class CombatMixin:
                                 else:
                                     keep.append(r)
                             for r in take:
-                                rounds_collected.append(r)
+                                rounds_collected.push(r)
                                 need -=1
                             itm['rounds']= keep
                             if not itm.get('rounds'):
@@ -444,10 +442,8 @@ class CombatMixin:
                         qty = int(itm.get('quantity')or 0)if isinstance(itm.get('quantity'), (int, float))else 0
                         if qty >0 and('caliber'in itm or 'name'in itm)and item_cal_matches(itm.get('caliber'), calibers)and variant_matches(itm):
                             take_n = min(need, qty)
-                            for _ in range(take_n):
-                                r = {k:v for k, v in itm.items()if k !='quantity'}
-                                rounds_collected.append(r)
-                                need -=1
+                            rounds_collected.push({k:v for k, v in itm.items()if k !='quantity'}, take_n)
+                            need -=take_n
                             itm['quantity']= qty -take_n
                             if itm['quantity']<=0:
                                 try:
@@ -537,7 +533,7 @@ class CombatMixin:
                 existing = weapon.get('rounds')or[]
                 if not isinstance(existing, list):
                     existing =[]
-                weapon['rounds']= existing +rounds_collected
+                weapon['rounds']= existing +rounds_collected.to_list()
 
                 try:
                     if 'loaded'in weapon:
@@ -985,7 +981,7 @@ class CombatMixin:
 
             if requires_charge:
                 charge_file = os.path.join(magic_folder, "charge.ogg")
-                if os.path.exists(charge_file):
+                if _sound_catalog.exists(charge_file):
                     try:
                         self._safe_sound_play("", charge_file, block = True)
                     except Exception:
@@ -993,7 +989,7 @@ class CombatMixin:
 
             if magicsys =="rf":
                 prefire_file = os.path.join(magic_folder, "prefire.ogg")
-                if os.path.exists(prefire_file):
+                if _sound_catalog.exists(prefire_file):
                     try:
                         self._safe_sound_play("", prefire_file, block = True)
                     except Exception:
@@ -1020,8 +1016,7 @@ class CombatMixin:
             shot_delay = 60.0 /float(rpm)
 
             try:
-                import glob as _glob
-                fire_candidates = _glob.glob(os.path.join(magic_folder, "fire*.ogg"))
+                fire_candidates = _sound_catalog.glob(os.path.join(magic_folder, "fire*.ogg"))
             except Exception:
                 fire_candidates =[]
 
@@ -1039,11 +1034,11 @@ class CombatMixin:
                     block_this_shot = magicsys in("at", "rf")
                     if fire_candidates:
                         chosen = random.choice(fire_candidates)
-                        self._safe_sound_play("", chosen, block = block_this_shot)
+                        self._safe_sound_play("", chosen, block = block_this_shot, mix = True)
                     else:
 
                         fallback_path = os.path.join("sounds", weapon.get("sound_folder", ""), "fire.ogg")
-                        self._safe_sound_play("", fallback_path, block = block_this_shot)
+                        self._safe_sound_play("", fallback_path, block = block_this_shot, mix = True)
                 except Exception:
                     logging.exception("Magic weapon fire sound failed")
 
@@ -1074,7 +1069,7 @@ class CombatMixin:
                     logging.exception("Suppressed exception")
 
             cooling_file = os.path.join(magic_folder, "cooling.ogg")
-            if magicsys in("at", "rf")and os.path.exists(cooling_file):
+            if magicsys in("at", "rf")and _sound_catalog.exists(cooling_file):
                 try:
                     self._safe_sound_play("", cooling_file, block = True)
                 except Exception:
@@ -1283,7 +1278,8 @@ class CombatMixin:
 
         rounds_fired = 0
         jammed = False
-        fired_rounds_list = []
+        # Only the first fired round is read back; a long burst collapses to a run or two.
+        fired_rounds_list = _roundpack.RoundRuns()
 
         fire_to_pump_delay = weapon.get("pump_fire_to_back_delay", 0.12)
         pump_back_to_forward_delay = weapon.get("pump_back_to_forward_delay", 0.15)
@@ -1308,11 +1304,11 @@ class CombatMixin:
                     if fs:
                         wf = os.path.join("sounds", "firearms", str(fs).lower())
                         for pat in(f"{action_name}*.ogg", f"{action_name}*.wav"):
-                            candidates +=glob.glob(os.path.join(wf, pat))
+                            candidates +=_sound_catalog.glob(os.path.join(wf, pat))
                         if not candidates:
                             wf2 = os.path.join("sounds", "firearms", "weaponsounds", str(fs).lower().replace('/', '_'))
                             for pat in(f"{action_name}*.ogg", f"{action_name}*.wav"):
-                                candidates +=glob.glob(os.path.join(wf2, pat))
+                                candidates +=_sound_catalog.glob(os.path.join(wf2, pat))
 
                     try:
                         plat = str(weapon.get("platform")or "").lower().replace('/', '_')
@@ -1321,11 +1317,11 @@ class CombatMixin:
                     if plat:
                         wf3 = os.path.join("sounds", "firearms", "weaponsounds", plat)
                         for pat in(f"{action_name}*.ogg", f"{action_name}*.wav"):
-                            candidates +=glob.glob(os.path.join(wf3, pat))
+                            candidates +=_sound_catalog.glob(os.path.join(wf3, pat))
 
                     uni = os.path.join("sounds", "firearms", "universal")
                     for pat in(f"{action_name}*.ogg", f"{action_name}*.wav"):
-                        candidates +=glob.glob(os.path.join(uni, pat))
+                        candidates +=_sound_catalog.glob(os.path.join(uni, pat))
 
                     return candidates[0]if candidates else None
 
@@ -1349,10 +1345,10 @@ class CombatMixin:
                     path_loop = _find_sound_candidate("rotaryloop")
                     if not path_loop:
                         path_loop = os.path.join("sounds", "firearms", "universal", "rotaryloop.ogg")
-                    if os.path.exists(path_loop):
+                    if _sound_catalog.exists(path_loop):
                         try:
-                            rotary_sound = pygame.mixer.Sound(path_loop)
-                            rotary_channel = pygame.mixer.find_channel()
+                            rotary_sound = _audio_cache.get(path_loop)
+                            rotary_channel = _find_channel()
                             if rotary_channel:
                                 rotary_channel.play(rotary_sound, loops = -1)
                                 rotary_playing = True
@@ -1370,7 +1366,7 @@ class CombatMixin:
             if isinstance(weapon, dict) and str(weapon.get("subtype", "")).lower() == "musket":
                 musket_sound_folder = os.path.join("sounds", "firearms", "weaponsounds", "musket")
                 hammer_file = os.path.join(musket_sound_folder, "hammer.ogg")
-                if os.path.exists(hammer_file):
+                if _sound_catalog.exists(hammer_file):
                     self._safe_sound_play("", hammer_file, block=True)
                     time.sleep(0.15)
         except Exception:
@@ -1414,7 +1410,7 @@ class CombatMixin:
                 slot = cylinder_layout[cylinder_index]
                 if isinstance(slot, dict):
                     fired_round = slot
-                    fired_rounds_list.append(fired_round)
+                    fired_rounds_list.push(fired_round)
 
                     try:
                         self._play_firearm_sound(weapon, "fire", fired_round = fired_round)
@@ -1429,7 +1425,7 @@ class CombatMixin:
                 chambered = None
             elif chambered:
                 fired_round = chambered
-                fired_rounds_list.append(fired_round)
+                fired_rounds_list.push(fired_round)
 
                 try:
 
@@ -1442,7 +1438,7 @@ class CombatMixin:
             elif is_internal and weapon.get("rounds"):
                 chambered = weapon["rounds"].pop(0)
                 fired_round = chambered
-                fired_rounds_list.append(fired_round)
+                fired_rounds_list.push(fired_round)
                 try:
                     self._play_firearm_sound(weapon, "fire", fired_round = fired_round)
                 except Exception:
@@ -1453,7 +1449,7 @@ class CombatMixin:
             elif loaded_mag and loaded_mag.get("rounds"):
                 chambered = loaded_mag["rounds"].pop(0)
                 fired_round = chambered
-                fired_rounds_list.append(fired_round)
+                fired_rounds_list.push(fired_round)
                 try:
                     self._play_firearm_sound(weapon, "fire", fired_round = fired_round)
                 except Exception:
@@ -1605,9 +1601,9 @@ class CombatMixin:
                                 logging.exception("Suppressed exception")
 
                             if is_shotgun:
-                                candidates = glob.glob(os.path.join("sounds", "firearms", "universal", "shelldrop*.ogg"))+glob.glob(os.path.join("sounds", "firearms", "universal", "shelldrop*.wav"))
+                                candidates = _sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "shelldrop*.ogg"))+_sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "shelldrop*.wav"))
                             else:
-                                candidates = glob.glob(os.path.join("sounds", "firearms", "universal", "casing*.ogg"))+glob.glob(os.path.join("sounds", "firearms", "universal", "casing*.wav"))
+                                candidates = _sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "casing*.ogg"))+_sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "casing*.wav"))
 
                             if candidates:
                                 try:
@@ -1814,9 +1810,9 @@ class CombatMixin:
                         cand_list =[]
                         if fs:
                             wf = os.path.join("sounds", "firearms", str(fs).lower())
-                            cand_list +=glob.glob(os.path.join(wf, "rotarywinddown*.ogg"))+glob.glob(os.path.join(wf, "rotarywinddown*.wav"))
+                            cand_list +=_sound_catalog.glob(os.path.join(wf, "rotarywinddown*.ogg"))+_sound_catalog.glob(os.path.join(wf, "rotarywinddown*.wav"))
                             wf2 = os.path.join("sounds", "firearms", "weaponsounds", str(fs).lower().replace('/', '_'))
-                            cand_list +=glob.glob(os.path.join(wf2, "rotarywinddown*.ogg"))+glob.glob(os.path.join(wf2, "rotarywinddown*.wav"))
+                            cand_list +=_sound_catalog.glob(os.path.join(wf2, "rotarywinddown*.ogg"))+_sound_catalog.glob(os.path.join(wf2, "rotarywinddown*.wav"))
 
                         try:
                             plat = str(weapon.get("platform")or "").lower().replace('/', '_')
@@ -1824,10 +1820,10 @@ class CombatMixin:
                             plat = None
                         if plat:
                             wf3 = os.path.join("sounds", "firearms", "weaponsounds", plat)
-                            cand_list +=glob.glob(os.path.join(wf3, "rotarywinddown*.ogg"))+glob.glob(os.path.join(wf3, "rotarywinddown*.wav"))
+                            cand_list +=_sound_catalog.glob(os.path.join(wf3, "rotarywinddown*.ogg"))+_sound_catalog.glob(os.path.join(wf3, "rotarywinddown*.wav"))
 
                         uni = os.path.join("sounds", "firearms", "universal")
-                        cand_list +=glob.glob(os.path.join(uni, "rotarywinddown*.ogg"))+glob.glob(os.path.join(uni, "rotarywinddown*.wav"))
+                        cand_list +=_sound_catalog.glob(os.path.join(uni, "rotarywinddown*.ogg"))+_sound_catalog.glob(os.path.join(uni, "rotarywinddown*.wav"))
 
                         return cand_list[0]if cand_list else None
 
@@ -1956,7 +1952,7 @@ class CombatMixin:
                 return None
 
             if fired_rounds_list:
-                _fr0 = fired_rounds_list[0]
+                _fr0 = fired_rounds_list.peek()
                 src_round_for_display = _fr0
                 if isinstance(_fr0, dict):
                     variant = _fr0.get("variant") or _fr0.get("name") or "Unknown"
@@ -2061,7 +2057,7 @@ class CombatMixin:
                 logging.exception("Suppressed exception")
 
             try:
-                fired_round_for_bonus = fired_rounds_list[0] if fired_rounds_list else chambered
+                fired_round_for_bonus = fired_rounds_list.peek() if fired_rounds_list else chambered
                 if not fired_round_for_bonus and loaded_mag and loaded_mag.get("rounds"):
                     fired_round_for_bonus = loaded_mag["rounds"][0]if loaded_mag["rounds"]else None
 
@@ -2092,10 +2088,8 @@ class CombatMixin:
                         else:
                             tbl_path = os.path.join("tables", sorted(glob.glob(os.path.join("tables", "*.sldtbl")))[0])if glob.glob(os.path.join("tables", "*.sldtbl"))else None
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding = 'utf-8')as tf:
-                                import json as _json
-                                tdata = _json.load(tf)
-                                clamp_val = tdata.get('additional_settings', {}).get('bonus_clamp')
+                            tdata = open_table(tbl_path)
+                            clamp_val = tdata.get('additional_settings', {}).get('bonus_clamp')
                     except Exception:
                         clamp_val = None
 
@@ -2236,25 +2230,23 @@ class CombatMixin:
                         tbl_path = os.path.join("tables", sorted(glob.glob(os.path.join("tables", "*.sldtbl")))[0])if glob.glob(os.path.join("tables", "*.sldtbl"))else None
                     if tbl_path and os.path.exists(tbl_path):
                         try:
-                            with open(tbl_path, 'r', encoding = 'utf-8')as tf:
-                                import json as _json
-                                tdata = _json.load(tf)
-                                ammo_arr = tdata.get('tables', {}).get('ammunition', [])
-                                for a in ammo_arr:
-                                    try:
-                                        if a.get('caliber')==caliber:
-                                            variants = a.get('variants')or[]
-                                            if variants and isinstance(variants, list):
-                                                first = variants[0]
-                                                if isinstance(first, dict)and first.get('name'):
-                                                    round_display = f"{caliber} {first.get('name')}"
-                                                    break
-                                                elif isinstance(first, str)and first:
-                                                    round_display = f"{caliber} {first}"
-                                                    break
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
-                                        continue
+                            tdata = open_table(tbl_path)
+                            ammo_arr = tdata.get('tables', {}).get('ammunition', [])
+                            for a in ammo_arr:
+                                try:
+                                    if a.get('caliber')==caliber:
+                                        variants = a.get('variants')or[]
+                                        if variants and isinstance(variants, list):
+                                            first = variants[0]
+                                            if isinstance(first, dict)and first.get('name'):
+                                                round_display = f"{caliber} {first.get('name')}"
+                                                break
+                                            elif isinstance(first, str)and first:
+                                                round_display = f"{caliber} {first}"
+                                                break
+                                except Exception:
+                                    logging.exception("Suppressed exception")
+                                    continue
                         except Exception:
                             logging.exception("Suppressed exception")
             except Exception:
@@ -2269,7 +2261,7 @@ class CombatMixin:
                 src_round = None
                 try:
                     if fired_rounds_list:
-                        src_round = fired_rounds_list[0]
+                        src_round = fired_rounds_list.peek()
                     elif chambered and isinstance(chambered, dict):
                         src_round = chambered
                     elif loaded_mag and loaded_mag.get('rounds'):
@@ -2338,31 +2330,29 @@ class CombatMixin:
                             else:
                                 tbl_path = os.path.join('tables', sorted(glob.glob(os.path.join('tables', '*.sldtbl')))[0]) if glob.glob(os.path.join('tables', '*.sldtbl')) else None
                             if tbl_path and os.path.exists(tbl_path):
-                                with open(tbl_path, 'r', encoding='utf-8') as tf:
-                                    import json as _json
-                                    tdata = _json.load(tf)
-                                    ammo_arr = tdata.get('tables', {}).get('ammunition', [])
-                                    for a in ammo_arr:
-                                        try:
-                                            if a.get('caliber') == caliber:
-                                                variants = a.get('variants') or []
-                                                for var in variants:
-                                                    if isinstance(var, dict):
-                                                        vname = var.get('name') or var.get('variant') or var.get('variant_name')
-                                                        if vname and str(vname).strip() == str(var_name).strip():
-                                                            pen_val = var.get('pen')
-                                                            if not type_val:
-                                                                type_val = var.get('type')
-                                                            if not round_labels:
-                                                                _lbl = _get_ammo_variant_labels(var)
-                                                                if _lbl:
-                                                                    round_labels = [str(x) for x in _lbl if x]
-                                                            break
-                                                if pen_val is not None:
-                                                    break
-                                        except Exception:
-                                            logging.exception("Suppressed exception")
-                                            continue
+                                tdata = open_table(tbl_path)
+                                ammo_arr = tdata.get('tables', {}).get('ammunition', [])
+                                for a in ammo_arr:
+                                    try:
+                                        if a.get('caliber') == caliber:
+                                            variants = a.get('variants') or []
+                                            for var in variants:
+                                                if isinstance(var, dict):
+                                                    vname = var.get('name') or var.get('variant') or var.get('variant_name')
+                                                    if vname and str(vname).strip() == str(var_name).strip():
+                                                        pen_val = var.get('pen')
+                                                        if not type_val:
+                                                            type_val = var.get('type')
+                                                        if not round_labels:
+                                                            _lbl = _get_ammo_variant_labels(var)
+                                                            if _lbl:
+                                                                round_labels = [str(x) for x in _lbl if x]
+                                                        break
+                                            if pen_val is not None:
+                                                break
+                                    except Exception:
+                                        logging.exception("Suppressed exception")
+                                        continue
                         except Exception:
                             logging.exception("Suppressed exception")
 
@@ -2377,74 +2367,72 @@ class CombatMixin:
                         else:
                             tbl_path = os.path.join('tables', sorted(glob.glob(os.path.join('tables', '*.sldtbl')))[0]) if glob.glob(os.path.join('tables', '*.sldtbl')) else None
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding='utf-8') as tf:
-                                import json as _json
-                                tdata = _json.load(tf)
-                                ammo_arr = tdata.get('tables', {}).get('ammunition', [])
-                                def _norm_cal_set(v):
-                                    out = set()
-                                    if isinstance(v, list):
-                                        for x in v:
-                                            if x is not None:
-                                                out.add(str(x).strip().lower())
-                                    elif v is not None:
-                                        out.add(str(v).strip().lower())
-                                    return out
-
-                                src_cal_set = _norm_cal_set(src_caliber)
-                                weapon_cal_set = _norm_cal_set(caliber_list)
-                                best_match = None
-                                best_score = -1
-
-                                for a in ammo_arr:
-                                    try:
-                                        variants = a.get('variants') or []
-                                        entry_cal_set = _norm_cal_set(a.get('caliber'))
-                                        entry_name = str(a.get('name') or '').strip().lower()
-                                        for var in variants:
-                                            if not isinstance(var, dict):
-                                                continue
-                                            vname = var.get('name') or var.get('variant') or var.get('variant_name')
-                                            if not(vname and str(vname).strip() == str(src_variant_name).strip()):
-                                                continue
+                            tdata = load_table_data(tbl_path)
+                            ammo_arr = tdata.get('tables', {}).get('ammunition', [])
+                            def _norm_cal_set(v):
+                                out = set()
+                                if isinstance(v, list):
+                                    for x in v:
+                                        if x is not None:
+                                            out.add(str(x).strip().lower())
+                                elif v is not None:
+                                    out.add(str(v).strip().lower())
+                                return out
+
+                            src_cal_set = _norm_cal_set(src_caliber)
+                            weapon_cal_set = _norm_cal_set(caliber_list)
+                            best_match = None
+                            best_score = -1
+
+                            for a in ammo_arr:
+                                try:
+                                    variants = a.get('variants') or []
+                                    entry_cal_set = _norm_cal_set(a.get('caliber'))
+                                    entry_name = str(a.get('name') or '').strip().lower()
+                                    for var in variants:
+                                        if not isinstance(var, dict):
+                                            continue
+                                        vname = var.get('name') or var.get('variant') or var.get('variant_name')
+                                        if not(vname and str(vname).strip() == str(src_variant_name).strip()):
+                                            continue
 
-                                            score = 1
-                                            if src_cal_set and entry_cal_set and src_cal_set.intersection(entry_cal_set):
-                                                score += 8
-                                            if weapon_cal_set and entry_cal_set and weapon_cal_set.intersection(entry_cal_set):
-                                                score += 3
-                                            if isinstance(src_round, dict):
-                                                _sn = str(src_round.get('name') or '').lower()
-                                                if _sn:
-                                                    for ec in entry_cal_set:
-                                                        if ec and ec in _sn:
-                                                            score += 2
-                                                            break
-                                                    if entry_name and entry_name in _sn:
-                                                        score += 6
-                                                    elif entry_name:
-                                                        # Light fuzzy boost if many entry words appear in round name.
-                                                        _hit_words = 0
-                                                        for _w in entry_name.replace('-', ' ').split():
-                                                            if len(_w) >= 4 and _w in _sn:
-                                                                _hit_words += 1
-                                                        score += min(3, _hit_words)
-
-                                            if score > best_score:
-                                                best_score = score
-                                                best_match = var
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
-                                        continue
+                                        score = 1
+                                        if src_cal_set and entry_cal_set and src_cal_set.intersection(entry_cal_set):
+                                            score += 8
+                                        if weapon_cal_set and entry_cal_set and weapon_cal_set.intersection(entry_cal_set):
+                                            score += 3
+                                        if isinstance(src_round, dict):
+                                            _sn = str(src_round.get('name') or '').lower()
+                                            if _sn:
+                                                for ec in entry_cal_set:
+                                                    if ec and ec in _sn:
+                                                        score += 2
+                                                        break
+                                                if entry_name and entry_name in _sn:
+                                                    score += 6
+                                                elif entry_name:
+                                                    # Light fuzzy boost if many entry words appear in round name.
+                                                    _hit_words = 0
+                                                    for _w in entry_name.replace('-', ' ').split():
+                                                        if len(_w) >= 4 and _w in _sn:
+                                                            _hit_words += 1
+                                                    score += min(3, _hit_words)
+
+                                        if score > best_score:
+                                            best_score = score
+                                            best_match = var
+                                except Exception:
+                                    logging.exception("Suppressed exception")
+                                    continue
 
-                                if isinstance(best_match, dict):
-                                    if best_match.get('pen') not in (None, ''):
-                                        pen_val = best_match.get('pen')
-                                    if best_match.get('type') not in (None, ''):
-                                        type_val = best_match.get('type')
-                                    _lbl = _get_ammo_variant_labels(best_match)
-                                    if _lbl:
-                                        round_labels = [str(x) for x in _lbl if x]
+                            if isinstance(best_match, dict):
+                                if best_match.get('pen') not in (None, ''):
+                                    pen_val = best_match.get('pen')
+                                if best_match.get('type') not in (None, ''):
+                                    type_val = best_match.get('type')
+                                _lbl = _get_ammo_variant_labels(best_match)
+                                if _lbl:
+                                    round_labels = [str(x) for x in _lbl if x]
                     except StopIteration:
                         logging.exception("Suppressed exception")
                     except Exception:
@@ -2498,7 +2486,7 @@ class CombatMixin:
                 sd_ref2 = save_data if isinstance(save_data, dict)else globals().get('save_data')or getattr(self, '_current_save_data', None)
                 fired_round_ref = None
                 try:
-                    fired_round_ref = fired_rounds_list[0] if fired_rounds_list else fired_round
+                    fired_round_ref = fired_rounds_list.peek() if fired_rounds_list else fired_round
                 except Exception:
                     logging.exception("Suppressed exception")
                 if fired_round_ref is None:
@@ -2728,12 +2716,11 @@ class CombatMixin:
             mag_to_load = weapon.get("mag_to_load")
             has_magazine_in_pool = weapon.get("has_magazine_in_pool", True)
 
-            table_data = None
+            table_index = None
             try:
                 tbl_path = get_current_table_path()
                 if tbl_path and os.path.exists(tbl_path):
-                    with open(tbl_path, 'r', encoding = 'utf-8')as f:
-                        table_data = json.load(f)
+                    table_index = get_table_index(tbl_path)
             except Exception:
                 logging.exception("Failed to load table data for infinite ammo reload")
 
@@ -2761,26 +2748,24 @@ class CombatMixin:
                         "caliber":caliber,
                         "variant":"Infinite"
                         })
-            elif mag_to_load is not None and table_data:
+            elif mag_to_load is not None and table_index is not None:
 
                 mag_id = mag_to_load if isinstance(mag_to_load, int)else None
                 if mag_id is not None:
-                    magazines = table_data.get("tables", {}).get("magazines", [])
-                    for mag in magazines:
-                        if mag.get("id")==mag_id:
-
-                            new_mag = json.loads(json.dumps(mag))
-                            capacity = new_mag.get("capacity", 30)
-                            new_mag["rounds"]=[]
-                            new_mag["infinite"]= True
-
-                            for _ in range(capacity):
-                                new_mag["rounds"].append({
-                                "name":f"{caliber} | Infinite",
-                                "caliber":caliber,
-                                "variant":"Infinite"
-                                })
-                            break
+                    mag = table_index.item(mag_id)
+                    if isinstance(mag, dict)and table_index.subtable_of.get(mag_id)=="magazines":
+
+                        new_mag = json.loads(json.dumps(mag))
+                        capacity = new_mag.get("capacity", 30)
+                        new_mag["rounds"]=[]
+                        new_mag["infinite"]= True
+
+                        for _ in range(capacity):
+                            new_mag["rounds"].append({
+                            "name":f"{caliber} | Infinite",
+                            "caliber":caliber,
+                            "variant":"Infinite"
+                            })
 
             if new_mag is None:
                 capacity = 30
@@ -3160,8 +3145,7 @@ class CombatMixin:
             maxid = 0
             for tf in table_files:
                 try:
-                    with open(tf, 'r', encoding = 'utf-8')as fh:
-                        td = json.load(fh)
+                    td = get_table_data(tf)
                     tables = td.get('tables', {})
                     for sub, items in tables.items():
                         if isinstance(items, list):
@@ -3266,10 +3250,10 @@ class CombatMixin:
                 try:
                     for p in patterns:
 
-                        candidates +=glob.glob(os.path.join(wf, p))
+                        candidates +=_sound_catalog.glob(os.path.join(wf, p))
                         try:
                             wav_pat = p.replace('.ogg', '.wav')if '.ogg'in p else p +'.wav'
-                            candidates +=glob.glob(os.path.join(wf, wav_pat))
+                            candidates +=_sound_catalog.glob(os.path.join(wf, wav_pat))
                         except Exception:
                             logging.exception("Suppressed exception")
                 except Exception:
@@ -3277,10 +3261,10 @@ class CombatMixin:
 
                 if not candidates:
                     for p in patterns:
-                        candidates +=glob.glob(os.path.join("sounds", "firearms", "40mm_grenade", p))
+                        candidates +=_sound_catalog.glob(os.path.join("sounds", "firearms", "40mm_grenade", p))
                         try:
                             wav_pat = p.replace('.ogg', '.wav')if '.ogg'in p else p +'.wav'
-                            candidates +=glob.glob(os.path.join("sounds", "firearms", "40mm_grenade", wav_pat))
+                            candidates +=_sound_catalog.glob(os.path.join("sounds", "firearms", "40mm_grenade", wav_pat))
                         except Exception:
                             logging.exception("Suppressed exception")
                 if candidates:
@@ -3687,8 +3671,8 @@ class CombatMixin:
             wf = os.path.join("sounds", "firearms", "weaponsounds", str(defaults.get("reload_sound_folder", "40mm_grenade")).lower().replace('/', '_'))
             logging.debug("Underbarrel reload: platform=%s wf=%s, defaults=%s, found_item=%s, found_location=%s", platform, wf, defaults, getattr(found_item, 'get', lambda k:None)('name')if isinstance(found_item, dict)else found_item, found_location)
 
-            open_candidates = glob.glob(os.path.join(wf, "open*.ogg"))+glob.glob(os.path.join(wf, "open*.wav"))
-            open_candidates +=glob.glob(os.path.join(wf, "door*.ogg"))+glob.glob(os.path.join(wf, "door*.wav"))
+            open_candidates = _sound_catalog.glob(os.path.join(wf, "open*.ogg"))+_sound_catalog.glob(os.path.join(wf, "open*.wav"))
+            open_candidates +=_sound_catalog.glob(os.path.join(wf, "door*.ogg"))+_sound_catalog.glob(os.path.join(wf, "door*.wav"))
             logging.debug("Underbarrel reload: open_candidates=%s", open_candidates)
             if open_candidates:
                 logging.debug("Playing underbarrel open sound: %s", open_candidates[0])
@@ -3696,8 +3680,8 @@ class CombatMixin:
             else:
 
                 alt_wf = os.path.join("sounds", "firearms", "weaponsounds", "m203")
-                alt_open = glob.glob(os.path.join(alt_wf, "open*.ogg"))+glob.glob(os.path.join(alt_wf, "open*.wav"))
-                alt_open +=glob.glob(os.path.join(alt_wf, "door*.ogg"))+glob.glob(os.path.join(alt_wf, "door*.wav"))
+                alt_open = _sound_catalog.glob(os.path.join(alt_wf, "open*.ogg"))+_sound_catalog.glob(os.path.join(alt_wf, "open*.wav"))
+                alt_open +=_sound_catalog.glob(os.path.join(alt_wf, "door*.ogg"))+_sound_catalog.glob(os.path.join(alt_wf, "door*.wav"))
                 logging.debug("Underbarrel reload: alt_open_candidates=%s", alt_open)
                 if alt_open:
                     logging.debug("Playing underbarrel open sound from alt m203: %s", alt_open[0])
@@ -3710,14 +3694,14 @@ class CombatMixin:
 
             time.sleep(random.uniform(1.0, 1.5))
 
-            insert_candidates = glob.glob(os.path.join(wf, "insert*.ogg"))+glob.glob(os.path.join(wf, "insert*.wav"))
+            insert_candidates = _sound_catalog.glob(os.path.join(wf, "insert*.ogg"))+_sound_catalog.glob(os.path.join(wf, "insert*.wav"))
             logging.debug("Underbarrel reload: insert_candidates=%s", insert_candidates)
             if insert_candidates:
                 logging.debug("Playing underbarrel insert sound: %s", insert_candidates[0])
                 self._safe_sound_play("", random.choice(insert_candidates), block = True)
             else:
                 alt_wf = os.path.join("sounds", "firearms", "weaponsounds", "m203")
-                alt_insert = glob.glob(os.path.join(alt_wf, "insert*.ogg"))+glob.glob(os.path.join(alt_wf, "insert*.wav"))
+                alt_insert = _sound_catalog.glob(os.path.join(alt_wf, "insert*.ogg"))+_sound_catalog.glob(os.path.join(alt_wf, "insert*.wav"))
                 logging.debug("Underbarrel reload: alt_insert_candidates=%s", alt_insert)
                 if alt_insert:
                     logging.debug("Playing underbarrel insert sound from alt m203: %s", alt_insert[0])
@@ -3730,16 +3714,16 @@ class CombatMixin:
 
             time.sleep(random.uniform(1.0, 1.5))
 
-            close_candidates = glob.glob(os.path.join(wf, "close*.ogg"))+glob.glob(os.path.join(wf, "close*.wav"))
-            close_candidates +=glob.glob(os.path.join(wf, "shut*.ogg"))+glob.glob(os.path.join(wf, "shut*.wav"))
+            close_candidates = _sound_catalog.glob(os.path.join(wf, "close*.ogg"))+_sound_catalog.glob(os.path.join(wf, "close*.wav"))
+            close_candidates +=_sound_catalog.glob(os.path.join(wf, "shut*.ogg"))+_sound_catalog.glob(os.path.join(wf, "shut*.wav"))
             logging.debug("Underbarrel reload: close_candidates=%s", close_candidates)
             if close_candidates:
                 logging.debug("Playing underbarrel close sound: %s", close_candidates[0])
                 self._safe_sound_play("", random.choice(close_candidates), block = True)
             else:
                 alt_wf = os.path.join("sounds", "firearms", "weaponsounds", "m203")
-                alt_close = glob.glob(os.path.join(alt_wf, "close*.ogg"))+glob.glob(os.path.join(alt_wf, "close*.wav"))
-                alt_close +=glob.glob(os.path.join(alt_wf, "shut*.ogg"))+glob.glob(os.path.join(alt_wf, "shut*.wav"))
+                alt_close = _sound_catalog.glob(os.path.join(alt_wf, "close*.ogg"))+_sound_catalog.glob(os.path.join(alt_wf, "close*.wav"))
+                alt_close +=_sound_catalog.glob(os.path.join(alt_wf, "shut*.ogg"))+_sound_catalog.glob(os.path.join(alt_wf, "shut*.wav"))
                 logging.debug("Underbarrel reload: alt_close_candidates=%s", alt_close)
                 if alt_close:
                     logging.debug("Playing underbarrel close sound from alt m203: %s", alt_close[0])
@@ -4796,11 +4780,11 @@ class CombatMixin:
             sound_duration = 0
             if sound_file:
                 path = os.path.join(musket_sound_folder, sound_file)
-                if os.path.exists(path):
+                if _sound_catalog.exists(path):
                     try:
-                        snd = pygame.mixer.Sound(path)
+                        snd = _audio_cache.get(path)
                         sound_duration = snd.get_length()
-                        channel = pygame.mixer.find_channel()
+                        channel = _find_channel()
                         if channel:
                             channel.play(snd)
                     except Exception:
@@ -5030,15 +5014,15 @@ class CombatMixin:
 
             if sound_folder:
                 wf = os.path.join("sounds", "firearms", "weaponsounds", str(sound_folder).lower().replace('/', '_'))
-                candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
 
             if not candidates and platform:
                 wf = os.path.join("sounds", "firearms", "weaponsounds", platform)
-                candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
 
             if not candidates:
                 uni = os.path.join("sounds", "firearms", "universal")
-                candidates = glob.glob(os.path.join(uni, f"{action_type}*.ogg"))+glob.glob(os.path.join(uni, f"{action_type}*.wav"))
+                candidates = _sound_catalog.glob(os.path.join(uni, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(uni, f"{action_type}*.wav"))
 
             if candidates:
                 sound_file = random.choice(candidates)
@@ -5070,13 +5054,8 @@ class CombatMixin:
 
             try:
                 cleaning_path = os.path.join("sounds", "firearms", "universal", "cleaning.ogg")
-                if os.path.exists(cleaning_path):
-                    if not hasattr(self, "_sound_cache"):
-                        self._sound_cache = {}
-                    snd = self._sound_cache.get(cleaning_path)
-                    if snd is None:
-                        snd = pygame.mixer.Sound(cleaning_path)
-                        self._sound_cache[cleaning_path] = snd
+                if _sound_catalog.exists(cleaning_path):
+                    snd = _audio_cache.get(cleaning_path)
                     cleaning_channel = snd.play()
                 else:
                     self._play_weapon_action_sound(weapon, "cleaning")
@@ -5700,7 +5679,9 @@ class CombatMixin:
             mag_type = str(weapon.get("magazinetype", "")or "").lower()
             is_internal_box = "internal"in mag_type and "box"in mag_type
 
-        rounds_collected =[]
+        # Rounds pulled from hands, as runs: a quantity stack adds one run
+        # rather than a dict per round; reload_step materialises them one at a time.
+        rounds_collected = _roundpack.RoundRuns()
 
         def round_matches_filter(r):
 
@@ -5737,7 +5718,7 @@ class CombatMixin:
                             remaining_rounds.append(r)
 
                     for r in rounds_to_take:
-                        rounds_collected.append(r)
+                        rounds_collected.push(r)
                         rounds_to_add -=1
 
                     item["rounds"]= remaining_rounds
@@ -5756,10 +5737,8 @@ class CombatMixin:
                 qty = int(item.get("quantity")or 0)if isinstance(item.get("quantity"), (int, float))else 0
                 if qty >0 and("caliber"in item or "name"in item):
                     take = min(rounds_to_add, qty)
-                    for _ in range(take):
-                        r = {k:v for k, v in item.items()if k !="quantity"}
-                        rounds_collected.append(r)
-                        rounds_to_add -=1
+                    rounds_collected.push({k:v for k, v in item.items()if k !="quantity"}, take)
+                    rounds_to_add -=take
                     item["quantity"]= qty -take
                     if item["quantity"]<=0:
                         try:
@@ -5771,7 +5750,7 @@ class CombatMixin:
                 if item.get("caliber"):
                     try:
                         hands_items.pop(hi)
-                        rounds_collected.append(item)
+                        rounds_collected.push(item)
                         rounds_to_add -=1
                     except Exception:
                         logging.exception("Suppressed exception")
@@ -5821,9 +5800,9 @@ class CombatMixin:
             insert_sound = f"bulletinsert{random.randint(0, 1)}"
             try:
                 sound_path = os.path.join("sounds", "firearms", "universal", f"{insert_sound}.ogg")
-                if os.path.exists(sound_path):
-                    sound = pygame.mixer.Sound(sound_path)
-                    channel = pygame.mixer.find_channel()
+                if _sound_catalog.exists(sound_path):
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
                         channel.play(sound)
             except Exception as e:
@@ -5831,11 +5810,11 @@ class CombatMixin:
 
         def start_reloader_sound():
             reloader_sound_path = os.path.join("sounds", "firearms", "universal", "reloaderloop.ogg")
-            if os.path.exists(reloader_sound_path):
-                channel = pygame.mixer.find_channel()
+            if _sound_catalog.exists(reloader_sound_path):
+                channel = _find_channel()
                 if channel:
                     try:
-                        sound = pygame.mixer.Sound(reloader_sound_path)
+                        sound = _audio_cache.get(reloader_sound_path)
                         channel.play(sound, loops = -1)
                         reload_state["reloader_channel"]= channel
                         reload_state["reloader_sound"]= sound
@@ -5846,9 +5825,9 @@ class CombatMixin:
 
             try:
                 sound_path = os.path.join("sounds", "firearms", "universal", "reloaderroundinsert.ogg")
-                if os.path.exists(sound_path):
-                    sound = pygame.mixer.Sound(sound_path)
-                    channel = pygame.mixer.find_channel()
+                if _sound_catalog.exists(sound_path):
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
                         channel.play(sound)
 
@@ -5911,7 +5890,7 @@ class CombatMixin:
                     on_complete(message)
                 return
 
-            current_rounds.append(rounds_collected[idx])
+            current_rounds.append(rounds_collected.pop())
             reload_state["index"]+=1
 
             progress = reload_state["index"]/loaded_from_hands
@@ -5962,15 +5941,15 @@ class CombatMixin:
                     duration_ms = 800
 
                     if wf:
-                        candidates = glob.glob(os.path.join(wf, "boltback*.ogg"))+glob.glob(os.path.join(wf, "boltback*.wav"))
+                        candidates = _sound_catalog.glob(os.path.join(wf, "boltback*.ogg"))+_sound_catalog.glob(os.path.join(wf, "boltback*.wav"))
                         if candidates:
                             sound_file = random.choice(candidates)
 
-                    if sound_file and os.path.exists(sound_file):
+                    if sound_file and _sound_catalog.exists(sound_file):
                         try:
-                            sound = pygame.mixer.Sound(sound_file)
+                            sound = _audio_cache.get(sound_file)
                             duration_ms = int(sound.get_length()*1000)+100
-                            channel = pygame.mixer.find_channel()
+                            channel = _find_channel()
                             if channel:
                                 channel.play(sound)
                         except Exception:
@@ -6014,8 +5993,7 @@ class CombatMixin:
             magazine["rounds"]= current_rounds
 
         if variant_filter:
-            matching_count = sum(1 for r in current_rounds if isinstance(r, dict)and str(r.get('variant', 'Unknown')).lower()==str(variant_filter).lower())
-            rounds_to_remove = matching_count
+            rounds_to_remove = _roundpack.RoundRuns(current_rounds).count_variant(variant_filter)
         else:
             rounds_to_remove = len(current_rounds)
 
@@ -6062,16 +6040,16 @@ class CombatMixin:
         "index":0,
         "reloader_channel":None,
         "reloader_sound":None,
-        "rounds_removed":[]
+        "rounds_removed":_roundpack.RoundRuns()
         }
 
         def play_insert_sound():
             insert_sound = f"bulletinsert{random.randint(0, 1)}"
             try:
                 sound_path = os.path.join("sounds", "firearms", "universal", f"{insert_sound}.ogg")
-                if os.path.exists(sound_path):
-                    sound = pygame.mixer.Sound(sound_path)
-                    channel = pygame.mixer.find_channel()
+                if _sound_catalog.exists(sound_path):
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
                         channel.play(sound)
             except Exception as e:
@@ -6079,11 +6057,11 @@ class CombatMixin:
 
         def start_reloader_sound():
             reloader_sound_path = os.path.join("sounds", "firearms", "universal", "reloaderloop.ogg")
-            if os.path.exists(reloader_sound_path):
-                channel = pygame.mixer.find_channel()
+            if _sound_catalog.exists(reloader_sound_path):
+                channel = _find_channel()
                 if channel:
                     try:
-                        sound = pygame.mixer.Sound(reloader_sound_path)
+                        sound = _audio_cache.get(reloader_sound_path)
                         channel.play(sound, loops = -1)
                         unload_state["reloader_channel"]= channel
                         unload_state["reloader_sound"]= sound
@@ -6094,9 +6072,9 @@ class CombatMixin:
 
             try:
                 sound_path = os.path.join("sounds", "firearms", "universal", "reloaderroundinsert.ogg")
-                if os.path.exists(sound_path):
-                    sound = pygame.mixer.Sound(sound_path)
-                    channel = pygame.mixer.find_channel()
+                if _sound_catalog.exists(sound_path):
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
                         channel.play(sound)
                         return int(sound.get_length()*1000)
@@ -6182,7 +6160,7 @@ class CombatMixin:
                         removed = current_rounds.pop()
 
                     if removed is not None:
-                        unload_state["rounds_removed"].append(removed)
+                        unload_state["rounds_removed"].push(removed)
                 except Exception:
                     logging.exception("Suppressed exception")
 
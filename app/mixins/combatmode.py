@@ -34,8 +34,7 @@ class CombatmodeMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
@@ -286,9 +285,7 @@ class CombatmodeMixin:
 
         weather_sound_state = {"channel": None, "sound": None, "thunder_after_id": None}
 
-        def _start_weather_sounds():
-            if not appearance_settings.get("weather_audio_effects", True):
-                return
+        def _weather_loop_file():
             w = weather_state.get("weather", "clear")
             loop_map = {
                 "rain": "rain_loop.ogg",
@@ -302,21 +299,39 @@ class CombatmodeMixin:
             wind_sev = weather_state.get("wind_severity", 0)
             if not loop_file and wind_sev > 0:
                 loop_file = "wind_loop.ogg"
+            return loop_file
+
+        def _weather_sound_paths():
+            if not appearance_settings.get("weather_audio_effects", True):
+                return []
+            paths = []
+            loop_file = _weather_loop_file()
+            if loop_file:
+                paths.append(os.path.join("sounds", "ambience", loop_file))
+            if weather_state.get("weather", "clear") in ("thunderstorm", "thunder_hard_rain", "thundersnow", "thunder"):
+                paths += [os.path.join("sounds", "ambience", f"thunder{idx}.ogg") for idx in range(5)]
+            return paths
+
+        def _start_weather_sounds():
+            if not appearance_settings.get("weather_audio_effects", True):
+                return
+            loop_file = _weather_loop_file()
             if not loop_file:
                 return
             try:
                 loop_path = os.path.join("sounds", "ambience", loop_file)
                 if os.path.exists(loop_path):
-                    snd = pygame.mixer.Sound(loop_path)
+                    snd = _audio_cache.get(loop_path)
                     vol = appearance_settings.get("sound_volume", 100) / 100.0
                     vol *= 0.5
-                    snd.set_volume(min(1.0, max(0.0, vol)))
                     try:
                         ch = pygame.mixer.Channel(pygame.mixer.get_num_channels() - 1)
                     except Exception:
-                        ch = pygame.mixer.find_channel(True)
+                        ch = _find_channel(True)
                     if ch:
+                        # The Sound is shared through _audio_cache; the volume goes on the channel.
                         ch.play(snd, loops = -1)
+                        ch.set_volume(min(1.0, max(0.0, vol)))
                         weather_sound_state["channel"] = ch # type: ignore
                         weather_sound_state["sound"] = snd # type: ignore
                         self._weather_ambient_channel = ch
@@ -347,12 +362,12 @@ class CombatmodeMixin:
                     idx = random.randint(0, 4)
                     thunder_path = os.path.join("sounds", "ambience", f"thunder{idx}.ogg")
                     if os.path.exists(thunder_path):
-                        snd = pygame.mixer.Sound(thunder_path)
+                        snd = _audio_cache.get(thunder_path)
                         vol = appearance_settings.get("sound_volume", 100) / 100.0 * 0.7
-                        snd.set_volume(min(1.0, max(0.0, vol)))
-                        ch = pygame.mixer.find_channel()
+                        ch = _find_channel()
                         if ch:
                             ch.play(snd)
+                            ch.set_volume(min(1.0, max(0.0, vol)))
                 except Exception:
                     logging.exception("Failed to play thunder sound")
 
@@ -450,6 +465,13 @@ class CombatmodeMixin:
             except Exception:
                 logging.exception("Failed to create lightning flash")
 
+        try:
+            _preload_items = [entry["item"] for entry in equipped_weapons]
+            _cur = combat_state.get("current_weapon_index", 0)
+            self._preload_combat_sounds(_preload_items[_cur:] + _preload_items[:_cur], _weather_sound_paths())
+        except Exception:
+            logging.exception("Failed to start combat sound preload")
+
         _start_weather_sounds()
         _schedule_thunder()
 
@@ -503,9 +525,8 @@ class CombatmodeMixin:
                     try:
                         tbl_path = get_current_table_path()
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding = 'utf-8-sig')as tf:
-                                td = json.load(tf)
-                                stat_clamp = td.get("additional_settings", {}).get("stat_clamp", stat_clamp)
+                            td = open_table(tbl_path)
+                            stat_clamp = td.get("additional_settings", {}).get("stat_clamp", stat_clamp)
                     except Exception:
                         logging.exception("Suppressed exception")
                 except Exception:
@@ -615,9 +636,8 @@ class CombatmodeMixin:
                         clamp_val = None
                         tbl_path = get_current_table_path()
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding = 'utf-8-sig')as tf:
-                                td = json.load(tf)
-                                clamp_val = td.get('additional_settings', {}).get('bonus_clamp')
+                            td = open_table(tbl_path)
+                            clamp_val = td.get('additional_settings', {}).get('bonus_clamp')
                     except Exception:
                         clamp_val = None
 
@@ -3785,8 +3805,7 @@ class CombatmodeMixin:
                         table_files = sorted(glob.glob(os.path.join('tables', f"*{global_variables.get('table_extension', '.sldtbl')}")))
                         for tf in table_files:
                             try:
-                                with open(tf, 'r', encoding = 'utf-8')as tfh:
-                                    td = json.load(tfh)
+                                td = get_table_data(tf)
                                 tables = td.get('tables', {})
                                 for subname, items in tables.items():
                                     if not isinstance(items, list):
@@ -3838,8 +3857,7 @@ class CombatmodeMixin:
                         table_files = sorted(glob.glob(os.path.join('tables', f"*{global_variables.get('table_extension', '.sldtbl')}")))
                         for tf in table_files:
                             try:
-                                with open(tf, 'r', encoding = 'utf-8')as tfh:
-                                    td = json.load(tfh)
+                                td = get_table_data(tf)
                                 tables = td.get('tables', {})
                                 for subname, items in tables.items():
                                     if not isinstance(items, list):
@@ -4343,8 +4361,7 @@ class CombatmodeMixin:
                     try:
                         tbl_path = get_current_table_path()
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                                table_data = json.load(f)
+                            table_data = open_table(tbl_path)
                             for ammo in table_data.get("tables", {}).get("ammunition", []):
                                 if ammo.get("caliber")==caliber_part or ammo.get("name")==caliber_part:
                                     for var in ammo.get("variants", []):
@@ -5193,8 +5210,8 @@ class CombatmodeMixin:
                             try:
                                 rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderloop.ogg')
                                 if os.path.exists(rpath):
-                                    snd = pygame.mixer.Sound(rpath)
-                                    ch = pygame.mixer.find_channel()
+                                    snd = _audio_cache.get(rpath)
+                                    ch = _find_channel()
                                     if ch:
                                         ch.play(snd, loops = -1)
                                         _reloader_state['channel'] = ch
@@ -5206,8 +5223,8 @@ class CombatmodeMixin:
                             try:
                                 rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderroundinsert.ogg')
                                 if os.path.exists(rpath):
-                                    snd = pygame.mixer.Sound(rpath)
-                                    ch = pygame.mixer.find_channel()
+                                    snd = _audio_cache.get(rpath)
+                                    ch = _find_channel()
                                     if ch:
                                         ch.play(snd)
                                         return int(snd.get_length() * 1000)
@@ -6068,8 +6085,8 @@ class CombatmodeMixin:
                                     uls['stoggle'] = 1 - uls['stoggle']
                                     sound_path = os.path.join('sounds', 'firearms', 'universal', f'{sn}.ogg')
                                     if os.path.exists(sound_path):
-                                        snd = pygame.mixer.Sound(sound_path)
-                                        ch = pygame.mixer.find_channel()
+                                        snd = _audio_cache.get(sound_path)
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(snd)
                                 except Exception:
@@ -6156,8 +6173,8 @@ class CombatmodeMixin:
                                 try:
                                     rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderloop.ogg')
                                     if os.path.exists(rpath):
-                                        snd = pygame.mixer.Sound(rpath)
-                                        ch = pygame.mixer.find_channel()
+                                        snd = _audio_cache.get(rpath)
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(snd, loops = -1)
                                             _unl_reloader['ch'] = ch # type: ignore
@@ -6177,8 +6194,8 @@ class CombatmodeMixin:
                                 try:
                                     rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderroundinsert.ogg')
                                     if os.path.exists(rpath):
-                                        snd = pygame.mixer.Sound(rpath)
-                                        ch = pygame.mixer.find_channel()
+                                        snd = _audio_cache.get(rpath)
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(snd)
                                 except Exception:
@@ -6226,8 +6243,8 @@ class CombatmodeMixin:
                                 try:
                                     rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderroundinsert.ogg')
                                     if os.path.exists(rpath):
-                                        snd = pygame.mixer.Sound(rpath)
-                                        ch = pygame.mixer.find_channel()
+                                        snd = _audio_cache.get(rpath)
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(snd)
                                 except Exception:
@@ -10513,8 +10530,8 @@ class CombatmodeMixin:
                     try:
                         spath = os.path.join('sounds', 'firearms', 'weaponsounds', 'break action', f'{action_name}.ogg')
                         if os.path.exists(spath):
-                            snd = pygame.mixer.Sound(spath)
-                            ch = pygame.mixer.find_channel()
+                            snd = _audio_cache.get(spath)
+                            ch = _find_channel()
                             if ch:
                                 ch.play(snd)
                     except Exception:
@@ -10526,8 +10543,8 @@ class CombatmodeMixin:
                         ls['stoggle'] = 1 - ls['stoggle']
                         spath = os.path.join('sounds', 'firearms', 'universal', f'{sn}.ogg')
                         if os.path.exists(spath):
-                            snd = pygame.mixer.Sound(spath)
-                            ch = pygame.mixer.find_channel()
+                            snd = _audio_cache.get(spath)
+                            ch = _find_channel()
                             if ch:
                                 ch.play(snd)
                     except Exception:
@@ -11098,16 +11115,6 @@ class CombatmodeMixin:
                                 try:
                                     self._flashbang_mute = False
                                     self._flashbang_volume = 1.0
-
-                                    try:
-                                        cache = getattr(self, '_sound_cache', {})or {}
-                                        for spath, ssound in cache.items():
-                                            try:
-                                                ssound.set_volume(1.0)
-                                            except Exception:
-                                                logging.exception("Suppressed exception")
-                                    except Exception:
-                                        logging.exception("Suppressed exception")
                                 except Exception:
                                     logging.exception("Suppressed exception")
                             except Exception:
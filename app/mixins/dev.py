@@ -264,8 +264,7 @@ class DevMixin:
                     id_map = {}
                     for tf in table_files:
                         try:
-                            with open(tf, 'r', encoding = 'utf-8')as fh:
-                                td = json.load(fh)
+                            td = get_table_data(tf)or {}
                             tables = td.get('tables', {})
                             for sub, items in tables.items():
                                 if isinstance(items, list):
@@ -281,10 +280,53 @@ class DevMixin:
                     snap['duplicate_ids']= sum(1 for k, v in id_map.items()if v >1)
                     snap['total_ids']= len(id_map)
                     snap['id_map']= id_map
+                    snap['tbl_cache']= _table_cache.stats()
                 except Exception:
                     snap['tbl_count']= snap['total_items']= snap['duplicate_ids']= snap['total_ids']= 0
                     snap['id_map']= {}
 
+                snap['load']= dict(_last_load_report)
+
+                try:
+                    snap['backup']= _backup_archiver.stats()
+                except Exception:
+                    snap['backup']= {}
+
+                try:
+                    snap['tasks']= _background_tasks.stats()
+                except Exception:
+                    snap['tasks']= {}
+
+                try:
+                    snap['startup']= _startup.summary()
+                except Exception:
+                    snap['startup']= {}
+
+                try:
+                    snap['sounds']= _sound_catalog.summary()
+                except Exception:
+                    snap['sounds']= {}
+
+                try:
+                    snap['audio']= _audio_cache.stats()
+                except Exception:
+                    snap['audio']= {}
+
+                try:
+                    snap['dsp']= _dsp_variants.summary()
+                except Exception:
+                    snap['dsp']= {}
+
+                try:
+                    snap['mixer']= _combat_mixer.summary()
+                except Exception:
+                    snap['mixer']= {}
+
+                try:
+                    snap['music']= _music_index.summary()
+                except Exception:
+                    snap['music']= {}
+
                 try:
                     snap['thread_lines']= self._collect_thread_info()
                 except Exception:
@@ -17,8 +17,7 @@ class DmtoolsMixin:
                 self._popup_show_info("Error", "No table files found.", sound = "error")
                 return
 
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
 
             all_items =[]
             for table_name, items in table_data.get("tables", {}).items():
@@ -1018,6 +1017,20 @@ class DmtoolsMixin:
             except Exception:
                 logging.exception("Suppressed exception")
 
+            # Background gunfire scheduled into the combat mixer is tagged with
+            # the window, and dropped when the window goes away.
+            mix_tag =("dungeon", id(dg))
+
+            def _cancel_mixed_combat(event = None):
+                if event is not None and event.widget is not dg:
+                    return
+                try:
+                    _combat_mixer.cancel(mix_tag)
+                except Exception:
+                    logging.exception("Suppressed exception")
+
+            dg.bind("<Destroy>", _cancel_mixed_combat, add = "+")
+
             dg.title("Dungeon Generator")
             dg.transient(self.root)
             dg.geometry("900x700")
@@ -2015,8 +2028,7 @@ class DmtoolsMixin:
                     tbl_path = get_current_table_path()
                     if not tbl_path or not os.path.exists(tbl_path):
                         return[]
-                    with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                        table_data = json.load(f)
+                    table_data = load_table_data(tbl_path)
                     return table_data.get("tables", {}).get("rooms", [])
                 except Exception as e:
                     logging.exception("Failed to load rooms table")
@@ -2028,28 +2040,23 @@ class DmtoolsMixin:
                     tbl_path = get_current_table_path()
                     if not tbl_path or not os.path.exists(tbl_path):
                         return[]
-                    with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                        table_data = json.load(f)
+                    table_data = load_table_data(tbl_path)
                     return table_data.get("tables", {}).get("enemy_drops", [])
                 except Exception as e:
                     logging.exception("Failed to load enemies table")
                     return[]
 
-            _distant_combat_sound_cache = {}
-
             def _play_distant_combat_sound(sound_path, volume = 0.15):
 
                 try:
-                    sound = _distant_combat_sound_cache.get(sound_path)
-                    if sound is None:
-                        if not os.path.exists(sound_path):
-                            return
-                        sound = pygame.mixer.Sound(sound_path)
-                        _distant_combat_sound_cache[sound_path] = sound
-                    sound.set_volume(volume)
-                    channel = pygame.mixer.find_channel()
+                    if not _sound_catalog.exists(sound_path):
+                        return
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
+                        # Shared Sound: the volume goes on this play's channel.
                         channel.play(sound)
+                        channel.set_volume(volume)
                 except Exception as e:
                     logging.debug(f"Failed to play distant combat sound: {e}")
 
@@ -2079,11 +2086,11 @@ class DmtoolsMixin:
                         if not sound_path or not os.path.exists(sound_path):
                             return
 
-                    sound = pygame.mixer.Sound(sound_path)
-                    sound.set_volume(volume)
-                    channel = pygame.mixer.find_channel()
+                    sound = _audio_cache.get(sound_path)
+                    channel = _find_channel()
                     if channel:
                         channel.play(sound)
+                        channel.set_volume(volume)
                 except Exception as e:
                     logging.debug(f"Failed to play dungeon sound '{sound_name}': {e}")
 
@@ -2256,11 +2263,18 @@ class DmtoolsMixin:
                             bolt_back = os.path.join(sound_dir, "boltback.ogg")
                             bolt_forward = os.path.join(sound_dir, "boltforward.ogg")
 
-                            if os.path.isfile(bolt_back):
-                                _play_distant_combat_sound(bolt_back, volume = volume)
-                            if os.path.isfile(bolt_forward):
+                            try:
+                                if _sound_catalog.exists(bolt_back):
+                                    _combat_mixer.play(bolt_back, volume, tag = mix_tag)
+                                if _sound_catalog.exists(bolt_forward):
+                                    _combat_mixer.play(bolt_forward, volume, delay = 0.3, tag = mix_tag)
+                            except Exception:
+                                logging.exception("Combat mixer failed; playing the action on a channel")
+                                if _sound_catalog.exists(bolt_back):
+                                    _play_distant_combat_sound(bolt_back, volume = volume)
+                                if _sound_catalog.exists(bolt_forward):
 
-                                dg.after(300, lambda:_play_distant_combat_sound(bolt_forward, volume = volume))
+                                    dg.after(300, lambda:_play_distant_combat_sound(bolt_forward, volume = volume))
                     except Exception as e:
                         logging.debug(f"Failed to play action sound: {e}")
 
@@ -2298,8 +2312,8 @@ class DmtoolsMixin:
                 is_manual = _is_manual_action(weapon)
 
                 try:
-                    if os.path.isdir(sound_dir):
-                        all_sounds = glob.glob(os.path.join(sound_dir, "*.wav"))+glob.glob(os.path.join(sound_dir, "*.ogg"))
+                    if _sound_catalog.isdir(sound_dir):
+                        all_sounds = _sound_catalog.glob(os.path.join(sound_dir, "*.wav"))+_sound_catalog.glob(os.path.join(sound_dir, "*.ogg"))
                     else:
                         all_sounds =[]
                 except Exception:
@@ -2321,9 +2335,16 @@ class DmtoolsMixin:
                     except Exception:
                         logging.exception("Suppressed exception")
 
-                for i in range(shots):
-                    shot_delay = start_delay +(i *cyclic_delay)
-                    dg.after(shot_delay, lambda num = i:play_shot(num))
+                # The whole burst goes to the mixer thread as one cyclic schedule;
+                # one Tk timer per shot only if the mixer is unavailable.
+                try:
+                    if resolved_sounds and shots >0:
+                        _combat_mixer.burst(resolved_sounds, shots, cyclic_delay /1000.0, resolved_volume, start_delay /1000.0, tag = mix_tag)
+                except Exception:
+                    logging.exception("Combat mixer failed; scheduling the burst shot by shot")
+                    for i in range(shots):
+                        shot_delay = start_delay +(i *cyclic_delay)
+                        dg.after(shot_delay, lambda num = i:play_shot(num))
 
                 if is_manual and shots >0:
                     action_delay = start_delay +(shots *cyclic_delay)+100
@@ -2975,13 +2996,12 @@ class DmtoolsMixin:
                     try:
                         tbl_path = get_current_table_path()
                         if tbl_path and os.path.exists(tbl_path):
-                            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                                full_table = json.load(f)
+                            full_table = load_table_data(tbl_path)
 
-                                table_data = {
-                                "rarity_weights":full_table.get("rarity_weights", {}),
-                                "tables":full_table.get("tables", {})
-                                }
+                            table_data = {
+                            "rarity_weights":full_table.get("rarity_weights", {}),
+                            "tables":full_table.get("tables", {})
+                            }
                     except Exception as e:
                         logging.error(f"Failed to load table data: {e}")
 
@@ -4370,8 +4390,7 @@ class DmtoolsMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
@@ -4620,8 +4639,7 @@ class DmtoolsMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table files found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load tables for item transfer: {e}")
             self._popup_show_info("Error", f"Failed to load tables: {e}", sound = "error")
@@ -4971,8 +4989,7 @@ class DmtoolsMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
@@ -5369,8 +5386,7 @@ class DmtoolsMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
@@ -310,13 +310,7 @@ class InventoryMixin:
             if not target_file and table_files:
                 target_file = table_files[0]
             if target_file:
-                with open(target_file, 'r', encoding = 'utf-8')as f:
-                    table_data = json.load(f)
-                for table_name, items_list in table_data.get("tables", {}).items():
-                    if isinstance(items_list, list):
-                        for tbl_item in items_list:
-                            if isinstance(tbl_item, dict)and "id"in tbl_item:
-                                table_items_map[tbl_item["id"]]= tbl_item
+                table_items_map = get_table_index(target_file).by_id
         except Exception as e:
             logging.warning(f"Failed to load table for weight calculation: {e}")
 
@@ -857,14 +851,13 @@ class InventoryMixin:
 
         stat_clamp = 4
         try:
-            import glob, json, os
+            import glob, os
             tbl_path = get_current_table_path()
             if tbl_path and os.path.exists(tbl_path):
-                with open(tbl_path, 'r', encoding = 'utf-8-sig')as tf:
-                    td = json.load(tf)
-                    sc = td.get("additional_settings", {}).get("stat_clamp")
-                    if isinstance(sc, (int, float)):
-                        stat_clamp = int(sc)
+                td = open_table(tbl_path)
+                sc = td.get("additional_settings", {}).get("stat_clamp")
+                if isinstance(sc, (int, float)):
+                    stat_clamp = int(sc)
         except Exception:
             logging.exception("Suppressed exception")
 
@@ -896,7 +889,6 @@ class InventoryMixin:
         }
 
     def _transfer_player(self):
-        import json
         import base64
         from datetime import datetime
 
@@ -2511,20 +2503,13 @@ class InventoryMixin:
                         table_files = sorted(glob.glob(os.path.join("tables", f"*{global_variables.get('table_extension', '.sldtbl')}")))
                         for tf in table_files:
                             try:
-                                with open(tf, 'r', encoding = 'utf-8')as f:
-                                    td = json.load(f)
+                                cand = get_table_index(tf).item(iid)
                             except Exception:
                                 logging.exception("Suppressed exception")
                                 continue
-                            for arr in td.get('tables', {}).values():
-                                if isinstance(arr, list):
-                                    for cand in arr:
-                                        if isinstance(cand, dict)and cand.get('id')==iid:
-                                            current_item = cand.copy()
-                                            break
-                                    if isinstance(current_item, dict):
-                                        break
-                            if isinstance(current_item, dict):
+                            if isinstance(cand, dict):
+                                import copy as _copy
+                                current_item = _copy.deepcopy(cand)
                                 break
                 except Exception:
                     logging.exception("Suppressed exception")
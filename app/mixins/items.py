@@ -63,28 +63,29 @@ class ItemsMixin:
 
     def _add_rounds_to_container(self, container_items, rounds_list):
 
-        if not isinstance(container_items, list)or not isinstance(rounds_list, list):
+        if isinstance(rounds_list, list):
+            rounds_list = _roundpack.RoundRuns(rounds_list)
+        if not isinstance(container_items, list)or not isinstance(rounds_list, _roundpack.RoundRuns):
             return
 
         round_groups = {}
-        for r in rounds_list:
+        for r, count in rounds_list.runs:
             if not isinstance(r, dict):
                 continue
             caliber = r.get("caliber", "Unknown")
             variant = r.get("variant", "Unknown")
             key =(str(caliber), str(variant))
             if key not in round_groups:
-                round_groups[key]=[]
-            round_groups[key].append(r)
+                round_groups[key]=[r, 0]
+            round_groups[key][1]+=count
 
-        for(caliber, variant), group_rounds in round_groups.items():
+        for(caliber, variant), (sample, quantity) in round_groups.items():
 
-            sample = group_rounds[0]if group_rounds else {}
             stack_item = {
             "name":sample.get("name", f"{caliber} | {variant}"),
             "caliber":caliber,
             "variant":variant,
-            "quantity":len(group_rounds)
+            "quantity":quantity
             }
 
             for k in["type", "pen", "modifiers", "tip", "rarity"]:
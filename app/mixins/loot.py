@@ -40,8 +40,7 @@ class LootMixin:
                 self._popup_show_info("Error", "No table files found.", sound = "error")
                 return
 
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
 
             lootcrates = table_data.get("lootcrates", [])
 
@@ -194,7 +193,7 @@ class LootMixin:
                         snd = pygame.mixer.Sound(_PICK_SND_PATH)
                         ch  = _lp_state.get("pick_channel")
                         if ch is None:
-                            ch = pygame.mixer.find_channel()
+                            ch = _find_channel()
                             _lp_state["pick_channel"] = ch
                         if ch:
                             ch.play(snd, loops = -1)  # loop until stopped
@@ -219,7 +218,7 @@ class LootMixin:
                     if p and os.path.exists(p):
                         try:
                             snd = pygame.mixer.Sound(p)
-                            ch  = pygame.mixer.find_channel()
+                            ch  = _find_channel()
                             if ch:
                                 ch.play(snd)
                         except Exception:
@@ -1477,9 +1476,8 @@ class LootMixin:
                             debug_info.append(f" ⚠ No magazinesystem found for {firearm_item.get('name', 'Unknown')}")
                         return spawned_mags
 
-                    magazines_table = table_data.get("tables", {}).get("magazines", [])
                     compatible_mags =[]
-                    for mag in magazines_table:
+                    for mag in get_table_index(table_data).magazines_for_system(mag_system):
                         if mag.get("magazinesystem")==mag_system:
                             mag_caliber = mag.get("caliber")
                             if isinstance(mag_caliber, str):
@@ -1641,9 +1639,8 @@ class LootMixin:
                             debug_info.append(f" ⚠ No magazinesystem found for {firearm_item.get('name', 'Unknown')}")
                         return spawned_mags
 
-                    magazines_table = table_data.get("tables", {}).get("magazines", [])
                     compatible_mags =[]
-                    for mag in magazines_table:
+                    for mag in get_table_index(table_data).magazines_for_system(mag_system):
                         if mag.get("magazinesystem")==mag_system:
                             mag_caliber = mag.get("caliber")
                             if isinstance(mag_caliber, str):
@@ -1968,9 +1965,8 @@ class LootMixin:
                     mag_system = item.get("magazinesystem")
                     caliber = self._get_effective_firearm_calibers_for_loot(item)
 
-                    magazines_table = table_data.get("tables", {}).get("magazines", [])
                     compatible_mags =[]
-                    for mag in magazines_table:
+                    for mag in get_table_index(table_data).magazines_for_system(mag_system):
                         if mag.get("magazinesystem")==mag_system:
                             mag_caliber = mag.get("caliber")
                             if isinstance(mag_caliber, str):
@@ -2703,7 +2699,7 @@ class LootMixin:
                             sound_path = os.path.join("sounds", "firearms", "universal", f"{sn}.ogg")
                             if os.path.exists(sound_path):
                                 snd = pygame.mixer.Sound(sound_path)
-                                ch = pygame.mixer.find_channel()
+                                ch = _find_channel()
                                 if ch:
                                     ch.play(snd)
                         except Exception:
@@ -3147,8 +3143,7 @@ class LootMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
@@ -3507,8 +3502,7 @@ class LootMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table files found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load tables for loot crate creator: {e}")
             self._popup_show_info("Error", f"Failed to load tables: {e}", sound = "error")
@@ -3600,8 +3594,7 @@ class LootMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table files found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load tables for loot crate creator: {e}")
             self._popup_show_info("Error", f"Failed to load tables: {e}", sound = "error")
@@ -49,16 +49,15 @@ class ReportsMixin:
                         if variant_name:
                             tbl_path = get_current_table_path()
                             if tbl_path and os.path.exists(tbl_path):
-                                with open(tbl_path, 'r', encoding = 'utf-8')as tf:
-                                    tdata = json.load(tf)
-                                    ammo_arr = tdata.get('tables', {}).get('ammunition', [])
-                                    for a in ammo_arr:
-                                        for v in(a.get('variants')or[]):
-                                            if isinstance(v, dict)and v.get('name')==variant_name:
-                                                is_lead_free = bool(v.get('lead_free', False))
-                                                break
-                                        if is_lead_free:
+                                tdata = open_table(tbl_path)
+                                ammo_arr = tdata.get('tables', {}).get('ammunition', [])
+                                for a in ammo_arr:
+                                    for v in(a.get('variants')or[]):
+                                        if isinstance(v, dict)and v.get('name')==variant_name:
+                                            is_lead_free = bool(v.get('lead_free', False))
                                             break
+                                    if is_lead_free:
+                                        break
                     except Exception:
                         logging.exception("Suppressed exception")
 
@@ -101,17 +100,18 @@ class ReportsMixin:
             lf_info = {}
             try:
                 lf_path = os.path.join('remotedata', 'lfinfo.json')
-                try:
-                    remote_url = 'https://raw.githubusercontent.com/soli-dstate/DOOM-Tools/master/remotedata/lfinfo.json'
-                    resp = requests.get(remote_url, timeout = 5)
-                    if resp.status_code ==200:
-                        lf_info = resp.json()
-                        os.makedirs('remotedata', exist_ok = True)
-                        with open(lf_path, 'w', encoding = 'utf-8')as f:
-                            json.dump(lf_info, f, indent = 4)
-                        logging.info('Pulled latest lfinfo.json from GitHub')
-                except Exception:
-                    logging.debug('Could not fetch lfinfo.json from GitHub, using local copy')
+                if not offline_mode():
+                    try:
+                        remote_url = 'https://raw.githubusercontent.com/soli-dstate/DOOM-Tools/master/remotedata/lfinfo.json'
+                        resp = requests.get(remote_url, timeout = 5)
+                        if resp.status_code ==200:
+                            lf_info = resp.json()
+                            os.makedirs('remotedata', exist_ok = True)
+                            with open(lf_path, 'w', encoding = 'utf-8')as f:
+                                json.dump(lf_info, f, indent = 4)
+                            logging.info('Pulled latest lfinfo.json from GitHub')
+                    except Exception:
+                        logging.debug('Could not fetch lfinfo.json from GitHub, using local copy')
                 if not lf_info and os.path.exists(lf_path):
                     with open(lf_path, 'r', encoding = 'utf-8')as f:
                         lf_info = json.load(f)
@@ -322,7 +322,7 @@ class ReportsMixin:
                 try:
                     snd = printer_sounds.get(name)
                     if snd:
-                        channel = pygame.mixer.find_channel()
+                        channel = _find_channel()
                         if channel:
                             channel.play(snd)
                 except Exception:
@@ -467,7 +467,7 @@ class ReportsMixin:
                                 try:
                                     loop_snd = printer_sounds.get('characterloop')
                                     if loop_snd:
-                                        ch = pygame.mixer.find_channel()
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(loop_snd, loops = -1)
                                             anim_state['loop_channel']= ch
@@ -698,7 +698,7 @@ class ReportsMixin:
                 try:
                     snd = printer_sounds.get(name)
                     if snd:
-                        channel = pygame.mixer.find_channel()
+                        channel = _find_channel()
                         if channel:
                             channel.play(snd)
                 except Exception:
@@ -840,7 +840,7 @@ class ReportsMixin:
                                 try:
                                     loop_snd = printer_sounds.get('characterloop')
                                     if loop_snd:
-                                        ch = pygame.mixer.find_channel()
+                                        ch = _find_channel()
                                         if ch:
                                             ch.play(loop_snd, loops = -1)
                                             anim_state['loop_channel']= ch
@@ -5,71 +5,84 @@ import logging
 
 class SavesMixin:
 
-    def _save_persistent_data(self):
+    def _save_persistent_data(self, defer = False):
 
+        persistent_path = os.path.join(saves_folder or "saves", "persistent_data.sldsv")
+        if defer:
+            _save_manager.submit(persistent_path, persistentdata, self._write_persistent_data)
+            return
         try:
-            persistent_path = os.path.join(saves_folder or "saves", "persistent_data.sldsv")
-            _signed_json_write(persistent_path, persistentdata)
-            logging.info(f"Persistent data saved to {persistent_path}")
+            with _save_manager.exclusive(persistent_path):
+                self._write_persistent_data(persistent_path, persistentdata)
         except Exception as e:
             logging.error(f"Failed to save persistent data: {e}")
+
+    def _write_persistent_data(self, persistent_path, data):
+        _signed_json_write(persistent_path, data)
+        logging.info(f"Persistent data saved to {persistent_path}")
+
     def _write_save_to_path(self, path, data):
+        if not path.endswith(global_variables.get("save_extension", ".sldsv")):
+            path +=global_variables.get("save_extension", ".sldsv")
+        # A deferred save of this file must not land after (and over) this write.
+        with _save_manager.exclusive(path):
+            self._write_save_now(path, data)
+
+    def _write_save_now(self, path, data):
         try:
             if not path.endswith(global_variables.get("save_extension", ".sldsv")):
                 path +=global_variables.get("save_extension", ".sldsv")
 
             filename = os.path.basename(path)
-            excluded_from_backup = {"persistent_data.sldsv", "settings.sldsv", "appearance_settings.sldsv", "dm_settings.sldsv"}
-            if filename not in excluded_from_backup and isinstance(data, dict):
-                try:
-                    char_name = data.get("charactername", "Unknown")
-                    safe_char_name = "".join(c if c.isalnum()or c in " _-"else "_"for c in char_name).strip()
-                    if not safe_char_name:
-                        safe_char_name = "Unknown"
-
-                    backup_folder = os.path.join(saves_folder or "saves", "backups", safe_char_name)
-                    archive_folder = os.path.join(backup_folder, "archive")
-                    os.makedirs(backup_folder, exist_ok = True)
-                    os.makedirs(archive_folder, exist_ok = True)
-
-                    backup_files = sorted(glob.glob(os.path.join(backup_folder, "*.sldsv")))
-                    if len(backup_files)>=50:
-                        archive_name = os.path.join(archive_folder, f"backups_archive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
-                        with zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED)as zipf:
-                            for backup_file in backup_files:
-                                zipf.write(backup_file, os.path.basename(backup_file))
-                                os.remove(backup_file)
-                        logging.info(f"Archived {len(backup_files)} backups to {archive_name}")
-
-                    backup_filename = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.sldsv"
-                    backup_path = os.path.join(backup_folder, backup_filename)
-
-                    if os.path.exists(path):
-                        try:
-                            import shutil
-                            shutil.copy2(path, backup_path)
-                            logging.info(f"Created backup at {backup_path}")
-                        except Exception as backup_err:
-                            logging.warning(f"Failed to create backup copy: {backup_err}")
-                    else:
-                        _signed_json_write(backup_path, data)
-                        logging.info(f"Created backup at {backup_path}")
-                except Exception as backup_err:
-                    logging.warning(f"Failed to create backup: {backup_err}")
+            backup_folder = None
+            if filename not in RESERVED_SAVE_NAMES and isinstance(data, dict):
+                backup_folder = _backup_folder_for(data.get("charactername", "Unknown"))
+                # Only park the file here; the archiver adds it to the store later.
+                if os.path.exists(path):
+                    self._park_backup(path, backup_folder)
+                    backup_folder = None
 
             comment_lines =[]
             if isinstance(data, dict):
                 comment_lines = data.pop("_save_comments", [])
 
-            _signed_json_write(path, data, comment_lines = comment_lines or None)
+            _signed_json_write(path, compact_save_items(data), comment_lines = comment_lines or None)
             logging.info(f"Data written to {path}")
+            try:
+                _save_catalog().record(path, _save_summary(data))
+            except Exception:
+                logging.exception("Failed to update the save catalog")
+            if backup_folder is not None:
+                self._park_backup(path, backup_folder)
         except Exception as e:
             logging.error(f"Failed to write save to {path}: {e}")
 
+    def _park_backup(self, path, folder):
+        try:
+            _backup_archiver.park(path, folder)
+            logging.info(f"Queued backup of {os.path.basename(path)}")
+        except Exception as backup_err:
+            logging.warning(f"Failed to create backup: {backup_err}")
+
+    def _read_backup(self, folder, snap_id):
+        """Save data of one backup snapshot, read and verified like any save."""
+        import tempfile
+        fd, tmp_path = tempfile.mkstemp(suffix = global_variables.get("save_extension", ".sldsv"))
+        os.close(fd)
+        try:
+            _backup_store(folder).restore_to(snap_id, tmp_path)
+            return self._read_save_from_path(tmp_path)
+        finally:
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                logging.exception("Suppressed exception")
+
     def _read_save_from_path(self, path):
         try:
             if not path.endswith(global_variables.get("save_extension", ".sldsv")):
                 path +=global_variables.get("save_extension", ".sldsv")
+            _save_manager.flush(path)
             if not os.path.exists(path):
                 logging.error(f"Save file '{path}' does not exist.")
                 return None
@@ -78,6 +91,7 @@ class SavesMixin:
 
             if status == "ok":
                 if isinstance(data, dict):
+                    data = hydrate_save_items(data)
                     if comment_lines:
                         data["_save_comments"]= comment_lines
                     logging.info(f"Loaded save from {path}")
@@ -164,14 +178,20 @@ class SavesMixin:
                 except Exception:
                     logging.exception('Failed to clean temporary effects before save')
 
-                self._write_save_to_path(save_path, data)
+                # Written behind by the save manager: combat, reloads and the store
+                # save after nearly every action, and a burst becomes one write.
+                if not save_path.endswith(global_variables.get("save_extension", ".sldsv")):
+                    save_path +=global_variables.get("save_extension", ".sldsv")
+                _save_manager.submit(save_path, data, self._write_save_now)
             except Exception as e:
                 logging.error(f"Failed to save data to {self.currentsave}: {e}")
-        self._save_persistent_data()
+        self._save_persistent_data(defer = True)
     def _load_file(self, save_filename):
 
         try:
             persistent_path = os.path.join(saves_folder or "saves", "persistent_data.sldsv")
+            # A deferred write holds newer values than the file; land it first.
+            _save_manager.flush(persistent_path)
             if os.path.exists(persistent_path):
                 loaded_persistent, _, p_status = _signed_json_read(persistent_path, allow_unsigned = False)
                 if p_status == "tampered":
@@ -202,6 +222,7 @@ class SavesMixin:
             save_path = os.path.join(saves_folder or "saves", save_filename)
         if not save_path.endswith('.sldsv'):
             save_path +='.sldsv'
+        _save_manager.flush(save_path)
         if not os.path.exists(save_path):
             logging.error(f"Save file '{save_path}' does not exist.")
             return None
@@ -265,8 +286,7 @@ class SavesMixin:
                                 cur_tbl = os.path.basename(tfiles[0])
                                 global_variables['current_table']= cur_tbl
                                 try:
-                                    with open(tfiles[0], 'r', encoding = 'utf-8')as tf:
-                                        globals()['table_data']= json.load(tf)
+                                    globals()['table_data']= open_table(tfiles[0])
                                 except Exception:
                                     logging.exception("Suppressed exception")
 
@@ -283,32 +303,8 @@ class SavesMixin:
                     persistentdata["last_loaded_save"]= uuid_part
                     logging.debug(f"Updated last_loaded_save to UUID: {uuid_part}")
 
-            data = populate_equipment_with_subslots(data, secondary_platform=_secondary_platform)
-
-            try:
-                data = self._fix_save_item_references(data)
-            except Exception:
-                logging.exception("Failed to fix save item references")
-
-            data = update_item_keys_from_table(data)
-
-            try:
-                data = self._normalize_save_data(data)
-                try:
-                    data = self._sync_equipment_slots(data)
-                except Exception:
-                    logging.exception("Failed to sync equipment slots after normalization")
-            except Exception as e:
-                logging.warning(f"Failed to normalize save data: {e}")
-            try:
-                data = data if isinstance(data, dict) else {}
-                self._cleanup_temporary_effects(data)
-            except Exception:
-                logging.exception('Failed to clean temporary effects after load')
-            try:
-                data = _resolve_unset_durability(data)
-            except Exception:
-                logging.exception("Failed to resolve unset durability values")
+            data = data if isinstance(data, dict) else {}
+            run_load_pipeline(data, self._load_stages(data), label = os.path.basename(save_path))
             try:
 
                 try:
@@ -322,9 +318,35 @@ class SavesMixin:
             logging.error(f"Failed to load data from '{save_path}': {e}")
             return None
 
+    def _load_stages(self, data):
+        """The fixers a loaded save goes through, in order (see run_load_pipeline)."""
+        stages =[
+        _populate_subslots_stage(_secondary_platform),
+        self._fix_item_references_stage(),
+        ]
+        # v2 saves were hydrated from the table on read, so their items are already in sync.
+        if not _savepack.is_v2(data):
+            stages.append(_update_item_keys_stage())
+        stages +=[
+        self._normalize_stage(),
+        _LoadStage("sync_equipment_slots", finish = self._sync_equipment_slots),
+        _LoadStage("cleanup_temporary_effects", finish = self._cleanup_temporary_effects),
+        _resolve_durability_stage(slots_synced = True),
+        ]
+        return stages
+
     def _normalize_save_data(self, data):
+        return run_load_pipeline(data, [self._normalize_stage()])
+
+    def _normalize_stage(self):
+        """Load stage: turn rounds stored as strings into round dicts with their
+        variant, and items stored as bare names into item dicts."""
+        ammo_table =[]
 
-        ammo_table = self._get_ammo_table_data()
+        def prepare(data):
+            nonlocal ammo_table
+            ammo_table = self._get_ammo_table_data()
+            return True
 
         def normalize_round(r):
             if isinstance(r, dict):
@@ -346,8 +368,16 @@ class SavesMixin:
                 mag["rounds"]=[normalize_round(rr)for rr in mag["rounds"]]
             return mag
 
-        for slot_name, item in(data.get("equipment")or {}).items():
+        def normalize_item(it):
+            if isinstance(it, dict):
+                if it.get("rounds")and isinstance(it.get("rounds"), list):
+                    it["rounds"]=[normalize_round(rr)for rr in it.get("rounds", [])]
+                return it
+            if isinstance(it, str):
+                return {"name":it}
+            return {"name":str(it)}
 
+        def equipment(slot_name, item):
             if isinstance(item, dict):
                 items_iter =[item]
             elif isinstance(item, list):
@@ -376,59 +406,18 @@ class SavesMixin:
                             if curr.get("chambered")and isinstance(curr.get("chambered"), str):
                                 curr["chambered"]= normalize_round(curr.get("chambered"))
 
-        hands = data.get("hands")or {}
-        if isinstance(hands, dict)and isinstance(hands.get("items"), list):
-            new_items =[]
-            for it in hands.get("items", []):
-                if isinstance(it, dict):
-                    if it.get("rounds")and isinstance(it.get("rounds"), list):
-                        it["rounds"]=[normalize_round(rr)for rr in it.get("rounds", [])]
-                    new_items.append(it)
-                elif isinstance(it, str):
-                    new_items.append({"name":it})
-                else:
-                    new_items.append({"name":str(it)})
-            hands["items"]= new_items
-
-        for slot_name, item in(data.get("equipment")or {}).items():
-
-            items_iter =[]
-            if isinstance(item, dict):
-                items_iter =[item]
-            elif isinstance(item, list):
-                items_iter =[it for it in item if isinstance(it, dict)]
-
-            for it in items_iter:
                 if "items"in it and isinstance(it["items"], list):
-                    new_items =[]
-                    for subit in it["items"]:
-                        if isinstance(subit, dict):
-                            if subit.get("rounds")and isinstance(subit.get("rounds"), list):
-                                subit["rounds"]=[normalize_round(rr)for rr in subit.get("rounds", [])]
-                            new_items.append(subit)
-                        elif isinstance(subit, str):
-                            new_items.append({"name":subit})
-                        else:
-                            new_items.append({"name":str(subit)})
-                    it["items"]= new_items
-
-        storage = data.get("storage")or {}
-        if isinstance(storage, dict):
-            for k, v in storage.items():
-                if isinstance(v, list):
-                    new_items =[]
-                    for it in v:
-                        if isinstance(it, dict):
-                            if it.get("rounds")and isinstance(it.get("rounds"), list):
-                                it["rounds"]=[normalize_round(rr)for rr in it.get("rounds", [])]
-                            new_items.append(it)
-                        elif isinstance(it, str):
-                            new_items.append({"name":it})
-                        else:
-                            new_items.append({"name":str(it)})
-                    storage[k]= new_items
+                    it["items"]=[normalize_item(subit)for subit in it["items"]]
 
-        return data
+        def finish(data):
+            # Storage kept as {container: [items]} by older saves.
+            storage = data.get("storage")or {}
+            if isinstance(storage, dict):
+                for k, v in storage.items():
+                    if isinstance(v, list):
+                        storage[k]=[normalize_item(it)for it in v]
+
+        return _LoadStage("normalize", prepare, equipment = equipment, hands = normalize_item, finish = finish)
 
     def _award_paychecks_for_save(self, save_data, save_path):
         try:
@@ -458,8 +447,7 @@ class SavesMixin:
             table_data = None
             if table_path and os.path.exists(table_path):
                 try:
-                    with open(table_path, 'r', encoding = 'utf-8')as tf:
-                        table_data = json.load(tf)
+                    table_data = open_table(table_path)
                 except Exception:
                     table_data = None
 
@@ -715,36 +703,26 @@ class SavesMixin:
                                     items.pop(index)
 
     def _fix_save_item_references(self, save_data):
-        import copy as _copy
-        if not isinstance(save_data, dict):
-            return save_data
-
-        try:
-            tbl_path = get_current_table_path()
-            if not tbl_path or not os.path.exists(tbl_path):
-                return save_data
-            with open(tbl_path, 'r', encoding = 'utf-8')as f:
-                table_data = json.load(f)
-        except Exception:
-            return save_data
-
-        tables = table_data.get('tables', {})
-        if not isinstance(tables, dict):
-            return save_data
+        return run_load_pipeline(save_data, [self._fix_item_references_stage()])
 
+    def _fix_item_references_stage(self):
+        """Load stage: replace attachment and part references (bare ids, or
+        {id, ...overrides} without a name) with the table items they name."""
+        import copy as _copy
         id_to_item = {}
-        for subtable_items in tables.values():
-            if not isinstance(subtable_items, list):
-                continue
-            for it in subtable_items:
-                if isinstance(it, dict)and 'id'in it:
-                    id_to_item[it['id']]= it
-
-        if not id_to_item:
-            return save_data
-
         fixed_count =[0]
 
+        def prepare(save_data):
+            nonlocal id_to_item
+            try:
+                tbl_path = get_current_table_path()
+                if not tbl_path or not os.path.exists(tbl_path):
+                    return False
+                id_to_item = get_table_index(tbl_path).by_id
+            except Exception:
+                return False
+            return bool(id_to_item)
+
         def _is_unresolved(cur):
             if isinstance(cur, int):
                 return True
@@ -863,7 +841,7 @@ class SavesMixin:
                 return
             _resolve_current(item)
 
-        for slot_name, equipped_item in save_data.get('equipment', {}).items():
+        def equipment(slot_name, equipped_item):
             if isinstance(equipped_item, dict):
                 _process_item(equipped_item)
                 for sub in(equipped_item.get('subslots')or[]):
@@ -878,16 +856,11 @@ class SavesMixin:
                     if isinstance(list_item, dict):
                         _process_item(list_item)
 
-        for item in save_data.get('hands', {}).get('items', []):
-            _process_item(item)
-
-        for item in save_data.get('storage', []):
-            _process_item(item)
-
-        if fixed_count[0]>0:
-            logging.info(f"Fixed {fixed_count[0]} unresolved attachment reference(s) in save data")
+        def finish(save_data):
+            if fixed_count[0]>0:
+                logging.info(f"Fixed {fixed_count[0]} unresolved attachment reference(s) in save data")
 
-        return save_data
+        return _LoadStage("fix_item_references", prepare, equipment = equipment, hands = _process_item, storage = _process_item, finish = finish)
 
     def _save_combat_state(self, save_data):
 
@@ -63,6 +63,8 @@ class SettingsMixin:
             else:
                 logging.info("No current save loaded at exit.")
 
+            flush_pending_saves()
+
             try:
                 self._save_persistent_data()
             except Exception as e:
@@ -502,8 +504,7 @@ class SettingsMixin:
         for table_file in table_files:
             try:
                 table_path = os.path.join("tables", table_file)
-                with open(table_path, 'r', encoding = 'utf-8-sig')as f:
-                    table_data = json.load(f)
+                table_data = open_table(table_path)
                 pretty_name = table_data.get("prettyname", table_file)
                 table_display_names.append(pretty_name)
                 table_name_map[pretty_name]= table_file
@@ -560,6 +561,18 @@ class SettingsMixin:
             info_label = customtkinter.CTkLabel(right_frame, text = "Enable devmode to edit these", text_color = "gray")
             info_label.grid(row = 6, column = 0, columnspan = 2, sticky = "w", padx = 10, pady =(0, 8))
 
+        offline_chk = customtkinter.CTkCheckBox(
+            right_frame,
+            text = "Offline Mode (no table sync or downloads)",
+            state = "disabled"if _offline_flag else "normal",
+            command = lambda: (global_variables.setdefault("offline", {"value":False, "forced":False}).__setitem__("value", bool(offline_chk.get())), settings_modified.__setitem__(0, True))
+        )
+        offline_chk.grid(row = 7, column = 0, columnspan = 2, sticky = "w", padx = 10, pady = 4)
+        if offline_mode():
+            offline_chk.select()
+        else:
+            offline_chk.deselect()
+
         button_frame = customtkinter.CTkFrame(main_frame, fg_color = "transparent")
         button_frame.grid(row = 2, column = 0, columnspan = 2, pady =(10, 0))
         button_frame.grid_columnconfigure((0, 1), weight = 1)
@@ -668,8 +681,7 @@ class SettingsMixin:
             if not tbl_path or not os.path.exists(tbl_path):
                 self._popup_show_info("Error", "No table file found.", sound = "error")
                 return
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
         except Exception as e:
             logging.error(f"Failed to load table: {e}")
             self._popup_show_info("Error", f"Failed to load table: {e}", sound = "error")
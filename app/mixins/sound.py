@@ -7,9 +7,9 @@ class SoundMixin:
 
     def _play_ui_sound(self, sound_filename):
         sound_path = os.path.join("sounds", "ui", sound_filename +".ogg")
-        if os.path.exists(sound_path):
+        if _sound_catalog.exists(sound_path):
             try:
-                sound = pygame.mixer.Sound(sound_path)
+                sound = _audio_cache.get(sound_path)
                 sound.play()
                 logging.debug(f"Played UI sound: {sound_filename}")
             except Exception as e:
@@ -35,7 +35,18 @@ class SoundMixin:
                 self._play_ui_sound("hover")
         button.bind("<Enter>", on_hover)
         return button
-    def _safe_sound_play(self, directory, sound_filename, block = False):
+    def _combat_mix_gain(self):
+        """Master gain of the combat mixer: the flashbang volume while deafened
+        (it ramps back up as hearing returns), otherwise 1.0."""
+        if getattr(self, '_flashbang_mute', False):
+            return float(getattr(self, '_flashbang_volume', 0.0))
+        return 1.0
+    def _safe_sound_play(self, directory, sound_filename, block = False, mix = False):
+        """Play a sound file with the flashbang/muffle volume rules applied.
+
+        With `mix`, a non-blocking sound goes into the combat mixer's stream
+        (one reserved channel) instead of taking a mixer channel of its own:
+        used for gunshots, which overlap by the dozen in full-auto."""
 
         if os.path.isabs(sound_filename)or sound_filename.endswith((".wav", ".ogg")):
             sound_path = sound_filename
@@ -43,31 +54,24 @@ class SoundMixin:
             sound_path = os.path.join("sounds", directory, sound_filename +".ogg")
 
         try:
-            exists = os.path.exists(sound_path)
+            exists = _sound_catalog.exists(sound_path)
         except Exception:
             exists = False
         logging.debug(f"_safe_sound_play: resolved '{sound_filename}' -> '{sound_path}', exists={exists}, block={block}")
 
-        if os.path.exists(sound_path):
+        if exists:
             try:
 
-                if not hasattr(self, "_sound_cache"):
-                    self._sound_cache = {}
-                cache = self._sound_cache
-                sound = cache.get(sound_path)
-                if sound is None:
-                    try:
-                        sound = pygame.mixer.Sound(sound_path)
-                    except Exception as e:
-                        logging.warning(f"Failed to load sound '{sound_path}': {e}")
-                        return
-                    cache[sound_path]= sound
-
-                if not hasattr(self, '_muffled_sound_cache'):
-                    try:
-                        self._muffled_sound_cache = {}
-                    except Exception:
-                        self._muffled_sound_cache = {}
+                try:
+                    sound = _audio_cache.get(sound_path)
+                except Exception as e:
+                    logging.warning(f"Failed to load sound '{sound_path}': {e}")
+                    return
+                sound_key = sound_path
+                final_vol = 1.0
+                # The mixer applies the flashbang volume itself, every block
+                # (see _combat_mix_gain), so a mixed shot keeps only the caps.
+                mix_vol = 1.0
 
                 try:
                     vol = 1.0
@@ -86,116 +90,51 @@ class SoundMixin:
                             is_bang =('explosion'in base)or('flashbang'in base)or('bang'in base)
                             logging.debug(f"_safe_sound_play: bang_muffle active, filename='{base}', is_bang={is_bang}")
                             if is_bang:
+                                cutoff = float(getattr(self, '_bang_muffle_cutoff', 3000.0))
                                 muffled = None
                                 try:
-                                    mcache = getattr(self, '_muffled_sound_cache', {})
-                                    muffled = mcache.get(sound_path)
+                                    muffled = _dsp_variants.ready(sound_path, "muffle", (cutoff, ))
+                                    if muffled is None:
+                                        _dsp_variants.request(sound_path, "muffle", (cutoff, ))
                                 except Exception:
                                     muffled = None
 
-                                if muffled is None:
-                                    try:
-                                        import numpy as _np
-                                        from numpy.fft import rfft, irfft, fftfreq
-                                        snd_arr = None
-                                        try:
-                                            snd_arr = pygame.sndarray.array(sound)
-                                        except Exception:
-                                            snd_arr = None
-
-                                        if snd_arr is None:
-                                            muffled = None
-                                        else:
-                                            try:
-                                                mixer_info = pygame.mixer.get_init()
-                                                sr = int(mixer_info[0])if mixer_info and mixer_info[0]else 44100
-                                            except Exception:
-                                                sr = 44100
-
-                                            orig_dtype = snd_arr.dtype
-                                            snd_float = snd_arr.astype(_np.float32)
-                                            if snd_float.ndim ==1:
-                                                channels = 1
-                                                channels_data =[snd_float]
-                                            else:
-                                                channels = snd_float.shape[1]
-                                                channels_data =[snd_float[:, c]for c in range(channels)]
-
-                                            processed =[]
-                                            cutoff = float(getattr(self, '_bang_muffle_cutoff', 3000.0))
-                                            for chdata in channels_data:
-                                                n = chdata.size
-                                                spec = rfft(chdata)
-                                                freqs = fftfreq(n, 1.0 /sr)[:spec.size]
-                                                spec[freqs >cutoff]= 0
-                                                proc = irfft(spec)
-                                                ir_len = int(0.03 *sr)
-                                                if ir_len >1:
-                                                    ir = _np.exp(-_np.linspace(0, 4, ir_len))
-                                                    ir = ir /(ir.sum()+1e-9)
-                                                    try:
-                                                        proc = _np.convolve(proc, ir, mode = 'same')
-                                                    except Exception:
-                                                        logging.exception("Suppressed exception")
-                                                processed.append(proc)
-
-                                            if channels ==1:
-                                                proc_arr = processed[0]
-                                            else:
-                                                proc_arr = _np.vstack(processed).T
-
-                                            try:
-                                                if _np.issubdtype(orig_dtype, _np.integer):
-                                                    info = _np.iinfo(orig_dtype)
-                                                    proc_arr = _np.clip(proc_arr, info.min, info.max)
-                                                else:
-                                                    proc_arr = _np.clip(proc_arr, -1.0, 1.0)
-                                                proc_arr = proc_arr.astype(orig_dtype)
-                                            except Exception:
-                                                try:
-                                                    proc_arr = proc_arr.astype(orig_dtype)
-                                                except Exception:
-                                                    logging.exception("Suppressed exception")
-
-                                            try:
-                                                muffled_sound = pygame.sndarray.make_sound(proc_arr)
-                                                try:
-                                                    self._muffled_sound_cache[sound_path]= muffled_sound
-                                                except Exception:
-                                                    logging.exception("Suppressed exception")
-                                                muffled = muffled_sound
-                                            except Exception:
-                                                muffled = None
-                                    except Exception:
-                                        muffled = None
-
                                 if muffled is not None:
                                     sound = muffled
+                                    sound_key = _dsp_variants.key(sound_path, "muffle", (cutoff, ))
                                     logging.debug(f"_safe_sound_play: using synthesized muffled sound for {sound_path}")
                                 else:
                                     mv = float(getattr(self, '_bang_muffle_volume', 0.45))
                                     vol = min(vol, mv)
-                                    logging.debug(f"_safe_sound_play: no synthesized muffled sound, capping vol to {vol}")
+                                    mix_vol = min(mix_vol, mv)
+                                    logging.debug(f"_safe_sound_play: muffled sound not rendered yet, capping vol to {vol}")
                     except Exception:
                         logging.exception('_safe_sound_play: error during muffle handling')
                         pass
+                    # Applied to the channel this play gets: the Sound is shared
+                    # through _audio_cache, and its own volume would reach every
+                    # other play of it.
                     final_vol = max(0.0, min(1.0, vol))
-                    try:
-                        sound.set_volume(final_vol)
-                    except Exception:
-                        logging.debug('_safe_sound_play: failed to set volume on sound object')
-                    logging.debug(f"_safe_sound_play: final volume set to {final_vol} for '{sound_path}'(flashbang_mute={getattr(self, '_flashbang_mute', False)}, bang_muffle={getattr(self, '_bang_muffle', False)})")
+                    logging.debug(f"_safe_sound_play: final volume {final_vol} for '{sound_path}'(flashbang_mute={getattr(self, '_flashbang_mute', False)}, bang_muffle={getattr(self, '_bang_muffle', False)})")
                 except Exception:
                     logging.exception("Suppressed exception")
 
+                if mix and not block:
+                    try:
+                        _combat_mixer.play(sound_key, max(0.0, min(1.0, mix_vol)))
+                        logging.debug(f"Mixed sound file: {sound_path}")
+                        return
+                    except Exception:
+                        logging.exception("Combat mixer unavailable, playing on a channel")
+
                 try:
                     weather_ch = getattr(self, '_weather_ambient_channel', None)
                     ch = None
                     if weather_ch is not None:
-                        ch = pygame.mixer.find_channel()
+                        ch = _find_channel()
                         if ch is None or ch == weather_ch:
                             ch = None
-                            for i in range(pygame.mixer.get_num_channels() - 2, -1, -1):
+                            for i in range(pygame.mixer.get_num_channels() - 2, COMBAT_MIXER_CHANNEL, -1):
                                 try:
                                     alt = pygame.mixer.Channel(i)
                                     if not alt.get_busy() and alt != weather_ch:
@@ -205,7 +144,7 @@ class SoundMixin:
                                     logging.exception("Suppressed exception")
                                     continue
                             if ch is None:
-                                for i in range(pygame.mixer.get_num_channels() - 2, -1, -1):
+                                for i in range(pygame.mixer.get_num_channels() - 2, COMBAT_MIXER_CHANNEL, -1):
                                     try:
                                         alt = pygame.mixer.Channel(i)
                                         if alt != weather_ch:
@@ -216,13 +155,14 @@ class SoundMixin:
                                         continue
                         if ch:
                             ch.play(sound)
+                            ch.set_volume(final_vol)
                             logging.debug(f"Played sound(reserved-safe channel) file: {sound_path}")
                         else:
                             logging.warning(f"No channel available to play sound: {sound_path}")
                     else:
                         ch = sound.play()
                         if ch is None:
-                            ch = pygame.mixer.find_channel(True)
+                            ch = _find_channel(True)
                             if ch:
                                 ch.play(sound)
                                 logging.debug(f"Played sound(forced channel) file: {sound_path}")
@@ -230,6 +170,8 @@ class SoundMixin:
                                 logging.warning(f"No channel available to play sound: {sound_path}")
                         else:
                             logging.debug(f"Played sound file: {sound_path}")
+                        if ch:
+                            ch.set_volume(final_vol)
 
                     if block:
                         try:
@@ -254,14 +196,14 @@ class SoundMixin:
     def _play_pitched_sound(self, sound_path, *, volume = 1.0, pitch = 1.0):
 
         try:
-            if not os.path.exists(sound_path):
+            if not _sound_catalog.exists(sound_path):
                 return False
 
-            base_sound = pygame.mixer.Sound(sound_path)
+            base_sound = _audio_cache.get(sound_path)
             try:
-                base_sound.set_volume(max(0.0, min(1.0, float(volume))))
+                volume = max(0.0, min(1.0, float(volume)))
             except Exception:
-                logging.exception("Suppressed exception")
+                volume = 1.0
 
             play_sound = base_sound
             try:
@@ -269,40 +211,26 @@ class SoundMixin:
             except Exception:
                 pitch = 1.0
 
-            if abs(pitch - 1.0) > 0.001:
+            bucket = _dsp.quantize_pitch(pitch)
+            if abs(bucket - 1.0) > 0.001:
                 try:
-                    sound_array = pygame.sndarray.array(base_sound)
-                    if sound_array.ndim == 1:
-                        source = sound_array.astype(np.float32)
-                        source_len = int(source.shape[0])
-                        target_len = max(1, int(round(source_len / pitch)))
-                        x_old = np.arange(source_len, dtype = np.float32)
-                        x_new = np.linspace(0, source_len - 1, target_len, dtype = np.float32)
-                        pitched = np.interp(x_new, x_old, source).astype(sound_array.dtype)
-                        play_sound = pygame.sndarray.make_sound(np.ascontiguousarray(pitched))
-                    else:
-                        source_len = int(sound_array.shape[0])
-                        target_len = max(1, int(round(source_len / pitch)))
-                        x_old = np.arange(source_len, dtype = np.float32)
-                        x_new = np.linspace(0, source_len - 1, target_len, dtype = np.float32)
-                        channels = []
-                        for ch_idx in range(sound_array.shape[1]):
-                            source = sound_array[:, ch_idx].astype(np.float32)
-                            channels.append(np.interp(x_new, x_old, source))
-                        pitched = np.stack(channels, axis = 1).astype(sound_array.dtype)
-                        play_sound = pygame.sndarray.make_sound(np.ascontiguousarray(pitched))
-                    try:
-                        play_sound.set_volume(max(0.0, min(1.0, float(volume))))
-                    except Exception:
-                        logging.exception("Suppressed exception")
+                    play_sound = _dsp_variants.ready(sound_path, "pitch", (bucket, ))
+                    if play_sound is None:
+                        # Rendered in the background; meanwhile the closest ready pitch, or none.
+                        _dsp_variants.request(sound_path, "pitch", (bucket, ))
+                        nearest = _dsp_variants.nearest_pitch(sound_path, bucket)
+                        play_sound = nearest[1]if nearest else base_sound
                 except Exception:
                     play_sound = base_sound
 
-            channel = pygame.mixer.find_channel(True)
+            # The cached Sounds are shared, so the volume goes on the channel.
+            channel = _find_channel(True)
             if channel:
                 channel.play(play_sound)
             else:
-                play_sound.play()
+                channel = play_sound.play()
+            if channel:
+                channel.set_volume(volume)
             return True
         except Exception:
             logging.exception("Failed to play pitched sound: %s", sound_path)
@@ -371,28 +299,42 @@ class SoundMixin:
 
         return caliber_map.get(caliber)or extra_map.get(caliber)
 
+    def _ammo_sound_folders(self, calibers):
+        """`sounds` of the ammunition entries matching any of `calibers`, in table order.
+
+        The caliber -> entries map is built once per ammunition table instead of
+        scanning the table on every shot."""
+        td = globals().get('table_data')or {}
+        ammo_tables = td.get('tables', {}).get('ammunition', [])if isinstance(td, dict)else[]
+        if not isinstance(ammo_tables, list):
+            return[]
+        cached = getattr(self, '_ammo_sound_index', None)
+        if cached is None or cached[0]is not ammo_tables or cached[1]!=len(ammo_tables):
+            by_caliber = {}
+            for idx, ammo_entry in enumerate(ammo_tables):
+                if not isinstance(ammo_entry, dict)or not ammo_entry.get('sounds'):
+                    continue
+                a_cal = ammo_entry.get('caliber')
+                if not a_cal:
+                    continue
+                for x in(a_cal if isinstance(a_cal, (list, tuple))else[a_cal]):
+                    by_caliber.setdefault(str(x).strip().lower(), []).append((idx, str(ammo_entry.get('sounds'))))
+            cached =(ammo_tables, len(ammo_tables), by_caliber)
+            self._ammo_sound_index = cached
+        matches = set()
+        for c in calibers or[]:
+            matches.update(cached[2].get(str(c).strip().lower(), ()))
+        return[folder for _, folder in sorted(matches)]
+
     def _caliber_to_sound_folder(self, caliber):
 
         if not caliber or not isinstance(caliber, str):
             return None
 
         try:
-            td = globals().get('table_data')or {}
-            ammo_tables = td.get('tables', {}).get('ammunition', [])if isinstance(td, dict)else[]
-            if isinstance(ammo_tables, list):
-                cal_lower = caliber.strip().lower()
-                for ammo_entry in ammo_tables:
-                    if not isinstance(ammo_entry, dict):
-                        continue
-                    a_cal = ammo_entry.get('caliber')
-                    if not a_cal:
-                        continue
-                    if isinstance(a_cal, (list, tuple)):
-                        match = any(str(x).strip().lower()==cal_lower for x in a_cal)
-                    else:
-                        match = str(a_cal).strip().lower()==cal_lower
-                    if match and ammo_entry.get('sounds'):
-                        return str(ammo_entry.get('sounds'))
+            folders = self._ammo_sound_folders([caliber])
+            if folders:
+                return folders[0]
         except Exception:
             logging.exception("Suppressed exception")
 
@@ -439,6 +381,95 @@ class SoundMixin:
 
         return caliber_map.get(caliber)
 
+    def _weapon_sound_folders(self, weapon):
+        """The sounds/ folders `_play_firearm_sound` and `_play_weapon_action_sound`
+        can pick from for `weapon`, most specific first (universal excluded)."""
+        folders =[]
+
+        def _add(name, weaponsounds = True, direct = True):
+            if isinstance(name, (list, tuple)):
+                name = name[0]if name else None
+            if not name or not isinstance(name, str):
+                return
+            if weaponsounds:
+                folders.append(os.path.join("sounds", "firearms", "weaponsounds", name.lower().replace('/', '_')))
+            if direct:
+                folders.append(os.path.join("sounds", "firearms", name))
+                folders.append(os.path.join("sounds", "firearms", name.lower()))
+
+        _add(weapon.get("platform"), direct = False)
+        pf_key = weapon.get("platform")or weapon.get("underbarrel_platform")or ""
+        if isinstance(pf_key, (list, tuple)):
+            pf_key = pf_key[0]if pf_key else ""
+        if pf_key and pf_key in self.PLATFORM_DEFAULTS:
+            _add(self.PLATFORM_DEFAULTS[pf_key].get("reload_sound_folder"), direct = False)
+        _add(self._get_firearm_sound_folder(weapon))
+        for key in("fire_sounds", "fire_sound", "sounds", "sound_folder", "reload_sounds", "action_sounds", "ammo_type", "ammo"):
+            _add(weapon.get(key))
+
+        rounds =[weapon.get("chambered")]
+        loaded = weapon.get("loaded")
+        if isinstance(loaded, dict)and isinstance(loaded.get("rounds"), list):
+            rounds += loaded["rounds"][:1]
+        for rnd in rounds:
+            if isinstance(rnd, dict):
+                _add(rnd.get("sounds"))
+                cal = rnd.get("caliber")
+                _add(self._caliber_to_sound_folder(cal[0]if isinstance(cal, (list, tuple))and cal else cal))
+        calibers = weapon.get("caliber")or[]
+        for af in self._ammo_sound_folders(calibers if isinstance(calibers, (list, tuple))else[calibers]):
+            _add(af)
+
+        magicsys = str(weapon.get("magicsoundsystem")or "").lower()
+        if str(weapon.get("type")or "").lower()=="magic"or magicsys in("hg", "at", "mg", "rf"):
+            folders.append(os.path.join("sounds", "firearms", "magic", magicsys or "hg"))
+
+        seen = set()
+        return[f for f in folders if not(f in seen or seen.add(f))]
+
+    def _preload_combat_sounds(self, weapons, extra_paths = ()):
+        """Decode, in the background, every sound `weapons` can play (their
+        folders, then sounds/firearms/universal) plus `extra_paths`, so the
+        first shot or reload does not stall on decoding, and queue the muffled
+        variants of the bang sounds among them. A newer call cancels the one
+        still running."""
+        previous = getattr(self, "_sound_preload_stop", None)
+        if previous is not None:
+            previous.set()
+        stop = threading.Event()
+        self._sound_preload_stop = stop
+
+        def _paths():
+            folders =[]
+            for weapon in weapons:
+                try:
+                    folders += self._weapon_sound_folders(weapon)
+                except Exception:
+                    logging.exception("Suppressed exception")
+            folders.append(os.path.join("sounds", "firearms", "universal"))
+            paths = list(extra_paths)
+            for folder in dict.fromkeys(folders):
+                for ext in _soundcatalog.SOUND_EXTENSIONS:
+                    paths += _sound_catalog.glob(os.path.join(folder, "*" +ext))
+            return[p for p in dict.fromkeys(paths)if _sound_catalog.exists(p)]
+
+        def _run():
+            try:
+                start = time.perf_counter()
+                paths = _paths()
+                loaded = _audio_cache.preload(paths, stop = stop)
+                logging.info(f"Preloaded {loaded} of {len(paths)} combat sounds in {(time.perf_counter()-start)*1000:.0f} ms")
+                # Muffled variants of the bangs, for when ear protection kicks in.
+                cutoff = float(getattr(self, '_bang_muffle_cutoff', 3000.0))
+                for path in paths:
+                    base = os.path.basename(path).lower()
+                    if not stop.is_set()and(('explosion'in base)or('flashbang'in base)or('bang'in base))and _audio_cache.contains(path):
+                        _dsp_variants.request(path, "muffle", (cutoff, ))
+            except Exception:
+                logging.exception("Failed to preload combat sounds")
+
+        threading.Thread(target = _run, name = "sound-preload", daemon = True).start()
+
     def _play_firearm_sound(self, weapon, sound_type = "fire", fired_round = None):
 
         try:
@@ -477,7 +508,7 @@ class SoundMixin:
 
             if sound_type =="equip"and weapon.get("custom_equip_sound"):
                 sound_path = weapon["custom_equip_sound"]
-                if os.path.exists(sound_path):
+                if _sound_catalog.exists(sound_path):
                     self._safe_sound_play("", sound_path)
                     return
 
@@ -499,12 +530,12 @@ class SoundMixin:
                         wf_map = os.path.join("sounds", "firearms", "weaponsounds", str(mapped_folder).lower().replace('/', '_'))
                         candidates =[]
                         if sound_type =="equip":
-                            candidates = glob.glob(os.path.join(wf_map, "equip*.ogg"))+glob.glob(os.path.join(wf_map, "draw*.ogg"))
+                            candidates = _sound_catalog.glob(os.path.join(wf_map, "equip*.ogg"))+_sound_catalog.glob(os.path.join(wf_map, "draw*.ogg"))
                         elif sound_type =="reload":
-                            candidates = glob.glob(os.path.join(wf_map, "reload*.ogg"))+glob.glob(os.path.join(wf_map, "load*.ogg"))+glob.glob(os.path.join(wf_map, "pump*.ogg"))
+                            candidates = _sound_catalog.glob(os.path.join(wf_map, "reload*.ogg"))+_sound_catalog.glob(os.path.join(wf_map, "load*.ogg"))+_sound_catalog.glob(os.path.join(wf_map, "pump*.ogg"))
                         else:
 
-                            candidates = glob.glob(os.path.join(wf_map, f"{sound_type}*.ogg"))
+                            candidates = _sound_catalog.glob(os.path.join(wf_map, f"{sound_type}*.ogg"))
                         if candidates:
                             self._safe_sound_play("", random.choice(candidates), block =(sound_type in("reload", "unselect", "holster")))
                             return
@@ -516,12 +547,12 @@ class SoundMixin:
                 if platform_folder:
                     wf_rel = os.path.join("weaponsounds", platform_folder)
                     wf_path = os.path.join("sounds", "firearms", wf_rel)
-                    if os.path.isdir(wf_path):
+                    if _sound_catalog.isdir(wf_path):
                         sound_folder = wf_rel
                     else:
 
                         direct_pf = os.path.join("sounds", "firearms", platform_folder)
-                        if os.path.isdir(direct_pf):
+                        if _sound_catalog.isdir(direct_pf):
                             sound_folder = platform_folder
 
             if sound_type =="equip":
@@ -529,7 +560,7 @@ class SoundMixin:
                 tried = False
                 if platform_folder:
                     wf = os.path.join("sounds", "firearms", "weaponsounds", platform_folder)
-                    candidates = glob.glob(os.path.join(wf, "equip*.ogg"))+glob.glob(os.path.join(wf, "draw*.ogg"))
+                    candidates = _sound_catalog.glob(os.path.join(wf, "equip*.ogg"))+_sound_catalog.glob(os.path.join(wf, "draw*.ogg"))
                     if candidates:
                         sound_file = random.choice(candidates)
                         self._safe_sound_play("", sound_file)
@@ -537,13 +568,13 @@ class SoundMixin:
                     tried = True
 
                 if sound_folder:
-                    base_equip_candidates = glob.glob(os.path.join("sounds", "firearms", sound_folder, "equip*.ogg"))+glob.glob(os.path.join("sounds", "firearms", sound_folder, "draw*.ogg"))
+                    base_equip_candidates = _sound_catalog.glob(os.path.join("sounds", "firearms", sound_folder, "equip*.ogg"))+_sound_catalog.glob(os.path.join("sounds", "firearms", sound_folder, "draw*.ogg"))
                     if base_equip_candidates:
                         sound_file = random.choice(base_equip_candidates)
                         self._safe_sound_play("", sound_file)
                         return
 
-                uni_candidates = glob.glob(os.path.join("sounds", "firearms", "universal", "equip*.ogg"))+glob.glob(os.path.join("sounds", "firearms", "universal", "draw*.ogg"))
+                uni_candidates = _sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "equip*.ogg"))+_sound_catalog.glob(os.path.join("sounds", "firearms", "universal", "draw*.ogg"))
                 if uni_candidates:
                     sound_file = random.choice(uni_candidates)
                     self._safe_sound_play("", sound_file)
@@ -553,6 +584,7 @@ class SoundMixin:
                 return
 
             is_suppressed = self._check_weapon_suppressed(weapon)
+            mix = sound_type =="fire"
 
             base_path = f"sounds/firearms/{sound_folder}"if sound_folder else None
             wf_platform = None
@@ -569,12 +601,13 @@ class SoundMixin:
 
             def _select_from_folder(folder):
                 try:
-                    if not folder or not os.path.isdir(folder):
+                    if not folder or not _sound_catalog.isdir(folder):
                         _dbg("_select_from_folder: missing folder %s", folder)
                         return None
                     _dbg("_select_from_folder: scanning folder %s(suppressed=%s)", folder, is_suppressed)
+                    plain, suppressed = _sound_catalog.variants(folder, "fire")
                     if is_suppressed:
-                        cands = glob.glob(os.path.join(folder, "fire*_suppressed.wav"))+glob.glob(os.path.join(folder, "fire*_suppressed.ogg"))
+                        cands = suppressed
                         _dbg("_select_from_folder: found %d suppressed candidates in %s", len(cands), folder)
                         if cands:
                             sel = random.choice(cands)
@@ -583,9 +616,7 @@ class SoundMixin:
                         _dbg("_select_from_folder: no suppressed candidates in %s", folder)
                         return None
                     else:
-                        cands = glob.glob(os.path.join(folder, "fire*.wav"))+glob.glob(os.path.join(folder, "fire*.ogg"))
-
-                        cands =[f for f in cands if "_suppressed"not in os.path.basename(f)]
+                        cands = plain
                         _dbg("_select_from_folder: found %d non-suppressed candidates in %s", len(cands), folder)
                         if cands:
                             sel = random.choice(cands)
@@ -600,7 +631,7 @@ class SoundMixin:
             if sound_type =="fire"and wf_platform:
                 sel = _select_from_folder(wf_platform)
                 if sel:
-                    self._safe_sound_play("", sel)
+                    self._safe_sound_play("", sel, mix = mix)
                     return
 
             ammo_folder = None
@@ -657,46 +688,30 @@ class SoundMixin:
                 wf_ammo_map = os.path.join("sounds", "firearms", "weaponsounds", str(ammo_folder).lower().replace('/', '_'))
                 sel = _select_from_folder(wf_ammo_map)
                 if sel:
-                    self._safe_sound_play("", sel)
+                    self._safe_sound_play("", sel, mix = mix)
                     return
                 wf_ammo = os.path.join("sounds", "firearms", str(ammo_folder))
                 sel = _select_from_folder(wf_ammo)
                 if sel:
-                    self._safe_sound_play("", sel)
+                    self._safe_sound_play("", sel, mix = mix)
                     return
 
             try:
                 if not ammo_folder:
-                    td = globals().get('table_data')or {}
-                    ammo_tables = td.get('tables', {}).get('ammunition', [])if isinstance(td, dict)else[]
-
                     cal_list = weapon.get('caliber')if isinstance(weapon, dict)else None
-                    if cal_list and isinstance(ammo_tables, list):
-                        for ammo_entry in ammo_tables:
+                    if cal_list:
+                        for af in self._ammo_sound_folders(cal_list):
                             try:
-                                if not isinstance(ammo_entry, dict):
-                                    continue
-                                a_cal = ammo_entry.get('caliber')
-                                if not a_cal:
-                                    continue
-
-                                if isinstance(a_cal, (list, tuple)):
-                                    match = any(str(x).strip().lower()in[str(c).strip().lower()for c in(cal_list or[])]for x in a_cal)
-                                else:
-                                    match = any(str(a_cal).strip().lower()==str(c).strip().lower()for c in(cal_list or[]))
-                                if match and ammo_entry.get('sounds'):
-
-                                    af = str(ammo_entry.get('sounds'))
-                                    wf_ammo_map = os.path.join('sounds', 'firearms', 'weaponsounds', af.lower().replace('/', '_'))
-                                    sel = _select_from_folder(wf_ammo_map)
-                                    if sel:
-                                        self._safe_sound_play('', sel)
-                                        return
-                                    wf_ammo2 = os.path.join('sounds', 'firearms', af.lower())
-                                    sel = _select_from_folder(wf_ammo2)
-                                    if sel:
-                                        self._safe_sound_play('', sel)
-                                        return
+                                wf_ammo_map = os.path.join('sounds', 'firearms', 'weaponsounds', af.lower().replace('/', '_'))
+                                sel = _select_from_folder(wf_ammo_map)
+                                if sel:
+                                    self._safe_sound_play('', sel, mix = mix)
+                                    return
+                                wf_ammo2 = os.path.join('sounds', 'firearms', af.lower())
+                                sel = _select_from_folder(wf_ammo2)
+                                if sel:
+                                    self._safe_sound_play('', sel, mix = mix)
+                                    return
                             except Exception:
                                 logging.exception("Suppressed exception")
             except Exception:
@@ -711,13 +726,13 @@ class SoundMixin:
                         sel = _select_from_folder(wf)
                         if sel:
                             logging.debug("Fire sound selected(weapon.fire_sounds): %s", sel)
-                            self._safe_sound_play("", sel)
+                            self._safe_sound_play("", sel, mix = mix)
                             return
                         wf2 = os.path.join("sounds", "firearms", str(fs).lower())
                         sel = _select_from_folder(wf2)
                         if sel:
                             logging.debug("Fire sound selected(weapon.fire_sounds): %s", sel)
-                            self._safe_sound_play("", sel)
+                            self._safe_sound_play("", sel, mix = mix)
                             return
             except Exception:
                 logging.exception("Suppressed exception")
@@ -725,7 +740,7 @@ class SoundMixin:
             if base_path:
                 sel = _select_from_folder(base_path)
                 if sel:
-                    self._safe_sound_play("", sel)
+                    self._safe_sound_play("", sel, mix = mix)
                     return
 
             subtype = weapon.get("subtype", "")
@@ -733,46 +748,46 @@ class SoundMixin:
             if is_suppressed:
 
                 if subtype =="shotgun":
-                    shotgun_supp = glob.glob("sounds/firearms/universal/shotgunfire_suppressed.wav")+glob.glob("sounds/firearms/universal/shotgunfire_suppressed.ogg")
+                    shotgun_supp = _sound_catalog.glob("sounds/firearms/universal/shotgunfire_suppressed.wav")+_sound_catalog.glob("sounds/firearms/universal/shotgunfire_suppressed.ogg")
                     if shotgun_supp:
-                        self._safe_sound_play("", random.choice(shotgun_supp))
+                        self._safe_sound_play("", random.choice(shotgun_supp), mix = mix)
                         return
 
-                    rifle_supp = glob.glob("sounds/firearms/universal/riflefire_suppressed.wav")+glob.glob("sounds/firearms/universal/riflefire_suppressed.ogg")
+                    rifle_supp = _sound_catalog.glob("sounds/firearms/universal/riflefire_suppressed.wav")+_sound_catalog.glob("sounds/firearms/universal/riflefire_suppressed.ogg")
                     if rifle_supp:
-                        self._safe_sound_play("", random.choice(rifle_supp))
+                        self._safe_sound_play("", random.choice(rifle_supp), mix = mix)
                         return
                 elif subtype in["rifle", "mg"]:
-                    rifle_supp = glob.glob("sounds/firearms/universal/riflefire_suppressed.wav")+glob.glob("sounds/firearms/universal/riflefire_suppressed.ogg")
+                    rifle_supp = _sound_catalog.glob("sounds/firearms/universal/riflefire_suppressed.wav")+_sound_catalog.glob("sounds/firearms/universal/riflefire_suppressed.ogg")
                     if rifle_supp:
-                        self._safe_sound_play("", random.choice(rifle_supp))
+                        self._safe_sound_play("", random.choice(rifle_supp), mix = mix)
                         return
                 elif subtype in["pistol", "smg"]:
-                    pistol_supp = glob.glob("sounds/firearms/universal/pistolfire_suppressed.wav")+glob.glob("sounds/firearms/universal/pistolfire_suppressed.ogg")
+                    pistol_supp = _sound_catalog.glob("sounds/firearms/universal/pistolfire_suppressed.wav")+_sound_catalog.glob("sounds/firearms/universal/pistolfire_suppressed.ogg")
                     if pistol_supp:
-                        self._safe_sound_play("", random.choice(pistol_supp))
+                        self._safe_sound_play("", random.choice(pistol_supp), mix = mix)
                         return
             else:
 
                 if subtype =="shotgun":
-                    shot = glob.glob("sounds/firearms/universal/shotgunfire.wav")
+                    shot = _sound_catalog.glob("sounds/firearms/universal/shotgunfire.wav")
                     if shot:
-                        self._safe_sound_play("", random.choice(shot))
+                        self._safe_sound_play("", random.choice(shot), mix = mix)
                         return
 
-                    rifle = glob.glob("sounds/firearms/universal/riflefire.wav")
+                    rifle = _sound_catalog.glob("sounds/firearms/universal/riflefire.wav")
                     if rifle:
-                        self._safe_sound_play("", random.choice(rifle))
+                        self._safe_sound_play("", random.choice(rifle), mix = mix)
                         return
                 elif subtype in["rifle", "mg"]:
-                    rifle = glob.glob("sounds/firearms/universal/riflefire.wav")
+                    rifle = _sound_catalog.glob("sounds/firearms/universal/riflefire.wav")
                     if rifle:
-                        self._safe_sound_play("", random.choice(rifle))
+                        self._safe_sound_play("", random.choice(rifle), mix = mix)
                         return
                 elif subtype in["pistol", "smg"]:
-                    pistol = glob.glob("sounds/firearms/universal/pistolfire.wav")
+                    pistol = _sound_catalog.glob("sounds/firearms/universal/pistolfire.wav")
                     if pistol:
-                        self._safe_sound_play("", random.choice(pistol))
+                        self._safe_sound_play("", random.choice(pistol), mix = mix)
                         return
 
             logging.warning(f"No fire sounds found for platform_folder={platform_folder} sound_folder={sound_folder} ammo_folder={ammo_folder}")
@@ -812,15 +827,15 @@ class SoundMixin:
 
                     if fs:
                         wf = os.path.join("sounds", "firearms", str(fs).lower())
-                        candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                        candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
                         if not candidates:
 
                             wf2 = os.path.join("sounds", "firearms", "weaponsounds", str(fs).lower().replace('/', '_'))
-                            candidates = glob.glob(os.path.join(wf2, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf2, f"{action_type}*.wav"))
+                            candidates = _sound_catalog.glob(os.path.join(wf2, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf2, f"{action_type}*.wav"))
 
                     if not candidates and platform_folder:
                         wf = os.path.join("sounds", "firearms", "weaponsounds", platform_folder)
-                        candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                        candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
 
                     if not candidates:
                         uni = os.path.join("sounds", "firearms", "universal")
@@ -835,7 +850,7 @@ class SoundMixin:
                         }
                         patterns = action_map.get(action_type, [f"{action_type}*.ogg"])
                         for pat in patterns:
-                            candidates +=glob.glob(os.path.join(uni, pat))
+                            candidates +=_sound_catalog.glob(os.path.join(uni, pat))
                     if candidates:
                         sound_file = random.choice(candidates)
                         logging.debug("Reload action sound: %s -> %s", action_type, sound_file)
@@ -869,7 +884,7 @@ class SoundMixin:
                     fs = weapon.get("reload_sounds")or weapon.get("action_sounds")or weapon.get("sounds")or weapon.get("sound_folder")or weapon.get("fire_sounds")
                     if fs:
                         wf = os.path.join("sounds", "firearms", "weaponsounds", str(fs).lower().replace('/', '_'))
-                        candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                        candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
                         if candidates:
                             import random as _r
                             sound_file = _r.choice(candidates)
@@ -882,21 +897,21 @@ class SoundMixin:
                 wf = os.path.join("sounds", "firearms", "weaponsounds", platform_folder)
                 candidates =[]
                 if action_type.startswith("tubeinsert")or action_type =="tubeinsert":
-                    candidates = glob.glob(os.path.join(wf, "tubeinsert*.ogg"))
+                    candidates = _sound_catalog.glob(os.path.join(wf, "tubeinsert*.ogg"))
                 elif action_type.startswith("bulletinsert"):
-                    candidates = glob.glob(os.path.join(wf, "bulletinsert*.ogg"))
+                    candidates = _sound_catalog.glob(os.path.join(wf, "bulletinsert*.ogg"))
                 else:
 
-                    pattern_candidates = glob.glob(os.path.join(wf, f"{action_type}*.ogg"))+glob.glob(os.path.join(wf, f"{action_type}*.wav"))
+                    pattern_candidates = _sound_catalog.glob(os.path.join(wf, f"{action_type}*.ogg"))+_sound_catalog.glob(os.path.join(wf, f"{action_type}*.wav"))
                     if pattern_candidates:
                         candidates = pattern_candidates
                     else:
 
                         exact_ogg = os.path.join(wf, f"{action_type}.ogg")
                         exact_wav = os.path.join(wf, f"{action_type}.wav")
-                        if os.path.exists(exact_ogg):
+                        if _sound_catalog.exists(exact_ogg):
                             candidates =[exact_ogg]
-                        elif os.path.exists(exact_wav):
+                        elif _sound_catalog.exists(exact_wav):
                             candidates =[exact_wav]
 
                 if candidates:
@@ -906,14 +921,14 @@ class SoundMixin:
                     return
 
                 if action_type == 'boltactionback':
-                    _ba_fallback = glob.glob(os.path.join(wf, "boltback*.ogg")) + glob.glob(os.path.join(wf, "boltback*.wav"))
+                    _ba_fallback = _sound_catalog.glob(os.path.join(wf, "boltback*.ogg")) + _sound_catalog.glob(os.path.join(wf, "boltback*.wav"))
                     if _ba_fallback:
                         sound_file = random.choice(_ba_fallback)
                         logging.debug("_play_weapon_action_sound: platform boltback fallback for boltactionback -> %s", sound_file)
                         self._safe_sound_play("", sound_file, block=should_block)
                         return
                 elif action_type == 'boltactionforward':
-                    _bf_fallback = glob.glob(os.path.join(wf, "boltforward*.ogg")) + glob.glob(os.path.join(wf, "boltforward*.wav"))
+                    _bf_fallback = _sound_catalog.glob(os.path.join(wf, "boltforward*.ogg")) + _sound_catalog.glob(os.path.join(wf, "boltforward*.wav"))
                     if _bf_fallback:
                         sound_file = random.choice(_bf_fallback)
                         logging.debug("_play_weapon_action_sound: platform boltforward fallback for boltactionforward -> %s", sound_file)
@@ -932,21 +947,21 @@ class SoundMixin:
             if action_type.startswith("tubeinsert")or action_type =="tubeinsert":
 
                 uni_folder = os.path.join("sounds", "firearms", "universal")
-                tube_candidates = glob.glob(os.path.join(uni_folder, "tubeinsert*.ogg"))
+                tube_candidates = _sound_catalog.glob(os.path.join(uni_folder, "tubeinsert*.ogg"))
                 if tube_candidates:
                     sound_file = random.choice(tube_candidates)
                     logging.debug("_play_weapon_action_sound: tubeinsert -> %s", sound_file)
                     self._safe_sound_play("", sound_file, block = should_block)
                     return
 
-                if os.path.exists(internal_sounds["tubeinsert"]):
+                if _sound_catalog.exists(internal_sounds["tubeinsert"]):
                     self._safe_sound_play("", internal_sounds["tubeinsert"], block = should_block)
                     return
 
             if action_type.startswith("bulletinsert"):
 
                 uni_folder = os.path.join("sounds", "firearms", "universal")
-                bullet_candidates = glob.glob(os.path.join(uni_folder, "bulletinsert*.ogg"))
+                bullet_candidates = _sound_catalog.glob(os.path.join(uni_folder, "bulletinsert*.ogg"))
                 if bullet_candidates:
                     sound_file = random.choice(bullet_candidates)
                     logging.debug("_play_weapon_action_sound: bulletinsert -> %s", sound_file)
@@ -954,24 +969,24 @@ class SoundMixin:
                     return
 
                 sound_file = internal_sounds.get(action_type)
-                if sound_file and os.path.exists(sound_file):
+                if sound_file and _sound_catalog.exists(sound_file):
                     self._safe_sound_play("", sound_file, block = should_block)
                     return
 
             if "revolver"in platform.lower()or "cylinder"in action_type:
-                if action_type =="cylinderopen"and os.path.exists(internal_sounds["cylinderopen"]):
+                if action_type =="cylinderopen"and _sound_catalog.exists(internal_sounds["cylinderopen"]):
                     logging.debug("_play_weapon_action_sound: revolver cylinderopen -> %s", internal_sounds["cylinderopen"])
                     self._safe_sound_play("", internal_sounds["cylinderopen"], block = should_block)
                     return
-                elif action_type =="cylinderclose"and os.path.exists(internal_sounds["cylinderclose"]):
+                elif action_type =="cylinderclose"and _sound_catalog.exists(internal_sounds["cylinderclose"]):
                     logging.debug("_play_weapon_action_sound: revolver cylinderclose -> %s", internal_sounds["cylinderclose"])
                     self._safe_sound_play("", internal_sounds["cylinderclose"], block = should_block)
                     return
-                elif action_type =="cylinderrelease"and os.path.exists(internal_sounds["cylinderrelease"]):
+                elif action_type =="cylinderrelease"and _sound_catalog.exists(internal_sounds["cylinderrelease"]):
                     logging.debug("_play_weapon_action_sound: revolver cylinderrelease -> %s", internal_sounds["cylinderrelease"])
                     self._safe_sound_play("", internal_sounds["cylinderrelease"], block = should_block)
                     return
-                elif action_type in("bulletinsert0", "bulletinsert1")and os.path.exists(internal_sounds[action_type]):
+                elif action_type in("bulletinsert0", "bulletinsert1")and _sound_catalog.exists(internal_sounds[action_type]):
                     logging.debug("_play_weapon_action_sound: revolver bulletinsert -> %s", internal_sounds[action_type])
                     self._safe_sound_play("", internal_sounds[action_type], block = should_block)
                     return
@@ -996,7 +1011,7 @@ class SoundMixin:
                     for nm in names:
                         for ext in(".ogg", ".wav"):
                             cand = os.path.join(wf, nm +ext)
-                            if os.path.exists(cand):
+                            if _sound_catalog.exists(cand):
                                 logging.debug("_play_weapon_action_sound: platform preferred %s -> %s", action_type, cand)
                                 self._safe_sound_play("", cand, block = should_block)
                                 return
@@ -1005,7 +1020,7 @@ class SoundMixin:
                 for nm in names:
                     for ext in(".ogg", ".wav"):
                         cand = os.path.join(uni_folder, nm +ext)
-                        if os.path.exists(cand):
+                        if _sound_catalog.exists(cand):
                             logging.debug("_play_weapon_action_sound: universal preferred %s -> %s", action_type, cand)
                             self._safe_sound_play("", cand, block = should_block)
                             return
@@ -1030,7 +1045,7 @@ class SoundMixin:
             if action_type in universal_sounds:
                 for sound_name in universal_sounds[action_type]:
                     sound_path = f"sounds/firearms/universal/{sound_name}.ogg"
-                    if os.path.exists(sound_path):
+                    if _sound_catalog.exists(sound_path):
                         logging.debug("_play_weapon_action_sound: universal %s -> %s", action_type, sound_path)
 
                         if action_type =="magin":
@@ -1079,7 +1094,7 @@ class SoundMixin:
             if platform_folder:
                 wf = os.path.join("sounds", "firearms", "weaponsounds", platform_folder)
                 exact = os.path.join(wf, action_type +".ogg")
-                if os.path.exists(exact):
+                if _sound_catalog.exists(exact):
                     logging.debug("_play_weapon_action_sound_strict: platform exact %s -> %s", action_type, exact)
                     self._safe_sound_play("", exact, block = block)
                     return True
@@ -1087,7 +1102,7 @@ class SoundMixin:
             uni = os.path.join("sounds", "firearms", "universal")
             for nm in names:
                 cand = os.path.join(uni, nm +".ogg")
-                if os.path.exists(cand):
+                if _sound_catalog.exists(cand):
                     logging.debug("_play_weapon_action_sound_strict: universal exact %s -> %s", action_type, cand)
                     self._safe_sound_play("", cand, block = block)
                     return True
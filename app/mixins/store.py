@@ -1,6 +1,7 @@
 """StoreMixin — App methods for the "store" feature area."""
 from app.foundation import *
 from app import fonts as _app_fonts
+import bisect
 import logging
 
 
@@ -34,8 +35,7 @@ class StoreMixin:
                 self._popup_show_info("Error", "Table file not found.", sound = "error")
                 return
 
-            with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                table_data = json.load(f)
+            table_data = load_table_data(tbl_path)
 
             try:
                 self._resolve_table_id_references(table_data)
@@ -298,43 +298,7 @@ class StoreMixin:
         if music_channel and music_channel.get("track"):
             try:
                 def _get_track_info(track_path):
-                    artist = None
-                    title = None
-                    length = None
-                    try:
-                        try:
-                            sound = pygame.mixer.Sound(track_path)
-                            length = float(sound.get_length())
-                        except Exception:
-                            length = None
-                        try:
-                            from mutagen._file import File as MutagenFile
-                            mf = MutagenFile(track_path)
-                            if mf is not None:
-                                tags = getattr(mf, "tags", {}) or {}
-                                def _get_tag(keys):
-                                    for k in keys:
-                                        v = tags.get(k)
-                                        if v:
-                                            try:
-                                                if isinstance(v, (list, tuple)):
-                                                    return str(v[0])
-                                                return str(v)
-                                            except Exception:
-                                                return str(v)
-                                    return None
-                                artist = _get_tag(["artist", "ARTIST", "TPE1", "IART"])
-                                title = _get_tag(["title", "TITLE", "TIT2", "INAM"])
-                        except Exception:
-                            logging.exception("Suppressed exception")
-                    except Exception:
-                        logging.exception("Suppressed exception")
-                    if not title:
-                        try:
-                            title = os.path.basename(track_path or "")
-                        except Exception:
-                            title = "Unknown"
-                    return {"artist": artist, "title": title, "length": length}
+                    return self._get_business_music_track_info(track_path)
 
                 marquee_frame = customtkinter.CTkFrame(header_frame, fg_color = "black")
                 marquee_frame.pack(pady = (6, 0))
@@ -865,25 +829,19 @@ class StoreMixin:
 
     def _get_business_music_track_length(self, track_path):
         try:
-            cache = getattr(self, "_business_music_track_length_cache", {})
-            if track_path in cache:
-                return cache.get(track_path)or 60.0
-        except Exception:
-            cache = {}
-
-        track_length = 60.0
-        try:
-            sound = pygame.mixer.Sound(track_path)
-            track_length = max(1.0, float(sound.get_length()or 0.0))
+            return max(1.0, float(_music_index.duration(track_path, probe = False)))
         except Exception:
-            track_length = 60.0
+            return 60.0
 
+    def _get_business_music_track_info(self, track_path):
+        """{"artist", "title", "length"} of a track for the music marquee, from
+        the playlist index; the file name until the index has probed it."""
         try:
-            cache[track_path]= track_length
-            self._business_music_track_length_cache = cache
+            info = _music_index.info(track_path, probe = False)
+            return {"artist":info.get("artist"), "title":info.get("title"), "length":info.get("duration")}
         except Exception:
             logging.exception("Suppressed exception")
-        return track_length
+            return {"artist":None, "title":os.path.basename(track_path or ""), "length":None}
 
     def _pick_business_music_track_and_position(self, playlists, all_tracks, first_play = False):
         tracks = sorted(all_tracks or [], key = lambda t:(os.path.basename(t).lower(), t.lower()))
@@ -930,18 +888,15 @@ class StoreMixin:
             seeded_tracks = list(tracks)
             order_rng.shuffle(seeded_tracks)
 
-            lengths_sec = []
-            for tp in seeded_tracks:
-                try:
-                    sec_len = int(round(float(self._get_business_music_track_length(tp))))
-                except Exception:
-                    sec_len = 60
-                lengths_sec.append(max(1, sec_len))
-
-            total_cycle_seconds = int(sum(lengths_sec))
-            if total_cycle_seconds <=0:
-                lengths_sec =[60 for _ in seeded_tracks]
-                total_cycle_seconds = int(sum(lengths_sec))
+            # Track start offsets and the cycle length come from the playlist
+            # index, memoised per order, so finding the current song is a bisect.
+            # Tracks it has not probed yet count as DEFAULT_DURATION.
+            try:
+                offsets, total_cycle_seconds = _music_index.cycle(seeded_tracks, probe = False)
+            except Exception:
+                logging.exception("Suppressed exception")
+                offsets = tuple(60 *i for i in range(len(seeded_tracks)))
+                total_cycle_seconds = 60 *len(seeded_tracks)
 
             offset_seed = int(_hashlib.sha256((seed_payload +"|offset").encode("utf-8")).hexdigest(), 16)
             seed_offset_seconds = int(offset_seed % max(1, total_cycle_seconds))
@@ -950,13 +905,11 @@ class StoreMixin:
             tick_seconds = int(time.time())
             phase_seconds = int((tick_seconds +seed_offset_seconds) % max(1, total_cycle_seconds))
 
-            cursor_seconds = 0
-            for idx, seg_len_seconds in enumerate(lengths_sec):
-                next_cursor = cursor_seconds +seg_len_seconds
-                if phase_seconds <next_cursor or idx ==len(lengths_sec)-1:
-                    start_pos = float(max(0, min(max(0, seg_len_seconds -1), phase_seconds -cursor_seconds)))
-                    return seeded_tracks[idx], start_pos
-                cursor_seconds = next_cursor
+            idx = max(0, bisect.bisect_right(offsets, phase_seconds)-1)
+            next_offset = offsets[idx +1]if idx +1 <len(offsets)else total_cycle_seconds
+            seg_len_seconds = next_offset -offsets[idx]
+            start_pos = float(max(0, min(max(0, seg_len_seconds -1), phase_seconds -offsets[idx])))
+            return seeded_tracks[idx], start_pos
 
         prev = getattr(self, "_last_business_music_track", None)
         if len(tracks)>1 and prev in tracks:
@@ -992,22 +945,12 @@ class StoreMixin:
                 logging.debug("Business music is muted by settings; skipping playback start")
                 return None
 
-            all_tracks =[]
-            for playlist in playlists:
-                music_folder = os.path.join("sounds", "music", playlist)
-                if os.path.exists(music_folder):
-                    tracks = []
-                    for ext in ("ogg", "wav", "mp3"):
-                        tracks.extend(glob.glob(os.path.join(music_folder, f"track*.{ext}")))
-
-                    tracks =[t for t in tracks if os.path.getsize(t)>0]
-                    all_tracks.extend(tracks)
-
-            failed_tracks = getattr(self, "_failed_music_tracks", set())
-
-            all_tracks =[t for t in all_tracks if t not in failed_tracks]
+            # Playable tracks (non-empty, not failed) come from the playlist
+            # index; a track that fails to load is flagged there and skipped
+            # until the file changes.
+            all_tracks = _music_index.tracks(playlists)
 
-            if all_tracks:
+            while all_tracks:
                 track, random_start = self._pick_business_music_track_and_position(playlists, all_tracks, first_play = first_play)
                 if not track:
                     return None
@@ -1016,16 +959,23 @@ class StoreMixin:
                     pygame.mixer.music.load(track)
                 except Exception as load_err:
                     logging.warning(f"Cannot load track {os.path.basename(track)}: {load_err}")
-                    failed_tracks.add(track)
-                    self._failed_music_tracks = failed_tracks
-
-                    return self._start_business_music(playlists, first_play)
+                    _music_index.mark_failed(track)
+                    all_tracks =[t for t in all_tracks if t !=track]
+                    continue
 
                 try:
                     self._last_business_music_track = track
                 except Exception:
                     logging.exception("Suppressed exception")
 
+                # Tracks the startup warm has not reached are probed off the
+                # Tk thread; the probe saves the index.
+                cold = _music_index.unprobed(all_tracks)
+                if cold:
+                    _background_tasks.submit("music index probe", lambda:_music_index.warm(paths = cold))
+                elif _music_index.dirty():
+                    _background_tasks.submit("music index save", _music_index.save)
+
                 try:
                     track_length = self._get_business_music_track_length(track)
                 except Exception:
@@ -1262,53 +1212,7 @@ class StoreMixin:
         marquee_job:list[object]=[None]
 
         def _get_track_info(track_path):
-            artist = None
-            title = None
-            length = None
-            try:
-                logging.debug(f"_get_track_info called for: {os.path.basename(track_path or '')}")
-            except Exception:
-                logging.exception("Suppressed exception")
-            try:
-
-                try:
-                    sound = pygame.mixer.Sound(track_path)
-                    length = float(sound.get_length())
-                except Exception:
-                    length = None
-
-                try:
-                    from mutagen._file import File as MutagenFile
-                    mf = MutagenFile(track_path)
-                    if mf is not None:
-                        tags = getattr(mf, 'tags', {})or {}
-
-                        def _get_tag(keys):
-                            for k in keys:
-                                v = tags.get(k)
-                                if v:
-                                    try:
-                                        if isinstance(v, (list, tuple)):
-                                            return str(v[0])
-                                        return str(v)
-                                    except Exception:
-                                        return str(v)
-                            return None
-                        artist = _get_tag(["artist", "ARTIST", "TPE1", "IART"])
-                        title = _get_tag(["title", "TITLE", "TIT2", "INAM"])
-                except Exception:
-                    logging.exception("Suppressed exception")
-
-            except Exception:
-                logging.exception("Suppressed exception")
-
-            if not title:
-                try:
-                    title = os.path.basename(track_path or "")
-                except Exception:
-                    title = "Unknown"
-
-            return {"artist":artist, "title":title, "length":length}
+            return self._get_business_music_track_info(track_path)
 
         def stop_ui_music():
             try:
@@ -2057,7 +1961,7 @@ class StoreMixin:
                                             sound_path = os.path.join('sounds', 'firearms', 'universal', f'{sn}.ogg')
                                             if os.path.exists(sound_path):
                                                 sound = pygame.mixer.Sound(sound_path)
-                                                ch = pygame.mixer.find_channel()
+                                                ch = _find_channel()
                                                 if ch:
                                                     ch.play(sound)
                                         except Exception:
@@ -2199,7 +2103,7 @@ class StoreMixin:
                                             rpath = os.path.join('sounds', 'firearms', 'universal', 'reloaderloop.ogg')
                                             if os.path.exists(rpath):
                                                 snd = pygame.mixer.Sound(rpath)
-                                                ch = pygame.mixer.find_channel()
+                                                ch = _find_channel()
                                                 if ch:
                                                     ch.play(snd, loops = -1)
                                                     _shop_reloader['ch'] = ch
@@ -2213,7 +2117,7 @@ class StoreMixin:
                                             if os.path.exists(rpath):
                                                 snd = pygame.mixer.Sound(rpath)
                                                 dur = max(int(snd.get_length() * 1000), 100)
-                                                ch = pygame.mixer.find_channel()
+                                                ch = _find_channel()
                                                 if ch:
                                                     ch.play(snd)
                                         except Exception:
@@ -3198,8 +3102,11 @@ class StoreMixin:
             return [json.loads(json.dumps(preferred_round)) for _ in range(max(0, int(count)))]
 
         def _find_mag_template(weapon_obj, tbl_data):
-            mags = (tbl_data or {}).get("tables", {}).get("magazines", []) or []
             target_systems = _to_lower_set(weapon_obj.get("magazinesystem"))
+            if target_systems and isinstance(tbl_data, dict):
+                mags = get_table_index(tbl_data).magazines_for_system(list(target_systems))
+            else:
+                mags = (tbl_data or {}).get("tables", {}).get("magazines", []) or []
             target_calibers = _to_lower_set(weapon_obj.get("caliber"))
             for mag in mags:
                 if not isinstance(mag, dict):
@@ -3536,47 +3443,7 @@ class StoreMixin:
         marquee_job:list[object]=[None]
 
         def _get_track_info(track_path):
-            artist = None
-            title = None
-            length = None
-            try:
-                try:
-                    sound = pygame.mixer.Sound(track_path)
-                    length = float(sound.get_length())
-                except Exception:
-                    length = None
-                try:
-                    from mutagen._file import File as MutagenFile
-                    mf = MutagenFile(track_path)
-                    if mf is not None:
-                        tags = getattr(mf, 'tags', {})or {}
-                        def _get_tag(keys):
-                            for k in keys:
-                                v = tags.get(k)
-                                if v:
-                                    try:
-                                        if isinstance(v, (list, tuple)):
-                                            return str(v[0])
-                                        return str(v)
-                                    except Exception:
-                                        return str(v)
-                            return None
-                        artist = _get_tag(["artist", "ARTIST", "TPE1", "IART"])
-                        title = _get_tag(["title", "TITLE", "TIT2", "INAM"])
-                except Exception:
-                    logging.exception("Suppressed exception")
-            except Exception:
-                logging.exception("Suppressed exception")
-            if not title:
-                try:
-                    title = os.path.basename(track_path or "")
-                except Exception:
-                    title = "Unknown"
-            try:
-                logging.debug(f"_get_track_info result: title={title} artist={artist} length={length}")
-            except Exception:
-                logging.exception("Suppressed exception")
-            return {"artist":artist, "title":title, "length":length}
+            return self._get_business_music_track_info(track_path)
 
         def stop_ui_music():
             try:
@@ -5450,43 +5317,7 @@ class StoreMixin:
         prev_track: list = [None]
 
         def _get_track_info(track_path):
-            artist = None
-            title = None
-            length = None
-            try:
-                try:
-                    sound = pygame.mixer.Sound(track_path)
-                    length = float(sound.get_length())
-                except Exception:
-                    length = None
-                try:
-                    from mutagen._file import File as MutagenFile
-                    mf = MutagenFile(track_path)
-                    if mf is not None:
-                        tags = getattr(mf, 'tags', {}) or {}
-                        def _get_tag(keys):
-                            for k in keys:
-                                v = tags.get(k)
-                                if v:
-                                    try:
-                                        if isinstance(v, (list, tuple)):
-                                            return str(v[0])
-                                        return str(v)
-                                    except Exception:
-                                        return str(v)
-                            return None
-                        artist = _get_tag(["artist", "ARTIST", "TPE1", "IART"])
-                        title = _get_tag(["title", "TITLE", "TIT2", "INAM"])
-                except Exception:
-                    logging.exception("Suppressed exception")
-            except Exception:
-                logging.exception("Suppressed exception")
-            if not title:
-                try:
-                    title = os.path.basename(track_path or "")
-                except Exception:
-                    title = "Unknown"
-            return {"artist": artist, "title": title, "length": length}
+            return self._get_business_music_track_info(track_path)
 
         def stop_ui_music():
             try:
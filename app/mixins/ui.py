@@ -244,7 +244,9 @@ class UiMixin:
                 if os.path.abspath(src_path) == os.path.abspath(dest_path):
                     results.append(f"\u2022 {dest_name} \u2014 already in {dest_dir}/")
                     continue
-                shutil.move(src_path, dest_path)
+                # A save still waiting to be written must not overwrite the dropped file.
+                with _save_manager.exclusive(dest_path):
+                    shutil.move(src_path, dest_path)
                 moved_exts.add(ext)
                 results.append(f"\u2022 {dest_name} \u2192 {dest_dir}/ ({label})")
                 logging.info("Drag-drop: moved '%s' -> '%s'", src_path, dest_path)
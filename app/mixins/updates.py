@@ -62,6 +62,8 @@ class UpdatesMixin:
             return()
 
     def _check_remote_version(self, label):
+        if offline_mode():
+            return
         try:
             api_url = 'https://api.github.com/repos/soli-dstate/DOOM-Tools/releases/latest'
             try:
@@ -9,8 +9,7 @@ class WeaponsMixin:
         try:
             tbl_path = get_current_table_path()
             if tbl_path and os.path.exists(tbl_path):
-                with open(tbl_path, 'r', encoding = 'utf-8-sig')as f:
-                    table_data = json.load(f)
+                table_data = open_table(tbl_path)
                 return table_data.get("tables", {}).get("ammunition", [])
         except Exception:
             logging.exception("Suppressed exception")
@@ -178,30 +177,23 @@ class WeaponsMixin:
             try:
                 tdata = globals().get('table_data')
                 if isinstance(tdata, dict):
-                    tables = tdata.get('tables', {})
-                    for arr in tables.values():
-                        if isinstance(arr, list):
-                            for it in arr:
-                                if isinstance(it, dict)and it.get('id')==tid:
-                                    return it
+                    it = get_table_index(tdata).item(tid)
+                    if isinstance(it, dict):
+                        return it
             except Exception:
                 logging.exception("Suppressed exception")
 
             try:
-                import json, os, glob
+                import os, glob
                 table_files = sorted(glob.glob(os.path.join('tables', f"*{global_variables.get('table_extension', '.sldtbl')}")))
                 for tf in table_files:
                     try:
-                        with open(tf, 'r', encoding = 'utf-8')as fh:
-                            td = json.load(fh)
+                        it = get_table_index(tf).item(tid)
                     except Exception:
                         logging.exception("Suppressed exception")
                         continue
-                    for arr in td.get('tables', {}).values():
-                        if isinstance(arr, list):
-                            for it in arr:
-                                if isinstance(it, dict)and it.get('id')==tid:
-                                    return it
+                    if isinstance(it, dict):
+                        return it
             except Exception:
                 logging.exception("Suppressed exception")
 
@@ -0,0 +1,326 @@
+"""Persistent index of the business and casino music playlists.
+
+Each time a business opened, `_start_business_music` globbed every playlist
+folder and stat'ed every track, and the track length came from decoding the
+whole file with `pygame.mixer.Sound`; the synchronized mode did that for
+every track of the playlist to find the current song. The marquee then read
+the tags with mutagen, once per screen. The index keeps all of it:
+
+    sounds/music/.playlist-index.json
+        {"version", "playlists": {name: {"mtime", "tracks": [path, ..]}},
+         "tracks": {path: {"size", "mtime", "duration", "artist", "title"}}}
+
+    tracks(playlists)   playable tracks (non-empty, not failed), from memory
+    info(path)          {"duration", "artist", "title"}, probed once per file
+    duration(path)      seconds, `DEFAULT_DURATION` when unknown
+    mark_failed(path)   skip the track this session, or until the file changes
+    cycle(tracks)       (start offsets, total seconds) of a playlist order
+    unprobed(paths)     the tracks whose metadata is not known yet
+
+The UI passes `probe = False` to `info`, `duration` and `cycle`: a track not
+probed yet reads as `DEFAULT_DURATION` and its file name, and the caller
+hands `unprobed()` to `warm(paths = ..)` on a background thread.
+
+A playlist folder and its tracks are re-stat'ed at most every `interval`
+seconds; the folder is listed again only when its mtime changed, and a track
+whose size or mtime changed (a new file, or one overwritten in place) loses
+its probed metadata. Failed tracks are re-stat'ed on every `tracks()` call and
+are playable again as soon as the file changes. Failures are not saved: a
+launch without a working audio device must not disable tracks for good.
+`warm()` probes everything up front (a background task at startup, on the
+local-work thread so it never waits behind the network) and `save()` writes
+the file atomically when something changed.
+
+Stdlib only; the probe (path -> {"duration", "artist", "title"}) is passed in.
+"""
+import fnmatch
+import json
+import logging
+import os
+import threading
+import time
+
+INDEX_NAME = ".playlist-index.json"
+TRACK_PATTERN = "track*"
+TRACK_EXTENSIONS = (".ogg", ".wav", ".mp3")
+DEFAULT_DURATION = 60.0
+REFRESH_INTERVAL = 10.0
+_INDEX_VERSION = 2
+
+
+class MusicIndex:
+    """Playlist folders under `root` and the metadata of their tracks. Thread-safe."""
+
+    def __init__(self, root, probe, interval = REFRESH_INTERVAL):
+        self.root = root
+        self.path = os.path.join(root, INDEX_NAME)
+        self.interval = interval
+        self._probe = probe
+        self._playlists = {}       # name -> {"mtime": ns, "tracks": [path, ..]}
+        self._tracks = {}          # path -> entry
+        self._failed = {}          # path -> (size, mtime) when it failed; this session only
+        self._checked = {}         # name -> time.monotonic() of the last stat
+        self._cycles = {}          # tuple of tracks -> (offsets, total)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self.stats = {"scans": 0, "probes": 0, "probe_ms": 0.0, "saves": 0}
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                with open(self.path, "r", encoding = "utf-8")as f:
+                    data = json.load(f)
+                if data.get("version")!= _INDEX_VERSION:
+                    return
+                self._playlists = {str(k): {"mtime": v.get("mtime"), "tracks": list(v.get("tracks") or [])}
+                for k, v in(data.get("playlists")or {}).items()}
+                self._tracks = {str(k): dict(v)for k, v in(data.get("tracks")or {}).items()}
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable music index '{self.path}': {e}")
+                self._playlists, self._tracks = {}, {}
+
+    def dirty(self):
+        return self._dirty
+
+    def save(self):
+        """Write the index if it changed. Returns True if written."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            data = {"version": _INDEX_VERSION, "playlists": self._playlists, "tracks": self._tracks}
+            payload = json.dumps(data, indent = 1, sort_keys = True)
+            self._dirty = False
+        try:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding = "utf-8")as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+            self.stats["saves"]+= 1
+            return True
+        except Exception as e:
+            logging.warning(f"Failed to save music index '{self.path}': {e}")
+            with self._lock:
+                self._dirty = True
+            return False
+
+    # ── Playlists ────────────────────────────────────────────────────────
+
+    def _scan(self, name, folder, mtime):
+        """Relist `folder` and re-stat its tracks (caller holds the lock)."""
+        tracks =[]
+        try:
+            names = sorted(os.listdir(folder))
+        except OSError:
+            names =[]
+        for file_name in names:
+            if not(fnmatch.fnmatch(file_name, TRACK_PATTERN)and file_name.lower().endswith(TRACK_EXTENSIONS)):
+                continue
+            path = os.path.join(folder, file_name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            self._update(path, st)
+            tracks.append(path)
+        old = self._playlists.get(name)
+        for path in(old or {}).get("tracks", ()):
+            if path not in tracks:
+                self._tracks.pop(path, None)
+        self._playlists[name]= {"mtime": mtime, "tracks": tracks}
+        self._cycles.clear()
+        self._dirty = True
+        self.stats["scans"]+= 1
+
+    def _update(self, path, st):
+        """Reset the entry of `path` unless it matches `st` (caller holds the
+        lock)."""
+        entry = self._tracks.get(path)
+        if entry is not None and entry.get("size")== st.st_size and entry.get("mtime")== st.st_mtime_ns:
+            return
+        self._tracks[path]= {"size": st.st_size, "mtime": st.st_mtime_ns, "duration": None,
+        "artist": None, "title": None}
+        self._failed.pop(path, None)
+        self._cycles.clear()
+        self._dirty = True
+
+    def _restat(self, paths):
+        """Re-stat tracks whose folder did not change, catching files overwritten
+        in place (caller holds the lock). Returns False if one has gone."""
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            self._update(path, st)
+        return True
+
+    def _playlist(self, name):
+        """Track paths of playlist `name`, rescanned when its folder changed."""
+        self.load()
+        folder = os.path.join(self.root, name)
+        with self._lock:
+            entry = self._playlists.get(name)
+            now = time.monotonic()
+            if entry is not None and now -self._checked.get(name, -self.interval)<self.interval:
+                return entry["tracks"]
+            self._checked[name]= now
+            try:
+                mtime = os.stat(folder).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime is None:
+                if entry is not None:
+                    self._playlists.pop(name)
+                    self._dirty = True
+                return[]
+            if entry is None or entry.get("mtime")!= mtime or not self._restat(entry["tracks"]):
+                self._scan(name, folder, mtime)
+            return self._playlists[name]["tracks"]
+
+    def tracks(self, playlists):
+        """Playable tracks of `playlists`: non-empty files not marked failed."""
+        out =[]
+        for name in playlists or ():
+            paths = self._playlist(str(name))
+            with self._lock:
+                self._recheck_failed()
+                for path in paths:
+                    entry = self._tracks.get(path)
+                    if entry and entry.get("size")and path not in self._failed:
+                        out.append(path)
+        return out
+
+    def _recheck_failed(self):
+        """Clear the failed flag of tracks whose file changed since (caller
+        holds the lock)."""
+        for path, sig in list(self._failed.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if(st.st_size, st.st_mtime_ns)!= sig:
+                self._update(path, st)
+
+    def playlist_names(self):
+        try:
+            return sorted(n for n in os.listdir(self.root)if os.path.isdir(os.path.join(self.root, n)))
+        except OSError:
+            return[]
+
+    # ── Tracks ───────────────────────────────────────────────────────────
+
+    def _entry(self, path):
+        self.load()
+        with self._lock:
+            entry = self._tracks.get(path)
+            if entry is None:
+                # A track outside the indexed playlists: index it on its own.
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    return None
+                self._update(path, st)
+                entry = self._tracks[path]
+            return entry
+
+    def _probed(self, path, probe = True):
+        entry = self._entry(path)
+        if entry is None or entry.get("duration")is not None or path in self._failed or not probe:
+            return entry
+        start = time.perf_counter()
+        try:
+            meta = self._probe(path)or {}
+        except Exception as e:
+            logging.warning(f"Failed to read music track '{path}': {e}")
+            meta = {}
+        with self._lock:
+            self.stats["probes"]+= 1
+            self.stats["probe_ms"]+=(time.perf_counter()-start)*1000
+            try:
+                duration = float(meta.get("duration")or 0.0)
+            except (TypeError, ValueError):
+                duration = 0.0
+            entry["duration"]= duration if duration >0 else DEFAULT_DURATION
+            entry["artist"]= meta.get("artist")
+            entry["title"]= meta.get("title")
+            self._cycles.clear()
+            self._dirty = True
+        return entry
+
+    def info(self, path, probe = True):
+        """{"duration", "artist", "title"} of `path`; the title falls back to the
+        file name. With `probe` False an unprobed file is not read."""
+        entry = self._probed(path, probe)or {}
+        return {"duration": entry.get("duration")or DEFAULT_DURATION,
+        "artist": entry.get("artist"),
+        "title": entry.get("title")or os.path.basename(path or "")}
+
+    def duration(self, path, probe = True):
+        return self.info(path, probe)["duration"]
+
+    def unprobed(self, paths):
+        """The tracks of `paths` whose metadata has not been read yet."""
+        out =[]
+        for path in paths or ():
+            entry = self._entry(path)
+            with self._lock:
+                if entry is not None and entry.get("duration")is None and path not in self._failed:
+                    out.append(path)
+        return out
+
+    def mark_failed(self, path):
+        """Skip `path` for the rest of the session, or until the file changes."""
+        entry = self._entry(path)
+        if entry is not None:
+            with self._lock:
+                self._failed[path]=(entry.get("size"), entry.get("mtime"))
+
+    def cycle(self, tracks, probe = True):
+        """(start offsets, total) in whole seconds of playing `tracks` in order,
+        each at least one second long. Memoised per order once every track is
+        probed."""
+        key = tuple(tracks)
+        with self._lock:
+            cached = self._cycles.get(key)
+        if cached is not None:
+            return cached
+        offsets =[]
+        total = 0
+        complete = True
+        for path in key:
+            offsets.append(total)
+            entry = self._probed(path, probe)
+            if entry is not None and entry.get("duration")is None and path not in self._failed:
+                complete = False
+            total += max(1, int(round(self.duration(path, False))))
+        result =(tuple(offsets), total)
+        if complete:
+            with self._lock:
+                self._cycles[key]= result
+        return result
+
+    def warm(self, stop = None, paths = None):
+        """Probe `paths`, or index every playlist and probe its tracks, then
+        save. A background task; `stop` is a threading.Event."""
+        if paths is None:
+            paths =[path for name in self.playlist_names()for path in self.tracks([name])]
+        for path in paths:
+            if stop is not None and stop.is_set():
+                break
+            self._probed(path)
+        self.save()
+
+    def summary(self):
+        with self._lock:
+            out = dict(self.stats, playlists = len(self._playlists), tracks = len(self._tracks),
+            failed = len(self._failed))
+        out["probe_ms"]= round(out["probe_ms"], 1)
+        return out
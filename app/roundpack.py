@@ -0,0 +1,243 @@
+"""Run-length storage for rounds in magazines, belts, cylinders and tubes.
+
+Rounds are kept as a list with one dict per round (`loaded["rounds"]`,
+`weapon["rounds"]`, `_cylinder_layout`), and most rounds in a feed are
+identical: a 200-round belt is usually one or two variants. `RoundRuns`
+holds them as [round, count] runs instead, so a belt is a handful of
+entries. Adjacent equal rounds are merged when pushed.
+
+The list form stays the in-memory format the mixins work with; runs are
+used where rounds are moved in bulk (reload, unload, stacking rounds into
+containers, a burst's fired rounds) and for storage: `encode_rounds` /
+`decode_rounds` write round lists into saves as {"_runs": [[round, count], ...]}.
+
+Rounds handed out by `pop`, `peek` and iteration are copies, so editing one
+never changes the others in its run. Cylinder slots that are not dicts
+("__spent__" markers, empty None slots) are runs like any other entry.
+
+Stdlib only, like tablepack and savepack.
+"""
+
+import copy
+
+RUNS_KEY = "_runs"
+
+# Item keys whose list value is a sequence of rounds.
+ROUND_LIST_KEYS = ("rounds", "_cylinder_layout")
+
+
+def _copy_round(entry):
+    if not isinstance(entry, dict):
+        return entry
+    if any(isinstance(v, (dict, list)) for v in entry.values()):
+        return copy.deepcopy(entry)
+    return dict(entry)
+
+
+def round_variant(entry):
+    """Variant label used to match rounds against a variant filter."""
+    if not isinstance(entry, dict):
+        return None
+    return str(entry.get("variant", "Unknown")).lower()
+
+
+class RoundRuns:
+    """A round sequence stored as [round, count] runs, front first."""
+
+    __slots__ = ("_runs", "_len")
+
+    def __init__(self, rounds = None):
+        self._runs = []
+        self._len = 0
+        if rounds is not None:
+            self.extend(rounds)
+
+    # ── Building ─────────────────────────────────────────────────────────
+
+    def push(self, entry, count = 1):
+        """Add `count` copies of `entry` at the back."""
+        if count <= 0:
+            return
+        if self._runs and self._runs[-1][0] == entry:
+            self._runs[-1][1] += count
+        else:
+            self._runs.append([_copy_round(entry), count])
+        self._len += count
+
+    def push_front(self, entry, count = 1):
+        if count <= 0:
+            return
+        if self._runs and self._runs[0][0] == entry:
+            self._runs[0][1] += count
+        else:
+            self._runs.insert(0, [_copy_round(entry), count])
+        self._len += count
+
+    def extend(self, rounds):
+        if isinstance(rounds, RoundRuns):
+            for entry, count in rounds._runs:
+                self.push(entry, count)
+            return
+        for entry in rounds:
+            self.push(entry)
+
+    # ── Taking ───────────────────────────────────────────────────────────
+
+    def peek(self, back = False):
+        """Copy of the next round (the front, or the back), or None when empty."""
+        if not self._runs:
+            return None
+        return _copy_round(self._runs[-1 if back else 0][0])
+
+    def pop(self, back = False):
+        """Remove and return one round from the front (or the back)."""
+        if not self._runs:
+            raise IndexError("pop from empty RoundRuns")
+        pos = -1 if back else 0
+        run = self._runs[pos]
+        run[1] -= 1
+        self._len -= 1
+        if run[1] <= 0:
+            self._runs.pop(pos)
+            return run[0]
+        return _copy_round(run[0])
+
+    def split(self, count):
+        """Remove the first `count` rounds and return them as a new RoundRuns."""
+        head = RoundRuns()
+        while count > 0 and self._runs:
+            entry, run_count = self._runs[0]
+            take = min(count, run_count)
+            head.push(entry, take)
+            if take == run_count:
+                self._runs.pop(0)
+            else:
+                self._runs[0][1] -= take
+            self._len -= take
+            count -= take
+        return head
+
+    def take_variant(self, variant, count, back = False):
+        """Remove up to `count` rounds of `variant` (case-insensitive), nearest
+        the back when `back`, and return them as a RoundRuns in feed order."""
+        variant = str(variant).lower()
+        taken = RoundRuns()
+        order = range(len(self._runs) - 1, -1, -1) if back else range(len(self._runs))
+        for pos in order:
+            if count <= 0:
+                break
+            run = self._runs[pos]
+            if round_variant(run[0]) != variant:
+                continue
+            take = min(count, run[1])
+            if back:
+                taken.push_front(run[0], take)
+            else:
+                taken.push(run[0], take)
+            run[1] -= take
+            self._len -= take
+            count -= take
+        self._runs = [run for run in self._runs if run[1] > 0]
+        self._merge()
+        return taken
+
+    def _merge(self):
+        merged = []
+        for run in self._runs:
+            if merged and merged[-1][0] == run[0]:
+                merged[-1][1] += run[1]
+            else:
+                merged.append(run)
+        self._runs = merged
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self._len > 0
+
+    def __iter__(self):
+        for entry, count in self._runs:
+            for _ in range(count):
+                yield _copy_round(entry)
+
+    def __repr__(self):
+        return f"RoundRuns({self._runs!r})"
+
+    @property
+    def runs(self):
+        """(round, count) pairs, front first. The rounds are the stored dicts; don't edit them."""
+        return [(entry, count) for entry, count in self._runs]
+
+    def count_variant(self, variant):
+        variant = str(variant).lower()
+        return sum(count for entry, count in self._runs if round_variant(entry) == variant)
+
+    def to_list(self):
+        """The rounds as the usual list of per-round dicts."""
+        return list(self)
+
+    # ── Storage ──────────────────────────────────────────────────────────
+
+    def encode(self):
+        return {RUNS_KEY: [[_copy_round(entry), count] for entry, count in self._runs]}
+
+    @classmethod
+    def decode(cls, value):
+        runs = cls()
+        for pair in value.get(RUNS_KEY) or []:
+            if isinstance(pair, (list, tuple)) and len(pair) == 2 and isinstance(pair[1], int):
+                runs.push(pair[0], pair[1])
+        return runs
+
+
+def is_encoded(value):
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(RUNS_KEY), list)
+
+
+def encode_rounds(rounds):
+    """Run-length form of a round list for storage, or the list itself when
+    that is not shorter (no repeated neighbours)."""
+    if not isinstance(rounds, list) or len(rounds) < 2:
+        return rounds
+    runs = RoundRuns(rounds)
+    if len(runs._runs) >= len(rounds):
+        return rounds
+    return runs.encode()
+
+
+def decode_rounds(value):
+    """Round list for a value written by `encode_rounds`; other values pass through."""
+    if is_encoded(value):
+        return RoundRuns.decode(value).to_list()
+    return value
+
+
+def encode_item_rounds(value):
+    """Copy of an item (or any nested value) with every round list encoded."""
+    if isinstance(value, dict):
+        out = {}
+        for key, child in value.items():
+            if key in ROUND_LIST_KEYS and isinstance(child, list):
+                out[key] = encode_rounds([encode_item_rounds(entry) for entry in child])
+            else:
+                out[key] = encode_item_rounds(child)
+        return out
+    if isinstance(value, list):
+        return [encode_item_rounds(entry) for entry in value]
+    return value
+
+
+def decode_item_rounds(value):
+    """Decode every encoded round list inside `value`, in place; returns `value`."""
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key in ROUND_LIST_KEYS and is_encoded(child):
+                value[key] = child = decode_rounds(child)
+            decode_item_rounds(child)
+    elif isinstance(value, list):
+        for entry in value:
+            decode_item_rounds(entry)
+    return value
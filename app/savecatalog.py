@@ -0,0 +1,234 @@
+"""Catalog of the character saves in the saves folder.
+
+The character and backup pickers used to list the saves folder and decode
+every save (base85, HMAC, JSON) just to show names, tables and dates. The
+catalog keeps that metadata in one small signed file next to the saves:
+
+    save_catalog.sldidx       v2 envelope (see envelope.py) holding
+                              {"version", "saves": {filename: entry},
+                               "backups": {folder name: {stamp, count}}}
+
+A save entry is the summary the app builds for it (character name, table,
+money, ...) plus the file's mtime_ns and size and its signature status.
+Reading the catalog reconciles it with the folder: one stat per save, and
+only saves whose mtime or size changed (or that are new) are decoded again.
+The app records each save it writes, so its own writes never cost a decode.
+Backup counts are keyed by the stat of each backup store's index.json.
+
+A catalog that fails its signature (or is missing) is rebuilt from the
+saves, so editing it cannot make a tampered save look valid.
+
+Stdlib only, like backupstore.
+"""
+import logging
+import os
+import threading
+
+if __package__:
+    from . import envelope as _envelope
+    from . import backupstore as _backupstore
+else:  # loaded by path from scripts/
+    import importlib.util as _importlib_util
+
+    def _load_sibling(name):
+        spec = _importlib_util.spec_from_file_location(name, os.path.join(os.path.dirname(os.path.abspath(__file__)), name + ".py"))
+        module = _importlib_util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    _envelope = _load_sibling("envelope")
+    _backupstore = _load_sibling("backupstore")
+
+CATALOG_NAME = "save_catalog.sldidx"
+SAVE_EXTENSION = ".sldsv"
+_CATALOG_VERSION = 1
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+class SaveCatalog:
+    """The catalog of saves folder `folder`. Thread-safe.
+
+    `summarize(path)` returns (summary dict, status) for one save file, where
+    status is what the signed reader reported ("ok", "tampered", ...);
+    `count_backups(folder)` returns the number of backups in one backup store
+    folder. `signer()` and `verifiers()` give the keys the catalog file is
+    signed and checked with. `reserved` names .sldsv files that are not
+    character saves (settings and the like)."""
+
+    def __init__(self, folder, summarize, count_backups, signer, verifiers, reserved = ()):
+        self.folder = folder
+        self.summarize = summarize
+        self.count_backups = count_backups
+        self.signer = signer
+        self.verifiers = verifiers
+        self.reserved = frozenset(reserved)
+        self._lock = threading.RLock()
+        self._saves = None
+        self._backups = None
+        self._catalog_stamp = None
+        self.stats = {"reconciles": 0, "decoded": 0, "recorded": 0, "writes": 0, "rebuilds": 0}
+
+    # ── File ─────────────────────────────────────────────────────────────
+
+    def _path(self):
+        return os.path.join(self.folder, CATALOG_NAME)
+
+    def _load(self):
+        """Entries from disk, re-read when the catalog file changed (a cloud
+        restore, another process)."""
+        stamp = _stamp(self._path())
+        if self._saves is not None and stamp == self._catalog_stamp:
+            return
+        saves, backups = {}, {}
+        if stamp is not None:
+            try:
+                decoded = _envelope.read_path(self._path())
+                if decoded.version == 2 and decoded.verify(self.verifiers()):
+                    parsed = decoded.data()
+                    if parsed.get("version") == _CATALOG_VERSION:
+                        saves = dict(parsed.get("saves") or {})
+                        backups = dict(parsed.get("backups") or {})
+                else:
+                    logging.warning("Save catalog failed verification; rebuilding it")
+                    self.stats["rebuilds"] += 1
+            except (OSError, ValueError, AttributeError) as e:
+                logging.warning(f"Ignoring unreadable save catalog: {e}")
+                self.stats["rebuilds"] += 1
+        self._saves = saves
+        self._backups = backups
+        self._catalog_stamp = stamp
+
+    def _save(self):
+        path = self._path()
+        tmp = path + ".tmp"
+        try:
+            payload = {"version": _CATALOG_VERSION, "saves": self._saves, "backups": self._backups}
+            with open(tmp, "wb") as f:
+                _envelope.write(f, payload, self.signer())
+            os.replace(tmp, path)
+            self._catalog_stamp = _stamp(path)
+            self.stats["writes"] += 1
+        except Exception as e:
+            logging.warning(f"Failed to write save catalog: {e}")
+
+    # ── Saves ────────────────────────────────────────────────────────────
+
+    def _is_save(self, name):
+        return (name.endswith(SAVE_EXTENSION) and not name.endswith(SAVE_EXTENSION + SAVE_EXTENSION)
+                and name not in self.reserved)
+
+    def _save_names(self):
+        try:
+            with os.scandir(self.folder) as it:
+                return [entry.name for entry in it if self._is_save(entry.name) and entry.is_file()]
+        except OSError:
+            return []
+
+    def has_saves(self):
+        """Whether the folder holds any character save (names only; nothing is read)."""
+        return bool(self._save_names())
+
+    def _reconcile(self):
+        """Bring the save entries in line with the folder. Returns whether any changed."""
+        self._load()
+        self.stats["reconciles"] += 1
+        changed = False
+        names = self._save_names()
+        for name in set(self._saves) - set(names):
+            del self._saves[name]
+            changed = True
+        for name in names:
+            path = os.path.join(self.folder, name)
+            stamp = _stamp(path)
+            entry = self._saves.get(name)
+            if stamp is None or (entry is not None and entry.get("stamp") == stamp):
+                continue
+            try:
+                summary, status = self.summarize(path)
+            except Exception as e:
+                logging.warning(f"Failed to read save file {name} for the catalog: {e}")
+                summary, status = {}, "unreadable"
+            self.stats["decoded"] += 1
+            self._saves[name] = dict(summary or {}, stamp = stamp, status = status)
+            changed = True
+        return changed
+
+    def saves(self):
+        """Entries of every character save, by filename: the summary plus
+        filename, mtime, size, status and backup_count."""
+        with self._lock:
+            changed = self._reconcile()
+            counts = self._reconcile_backups()
+            if changed or counts is not None:
+                self._save()
+            counts = {name: info["count"] for name, info in self._backups.items()}
+            out = []
+            for name in sorted(self._saves):
+                entry = dict(self._saves[name])
+                mtime_ns, size = entry.pop("stamp")
+                entry.update(filename = name, mtime = mtime_ns / 1e9, size = size,
+                             backup_count = counts.get(entry.get("backup_folder"), 0))
+                out.append(entry)
+            return out
+
+    def record(self, path, summary, status = "ok"):
+        """Note that the app just wrote `summary`'s save to `path`."""
+        if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.folder):
+            return
+        name = os.path.basename(path)
+        if not self._is_save(name):
+            return
+        stamp = _stamp(path)
+        if stamp is None:
+            return
+        with self._lock:
+            self._load()
+            self._saves[name] = dict(summary, stamp = stamp, status = status)
+            self.stats["recorded"] += 1
+            self._save()
+
+    # ── Backups ──────────────────────────────────────────────────────────
+
+    def _reconcile_backups(self):
+        """Refresh backup counts whose store index changed. Returns the changed
+        folder names, or None when nothing changed."""
+        root = os.path.join(self.folder, "backups")
+        try:
+            with os.scandir(root) as it:
+                folders = [entry.name for entry in it if entry.is_dir() and entry.name != "archive"]
+        except OSError:
+            folders = []
+        changed = []
+        for name in set(self._backups) - set(folders):
+            del self._backups[name]
+            changed.append(name)
+        for name in folders:
+            folder = os.path.join(root, name)
+            stamp = _stamp(os.path.join(folder, _backupstore.INDEX_NAME))
+            info = self._backups.get(name)
+            if info is not None and info.get("stamp") == stamp:
+                continue
+            try:
+                count = self.count_backups(folder)
+            except Exception as e:
+                logging.warning(f"Failed to count backups in {folder}: {e}")
+                continue
+            # Counting can create index.json (rebuilt from manifests): stamp after.
+            self._backups[name] = {"stamp": _stamp(os.path.join(folder, _backupstore.INDEX_NAME)), "count": count}
+            changed.append(name)
+        return changed or None
+
+    def backup_counts(self):
+        """{backup folder name: number of backups} for every character backup folder."""
+        with self._lock:
+            self._load()
+            if self._reconcile_backups() is not None:
+                self._save()
+            return {name: info["count"] for name, info in self._backups.items()}
@@ -0,0 +1,196 @@
+"""Reference-based item storage for save files (save format v2).
+
+A v1 save carries a full copy of every table item the character owns, and
+`update_item_keys_from_table` re-syncs those copies key by key on every load.
+In v2 each item the table knows is stored as
+
+    {"id": <table id>, "overrides": {<keys that belong to this copy>}}
+
+The overrides are the variable keys (quantity, rounds, loaded, chambered,
+durability, ...), underscore-prefixed bookkeeping keys and any key the table
+item does not have. Every other key is taken from the table when the save is
+read (`hydrate_save`), which is exactly what the v1 key sync produced, so a
+hydrated v2 save needs no sync pass. Items the table does not know (custom or
+remote items) and id-less items are stored as plain dicts, as in v1.
+
+Item positions are the ones the key sync walks: storage, hands items and
+equipment slots, recursing into container "items" and subslot "current"
+items. Values of the other variable keys (accessories, parts, loaded
+magazines) are kept as they are, except that round lists anywhere in an item
+are written run-length encoded (see roundpack).
+
+Stdlib only: scripts/convert_legacy_saves.py migrates v1 saves with it
+without importing the app.
+"""
+import copy
+import logging
+
+if __package__:
+    from . import roundpack as _roundpack
+else:  # loaded by path from scripts/
+    import importlib.util as _importlib_util
+    import os as _os
+    _spec = _importlib_util.spec_from_file_location("roundpack", _os.path.join(_os.path.dirname(_os.path.abspath(__file__)), "roundpack.py"))
+    _roundpack = _importlib_util.module_from_spec(_spec)
+    _spec.loader.exec_module(_roundpack)
+
+SAVE_FORMAT_KEY = "_save_format"
+SAVE_FORMAT_VERSION = 2
+
+# Per-copy state that must survive a load; everything else is owned by the table.
+VARIABLE_KEYS = frozenset({
+    "quantity", "current", "items", "subslots", "uses_left", "hits_left",
+    "battery_life", "loaded", "chambered", "rounds",
+    "accessories", "attachment", "parts", "current_durability", "spring_durability",
+})
+
+# Top-level keys that hold items.
+ITEM_POSITIONS = ("storage", "hands", "equipment")
+
+
+def is_v2(data):
+    return isinstance(data, dict) and data.get(SAVE_FORMAT_KEY) == SAVE_FORMAT_VERSION
+
+
+def _is_reference(entry):
+    return isinstance(entry, dict) and len(entry) == 2 and "id" in entry and isinstance(entry.get("overrides"), dict)
+
+
+def _table_item(table_items, item_id):
+    try:
+        found = table_items.get(item_id)
+    except TypeError:  # malformed (unhashable) id
+        return None
+    return found if isinstance(found, dict) else None
+
+
+def _owned_by_table(key):
+    return key not in VARIABLE_KEYS and not (isinstance(key, str) and key.startswith("_"))
+
+
+def table_items_by_id(table_data):
+    """id -> item over every subtable of a parsed table; the last item wins on
+    duplicate ids, as in the app's table index."""
+    by_id = {}
+    tables = table_data.get("tables", {}) if isinstance(table_data, dict) else {}
+    if not isinstance(tables, dict):
+        return by_id
+    for items in tables.values():
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            if isinstance(item, dict) and "id" in item:
+                try:
+                    by_id[item["id"]] = item
+                except TypeError:
+                    continue
+    return by_id
+
+
+# ─── Compaction (write side) ─────────────────────────────────────────────────
+
+def _compact_nested(item, table_items):
+    """Copy of `item` (a dict) with its container items and subslot items compacted."""
+    out = dict(item)
+    if isinstance(out.get("items"), list):
+        out["items"] = [compact_item(child, table_items) for child in out["items"]]
+    if isinstance(out.get("subslots"), list):
+        subslots = []
+        for subslot in out["subslots"]:
+            if isinstance(subslot, dict) and isinstance(subslot.get("current"), dict):
+                subslot = dict(subslot, current = compact_item(subslot["current"], table_items))
+            subslots.append(subslot)
+        out["subslots"] = subslots
+    return out
+
+
+def compact_item(item, table_items):
+    """v2 form of one item. Never modifies `item`."""
+    if not isinstance(item, dict):
+        return item
+    nested = _compact_nested(item, table_items)
+    if "id" not in item:
+        return nested
+    table_item = _table_item(table_items, item["id"])
+    if table_item is None:
+        return nested
+    overrides = {k: v for k, v in nested.items()
+                 if k != "id" and (not _owned_by_table(k) or k not in table_item)}
+    return {"id": item["id"], "overrides": overrides}
+
+
+def _map_positions(data, fn):
+    """Apply `fn` to every top-level item position; returns a shallow copy of `data`."""
+    out = dict(data)
+    if isinstance(out.get("storage"), list):
+        out["storage"] = [fn(item) for item in out["storage"]]
+    hands = out.get("hands")
+    if isinstance(hands, dict) and isinstance(hands.get("items"), list):
+        out["hands"] = dict(hands, items = [fn(item) for item in hands["items"]])
+    equipment = out.get("equipment")
+    if isinstance(equipment, dict):
+        mapped = {}
+        for slot, equipped in equipment.items():
+            if isinstance(equipped, dict):
+                mapped[slot] = fn(equipped)
+            elif isinstance(equipped, list):
+                mapped[slot] = [fn(it) if isinstance(it, dict) else it for it in equipped]
+            else:
+                mapped[slot] = equipped
+        out["equipment"] = mapped
+    return out
+
+
+def compact_save(data, table_items):
+    """v2 copy of a save dict, items reduced to {id, overrides} against
+    `table_items` (id -> table item). The live save dict is left untouched."""
+    if not isinstance(data, dict) or not any(key in data for key in ITEM_POSITIONS):
+        return data  # settings and other non-character saves
+    out = _map_positions(data, lambda item: _roundpack.encode_item_rounds(compact_item(item, table_items)))
+    out[SAVE_FORMAT_KEY] = SAVE_FORMAT_VERSION
+    return out
+
+
+# ─── Hydration (read side) ───────────────────────────────────────────────────
+
+def hydrate_item(entry, table_items, missing = None):
+    """Full item dict for a v2 entry. Plain item dicts are returned with their
+    nested positions hydrated. Referenced ids the table no longer has are
+    appended to `missing`; those items keep only their overrides."""
+    if not isinstance(entry, dict):
+        return entry
+    if _is_reference(entry):
+        item_id = entry["id"]
+        table_item = _table_item(table_items, item_id)
+        item = {"id": item_id}
+        if table_item is None:
+            if missing is not None:
+                missing.append(item_id)
+        else:
+            for key, value in table_item.items():
+                if key != "id" and _owned_by_table(key):
+                    # Table dicts are shared through the table cache; never alias them.
+                    item[key] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+        item.update(entry["overrides"])
+    else:
+        item = entry
+    if isinstance(item.get("items"), list):
+        item["items"] = [hydrate_item(child, table_items, missing) for child in item["items"]]
+    if isinstance(item.get("subslots"), list):
+        for subslot in item["subslots"]:
+            if isinstance(subslot, dict) and isinstance(subslot.get("current"), dict):
+                subslot["current"] = hydrate_item(subslot["current"], table_items, missing)
+    return item
+
+
+def hydrate_save(data, table_items):
+    """Expand a v2 save in place. v1 saves are returned as they are. The
+    format marker is kept so the loader knows the items are already synced."""
+    if not is_v2(data):
+        return data
+    missing = []
+    hydrated = _map_positions(data, lambda entry: hydrate_item(_roundpack.decode_item_rounds(entry), table_items, missing))
+    data.update(hydrated)
+    if missing:
+        logging.warning(f"Save references {len(missing)} item(s) missing from the table; kept their saved keys only: {sorted(set(map(str, missing)))}")
+    return data
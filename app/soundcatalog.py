@@ -0,0 +1,248 @@
+"""In-memory index of the sounds folder.
+
+Every shot used to glob its folders again (`fire*.wav`, `fire*_suppressed.ogg`,
+then the ammo folder, then universal), and weapon actions did the same for
+each action type. The catalog walks `sounds/` once, on first use, and answers
+those questions from memory:
+
+    glob(pattern)               glob.glob() for a single directory level
+    exists(path) / isdir(path)  os.path.exists() / os.path.isdir()
+    variants(folder, action)    (variants, suppressed variants) of an action,
+                                e.g. ("fire0.ogg", ...), ("fire0_suppressed.ogg", ...)
+
+Results are memoised per (folder, pattern), so a full-auto burst is dict
+lookups with no filesystem calls. A daemon thread re-stats the indexed
+folders every `interval` seconds and rescans the ones whose mtime changed
+(a file added, removed or renamed), dropping their memoised results. Paths
+outside the root are passed through to the real filesystem.
+
+Stdlib only.
+"""
+import fnmatch
+import glob as _glob
+import logging
+import os
+import threading
+import time
+
+REFRESH_INTERVAL = 10.0
+SOUND_EXTENSIONS = (".ogg", ".wav")
+SUPPRESSED_SUFFIX = "_suppressed"
+
+
+def _key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+class SoundCatalog:
+    """Index of the folders under `root`. Thread-safe."""
+
+    def __init__(self, root = "sounds", interval = REFRESH_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._root_key = _key(root)
+        self._abs_root_key = _key(os.path.abspath(root))
+        self._dirs = None          # dir key -> {"names": (..), "subdirs": set, "mtime": ns}
+        self._memo = {}            # (dir key, pattern) -> tuple of names
+        self._generation = 0       # bumped whenever the index changes
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stop = threading.Event()
+        self.stats = {"builds": 0, "rescans": 0, "hits": 0, "misses": 0, "passthrough": 0, "build_ms": None}
+
+    # ── Index ────────────────────────────────────────────────────────────
+
+    def _scan_dir(self, path):
+        names = []
+        subdirs = set()
+        with os.scandir(path)as it:
+            for entry in it:
+                names.append(entry.name)
+                try:
+                    if entry.is_dir():
+                        subdirs.add(os.path.normcase(entry.name))
+                except OSError:
+                    pass
+        return {"names": tuple(names), "subdirs": subdirs, "mtime": os.stat(path).st_mtime_ns}
+
+    def _scan_tree(self, path, dirs, seen = None):
+        seen = set()if seen is None else seen
+        real = os.path.realpath(path)
+        if real in seen:
+            return  # symlink loop
+        seen.add(real)
+        try:
+            info = self._scan_dir(path)
+        except OSError:
+            return
+        dirs[_key(path)]= info
+        for name in info["names"]:
+            if os.path.normcase(name)in info["subdirs"]:
+                self._scan_tree(os.path.join(path, name), dirs, seen)
+
+    def build(self):
+        """(Re)build the whole index. Called on first use."""
+        start = time.perf_counter()
+        dirs = {}
+        self._scan_tree(self.root, dirs)
+        with self._lock:
+            self._dirs = dirs
+            self._memo.clear()
+            self._generation += 1
+            self.stats["builds"]+= 1
+            self.stats["build_ms"]= round((time.perf_counter()-start)*1000, 1)
+        files = sum(len(d["names"])-len(d["subdirs"])for d in dirs.values())
+        logging.info(f"Sound catalog: {len(dirs)} folders, {files} files indexed in {self.stats['build_ms']} ms")
+        self._start_watcher()
+
+    def _index(self):
+        dirs = self._dirs
+        if dirs is None:
+            with self._lock:
+                if self._dirs is None:
+                    self.build()
+                dirs = self._dirs
+        return dirs
+
+    def warm(self):
+        """Build the index now unless it is built already (a background task at startup)."""
+        self._index()
+
+    def refresh(self):
+        """Rescan the folders whose mtime changed since they were indexed, pick up
+        new folders and forget removed ones. Returns the number rescanned."""
+        if self._dirs is None:
+            return 0
+        changed = 0
+        with self._lock:
+            dirs = dict(self._dirs)
+            for key in list(dirs):
+                if key not in dirs:
+                    continue  # removed with its parent below
+                try:
+                    mtime = os.stat(key).st_mtime_ns
+                except OSError:
+                    mtime = None
+                if mtime == dirs[key]["mtime"]:
+                    continue
+                changed += 1
+                prefix = key + os.sep
+                for sub in [k for k in dirs if k.startswith(prefix)]:
+                    del dirs[sub]
+                del dirs[key]
+                if mtime is not None:
+                    self._scan_tree(key, dirs)
+            if not dirs and os.path.isdir(self.root):
+                self._scan_tree(self.root, dirs)
+                changed += 1
+            if changed:
+                self._dirs = dirs
+                self._memo.clear()
+                self._generation += 1
+                self.stats["rescans"]+= changed
+        if changed:
+            logging.debug(f"Sound catalog: rescanned {changed} changed folder(s)")
+        return changed
+
+    def _start_watcher(self):
+        if self._watcher is not None or not self.interval:
+            return
+        self._watcher = threading.Thread(target = self._watch, name = "sound-catalog", daemon = True)
+        self._watcher.start()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                logging.exception("Suppressed exception")
+
+    def close(self):
+        self._stop.set()
+
+    # ── Lookups ──────────────────────────────────────────────────────────
+
+    def _dir_key(self, path):
+        """Index key of `path`, or None when it lies outside the root."""
+        key = _key(path)
+        if os.path.isabs(key):
+            abs_root = self._abs_root_key
+            if not(key == abs_root or key.startswith(abs_root + os.sep)):
+                return None
+            key = os.path.join(self._root_key, key[len(abs_root)+1:])if key != abs_root else self._root_key
+        if key == self._root_key or key.startswith(self._root_key + os.sep):
+            return key
+        return None
+
+    def _match(self, key, pattern):
+        memo_key =(key, pattern)
+        names = self._memo.get(memo_key)
+        if names is not None:
+            self.stats["hits"]+= 1
+            return names
+        self.stats["misses"]+= 1
+        self._index()
+        with self._lock:
+            generation, entry = self._generation, self._dirs.get(key)
+        if entry is None:
+            names =()
+        else:
+            hidden_ok = pattern.startswith(".")
+            names = tuple(n for n in entry["names"]
+            if(hidden_ok or not n.startswith("."))and fnmatch.fnmatch(n, pattern))
+        with self._lock:
+            if generation == self._generation:  # not rescanned meanwhile
+                self._memo[memo_key]= names
+        return names
+
+    def glob(self, pattern):
+        """glob.glob(pattern) for patterns with wildcards in the file name only."""
+        folder, name_pattern = os.path.split(pattern)
+        key = self._dir_key(folder or ".")
+        if key is None or _glob.has_magic(folder):
+            self.stats["passthrough"]+= 1
+            return _glob.glob(pattern)
+        if not _glob.has_magic(name_pattern):
+            return[pattern]if self.exists(pattern)else[]
+        return[os.path.join(folder, n)for n in self._match(key, name_pattern)]
+
+    def isdir(self, path):
+        key = self._dir_key(path)
+        if key is None:
+            self.stats["passthrough"]+= 1
+            return os.path.isdir(path)
+        return key in self._index()
+
+    def exists(self, path):
+        key = self._dir_key(path)
+        if key is None:
+            self.stats["passthrough"]+= 1
+            return os.path.exists(path)
+        if key == self._root_key:
+            return key in self._index()
+        folder, name = os.path.split(key)
+        entry = self._index().get(folder)
+        if entry is None or not name:
+            return False
+        if name in entry["names"]:
+            return True
+        return bool(self._match(folder, _escape(name)))
+
+    def variants(self, folder, action):
+        """(variants, suppressed variants) of `action` in `folder`: the paths of
+        `<action>*.wav/.ogg`, split on the `_suppressed` suffix."""
+        both =[]
+        for ext in SOUND_EXTENSIONS:
+            both += self.glob(os.path.join(folder, action + "*" + ext))
+        plain =[p for p in both if SUPPRESSED_SUFFIX not in os.path.basename(p)]
+        suppressed =[p for p in both if os.path.splitext(os.path.basename(p))[0].endswith(SUPPRESSED_SUFFIX)]
+        return plain, suppressed
+
+    def summary(self):
+        dirs = self._dirs
+        return dict(self.stats, folders = None if dirs is None else len(dirs), memoised = len(self._memo))
+
+
+def _escape(name):
+    """`name` as an fnmatch pattern matching only itself."""
+    return "".join("[" + c + "]"if c in "*?["else c for c in name)
@@ -0,0 +1,167 @@
+"""Startup timeline and lazy imports.
+
+The timeline starts when this module is first imported (the first thing
+app.foundation does) and collects what happens until the main window is on
+screen:
+
+    mark(label)             a point in time ("settings loaded"); the report
+                            shows the time since the previous mark
+    with phase(label):      a span ("App.__init__")
+    lazy_import(name)       a module imported on first use; the import is
+                            recorded as a span when it happens, with its thread
+
+`report()` logs the timeline once the first window is shown, and `summary()`
+is what the dev panel shows. Times are milliseconds since the timeline
+started (`elapsed_ms`); `since_process_start_ms` adds the interpreter's own
+startup when psutil is around to tell it.
+
+Stdlib only: it has to load before anything heavy does.
+"""
+import contextlib
+import importlib
+import logging
+import sys
+import threading
+import time
+import types
+
+_T0 = time.perf_counter()
+_T0_WALL = time.time()
+_lock = threading.Lock()
+_events = []
+_first_window_ms = None
+
+
+def elapsed_ms():
+    return round((time.perf_counter() - _T0) * 1000, 1)
+
+
+def _record(label, start_ms, duration_ms = None, kind = "mark"):
+    thread = threading.current_thread()
+    event = {"label": label, "at_ms": start_ms, "ms": duration_ms, "kind": kind,
+             "thread": None if thread is threading.main_thread() else thread.name}
+    with _lock:
+        _events.append(event)
+    return event
+
+
+def mark(label):
+    """Note that `label` happened now."""
+    return _record(label, elapsed_ms())
+
+
+@contextlib.contextmanager
+def phase(label):
+    """Time the body of the with block as `label`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(label, round((start - _T0) * 1000, 1), round((time.perf_counter() - start) * 1000, 1), "phase")
+
+
+class _LazyModule(types.ModuleType):
+    """Stand-in for a module that is imported on first attribute access.
+
+    After the import the real module's namespace is copied in, so later
+    attribute reads are plain lookups; names that appear on the real module
+    afterwards (submodules) still resolve through __getattr__."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _lazy_load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+        with self.__dict__["_lazy_lock"]:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                start = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                _record(f"import {self.__name__}", round((start - _T0) * 1000, 1),
+                        round((time.perf_counter() - start) * 1000, 1), "lazy import")
+                self.__dict__.update({k: v for k, v in module.__dict__.items() if not k.startswith("__")})
+                self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, name):
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return getattr(self._lazy_load(), name)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name):
+    """`name` if it is already imported, else a stand-in that imports it on first use."""
+    module = sys.modules.get(name)
+    return module if module is not None else _LazyModule(name)
+
+
+def is_loaded(module):
+    return not isinstance(module, _LazyModule) or module.__dict__["_lazy_module"] is not None
+
+
+def first_window_shown():
+    """Mark the main window as on screen and log the timeline (once)."""
+    global _first_window_ms
+    if _first_window_ms is not None:
+        return
+    _first_window_ms = elapsed_ms()
+    mark("first window shown")
+    report()
+
+
+def _process_start_offset_ms():
+    """How long the interpreter ran before the timeline started, if known."""
+    try:
+        import psutil
+        return max(0.0, round((_T0_WALL - psutil.Process().create_time()) * 1000, 1))
+    except Exception:
+        return None
+
+
+def timeline():
+    with _lock:
+        return [dict(event) for event in _events]
+
+
+def summary():
+    """First-window time, the slowest phases and the lazy imports done so far."""
+    events = timeline()
+    spans = [e for e in events if e["ms"] is not None]
+    offset = _process_start_offset_ms()
+    return {
+        "first_window_ms": _first_window_ms,
+        "since_process_start_ms": None if _first_window_ms is None or offset is None else round(_first_window_ms + offset, 1),
+        "slowest": sorted(((e["label"], e["ms"]) for e in spans if e["kind"] == "phase"), key = lambda x: -x[1])[:5],
+        "lazy_imports": [(e["label"][len("import "):], e["ms"]) for e in spans if e["kind"] == "lazy import"],
+    }
+
+
+def report():
+    """Log the timeline: one line per event, in order. Main-thread marks show
+    the time since the previous one, so consecutive marks read as phases."""
+    events = sorted(timeline(), key = lambda e: e["at_ms"])
+    lines = []
+    last_mark = 0.0
+    for e in events:
+        line = f"{e['at_ms']:9.1f} ms  {e['label']}"
+        if e["ms"] is not None:
+            line += f" ({e['ms']:.1f} ms)"
+        elif not e["thread"]:
+            line += f" (+{e['at_ms'] - last_mark:.1f} ms)"
+            last_mark = e["at_ms"]
+        if e["thread"]:
+            line += f" [{e['thread']}]"
+        lines.append(line)
+    offset = _process_start_offset_ms()
+    head = "Startup timeline"
+    if offset is not None:
+        head += f" (interpreter startup before it: {offset:.0f} ms)"
+    logging.info(head + ":\n" + "\n".join(lines))
@@ -0,0 +1,454 @@
+"""Compiled sidecars for .sldtbl tables.
+
+A table is plain JSON and stays the source of truth, but parsing 3 MB of text
+every time a tool opens is the single biggest stall on slow machines. This
+module compiles a table into a `<table>.sldtblc` sidecar next to it:
+
+    MAGIC | header length (u32 LE) | header | item records...
+
+The header is a marshal-encoded dict holding the source's SHA-256/size/mtime,
+the table's top-level settings, the byte offset and length of every item
+record, and precomputed id/slot/caliber/magazinesystem/platform indexes. Each
+item is its own marshal record, so a reader mmaps the file and decodes only
+the items it actually touches; `CompiledTable.view()` goes one step further
+and hands out the table dict with each subtable decoded on first access. Dict keys are interned before encoding, which
+makes marshal write them once per record and intern them again on load, so
+every decoded item shares the same key objects.
+
+marshal's format is tied to the interpreter, so the header also records the
+marshal version and Python version; a sidecar written by a different Python is
+treated as stale and rebuilt, like one whose source hash no longer matches.
+
+Every view holds a reference on its CompiledTable's mmap until it has
+decoded all of its subtables or is collected. When a table changes, its
+owner calls `retire()`: live views decode what they still lack, and the map
+is closed once the last reference goes, so the sidecar is never held open
+(Windows cannot replace a mapped file).
+Stdlib only: scripts/compile_tables.py uses it without importing the app.
+"""
+import hashlib
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import weakref
+
+MAGIC = b"SLDTBLC\x01"
+FORMAT_VERSION = 1
+SIDECAR_EXT = ".sldtblc"
+_LEN = struct.Struct("<I")
+
+# Fields indexed in the header, mirroring app.foundation._TableIndex.
+INDEXED_FIELDS = ("slot", "caliber", "magazinesystem", "platform")
+
+
+def _runtime_tag():
+    return (marshal.version, sys.version_info[0], sys.version_info[1])
+
+
+def sidecar_path(table_path):
+    return table_path + SIDECAR_EXT
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _intern_keys(value):
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_keys(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_keys(v) for v in value]
+    return value
+
+
+def _index_values(value):
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip().lower() for v in value if v is not None and str(v).strip()]
+    if value is None or not str(value).strip():
+        return []
+    return [str(value).strip().lower()]
+
+
+def compile_table(table_path, table_data = None, out_path = None):
+    """Write the sidecar for `table_path` and return its path.
+
+    `table_data` may be passed when the caller already parsed the table; it
+    must be the parsed content of `table_path` as it is on disk now."""
+    import json
+    st = os.stat(table_path)
+    source_sha = _file_sha256(table_path)
+    if table_data is None:
+        with open(table_path, "r", encoding = "utf-8-sig") as f:
+            table_data = json.load(f)
+    if not isinstance(table_data, dict):
+        raise ValueError(f"{table_path} is not a table object")
+
+    tables = table_data.get("tables", {})
+    if not isinstance(tables, dict):
+        tables = {}
+    meta = {k: v for k, v in table_data.items() if k != "tables"}
+
+    records = []
+    offset = 0
+    subtables = {}
+    plain = {}
+    ids = {}
+    indexes = {field: {} for field in INDEXED_FIELDS}
+    for name, items in tables.items():
+        if not isinstance(items, list):
+            plain[name] = items
+            continue
+        spans = []
+        for pos, item in enumerate(items):
+            record = marshal.dumps(_intern_keys(item))
+            spans.append((offset, len(record)))
+            records.append(record)
+            offset += len(record)
+            if not isinstance(item, dict):
+                continue
+            ref = (name, pos)
+            item_id = item.get("id")
+            if item_id is not None:
+                try:
+                    ids[item_id] = ref
+                except TypeError:
+                    pass
+            for field in INDEXED_FIELDS:
+                for key in _index_values(item.get(field)):
+                    indexes[field].setdefault(key, []).append(ref)
+        subtables[name] = spans
+
+    header = {
+        "format": FORMAT_VERSION,
+        "runtime": _runtime_tag(),
+        "source_sha256": source_sha,
+        "source_size": st.st_size,
+        "source_mtime_ns": st.st_mtime_ns,
+        "meta": meta,
+        "keys": list(table_data.keys()),
+        "order": list(tables.keys()),
+        "subtables": subtables,
+        "plain": plain,
+        "ids": ids,
+        "indexes": indexes,
+    }
+    header_bytes = marshal.dumps(header)
+
+    out_path = out_path or sidecar_path(table_path)
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    fd, tmp_path = tempfile.mkstemp(prefix = ".sldtblc-", dir = out_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LEN.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for record in records:
+                f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; readable by whoever can read the table.
+        try:
+            os.chmod(tmp_path, st.st_mode & 0o666)
+        except OSError:
+            pass
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return out_path
+
+
+class CompiledTable:
+    """Read-only, mmap-backed view of a compiled table.
+
+    Items are decoded on first access and memoized; `materialize()` rebuilds
+    the full table dict in the same shape json.load would have produced.
+    Views handed out by `view()` keep the mmap open until `retire()`."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access = mmap.ACCESS_READ)
+        finally:
+            # The mapping keeps its own handle; it is released when the mmap is
+            # closed or garbage collected along with the last view using it.
+            self._file.close()
+        try:
+            if self._mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a compiled table")
+            (header_len,) = _LEN.unpack_from(self._mm, len(MAGIC))
+            start = len(MAGIC) + _LEN.size
+            self.header = marshal.loads(self._mm[start:start + header_len])
+            self._base = start + header_len
+        except Exception:
+            self.close()
+            raise
+        self._decoded = {}
+        self._lists = {}
+        self._lock = threading.Lock()
+        self._refs = 0
+        self._retired = False
+        self._views = []      # weakrefs; SubtablesView is unhashable, like a dict
+
+    def close(self):
+        """Unmap the file now. Views still reading through it fail; tables that
+        handed out views are closed with `retire()` instead."""
+        try:
+            self._mm.close()
+        except Exception:
+            pass
+
+    def _acquire(self):
+        with self._lock:
+            self._refs += 1
+
+    def _release(self):
+        with self._lock:
+            self._refs -= 1
+            done = self._retired and self._refs <= 0
+        if done:
+            self.close()
+
+    def retire(self):
+        """Stop using this table: live views decode the subtables they still
+        lack, and the mmap is closed once the last of them let go of it."""
+        with self._lock:
+            self._retired = True
+            views = [ref() for ref in self._views]
+            self._views = []
+        for view in views:
+            if view is None:
+                continue
+            try:
+                view.detach()
+            except Exception:
+                logging.warning(f"Failed to detach a view of {self.path}", exc_info = True)
+        with self._lock:
+            done = self._refs <= 0
+        if done:
+            self.close()
+
+    def is_current_for(self, table_path):
+        h = self.header
+        if h.get("format") != FORMAT_VERSION or tuple(h.get("runtime", ())) != _runtime_tag():
+            return False
+        try:
+            st = os.stat(table_path)
+        except OSError:
+            return False
+        if st.st_size != h.get("source_size"):
+            return False
+        if st.st_mtime_ns == h.get("source_mtime_ns"):
+            return True
+        # Touched but possibly unchanged (checkout, copy): fall back to the hash.
+        return _file_sha256(table_path) == h.get("source_sha256")
+
+    @property
+    def meta(self):
+        return self.header.get("meta", {})
+
+    @property
+    def subtable_names(self):
+        return list(self.header.get("order", ()))
+
+    def subtable_length(self, name):
+        spans = self.header.get("subtables", {}).get(name)
+        if spans is not None:
+            return len(spans)
+        value = self.header.get("plain", {}).get(name)
+        return len(value) if hasattr(value, "__len__") else 0
+
+    def record(self, name, pos):
+        key = (name, pos)
+        cached = self._decoded.get(key)
+        if cached is not None:
+            return cached
+        offset, length = self.header["subtables"][name][pos]
+        start = self._base + offset
+        value = marshal.loads(self._mm[start:start + length])
+        self._decoded[key] = value
+        return value
+
+    def item(self, item_id, default = None):
+        try:
+            ref = self.header["ids"].get(item_id)
+        except TypeError:
+            return default
+        if ref is None:
+            return default
+        return self.record(*ref)
+
+    def subtable(self, name):
+        if name in self.header.get("plain", {}):
+            return self.header["plain"][name]
+        cached = self._lists.get(name)
+        if cached is not None:
+            return cached
+        spans = self.header.get("subtables", {}).get(name)
+        if spans is None:
+            return None
+        items = [self.record(name, pos) for pos in range(len(spans))]
+        self._lists[name] = items
+        return items
+
+    def lookup(self, field, value):
+        """Items whose `field` (one of INDEXED_FIELDS) matches `value`, in table order."""
+        index = self.header.get("indexes", {}).get(field, {})
+        refs = []
+        seen = set()
+        for key in _index_values(value):
+            for ref in index.get(key, ()):
+                if ref not in seen:
+                    seen.add(ref)
+                    refs.append(ref)
+        if len(_index_values(value)) > 1:
+            order = {name: n for n, name in enumerate(self.subtable_names)}
+            refs.sort(key = lambda r: (order.get(r[0], 0), r[1]))
+        return [self.record(*ref) for ref in refs]
+
+    def _assemble(self, tables):
+        meta = self.meta
+        data = {}
+        for key in self.header.get("keys", list(meta) + ["tables"]):
+            data[key] = tables if key == "tables" else meta.get(key)
+        return data
+
+    def materialize(self):
+        return self._assemble({name: self.subtable(name) for name in self.subtable_names})
+
+    def view(self):
+        """Table dict whose "tables" entry decodes each subtable on first access."""
+        tables = SubtablesView(self)
+        with self._lock:
+            self._views = [ref for ref in self._views if ref() is not None]
+            self._views.append(weakref.ref(tables))
+        return self._assemble(tables)
+
+
+class SubtablesView(dict):
+    """`table["tables"]` of a compiled table, filled in one subtable at a time.
+
+    Indexing or .get() decodes just the requested subtable; anything that
+    needs every subtable (iteration, .items(), comparison, copying) loads the
+    rest first and from then on behaves as the plain dict json.load returns."""
+
+    def __init__(self, compiled):
+        super().__init__()
+        self._compiled = compiled
+        self._names = compiled.subtable_names
+        self._known = frozenset(self._names)
+        self._complete = False
+        compiled._acquire()
+        # Runs once: when the view has every subtable, or is collected.
+        self._release = weakref.finalize(self, compiled._release)
+
+    def __missing__(self, name):
+        if name not in self._known:
+            raise KeyError(name)
+        value = self._compiled.subtable(name)
+        dict.__setitem__(self, name, value)
+        return value
+
+    def get(self, name, default = None):
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        if name in self._known:
+            return self[name]
+        return default
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self._known
+
+    def _load_all(self):
+        if self._complete:
+            return
+        loaded = {name: self.get(name) for name in self._names}
+        for name, value in dict.items(self):
+            loaded.setdefault(name, value)
+        dict.clear(self)
+        dict.update(self, loaded)
+        self._complete = True
+        self._compiled = None
+        self._release()
+
+    def detach(self):
+        """Decode every subtable and let go of the compiled table's mmap."""
+        self._load_all()
+
+    def __len__(self):
+        self._load_all()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self._load_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._load_all()
+        return dict.__ne__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._load_all()
+        return dict.__repr__(self)
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._load_all()
+        return dict(dict.items(self))
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles come out as plain dicts, never holding the mmap.
+        return (dict, (self.copy(),))
+
+
+def open_compiled(table_path, rebuild = True, table_data = None):
+    """CompiledTable for `table_path`, rebuilding a missing or stale sidecar
+    when `rebuild` is true. Returns None if no usable sidecar can be had."""
+    path = sidecar_path(table_path)
+    if os.path.exists(path):
+        try:
+            compiled = CompiledTable(path)
+            if compiled.is_current_for(table_path):
+                return compiled
+            compiled.close()
+        except Exception:
+            logging.warning(f"Discarding unreadable compiled table {path}", exc_info = True)
+    if not rebuild:
+        return None
+    try:
+        compile_table(table_path, table_data = table_data)
+        return CompiledTable(path)
+    except Exception:
+        # Read-only installs cannot write sidecars; the JSON path still works.
+        logging.warning(f"Failed to compile table {table_path}", exc_info = True)
+        return None
@@ -0,0 +1,293 @@
+"""Local cache of the CTkThemesPack themes.
+
+The app used to download the CTkThemesPack zip (30 s timeout) during import
+whenever the themes folder was empty. The pack now lives in a cache next to
+the themes it installs:
+
+    themes/*.json                   installed theme files (what the settings list)
+    themes/.themepack/pack.json     {"version", "sha256", "etag", "last_modified",
+                                     "url", "checked", "files": {name: sha256},
+                                     "user_modified": [name, ..], "removed": [name, ..]}
+    themes/.themepack/<sha256>.zip  the archive those files came from
+
+Startup only ever uses the cache (`install_cached`): a themes folder left
+with no theme at all is filled from the cached zip after its SHA-256 is
+checked, with no network.
+`refresh` is the background updater: a conditional GET (If-None-Match /
+If-Modified-Since) at most once per `interval`; a 304 costs one round trip, a
+new archive is verified (zip CRC, theme JSON parses) before its files replace
+the installed ones, one atomic rename per file.
+
+"files" holds the SHA-256 of each theme as it was last installed. A theme file
+whose content no longer matches it was edited by the user, and one that was
+there before the pack installed anything is the user's own: neither is ever
+overwritten, they are listed under "user_modified" instead. A pack theme
+missing from a folder that still holds other themes was deleted by the user:
+it moves from "files" to "removed" and is not installed again.
+
+Stdlib only; the HTTP call is passed in, so this module never imports requests.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+
+CACHE_DIR = ".themepack"
+MANIFEST_NAME = "pack.json"
+REFRESH_INTERVAL = 24 * 3600
+_MANIFEST_VERSION = 1
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def read_themes(archive):
+    """{file name: bytes} of the themes/*.json members of a CTkThemesPack zip
+    (raw bytes). Raises ValueError when the archive is damaged or holds no
+    valid theme."""
+    try:
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            bad = zf.testzip()
+            if bad is not None:
+                raise ValueError(f"corrupt member {bad}")
+            themes = {}
+            for info in zf.infolist():
+                parts = info.filename.split("/")
+                # <root>/themes/<name>.json; nothing nested, no path tricks.
+                if (len(parts) == 3 and parts[1] == "themes" and parts[2].endswith(".json")
+                        and not info.is_dir() and parts[2] not in ("", ".", "..")):
+                    data = zf.read(info)
+                    json.loads(data.decode("utf-8"))
+                    themes[parts[2]] = data
+    except (zipfile.BadZipFile, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"not a usable theme pack: {e}") from e
+    if not themes:
+        raise ValueError("no themes/*.json in the archive")
+    return themes
+
+
+class ThemePack:
+    """The theme pack cache of `themes_dir`, fetched from `url`. Thread-safe."""
+
+    def __init__(self, themes_dir, url, interval = REFRESH_INTERVAL):
+        self.themes_dir = themes_dir
+        self.url = url
+        self.interval = interval
+        self._lock = threading.Lock()
+        self.stats = {"restored": 0, "checks": 0, "not_modified": 0, "updates": 0, "rejected": 0}
+
+    # ── Cache files ──────────────────────────────────────────────────────
+
+    def _cache_dir(self):
+        return os.path.join(self.themes_dir, CACHE_DIR)
+
+    def _manifest_path(self):
+        return os.path.join(self._cache_dir(), MANIFEST_NAME)
+
+    def _archive_path(self, sha256):
+        return os.path.join(self._cache_dir(), sha256 + ".zip")
+
+    def manifest(self):
+        try:
+            with open(self._manifest_path(), "r", encoding = "utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("manifest") == _MANIFEST_VERSION:
+                return manifest
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable theme pack manifest: {e}")
+        return {}
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self._cache_dir(), exist_ok = True)
+        _write_atomic(self._manifest_path(), json.dumps(dict(manifest, manifest = _MANIFEST_VERSION), indent = 1).encode("utf-8"))
+
+    def _cached_archive(self, manifest):
+        """The cached zip's bytes when its SHA-256 matches the manifest, else None."""
+        sha256 = manifest.get("sha256")
+        if not sha256:
+            return None
+        try:
+            with open(self._archive_path(sha256), "rb") as f:
+                archive = f.read()
+        except OSError:
+            return None
+        if _sha256(archive) != sha256:
+            logging.warning("Cached theme pack failed its integrity check; it will be downloaded again")
+            return None
+        return archive
+
+    # ── Installed themes ─────────────────────────────────────────────────
+
+    def _missing(self, files):
+        """Names from `files` that are not in themes_dir."""
+        return [name for name in files if not os.path.exists(os.path.join(self.themes_dir, name))]
+
+    def _current_sha256(self, name):
+        try:
+            return _file_sha256(os.path.join(self.themes_dir, name))
+        except OSError:
+            return None
+
+    def _install(self, themes, names = None):
+        os.makedirs(self.themes_dir, exist_ok = True)
+        for name in (themes if names is None else names):
+            _write_atomic(os.path.join(self.themes_dir, name), themes[name])
+
+    def _record_removed(self, manifest, names):
+        """Move `names` from the manifest's "files" to "removed" (caller holds
+        the lock and saves the manifest)."""
+        files = dict(manifest.get("files") or {})
+        removed = set(manifest.get("removed") or ())
+        for name in names:
+            files.pop(name, None)
+            removed.add(name)
+        manifest.update(files = files, removed = sorted(removed))
+
+    def install_cached(self):
+        """Fill an empty themes folder from the cached archive. Pack themes the
+        user deleted are recorded as removed, edited ones are left alone. No
+        network. Returns the number of theme files written."""
+        with self._lock:
+            manifest = self.manifest()
+            missing = self._missing(manifest.get("files") or {})
+            if not missing:
+                return 0
+            if self.has_themes():
+                self._record_removed(manifest, missing)
+                self._save_manifest(manifest)
+                logging.info(f"Theme pack: {len(missing)} theme file(s) deleted by the user will not be restored: {', '.join(missing)}")
+                return 0
+            archive = self._cached_archive(manifest)
+            if archive is None:
+                return 0
+            try:
+                themes = read_themes(archive)
+            except ValueError as e:
+                logging.warning(f"Cached theme pack is unusable: {e}")
+                return 0
+            names = [name for name in missing if name in themes]
+            self._install(themes, names)
+            self.stats["restored"] += len(names)
+            logging.info(f"Restored {len(names)} theme file(s) from the cached theme pack v{manifest.get('version')}")
+            return len(names)
+
+    def has_themes(self):
+        try:
+            return any(name.endswith(".json") for name in os.listdir(self.themes_dir))
+        except OSError:
+            return False
+
+    # ── Refresh ──────────────────────────────────────────────────────────
+
+    def due(self, now = None):
+        """Whether `refresh` should ask the server now."""
+        manifest = self.manifest()
+        if not manifest.get("sha256") or not self.has_themes():
+            return True
+        return (now or time.time()) - float(manifest.get("checked") or 0) >= self.interval
+
+    def refresh(self, get, force = False):
+        """Ask the server for a newer pack and install it.
+
+        `get(url, headers)` performs the HTTP GET and returns (status, headers,
+        body bytes). Returns "skipped", "not modified", "unchanged" or
+        "updated"; raises on network or server errors."""
+        if not force and not self.due():
+            return "skipped"
+        manifest = self.manifest()
+        headers = {}
+        if manifest.get("url") == self.url and self._cached_archive(manifest) is not None:
+            if manifest.get("etag"):
+                headers["If-None-Match"] = manifest["etag"]
+            if manifest.get("last_modified"):
+                headers["If-Modified-Since"] = manifest["last_modified"]
+        self.stats["checks"] += 1
+        status, response_headers, body = get(self.url, headers)
+        response_headers = {k.lower(): v for k, v in (response_headers or {}).items()}
+        now = time.time()
+
+        if status == 304:
+            with self._lock:
+                manifest = dict(self.manifest(), checked = now)
+                self._save_manifest(manifest)
+            self.stats["not_modified"] += 1
+            logging.info("Theme pack is up to date (not modified)")
+            return "not modified"
+        if status != 200:
+            raise OSError(f"theme pack download failed with status {status}")
+
+        sha256 = _sha256(body)
+        try:
+            themes = read_themes(body)
+        except ValueError:
+            self.stats["rejected"] += 1
+            raise
+        with self._lock:
+            manifest = self.manifest()
+            files = {name: _sha256(data) for name, data in themes.items()}
+            changed = sha256 != manifest.get("sha256")
+            if changed:
+                os.makedirs(self._cache_dir(), exist_ok = True)
+                _write_atomic(self._archive_path(sha256), body)
+                old = manifest.get("sha256")
+                if old and old != sha256:
+                    try:
+                        os.remove(self._archive_path(old))
+                    except OSError:
+                        pass
+            installed = manifest.get("files") or {}
+            removed = set(manifest.get("removed") or ())
+            empty = not self.has_themes()
+            write, recorded, user_modified = [], {}, []
+            for name, digest in sorted(files.items()):
+                current = self._current_sha256(name)
+                if current is None and (name in removed or (name in installed and not empty)):
+                    # Installed before and deleted by the user since.
+                    removed.add(name)
+                elif current == digest:
+                    recorded[name] = digest
+                elif current is None or current == installed.get(name):
+                    # New to the pack, or still exactly what the pack installed last.
+                    write.append(name)
+                    recorded[name] = digest
+                else:
+                    user_modified.append(name)
+                    if name in installed:
+                        recorded[name] = installed[name]
+            self._install(themes, write)
+            if user_modified:
+                logging.info(f"Theme pack: kept {len(user_modified)} theme file(s) changed by the user: {', '.join(user_modified)}")
+            manifest.update(
+                version = int(manifest.get("version") or 0) + (1 if changed else 0),
+                sha256 = sha256, url = self.url, checked = now, files = recorded, user_modified = user_modified,
+                removed = sorted(removed & set(files)),
+                etag = response_headers.get("etag"), last_modified = response_headers.get("last-modified"))
+            self._save_manifest(manifest)
+        if changed:
+            self.stats["updates"] += 1
+            logging.info(f"Installed theme pack v{manifest['version']} ({len(themes)} themes, SHA-256 {sha256[:16]}...)")
+            return "updated"
+        logging.info("Theme pack download matched the cached one")
+        return "unchanged"
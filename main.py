@@ -27,7 +27,8 @@ if __name__ =="__main__":
         logging.exception("Suppressed exception")
 
     try:
-        show_table_selection_dialog()
+        with _startup.phase("table selection dialog"):
+            show_table_selection_dialog()
     except Exception:
         logging.exception("Table selection dialog failed")
 
@@ -0,0 +1,274 @@
+"""
+Startup Benchmark — times how long the app takes to reach an interactive App,
+headless, and prints the results as JSON.
+
+Each run is a fresh child process, against the bundled tables/redo.sldtbl and
+remotedata/Charlotte Baker.sldsv. The tables (the .sldtbl sources only: no
+compiled sidecars, staged updates or findings) and remotedata/ are copied into
+a sandbox working directory, and the child runs there with its own
+HOME/LOCALAPPDATA (so its saves, keys and caches never touch yours), its own
+bytecode cache (PYTHONPYCACHEPREFIX) and offline mode. The first run starts
+with all of them empty: that is the cold start. The runs after it reuse them:
+those are the warm starts, summarised by their median.
+
+Timed in each run (milliseconds):
+    foundation_import   import app.foundation (settings, keys, table sync setup,
+                        and table validation when it is not deferred)
+    core_import         import app.core (the eager feature mixins)
+    validate_tables     validate_table_ids(), run in full
+    table_selection     show_table_selection_dialog() (returns at once with one table)
+    app_init            App(run = False): main window and main menu, no main loop
+    first_paint         the first root.update() after App()
+    first_save_load     App._load_file() of the bundled save
+    total               from the start of the child to the end of the save load
+The child's startup timeline (app/startup.py) is included as well.
+
+A budget file caps any of these, per start kind:
+    {"cold": {"total": 9000}, "warm": {"total": 3000, "app_init": 800}}
+and the exit status is 1 when a budget is exceeded.
+
+On Linux without a display, run it under Xvfb:
+    xvfb-run -a python scripts/bench_startup.py
+
+Usage:
+    python scripts/bench_startup.py [--runs N] [--out FILE] [--budget FILE] [--keep]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLE_NAME = "redo.sldtbl"
+SAVE_FIXTURE = os.path.join("remotedata", "Charlotte Baker.sldsv")
+METRICS = ("foundation_import", "core_import", "validate_tables", "table_selection",
+           "app_init", "first_paint", "first_save_load", "total")
+IDE_INDICATORS = ("PYCHARM_HOSTED", "VSCODE_PID", "SPYDER_KERNELS_NAMESPACE", "PYDEVD_USE_FRAME_EVAL", "TERM_PROGRAM",
+                  "JUPYTER_RUNTIME_DIR", "JPY_PARENT_PID", "IPYTHONDIR", "PYCHARM_MATPLOTLIB_INTERACTIVE",
+                  "PYCHARM_DISPLAY_PORT", "INTELLIJ_ENVIRONMENT_READER", "IDEA_INITIAL_DIRECTORY",
+                  "PYTHONIOENCODING", "PYDEV_CONSOLE_ENCODING", "VSCODE_CLI", "VSCODE_GIT_ASKPASS_NODE",
+                  "VSCODE_INJECTION")
+
+
+# ─── Child ────────────────────────────────────────────────────────────────────
+
+def _ms(start):
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _fixture_save(foundation):
+    """The bundled save, re-signed with this sandbox's key into its saves folder.
+
+    The fixture is signed with a key no sandbox has, so it would only ever
+    load as "tampered"; the benchmark wants the real load path."""
+    decoded = foundation._envelope.read_path(os.path.join(os.getcwd(), SAVE_FIXTURE))
+    if decoded.version == 2:
+        data = decoded.data()
+    else:
+        data = json.loads(foundation.base64.b85decode(decoded.payload.encode("ascii")).decode("utf-8"))["_data"]
+    os.makedirs(foundation.saves_folder, exist_ok=True)
+    name = os.path.splitext(os.path.basename(SAVE_FIXTURE))[0]
+    uuid = data.get("uuid")
+    path = os.path.join(foundation.saves_folder, f"{name}_{uuid}.sldsv" if uuid else f"{name}.sldsv")
+    foundation._signed_json_write(path, data)
+    foundation._save_manager.flush(path)
+    return path
+
+
+def _child(result_path):
+    started = time.perf_counter()
+    times = {}
+    result = {"times": times}
+    try:
+        sys.path.insert(0, ROOT_DIR)
+        t = time.perf_counter()
+        import app.foundation as foundation
+        times["foundation_import"] = _ms(t)
+        result["validation_deferred"] = bool(foundation._table_validation_deferred)
+
+        t = time.perf_counter()
+        from app.core import App
+        times["core_import"] = _ms(t)
+
+        t = time.perf_counter()
+        foundation.validate_table_ids(secondary_platform=foundation._secondary_platform)
+        times["validate_tables"] = _ms(t)
+
+        t = time.perf_counter()
+        foundation.show_table_selection_dialog()
+        times["table_selection"] = _ms(t)
+
+        save_path = _fixture_save(foundation)
+
+        t = time.perf_counter()
+        app = App(run=False)
+        times["app_init"] = _ms(t)
+
+        t = time.perf_counter()
+        app.root.update()
+        times["first_paint"] = _ms(t)
+
+        t = time.perf_counter()
+        loaded = app._load_file(save_path)
+        times["first_save_load"] = _ms(t)
+        result["save_loaded"] = isinstance(loaded, dict)
+        times["total"] = _ms(started)
+
+        result["timeline"] = foundation._startup.timeline()
+        result["ok"] = True
+    except BaseException as e:  # SystemExit from validation included
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    # Skip interpreter teardown: the app's daemon threads (log view, workers)
+    # are not meant to be joined, and App normally leaves through os._exit too.
+    os._exit(0 if result["ok"] else 1)
+
+
+# ─── Runner ───────────────────────────────────────────────────────────────────
+
+def _sandbox_env(sandbox):
+    env = dict(os.environ)
+    home = os.path.join(sandbox, "home")
+    os.makedirs(home, exist_ok=True)
+    env.update({
+        "HOME": home,
+        "USERPROFILE": home,
+        "LOCALAPPDATA": os.path.join(home, "AppData", "Local"),
+        "PYTHONPYCACHEPREFIX": os.path.join(sandbox, "pycache"),
+        "DOOMTOOLS_OFFLINE": "1",
+    })
+    # Any of app.foundation's ide_indicators would switch the app into devmode
+    # (./saves, .gitignore and requirements.txt updates).
+    for key in IDE_INDICATORS:
+        env.pop(key, None)
+    return env
+
+
+def _sandbox_workdir(sandbox):
+    """Working directory for the children: copies of the source tables and
+    remotedata/, so sidecars, staged updates and anything else the app writes
+    next to them stay in the sandbox."""
+    workdir = os.path.join(sandbox, "root")
+    tables = os.path.join(workdir, "tables")
+    os.makedirs(tables, exist_ok=True)
+    for name in os.listdir(os.path.join(ROOT_DIR, "tables")):
+        if name.endswith(".sldtbl"):
+            shutil.copy2(os.path.join(ROOT_DIR, "tables", name), tables)
+    shutil.copytree(os.path.join(ROOT_DIR, "remotedata"), os.path.join(workdir, "remotedata"))
+    return workdir
+
+
+def _run_child(sandbox, index, timeout):
+    result_path = os.path.join(sandbox, f"run{index}.json")
+    stderr_path = os.path.join(sandbox, f"run{index}.stderr")
+    try:
+        with open(stderr_path, "wb") as err:
+            proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", result_path],
+                                  cwd=os.path.join(sandbox, "root"), env=_sandbox_env(sandbox), stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.DEVNULL, stderr=err, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "error": f"timed out after {timeout:.0f} s"}
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        with open(stderr_path, "r", encoding="utf-8", errors="replace") as f:
+            tail = f.read()[-2000:]
+        return {"ok": False, "error": f"child exited with {proc.returncode} and no result", "stderr": tail}
+
+
+def _median(runs):
+    out = {}
+    for metric in METRICS:
+        values = [r["times"][metric] for r in runs if metric in r.get("times", {})]
+        if values:
+            out[metric] = round(statistics.median(values), 1)
+    return out
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _over_budget(results, budget):
+    failures = []
+    for kind in ("cold", "warm"):
+        measured = results.get(kind) or {}
+        for metric, limit in (budget.get(kind) or {}).items():
+            value = measured.get(metric)
+            if value is not None and value > limit:
+                failures.append(f"{kind} {metric}: {value} ms > {limit} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless cold/warm startup benchmark; prints JSON.")
+    parser.add_argument("--runs", type=int, default=5, help="Warm runs after the cold one (default 5)")
+    parser.add_argument("--out", help="Also write the JSON results to this file")
+    parser.add_argument("--budget", help="JSON budget file; exit 1 when a median/cold time exceeds it")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Seconds before a run is abandoned")
+    parser.add_argument("--keep", action="store_true", help="Keep the sandbox directory (logs, stderr, results)")
+    parser.add_argument("--child", metavar="RESULT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+        return 0
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        print("No display: run under Xvfb, e.g. `xvfb-run -a python scripts/bench_startup.py`", file=sys.stderr)
+        return 2
+    if not os.path.exists(os.path.join(ROOT_DIR, "tables", TABLE_NAME)) or not os.path.exists(os.path.join(ROOT_DIR, SAVE_FIXTURE)):
+        print(f"Missing tables/{TABLE_NAME} or {SAVE_FIXTURE}", file=sys.stderr)
+        return 2
+
+    sandbox = tempfile.mkdtemp(prefix="doomtools-bench-")
+    try:
+        _sandbox_workdir(sandbox)
+        runs = [_run_child(sandbox, i, args.timeout) for i in range(args.runs + 1)]
+    finally:
+        if not args.keep:
+            shutil.rmtree(sandbox, ignore_errors=True)
+    cold, warm = runs[0], [r for r in runs[1:] if r.get("ok")]
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "table": TABLE_NAME,
+        "save": os.path.basename(SAVE_FIXTURE),
+        "cold": cold.get("times") if cold.get("ok") else None,
+        "warm": _median(warm) if warm else None,
+        "warm_runs": len(warm),
+        "runs": runs,
+    }
+    if args.keep:
+        results["sandbox"] = sandbox
+    failures = [r.get("error") for r in runs if not r.get("ok")]
+    if args.budget:
+        with open(args.budget, "r", encoding="utf-8") as f:
+            results["over_budget"] = _over_budget(results, json.load(f))
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 1 if failures or results.get("over_budget") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
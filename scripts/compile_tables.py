@@ -0,0 +1,95 @@
+"""
+Table Compiler — builds the .sldtblc sidecars the app loads tables from.
+
+The app compiles missing or stale sidecars on its own, but running this as a
+build step (e.g. before packaging a release) means the first start after an
+install skips the JSON parse too.
+
+Usage:
+    python scripts/compile_tables.py [--check] [--force] [table ...]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLES_DIR = os.path.join(ROOT_DIR, "tables")
+
+
+def _load_tablepack():
+    # Load by path: importing the app package would run its whole startup.
+    spec = importlib.util.spec_from_file_location("tablepack", os.path.join(ROOT_DIR, "app", "tablepack.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _default_tables():
+    if not os.path.isdir(TABLES_DIR):
+        return []
+    return sorted(os.path.join(TABLES_DIR, f) for f in os.listdir(TABLES_DIR)
+                  if f.endswith(".sldtbl") or f.endswith(".disabled"))
+
+
+def _is_current(tablepack, table_path):
+    sidecar = tablepack.sidecar_path(table_path)
+    if not os.path.exists(sidecar):
+        return False
+    try:
+        compiled = tablepack.CompiledTable(sidecar)
+    except Exception:
+        return False
+    try:
+        return compiled.is_current_for(table_path)
+    finally:
+        compiled.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile .sldtbl tables into mmap-loadable sidecars.")
+    parser.add_argument("tables", nargs="*", help="table files (default: every table in tables/)")
+    parser.add_argument("--check", action="store_true", help="only report stale sidecars; exit 1 if any")
+    parser.add_argument("--force", action="store_true", help="rebuild even when the sidecar is current")
+    args = parser.parse_args(argv)
+
+    tablepack = _load_tablepack()
+    tables = args.tables or _default_tables()
+    if not tables:
+        print("No tables found.")
+        return 0
+
+    stale = 0
+    failed = 0
+    for table_path in tables:
+        name = os.path.basename(table_path)
+        current = _is_current(tablepack, table_path)
+        if args.check:
+            if not current:
+                stale += 1
+            print(f"{'ok   ' if current else 'STALE'} {name}")
+            continue
+        if current and not args.force:
+            print(f"up to date  {name}")
+            continue
+        started = time.perf_counter()
+        try:
+            out_path = tablepack.compile_table(table_path)
+        except Exception as e:
+            failed += 1
+            print(f"FAILED      {name}: {e}", file=sys.stderr)
+            continue
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"compiled    {name} -> {os.path.basename(out_path)} "
+              f"({os.path.getsize(out_path) / 1024:.0f} KiB, {elapsed:.0f} ms)")
+
+    if args.check:
+        return 1 if stale else 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,12 +5,15 @@ Batch-convert legacy pickle-format save/transfer/loot/preset files to JSON,
 and sign them with HMAC-SHA256 for tamper protection.
 
 The old format stored data as: base85(pickle.dumps(data))
-The new format stores data as: base85(json({"_sig": "<hmac hex>", "_data": <json data>}))
+The new format stores data as a signed envelope (app/envelope.py): v2 is
+base85(<json data> + "\n" + <hmac hex>) behind a magic prefix, v1 was
+base85(json({"_sig": "<hmac hex>", "_data": <json data>})). Both are read.
 
 Usage:
     python scripts/convert_legacy_saves.py             # convert & sign
     python scripts/convert_legacy_saves.py --dry-run   # preview without writing
     python scripts/convert_legacy_saves.py --resign     # re-sign already-converted JSON files
+    python scripts/convert_legacy_saves.py --to-v2      # store save items as {id, overrides}
 
 Scans:
     saves/          *.sldsv   (save files & persistent data)
@@ -25,9 +28,12 @@ from __future__ import annotations
 
 import argparse
 import base64
+import functools
 import glob
 import hashlib
 import hmac as _hmac
+import importlib.util
+import io
 import json
 import os
 import pickle
@@ -39,8 +45,25 @@ from pathlib import Path
 import logging
 
 
+def _load_app_module(name: str):
+    # Load by path: importing the app package would run its whole startup.
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", name + ".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_savepack():
+    return _load_app_module("savepack")
+
+
+_envelope = _load_app_module("envelope")
+
+
+@functools.lru_cache(maxsize=None)
 def _get_save_key() -> bytes:
-    """Load or generate the per-installation HMAC key."""
+    """Load or generate the per-installation HMAC key (read once per run)."""
     key_path = os.path.join("saves", ".save_key")
     if os.path.isfile(key_path):
         with open(key_path, "rb") as f:
@@ -54,30 +77,57 @@ def _get_save_key() -> bytes:
     return key
 
 
-def _sign_data(json_str: str) -> str:
-    """Return hex HMAC-SHA256 signature for a JSON string."""
-    key = _get_save_key()
-    return _hmac.new(key, json_str.encode("utf-8"), hashlib.sha256).hexdigest()
+@functools.lru_cache(maxsize=None)
+def _verifiers() -> tuple:
+    """Prepared HMAC objects for the verification keys, read once per run."""
+    return tuple(_hmac.new(key, digestmod=hashlib.sha256) for key in _verification_keys())
+
+
+def _verification_keys() -> list[bytes]:
+    """Keys a save may have been signed with: this script's key and the app's shared key."""
+    keys = [_get_save_key()]
+    if os.name == "nt":
+        shared_dir = os.path.join(os.getenv("LOCALAPPDATA") or os.path.expanduser("~"), "soli_dstate", "DOOM-Tools")
+    else:
+        shared_dir = os.path.expanduser("~/.local/share/soli_dstate/DOOM-Tools")
+    shared_path = os.path.join(shared_dir, ".save_key")
+    if os.path.isfile(shared_path):
+        with open(shared_path, "rb") as f:
+            key = f.read()
+        if len(key) >= 32 and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def _envelope_verifies(envelope: dict) -> bool:
+    if "_body" in envelope:  # v2: the signature covers the stored bytes
+        return _envelope.Decoded(2, [], body=envelope["_body"], sig=envelope["_sig"]).verify(_verifiers())
+    sig = envelope.get("_sig")
+    if not isinstance(sig, str):
+        return False
+    payload = json.dumps(envelope["_data"], ensure_ascii=False, sort_keys=True).encode("utf-8")
+    for template in _verifiers():
+        mac = template.copy()
+        mac.update(payload)
+        if _hmac.compare_digest(mac.hexdigest(), sig):
+            return True
+    return False
 
 
 def _make_signed_payload(data: dict | list, comment_lines: list[str] | None = None) -> str:
-    """Build the base85-encoded signed envelope string, optionally prepending comment lines."""
-    payload_str = json.dumps(data, ensure_ascii=False, sort_keys=True)
-    sig = _sign_data(payload_str)
-    envelope = {"_sig": sig, "_data": data}
-    json_str = json.dumps(envelope, ensure_ascii=False, indent=None)
-    encoded = base64.b85encode(json_str.encode("utf-8")).decode("ascii")
-    output = ""
-    if comment_lines:
-        for cl in comment_lines:
-            output += cl if cl.endswith("\n") else cl + "\n"
-    output += encoded
-    return output
+    """Build the signed file text (v2 envelope, see app/envelope.py), optionally prepending comment lines."""
+    return _envelope.encode(data, _verifiers()[0], comment_lines)
 
 
 def _try_decode_signed_b85(payload: str) -> dict | None:
-    """Try to base85-decode and JSON-parse a signed envelope. Returns parsed dict or None."""
+    """Try to decode a signed envelope. Returns {"_sig", "_data"} (plus the signed
+    "_body" bytes for v2) or None."""
     try:
+        decoded = _envelope.read(io.BytesIO(payload.encode("ascii")))
+        if decoded.version == 2:
+            if decoded.sig is None:
+                return None
+            return {"_sig": decoded.sig, "_data": decoded.data(), "_body": bytes(decoded.body)}
         decoded = base64.b85decode(payload.encode("ascii")).decode("utf-8")
         parsed = json.loads(decoded)
         if isinstance(parsed, dict) and "_sig" in parsed and "_data" in parsed:
@@ -254,6 +304,98 @@ def resign_file(filepath: str, *, dry_run: bool = False) -> str:
         return f"error: {e}"
 
 
+class _TableItems:
+    """Parsed tables/ files by name, loaded on first use."""
+
+    def __init__(self, savepack):
+        self._savepack = savepack
+        self._files = sorted(glob.glob(os.path.join("tables", "*.sldtbl")))
+        self._loaded = {}
+
+    def for_save(self, data: dict) -> dict | None:
+        """id -> item map of the table a save was made with (its "_table"), else the first table."""
+        wanted = data.get("_table") or data.get("table")
+        target = None
+        if wanted:
+            for fpath in self._files:
+                name = os.path.basename(fpath)
+                if wanted in (name, os.path.splitext(name)[0]) or os.path.abspath(fpath).endswith(wanted):
+                    target = fpath
+                    break
+            if target is None:
+                return None
+        elif self._files:
+            target = self._files[0]
+        else:
+            return None
+        if target not in self._loaded:
+            with open(target, "r", encoding="utf-8-sig") as f:
+                self._loaded[target] = self._savepack.table_items_by_id(json.load(f))
+        return self._loaded[target]
+
+
+def compact_file(filepath: str, savepack, tables: _TableItems, *, dry_run: bool = False, backup: bool = True) -> str:
+    """Rewrite a signed save in save format v2 (items as {id, overrides}).
+
+    The signature is checked first, so a tampered save is never re-signed.
+
+    Returns: 'compacted', 'already_v2', 'not_a_save', 'no_table', 'not_signed', 'tampered', or 'error:...'.
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        lines = content.splitlines(True)
+        comment_lines = []
+        data_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith("//"):
+                comment_lines.append(line)
+            elif stripped == "" and not data_lines:
+                comment_lines.append(line)
+            else:
+                data_lines.append(line)
+        payload = "".join(data_lines).strip()
+
+        signed_envelope = _try_decode_signed_b85(payload) if payload else None
+        if signed_envelope is None:
+            return "not_signed"
+        if not _envelope_verifies(signed_envelope):
+            return "tampered"
+
+        data = signed_envelope["_data"]
+        if savepack.is_v2(data):
+            return "already_v2"
+        if not isinstance(data, dict) or not any(key in data for key in savepack.ITEM_POSITIONS):
+            return "not_a_save"
+
+        table_items = tables.for_save(data)
+        if table_items is None:
+            return "no_table"
+
+        if dry_run:
+            return "compacted"
+
+        if backup:
+            backup_dir = os.path.join(os.path.dirname(filepath), ".v1_backup")
+            os.makedirs(backup_dir, exist_ok=True)
+            backup_path = os.path.join(backup_dir, os.path.basename(filepath) + ".bak")
+            if os.path.exists(backup_path):
+                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_path = os.path.join(backup_dir, f"{os.path.basename(filepath)}.{ts}.bak")
+            shutil.copy2(filepath, backup_path)
+
+        output = _make_signed_payload(savepack.compact_save(data, table_items), comment_lines)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(output)
+
+        return "compacted"
+
+    except Exception as e:
+        return f"error: {e}"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert legacy pickle-format files to signed JSON, or re-sign existing JSON files."
@@ -273,6 +415,11 @@ def main():
         action="store_true",
         help="Sign existing unsigned JSON files with HMAC (no pickle conversion needed).",
     )
+    parser.add_argument(
+        "--to-v2",
+        action="store_true",
+        help="Rewrite signed save files in save format v2 (items stored as {id, overrides} against the table).",
+    )
     parser.add_argument(
         "--root",
         default=None,
@@ -297,14 +444,21 @@ def main():
         ("enemyloot/*.sldenlt", "Enemy loot files"),
     ]
 
+    if args.to_v2:
+        # Only character saves carry items; transfers and loot files keep their format.
+        scan_patterns = [p for p in scan_patterns if p[0].endswith(".sldsv")]
+        savepack = _load_savepack()
+        tables = _TableItems(savepack)
+
     total = 0
     converted = 0
+    compacted = 0
     signed = 0
     already_ok = 0
     skipped = 0
     errors = 0
 
-    mode_label = "RESIGN" if args.resign else "CONVERT"
+    mode_label = "TO-V2" if args.to_v2 else "RESIGN" if args.resign else "CONVERT"
     if args.dry_run:
         print(f"=== DRY RUN ({mode_label}) — no files will be modified ===\n")
 
@@ -317,7 +471,28 @@ def main():
         for filepath in files:
             total += 1
 
-            if args.resign:
+            if args.to_v2:
+                status = compact_file(filepath, savepack, tables, dry_run=args.dry_run, backup=not args.no_backup)
+                if status == "compacted":
+                    compacted += 1
+                    action = "WOULD COMPACT" if args.dry_run else "COMPACTED"
+                    print(f"  {action}: {filepath}")
+                elif status in ("already_v2", "not_a_save"):
+                    already_ok += 1
+                    print(f"  OK ({status.replace('_', ' ')}): {filepath}")
+                elif status == "no_table":
+                    skipped += 1
+                    print(f"  SKIPPED (table not found in tables/): {filepath}")
+                elif status == "not_signed":
+                    skipped += 1
+                    print(f"  SKIPPED (not a signed save — convert/--resign first): {filepath}")
+                elif status == "tampered":
+                    skipped += 1
+                    print(f"  SKIPPED (signature does not verify with this installation's keys): {filepath}")
+                else:
+                    errors += 1
+                    print(f"  ERROR: {filepath} — {status}")
+            elif args.resign:
                 status = resign_file(filepath, dry_run=args.dry_run)
                 if status == "signed":
                     signed += 1
@@ -355,7 +530,9 @@ def main():
 
     print("=" * 50)
     print(f"Total files scanned:  {total}")
-    if args.resign:
+    if args.to_v2:
+        print(f"Compacted to v2:      {compacted}")
+    elif args.resign:
         print(f"Signed:               {signed}")
     else:
         print(f"Converted & signed:   {converted}")
@@ -364,9 +541,11 @@ def main():
     print(f"Errors:               {errors}")
 
     if converted > 0 and not args.dry_run:
-        print(f"\nOriginal files backed up to '.legacy_backup/' folders.")
-    if (converted > 0 or signed > 0) and args.dry_run:
-        print(f"\nRe-run without --dry-run to apply changes.")
+        print("\nOriginal files backed up to '.legacy_backup/' folders.")
+    if compacted > 0 and not args.dry_run and not args.no_backup:
+        print("\nv1 files backed up to '.v1_backup/' folders.")
+    if (converted > 0 or signed > 0 or compacted > 0) and args.dry_run:
+        print("\nRe-run without --dry-run to apply changes.")
 
     return 0 if errors == 0 else 1
 
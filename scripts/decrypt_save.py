@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Decode DOOM-Tools signed save files for debugging.
 
-Saves are NOT encrypted — they are a base85-encoded JSON envelope
-``{"_sig": <hmac-sha256-hex>, "_data": <data>}`` optionally preceded by ``//``
-comment lines. The ``.save_key`` (32 random bytes) is only used to HMAC-sign the
-payload for tamper detection; it is not needed to read the data.
+Saves are NOT encrypted — they are base85 text optionally preceded by ``//``
+comment lines. v2 files (written by the app, see app/envelope.py) hold the JSON
+data followed by its HMAC-SHA256; v1 files and portable transfer files hold a
+JSON envelope ``{"_sig": <hmac-sha256-hex>, "_data": <data>}``. The
+``.save_key`` (32 random bytes) is only used to HMAC-sign the payload for tamper
+detection; it is not needed to read the data.
 
 Usage:
     python scripts/decrypt_save.py <file.sldsv> [--key path/to/.save_key]
@@ -20,6 +22,7 @@ import argparse
 import base64
 import hashlib
 import hmac
+import importlib.util
 import json
 import os
 import sys
@@ -29,6 +32,18 @@ import logging
 PORTABLE_KEY = hashlib.sha256(b"DOOM-Tools-portable-transfer-signing-key-v1").digest()
 
 
+def _load_envelope():
+    # Load by path: importing the app package would run its whole startup.
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "envelope.py")
+    spec = importlib.util.spec_from_file_location("envelope", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_envelope = _load_envelope()
+
+
 def _looks_like_raw_key(path):
     """A .save_key is ~32 raw bytes that are not valid base85 text."""
     if os.path.basename(path) == ".save_key":
@@ -61,23 +76,20 @@ def dump_key(path):
 def decode_save(path, key=None):
     """Return (data, signature, status). status is one of:
     ok / unsigned / tampered / no_key / incompatible_format."""
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        text = f.read()
-
-    # Strip leading // comment lines and blank lines, like _signed_json_read.
-    data_lines = []
-    for line in text.splitlines(True):
-        stripped = line.strip()
-        if stripped.startswith("//") and not data_lines:
-            continue
-        if stripped == "" and not data_lines:
-            continue
-        data_lines.append(line)
-    payload = "".join(data_lines).strip()
+    decoded = _envelope.read_path(path)
+    if decoded.version == 2:
+        if decoded.sig is None:
+            return None, None, "incompatible_format"
+        status = "no_key"
+        if key is not None:
+            status = "ok" if decoded.verify([key]) else "tampered"
+        return decoded.data(), decoded.sig, status
+
+    payload = decoded.payload
     if not payload:
         raise ValueError("empty payload")
 
-    # Current format: base85-encoded envelope. Legacy: raw JSON.
+    # v1: base85-encoded envelope. Legacy: raw JSON.
     try:
         envelope_json = base64.b85decode(payload.encode("ascii")).decode("utf-8")
     except Exception:
@@ -102,14 +114,15 @@ def decode_save(path, key=None):
 def encode_save(data, key=None, *, portable=False, comment_lines=None):
     """Build the on-disk text for a signed save (inverse of decode_save).
 
-    Mirrors main.py's _signed_json_write: HMAC-sign the canonical payload, wrap
-    it as {"_sig", "_data"}, base85-encode, and prepend any // comment lines.
-    Pass portable=True to use the built-in portable transfer key.
+    Mirrors the app's _signed_json_write: a v2 envelope signed with `key`, or
+    with portable=True the built-in portable transfer key in a v1 envelope
+    ({"_sig", "_data"}, base85-encoded), with any // comment lines prepended.
     """
-    if portable:
-        key = PORTABLE_KEY
-    if key is None:
-        raise ValueError("a key is required to sign a save (or pass portable=True)")
+    if not portable:
+        if key is None:
+            raise ValueError("a key is required to sign a save (or pass portable=True)")
+        return _envelope.encode(data, key, comment_lines)
+    key = PORTABLE_KEY
 
     payload_str = json.dumps(data, ensure_ascii=False, sort_keys=True)
     sig = hmac.new(key, payload_str.encode("utf-8"), hashlib.sha256).hexdigest()
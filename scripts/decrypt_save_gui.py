@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """GUI for decoding DOOM-Tools signed save files (debugging tool).
 
-Saves are a base85-encoded JSON envelope ``{"_sig": ..., "_data": ...}`` — not
-encrypted. The ``.save_key`` is only used to HMAC-verify the signature. This
-window lets you browse to a save, decode it, verify the signature, view the
-JSON, and copy/save it. Pointing it at a ``.save_key`` shows the key bytes.
+Saves are base85 text, not encrypted. v2 files (what the app writes, see
+app/envelope.py) hold the JSON data followed by its HMAC-SHA256; v1 files and
+portable transfer files hold a JSON envelope ``{"_sig": ..., "_data": ...}``.
+Both are read through scripts/decrypt_save.py. The ``.save_key`` is only used
+to HMAC-verify the signature. This window lets you browse to a save, decode
+it, verify the signature, view the JSON, and copy/save it. Encoding signs JSON
+back into a v2 save, or a v1 envelope with the portable key. Pointing it at a
+``.save_key`` shows the key bytes.
 
 Run:  python scripts/decrypt_save_gui.py
 """
@@ -37,6 +37,11 @@ except ImportError:
 
 from openai import OpenAI
 
+try:
+    from scripts.incremental_validation import IncrementalValidator
+except ImportError:  # run directly as scripts/firearm_fixer.py
+    from incremental_validation import IncrementalValidator
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 OPENROUTER_API_KEY = None  # Set your OpenRouter API key here or via environment variable OPENROUTER_API_KEY
@@ -122,12 +127,15 @@ def next_available_id(table_data: dict) -> int:
                     max_id = max(max_id, item["id"])
     return max_id + 1
 
-def apply_fix(table_data: dict, subtable: str, item_index: int, part_index: int, new_id: int):
-    part = table_data["tables"][subtable][item_index]["parts"][part_index]
+def apply_fix(table_data: dict, subtable: str, item_index: int, part_index: int, new_id: int) -> dict:
+    """Point one part slot at `new_id`. Returns the edited firearm."""
+    firearm = table_data["tables"][subtable][item_index]
+    part = firearm["parts"][part_index]
     if part.get("current") is None or isinstance(part["current"], str):
         part["current"] = {"id": new_id}
     else:
         part["current"]["id"] = new_id
+    return firearm
 
 def insert_new_part(table_data: dict, new_part: dict) -> int:
     parts_list = table_data.setdefault("tables", {}).setdefault("parts", [])
@@ -1106,6 +1114,8 @@ class FirearmFixerApp(customtkinter.CTk):
         self._tables_dir = tables_dir
         self._table_data: Optional[dict] = None
         self._table_path: Optional[str] = None
+        self._validator: Optional[IncrementalValidator] = None
+        self._validator_lock = threading.Lock()
         self._null_parts: list = []
         self._available_parts: list = []
         self._ai_running = False
@@ -1296,6 +1306,7 @@ class FirearmFixerApp(customtkinter.CTk):
             self._table_path = path
             pretty = self._table_data.get("prettyname", filename)
             self._log(f"Loaded: {pretty} ({filename})", "head")
+            self._open_validator(path)
             self._scan_table()
         except Exception as e:
             self._log(f"Failed to load {filename}: {e}", "error")
@@ -1479,12 +1490,41 @@ class FirearmFixerApp(customtkinter.CTk):
         self._log("\n✓ AI run complete. Press Save when satisfied.", "ok")
 
     def _apply_fix_to_data(self, entry, new_id: int, status_lbl, status_var, reason: str = ""):
-        apply_fix(self._table_data, entry["subtable"],
-                  entry["item_index"], entry["part_index"], new_id)
+        firearm = apply_fix(self._table_data, entry["subtable"],
+                            entry["item_index"], entry["part_index"], new_id)
         self.after(0, lambda: (
             status_lbl.configure(text_color=OK_COLOR),
             status_var.set("✓"),
         ))
+        self._revalidate([firearm])
+
+    # ── Validation (shared) ───────────────────────────────────────────────
+
+    def _open_validator(self, path: str):
+        with self._validator_lock:
+            try:
+                self._validator = IncrementalValidator.open(path, self._table_data)
+            except Exception as e:
+                self._validator = None
+                self._log(f"Validation unavailable: {e}", "warn")
+                return
+            self._log(self._validator.summary_text(), "warn" if self._validator.findings else "ok")
+
+    def _revalidate(self, items: Optional[list] = None):
+        """Re-check the edited firearm(s) and log what is still wrong with them."""
+        with self._validator_lock:
+            if not self._validator:
+                return
+            try:
+                self._validator.revalidate(items)
+            except Exception as e:
+                self._validator = None
+                self._log(f"Validation failed: {e}", "error")
+                return
+            for item in items or []:
+                for finding in self._validator.findings_for(item):
+                    self._log(f"  {'✗' if finding.severity == 'error' else '⚠'} [{finding.category}] {finding.message}",
+                              "error" if finding.severity == "error" else "warn")
 
     # ── Save (shared) ─────────────────────────────────────────────────────
 
@@ -1494,6 +1534,10 @@ class FirearmFixerApp(customtkinter.CTk):
             return
         try:
             save_table(self._table_path, self._table_data)
+            with self._validator_lock:
+                if self._validator:
+                    self._validator.revalidate()
+                    self._validator.save(self._table_path)
             fname = os.path.basename(self._table_path)
             self._log(f"✓ Saved to {fname}", "ok")
             self._set_status(f"Saved: {fname}", OK_COLOR)
@@ -0,0 +1,347 @@
+"""
+Incremental validation for the table editors (sldtbl_editor.py and
+firearm_fixer.py).
+
+Runs the validation_engine group rules against one table held in memory and
+keeps the findings. After an edit only the rules whose declared inputs
+(validation_engine.RULE_DEPS) changed are re-run, and per-item rules only for
+the edited items plus the items that reference them, so feedback stays
+near-instant on large tables.
+
+Findings are persisted next to the table (<table>.findings.json) together
+with the file's content hash, so reopening an unchanged table shows them
+without validating again.
+
+The table is validated on its own: a foo_wt working copy is not merged with
+foo.sldtbl, and the cross-table checks (duplicate IDs, ammunition present
+anywhere, weapon sounds, equipment slots) still need validate_tables.py.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+
+try:
+    from scripts import validation_engine
+except ImportError:  # run directly from scripts/
+    import validation_engine
+
+Finding = validation_engine.Finding
+GROUP_RULES = validation_engine.GROUP_RULES
+RULE_DEPS = validation_engine.RULE_DEPS
+ERROR = validation_engine.ERROR
+WARNING = validation_engine.WARNING
+
+
+STORE_SUFFIX = ".findings.json"
+_STORE_VERSION = 1
+_REF_KEYS = ("parts", "accessories", "subslots")
+
+
+def store_path_for(table_path):
+    return table_path + STORE_SUFFIX
+
+
+def _content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _item_id(item):
+    """The item's id if it can key findings, else None (missing or malformed)."""
+    value = item.get("id") if isinstance(item, dict) else None
+    return value if isinstance(value, (int, float, str)) else None
+
+
+_MISSING = object()
+
+
+def _ref_ids(item, out=None):
+    """Item IDs an item points at through parts/accessories/subslots "current",
+    including references nested inside inline (id-less) current dicts."""
+    if out is None:
+        out = set()
+    for key in _REF_KEYS:
+        entries = item.get(key)
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            cur = entry.get("current")
+            if isinstance(cur, int) and not isinstance(cur, bool):
+                out.add(cur)
+            elif isinstance(cur, dict):
+                if isinstance(cur.get("id"), int):
+                    out.add(cur["id"])
+                else:
+                    _ref_ids(cur, out)
+    return out
+
+
+class _Change:
+    """One edited item: copies of its old and new state (None when added/removed)."""
+
+    __slots__ = ("key", "item", "new_sub", "new", "ids", "subtables", "fields")
+
+    def __init__(self, item, old, new, old_sub, new_sub):
+        self.key = id(item)
+        self.item = item if new is not None else None
+        self.new_sub = new_sub
+        self.new = new
+        self.ids = set()
+        self.subtables = set()
+        for snap, sub in ((old, old_sub), (new, new_sub)):
+            if snap is None:
+                continue
+            self.subtables.add(str(sub).lower())
+            self.ids.add(_item_id(snap))
+        if old is None or new is None or old_sub != new_sub:
+            self.fields = None  # everything
+        else:
+            self.fields = {k for k in set(old) | set(new) if old.get(k, _MISSING) != new.get(k, _MISSING)}
+
+    def touches(self, dep):
+        """Whether this change can alter what a "field" or "subtable:field" dependency reads."""
+        sub, _, field = dep.rpartition(":")
+        if sub and sub not in self.subtables:
+            return False
+        return self.fields is None or field == "*" or field in self.fields
+
+
+class IncrementalValidator:
+    """Findings for one table, kept current as the table is edited in place."""
+
+    def __init__(self, table_file, table_data, secondary_platform=None):
+        self.table_file = table_file
+        self.table_data = table_data
+        self.secondary_platform = secondary_platform
+        self.findings = []
+        self.last_run = {"rules": 0, "scoped_items": 0, "elapsed": 0.0}
+        self._snapshot = {}            # id(item) -> (item, subtable, deep copy of the item)
+        self._settings = None
+
+    # ── Opening / persistence ────────────────────────────────────────────
+
+    @classmethod
+    def open(cls, table_path, table_data, secondary_platform=None):
+        """Validator for a table just read from `table_path`. Reuses the stored
+        findings when the file is unchanged since they were written."""
+        validator = cls(os.path.basename(table_path), table_data, secondary_platform)
+        stored = None
+        try:
+            content_hash = _content_hash(table_path)
+            with open(store_path_for(table_path), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if (stored.get("version") != _STORE_VERSION or stored.get("hash") != content_hash
+                    or stored.get("secondary_platform") != secondary_platform):
+                stored = None
+        except (OSError, ValueError):
+            stored = None
+        if stored is None:
+            validator.validate_all()
+            validator.save(table_path)
+        else:
+            validator.findings = [Finding(*f) for f in stored.get("findings", [])]
+            validator._take_snapshot()
+        return validator
+
+    def save(self, table_path):
+        """Write the findings store for the table as it is now on disk at `table_path`."""
+        path = store_path_for(table_path)
+        tmp = path + ".tmp"
+        try:
+            payload = {
+                "version": _STORE_VERSION,
+                "hash": _content_hash(table_path),
+                "secondary_platform": self.secondary_platform,
+                "findings": [list(f) for f in self.findings],
+            }
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning(f"Failed to write findings store '{path}': {e}")
+
+    # ── Validation ───────────────────────────────────────────────────────
+
+    def _walk(self):
+        for subtable, items in (self.table_data.get("tables") or {}).items():
+            if isinstance(items, list):
+                for item in items:
+                    if isinstance(item, dict):
+                        yield item, subtable
+
+    def _settings_snapshot(self):
+        return json.dumps({k: v for k, v in self.table_data.items() if k != "tables"}, sort_keys=True, default=str)
+
+    def _take_snapshot(self):
+        self._snapshot = {id(item): (item, sub, copy.deepcopy(item)) for item, sub in self._walk()}
+        self._settings = self._settings_snapshot()
+
+    def _index(self):
+        return validation_engine.TableGroupIndex(None, [self.table_file], self.secondary_platform,
+                                                 tables={self.table_file: self.table_data})
+
+    def validate_all(self):
+        started = time.perf_counter()
+        self.findings = validation_engine._run_rules(GROUP_RULES, self._index())
+        self._take_snapshot()
+        self.last_run = {"rules": len(GROUP_RULES), "scoped_items": None, "elapsed": time.perf_counter() - started}
+        return self.findings
+
+    def _diff(self, items):
+        """Changes since the last snapshot. With `items`, only those dicts are
+        compared with their copies; additions and removals are always found."""
+        current = {}
+        for item, sub in self._walk():
+            current[id(item)] = (item, sub)
+        changes = []
+        if items is None:
+            candidates = current.keys() & self._snapshot.keys()
+        else:
+            candidates = {id(i) for i in items} & current.keys() & self._snapshot.keys()
+        for key in candidates:
+            item, sub = current[key]
+            _old_item, old_sub, old = self._snapshot[key]
+            if item != old or sub != old_sub:
+                changes.append(_Change(item, old, copy.deepcopy(item), old_sub, sub))
+        for key in current.keys() - self._snapshot.keys():
+            item, sub = current[key]
+            changes.append(_Change(item, None, copy.deepcopy(item), None, sub))
+        for key in self._snapshot.keys() - current.keys():
+            old_item, old_sub, old = self._snapshot[key]
+            changes.append(_Change(old_item, old, None, old_sub, None))
+        return changes
+
+    def _referrers(self, ids):
+        """Items that reach any of `ids` through "current" references, transitively."""
+        by_target = {}
+        for item, sub in self._walk():
+            for target in _ref_ids(item):
+                by_target.setdefault(target, []).append(item)
+        found = {}
+        frontier = list(ids)
+        seen_ids = set(frontier)
+        while frontier:
+            target = frontier.pop()
+            for item in by_target.get(target, ()):
+                if id(item) in found:
+                    continue
+                found[id(item)] = item
+                item_id = item.get("id")
+                if item_id is not None and item_id not in seen_ids:
+                    seen_ids.add(item_id)
+                    frontier.append(item_id)
+        return found
+
+    def revalidate(self, items=None):
+        """Re-run what the edits since the last call can affect and return the
+        full, updated findings list. Pass the edited item dicts as `items` to
+        skip diffing the rest of the table."""
+        started = time.perf_counter()
+        if self._settings_snapshot() != self._settings:
+            return self.validate_all()
+        changes = self._diff(items)
+        if not changes:
+            return self.findings
+
+        changed_ids = set()
+        subjects = {}
+        for change in changes:
+            changed_ids |= change.ids
+            if change.item is not None:
+                subjects[id(change.item)] = change.item
+        # Findings are keyed by item id, so every item sharing an edited id
+        # (or, for id-less items, every other id-less item) is re-checked with it.
+        for item, sub in self._walk():
+            if _item_id(item) in changed_ids:
+                subjects[id(item)] = item
+        referrers = None
+
+        plan = {}
+        for rule_id, category, fn in GROUP_RULES:
+            deps = RULE_DEPS.get(rule_id)
+            if deps is None:
+                plan[rule_id] = None
+                continue
+            plain = [d for d in deps.depends if not d.startswith("ref:")]
+            refs = [d[len("ref:"):] for d in deps.depends if d.startswith("ref:")]
+            if any(c.touches(d) for c in changes for d in plain):
+                plan[rule_id] = None
+            elif deps.table_wide:
+                continue
+            else:
+                scope = dict(subjects)
+                if any(c.touches(d) for c in changes for d in refs):
+                    if referrers is None:
+                        referrers = self._referrers(changed_ids - {None})
+                    scope.update(referrers)
+                    if any(_item_id(item) is None for item in referrers.values()):
+                        scope.update((id(item), item) for item, sub in self._walk() if _item_id(item) is None)
+                plan[rule_id] = scope
+
+        ix = self._index()
+        rerun_ids = {}
+        new_findings = []
+        scoped_items = set()
+        for rule_id, category, fn in GROUP_RULES:
+            if rule_id not in plan:
+                continue
+            scope = plan[rule_id]
+            ix.scope = None if scope is None else set(scope)
+            if scope is not None:
+                scoped_items |= ix.scope
+                rerun_ids[rule_id] = {_item_id(item) for item in scope.values()} | changed_ids
+            else:
+                rerun_ids[rule_id] = None
+            new_findings.extend(validation_engine._run_rules([(rule_id, category, fn)], ix))
+
+        kept = []
+        for f in self.findings:
+            if f.rule not in rerun_ids:
+                kept.append(f)
+                continue
+            ids = rerun_ids[f.rule]
+            if ids is not None and f.table is not None and _item_id({"id": f.item_id}) not in ids:
+                kept.append(f)
+        self.findings = kept + new_findings
+        order = {rule_id: n for n, (rule_id, category, fn) in enumerate(GROUP_RULES)}
+        self.findings.sort(key=lambda f: order.get(f.rule, len(order)))
+        for change in changes:
+            if change.item is None:
+                self._snapshot.pop(change.key, None)
+            else:
+                self._snapshot[change.key] = (change.item, change.new_sub, change.new)
+        self.last_run = {"rules": len(plan), "scoped_items": len(scoped_items), "elapsed": time.perf_counter() - started}
+        return self.findings
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    @property
+    def errors(self):
+        return [f for f in self.findings if f.severity == ERROR]
+
+    @property
+    def warnings(self):
+        return [f for f in self.findings if f.severity == WARNING]
+
+    def findings_for(self, item):
+        """Per-item findings about `item` (table-wide findings are not attributed to items)."""
+        item_id = _item_id(item)
+        if item_id is None:
+            return []
+        return [f for f in self.findings
+                if f.item_id == item_id and not getattr(RULE_DEPS.get(f.rule), "table_wide", False)]
+
+    def summary_text(self):
+        errors, warnings = len(self.errors), len(self.warnings)
+        if not errors and not warnings:
+            return "Validation: no issues"
+        return f"Validation: {errors} error(s), {warnings} warning(s)"
@@ -6,6 +6,7 @@ editing, search, and compact JSON output matching the hand-written format.
 
 import customtkinter as ctk
 import json
+import logging
 import os
 import re
 import copy
@@ -13,6 +14,11 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Any
 
+try:
+    from scripts.incremental_validation import IncrementalValidator
+except ImportError:  # run directly as scripts/sldtbl_editor.py
+    from incremental_validation import IncrementalValidator
+
 # ─── Constants ────────────────────────────────────────────────────────────────
 
 RARITY_OPTIONS = ["Common", "Uncommon", "Rare", "Legendary", "Mythic"]
@@ -820,6 +826,7 @@ class SLDTBLEditor(ctk.CTk):
         self.current_item_index: int | None = None
         self.unsaved_changes = False
         self.field_widgets: dict = {}
+        self.validator: IncrementalValidator | None = None
 
         self._build_ui()
         self._bind_shortcuts()
@@ -918,7 +925,7 @@ class SLDTBLEditor(ctk.CTk):
     def _build_right_panel(self):
         self.right = ctk.CTkFrame(self.main_pane)
         self.right.grid(row=0, column=1, sticky="nsew", padx=(3, 0))
-        self.right.grid_rowconfigure(1, weight=1)
+        self.right.grid_rowconfigure(2, weight=1)
         self.right.grid_columnconfigure(0, weight=1)
 
         header = ctk.CTkFrame(self.right, fg_color="transparent")
@@ -929,8 +936,12 @@ class SLDTBLEditor(ctk.CTk):
         ctk.CTkButton(header, text="Apply Changes", width=120, command=self._apply_changes).pack(side="right", padx=5)
         ctk.CTkButton(header, text="+ Add Field", width=100, command=self._add_custom_field).pack(side="right", padx=5)
 
+        self.findings_label = ctk.CTkLabel(self.right, text="", anchor="w", justify="left",
+                                           font=("", 11), wraplength=900)
+        self.findings_label.grid(row=1, column=0, padx=12, sticky="ew")
+
         self.editor_scroll = ctk.CTkScrollableFrame(self.right)
-        self.editor_scroll.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+        self.editor_scroll.grid(row=2, column=0, padx=5, pady=5, sticky="nsew")
         self.editor_scroll.grid_columnconfigure(1, weight=1)
 
     # ── Shortcuts ────────────────────────────────────────────────────────────
@@ -959,6 +970,7 @@ class SLDTBLEditor(ctk.CTk):
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 self.file_data = json.load(f)
+            self.validator = self._open_validator(filepath)
             self.current_filepath = filepath
             self.current_table = None
             self.current_item_index = None
@@ -1002,6 +1014,8 @@ class SLDTBLEditor(ctk.CTk):
             with open(filepath, "w", encoding="utf-8") as f:
                 f.write(sldtbl_dumps(self.file_data))
             self.unsaved_changes = False
+            if self.validator:
+                self.validator.save(filepath)
             self._set_status(f"Saved: {filepath}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file:\n{e}")
@@ -1019,6 +1033,7 @@ class SLDTBLEditor(ctk.CTk):
             if k in updated:
                 self.file_data[k] = updated[k]
         self.unsaved_changes = True
+        self._revalidate()
         fname = os.path.basename(self.current_filepath) if self.current_filepath else "untitled"
         self.file_label.configure(text=f"{self.file_data.get('prettyname', fname)} ({fname})")
         self._set_status("Settings updated")
@@ -1132,6 +1147,7 @@ class SLDTBLEditor(ctk.CTk):
         items = self.file_data["tables"][self.current_table]
         items.append(new)
         self.unsaved_changes = True
+        self._revalidate([])
         self.current_item_index = len(items) - 1
         self._refresh_items()
         self._load_item_editor()
@@ -1149,6 +1165,7 @@ class SLDTBLEditor(ctk.CTk):
         items.insert(self.current_item_index + 1, new)
         self.current_item_index += 1
         self.unsaved_changes = True
+        self._revalidate([])
         self._refresh_items()
         self._load_item_editor()
         self._set_status(f"Duplicated: {orig.get('name', 'Item')}")
@@ -1162,6 +1179,7 @@ class SLDTBLEditor(ctk.CTk):
             return
         items.pop(self.current_item_index)
         self.unsaved_changes = True
+        self._revalidate([])
         if self.current_item_index >= len(items):
             self.current_item_index = len(items) - 1 if items else None
         self._refresh_items()
@@ -1186,6 +1204,7 @@ class SLDTBLEditor(ctk.CTk):
         item = items.pop(self.current_item_index)
         self.file_data["tables"][target].append(item)
         self.unsaved_changes = True
+        self._revalidate()
         self.current_item_index = None
         self._refresh_tables()
         self._refresh_items()
@@ -1272,6 +1291,7 @@ class SLDTBLEditor(ctk.CTk):
             item["platform"] = source.get("platform", "")
 
         self.unsaved_changes = True
+        self._revalidate([item])
         self._load_item_editor()
         self._set_status(f"Autofilled from: {source.get('name', 'Unknown')}")
 
@@ -1293,6 +1313,7 @@ class SLDTBLEditor(ctk.CTk):
             w.destroy()
         self.field_widgets.clear()
         self.editor_title.configure(text="Select an item to edit")
+        self.findings_label.configure(text="")
 
     def _load_item_editor(self):
         self._clear_editor()
@@ -1304,6 +1325,7 @@ class SLDTBLEditor(ctk.CTk):
 
         item = items[self.current_item_index]
         self.editor_title.configure(text=f"Editing: {item.get('name', 'Unknown')} (ID: {item.get('id', '?')})")
+        self._show_findings(item)
 
         row = 0
         priority = ["name", "id", "value", "description", "rarity", "weight",
@@ -1470,18 +1492,22 @@ class SLDTBLEditor(ctk.CTk):
     def _open_accessories_editor(self, key: str, value: Any):
         def on_save(new_val):
             if self.current_table and self.current_item_index is not None:
-                self.file_data["tables"][self.current_table][self.current_item_index][key] = new_val
+                item = self.file_data["tables"][self.current_table][self.current_item_index]
+                item[key] = new_val
                 self.field_widgets[key] = ("complex", new_val)
                 self.unsaved_changes = True
+                self._revalidate([item])
                 self._load_item_editor()
         AccessoriesEditorDialog(self, value if isinstance(value, list) else [], on_save)
 
     def _open_parts_editor(self, key: str, value: Any):
         def on_save(new_val):
             if self.current_table and self.current_item_index is not None:
-                self.file_data["tables"][self.current_table][self.current_item_index][key] = new_val
+                item = self.file_data["tables"][self.current_table][self.current_item_index]
+                item[key] = new_val
                 self.field_widgets[key] = ("complex", new_val)
                 self.unsaved_changes = True
+                self._revalidate([item])
                 self._load_item_editor()
         PartsEditorDialog(self, value if isinstance(value, list) else [], on_save)
 
@@ -1518,8 +1544,10 @@ class SLDTBLEditor(ctk.CTk):
         def on_save(new_val):
             self.field_widgets[key] = ("complex", new_val)
             if self.current_table and self.current_item_index is not None:
-                self.file_data["tables"][self.current_table][self.current_item_index][key] = new_val
+                item = self.file_data["tables"][self.current_table][self.current_item_index]
+                item[key] = new_val
                 self.unsaved_changes = True
+                self._revalidate([item])
                 self._load_item_editor()
         JSONEditorDialog(self, f"Edit: {key}", value, on_save)
 
@@ -1545,6 +1573,7 @@ class SLDTBLEditor(ctk.CTk):
         if key in item:
             del item[key]
             self.unsaved_changes = True
+            self._revalidate([item])
             self._load_item_editor()
             self._set_status(f"Removed field: {key}")
 
@@ -1563,6 +1592,7 @@ class SLDTBLEditor(ctk.CTk):
                     "list": [], "object": {}, "null": None}
         item[field_name] = defaults.get(field_type, "")
         self.unsaved_changes = True
+        self._revalidate([item])
         self._load_item_editor()
         self._set_status(f"Added field: {field_name} ({field_type})")
 
@@ -1614,15 +1644,53 @@ class SLDTBLEditor(ctk.CTk):
                 messagebox.showwarning("Field Error", f"Could not apply field '{key}': {e}")
 
         self.unsaved_changes = True
+        self._revalidate([item])
         self._refresh_items()
         self.editor_title.configure(text=f"Editing: {item.get('name', 'Unknown')} (ID: {item.get('id', '?')})")
+        self._show_findings(item)
         self._set_status("Changes applied")
 
+    # ── Validation ───────────────────────────────────────────────────────────
+
+    def _open_validator(self, filepath: str) -> IncrementalValidator | None:
+        try:
+            return IncrementalValidator.open(filepath, self.file_data)
+        except Exception:
+            logging.exception("Suppressed exception")
+            return None
+
+    def _revalidate(self, items: list | None = None):
+        """Re-check what the last edit touched. `items` lists the edited item dicts;
+        additions and removals are picked up either way."""
+        if not self.validator:
+            return
+        try:
+            self.validator.revalidate(items)
+        except Exception:
+            logging.exception("Suppressed exception")
+            self.validator = None
+
+    def _show_findings(self, item: dict):
+        # Findings are attributed by item id, so id-less items get no per-item feedback.
+        if not self.validator or item.get("id") is None:
+            self.findings_label.configure(text="")
+            return
+        findings = self.validator.findings_for(item)
+        if not findings:
+            self.findings_label.configure(text="✓ No validation issues", text_color="#4CAF50")
+            return
+        lines = [f"{'✗' if f.severity == 'error' else '⚠'} [{f.category}] {f.message}" for f in findings[:4]]
+        if len(findings) > 4:
+            lines.append(f"… and {len(findings) - 4} more")
+        color = "#F44336" if any(f.severity == "error" for f in findings) else "#FF9800"
+        self.findings_label.configure(text="\n".join(lines), text_color=color)
+
     # ── Status ───────────────────────────────────────────────────────────────
 
     def _set_status(self, text: str):
         prefix = "● " if self.unsaved_changes else ""
-        self.status_var.set(f"{prefix}{text}")
+        suffix = f"  |  {self.validator.summary_text()}" if self.validator else ""
+        self.status_var.set(f"{prefix}{text}{suffix}")
 
 
 # ─── Entry Point ─────────────────────────────────────────────────────────────
@@ -0,0 +1,105 @@
+"""
+Table Server — a local stand-in for the GitHub URLs the app downloads from.
+
+Serves the files of a directory the way raw.githubusercontent.com does, plus a
+`<name>.sha256` for each one (computed on request unless a real .sha256 file
+sits next to it). Responses carry an ETag and Last-Modified, and conditional
+requests (If-None-Match / If-Modified-Since) get a 304, like GitHub's. Point
+the app at it with
+
+    python main.py --table-url http://127.0.0.1:8765/
+    python main.py --theme-pack-url http://127.0.0.1:8765/CTkThemesPack.zip
+
+or DOOMTOOLS_TABLE_URL / DOOMTOOLS_THEME_PACK_URL. --delay and --status
+simulate a slow or failing server, to check that startup does not wait on it.
+
+Usage:
+    python scripts/table_server.py [--dir DIR] [--port PORT] [--delay SECONDS] [--status CODE]
+"""
+
+import argparse
+import email.utils
+import hashlib
+import http.server
+import os
+import time
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLES_DIR = os.path.join(ROOT_DIR, "tables")
+
+
+def _handler(directory, delay, status):
+    class TableHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if delay:
+                time.sleep(delay)
+            if status != 200:
+                self._send(status, b"")
+                return
+            name = os.path.basename(self.path.split("?", 1)[0])
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    body = f.read()
+                etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                mtime = int(os.path.getmtime(path))
+                if self._not_modified(etag, mtime):
+                    self._send(304, b"", {"ETag": etag})
+                    return
+                self._send(200, body, {"ETag": etag, "Last-Modified": email.utils.formatdate(mtime, usegmt=True)})
+                return
+            table = path[:-len(".sha256")] if name.endswith(".sha256") else None
+            if table and os.path.isfile(table):
+                with open(table, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                self._send(200, f"{digest}  {os.path.basename(table)}\n".encode("ascii"))
+                return
+            self._send(404, b"Not Found")
+
+        def _not_modified(self, etag, mtime):
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match is not None:
+                return etag in [tag.strip() for tag in if_none_match.split(",")]
+            since = self.headers.get("If-Modified-Since")
+            if since:
+                try:
+                    return mtime <= email.utils.parsedate_to_datetime(since).timestamp()
+                except (TypeError, ValueError):
+                    return False
+            return False
+
+        def _send(self, code, body, headers=None):
+            self.send_response(code)
+            self.send_header("Content-Type", "application/zip" if self.path.endswith(".zip") else "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return TableHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve tables and other downloads locally for testing the app's remote updates.")
+    parser.add_argument("--dir", default=TABLES_DIR, help="Directory holding the files to serve (default: tables/)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before answering each request")
+    parser.add_argument("--status", type=int, default=200, help="Answer every request with this status instead")
+    args = parser.parse_args()
+
+    directory = os.path.abspath(args.dir)
+    server = http.server.ThreadingHTTPServer((args.host, args.port), _handler(directory, args.delay, args.status))
+    print(f"Serving {directory} at http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
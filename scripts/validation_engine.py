@@ -0,0 +1,1115 @@
+"""
+Table validation engine used by validate_tables.py (GUI and --cli).
+
+Tables are validated per logical group (foo.sldtbl together with its
+foo_wt working copy). Each group is loaded once into a TableGroupIndex that
+every rule reads from (id maps, part/magazine lists, slot tokens, ammo
+profiles), and the groups are spread over a process pool. When there are
+fewer groups than workers the rule list is split as well, so a single large
+table still uses more than one core. Checks that need every table at once
+(ammunition present anywhere, duplicate-ID suggestions, weapon sounds,
+equipment slot coverage) run afterwards in the calling process from small
+per-group summaries.
+
+Every check reports Finding tuples: (rule, table, item_id, severity,
+category, message). `table` is the file the finding is attributed to, which
+is what decides whether it counts against an enabled or a disabled table.
+
+Stdlib only, so worker processes never import the GUI toolkit.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tables")
+
+ERROR = "error"
+WARNING = "warning"
+
+Finding = namedtuple("Finding", "rule table item_id severity category message")
+
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def _logical_table_key(table_file):
+    """Return a grouping key that treats foo.sldtbl and foo_wt.sldtbl as one table."""
+    base_name = table_file
+    if base_name.endswith(".disabled"):
+        base_name = base_name[: -len(".disabled")]
+    if base_name.endswith(".sldtbl"):
+        base_name = base_name[: -len(".sldtbl")]
+    if base_name.lower().endswith("_wt"):
+        base_name = base_name[:-3]
+    elif base_name.lower().endswith("-wt"):
+        base_name = base_name[:-3]
+    return base_name.lower()
+
+
+def _is_working_table_filename(table_file):
+    clean_name = table_file[:-len(".disabled")] if table_file.endswith(".disabled") else table_file
+    lower_name = clean_name.lower()
+    return lower_name.endswith("_wt.sldtbl") or lower_name.endswith("-wt.sldtbl")
+
+
+def list_table_files(tables_dir):
+    return sorted(f for f in os.listdir(tables_dir) if f.endswith(".sldtbl") or f.endswith(".disabled"))
+
+
+def load_table(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _platforms_compatible(fplat, tplat, secondary=None):
+    try:
+        lf = str(fplat).strip().lower() if fplat is not None else ""
+        lt = str(tplat).strip().lower() if tplat is not None else ""
+        if not lf or not lt:
+            return True
+        if lf in lt or lt in lf:
+            return True
+        # Known equivalences between platforms (case-insensitive)
+        PLATFORM_EQUIVALENTS = {
+            "hk21": {"g3"},
+            "g3": {"hk21"},
+        }
+
+        if secondary:
+            ls = str(secondary).strip().lower()
+            if ls and (ls in lf or lf in ls or ls in lt or lt in ls):
+                return True
+
+        try:
+            if lt in PLATFORM_EQUIVALENTS.get(lf, set()):
+                return True
+            if lf in PLATFORM_EQUIVALENTS.get(lt, set()):
+                return True
+        except Exception:
+            logging.exception("Suppressed exception")
+
+        return False
+    except Exception:
+        return False
+
+
+def _token_set(value):
+    tokens = set()
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    for entry in values:
+        if entry is None or isinstance(entry, dict):
+            continue
+        sval = str(entry).strip().lower()
+        if sval and sval != "null":
+            tokens.add(sval)
+    return tokens
+
+
+def _extract_ammo_fields(item):
+    if not isinstance(item, dict):
+        return set(), set()
+
+    ammo_names = set()
+    calibers = set()
+
+    ammo_names |= _token_set(item.get("ammo_type"))
+    ammo_names |= _token_set(item.get("ammunition"))
+    calibers |= _token_set(item.get("caliber"))
+    calibers |= _token_set(item.get("musket_caliber"))
+
+    overrides = item.get("overrides")
+    if isinstance(overrides, dict):
+        ammo_names |= _token_set(overrides.get("ammo_type"))
+        ammo_names |= _token_set(overrides.get("ammunition"))
+        calibers |= _token_set(overrides.get("caliber"))
+        calibers |= _token_set(overrides.get("musket_caliber"))
+
+    return ammo_names, calibers
+
+
+def _resolve_current_item(cur, id_map, source=None):
+    if isinstance(cur, int):
+        target = id_map.get(cur)
+        ref_overrides = {}
+    elif isinstance(cur, dict):
+        target_id = cur.get("id") if "id" in cur else None
+        if isinstance(target_id, int):
+            target = id_map.get(target_id)
+            ref_overrides = {k: v for k, v in cur.items() if k not in ("id", "sub_attachment")}
+        else:
+            target = cur
+            ref_overrides = {}
+    else:
+        return None
+
+    if not isinstance(target, dict):
+        return None
+
+    effective = dict(target)
+    if isinstance(target.get("overrides"), dict):
+        effective.update(target.get("overrides") or {})
+    if ref_overrides:
+        effective.update(ref_overrides)
+
+    # If we're resolving something coming from parts/accessories/subslots,
+    # avoid resolving to ammunition-like entries (they usually have 'caliber'
+    # and lack 'type'/'slot'). This prevents mistakenly treating ammo as a
+    # weapon part due to ID collisions across subtables.
+    try:
+        if isinstance(source, str) and source.lower() in ("parts", "accessories", "subslots"):
+            if ("caliber" in target) and (not target.get("type") and not target.get("slot")):
+                return None
+    except Exception:
+        logging.exception("Suppressed exception")
+
+    return effective
+
+
+def _collect_firearm_ammo_profiles(firearm, id_map):
+    profiles = []
+    base_names, base_calibers = _extract_ammo_fields(firearm)
+    profiles.append(("base firearm", base_names, base_calibers))
+
+    queue = []
+    for key in ("parts", "accessories", "subslots"):
+        entries = firearm.get(key) or []
+        if isinstance(entries, list):
+            for entry in entries:
+                if isinstance(entry, dict) and "current" in entry:
+                    queue.append((key, entry.get("current")))
+
+    seen = set()
+    # Resolved items are fresh dicts; keep them alive so a freed one's id()
+    # is never reused by a later item and mistaken for "already seen".
+    resolved = []
+    while queue:
+        source, cur = queue.pop(0)
+        effective = _resolve_current_item(cur, id_map, source)
+        if not isinstance(effective, dict):
+            continue
+
+        marker = id(effective)
+        if marker in seen:
+            continue
+        seen.add(marker)
+        resolved.append(effective)
+
+        names, calibers = _extract_ammo_fields(effective)
+        if names or calibers:
+            profiles.append((source, names, calibers))
+
+        for nested_key in ("parts", "accessories", "subslots"):
+            nested = effective.get(nested_key) or []
+            if isinstance(nested, list):
+                for nested_entry in nested:
+                    if isinstance(nested_entry, dict) and "current" in nested_entry:
+                        queue.append((nested_key, nested_entry.get("current")))
+
+    return profiles
+
+
+def _magazine_matches_systems(mag_item, required_systems):
+    if not isinstance(mag_item, dict):
+        return False
+    if not required_systems:
+        return True
+    mag_systems = _token_set(mag_item.get("magazinesystem"))
+    return bool(mag_systems & required_systems)
+
+
+def _caliber_supported(item, caliber):
+    if not isinstance(item, dict):
+        return False
+    cal_set = _token_set(item.get("caliber"))
+    # If caliber is unspecified, treat as generic compatibility.
+    if not cal_set:
+        return True
+    return caliber in cal_set
+
+
+def _safe_capacity(value):
+    try:
+        return int(value or 0)
+    except Exception:
+        return 0
+
+
+# ─── Per-group index ──────────────────────────────────────────────────────────
+
+class TableGroupIndex:
+    """Everything the rules need about one logical table, computed once."""
+
+    def __init__(self, tables_dir, files, secondary_platform=None, tables=None):
+        """`tables` maps table file -> already parsed data; files not in it are
+        read from `tables_dir`."""
+        self.files = list(files)
+        self.secondary_platform = secondary_platform
+        self.load_errors = []          # (table_file, message)
+        self.pretty_names = {}
+        self.hardcore = {}
+        self.file_max_ids = {}
+        self.items = []                # (item, table_file, subtable) for dict items, in table order
+        self.id_map = {}               # last definition wins, as in the old validator
+        self.id_subtable = {}
+        self.id_locations = {}         # id -> [(file, subtable, name)]
+        self.ids = []
+        self.first_locs = {}
+        self.magazines = []            # dict entries of each file's "magazines" subtable
+        self.referenced_slots = set()
+        self.display_name = None
+        self.owner_file = None
+        self.scope = None              # id()s of the subject items rules should report on; None = all
+        self._memo = {}
+
+        for table_file in self.files:
+            try:
+                if tables is not None and table_file in tables:
+                    table_data = tables[table_file]
+                else:
+                    table_data = load_table(os.path.join(tables_dir, table_file))
+            except Exception as e:
+                self.load_errors.append((table_file, f"Failed to load '{table_file}': {e}"))
+                continue
+            self._add_file(table_file, table_data)
+
+        if self.display_name is None:
+            self.display_name = self.files[0]
+        if self.owner_file is None:
+            self.owner_file = self.files[0]
+
+    def _add_file(self, table_file, table_data):
+        table_name = table_data.get("prettyname", table_file)
+        self.pretty_names[table_file] = table_name
+        is_working_table = _is_working_table_filename(table_file)
+        if self.display_name is None or not is_working_table:
+            self.display_name = table_name
+        owner = self.owner_file
+        if owner is None:
+            self.owner_file = table_file
+        elif owner.endswith(".disabled") and not table_file.endswith(".disabled"):
+            self.owner_file = table_file
+        elif _is_working_table_filename(owner) and not is_working_table:
+            self.owner_file = table_file
+
+        tables = table_data.get("tables", {})
+        try:
+            self.hardcore[table_file] = bool((table_data.get("additional_settings") or {}).get("hardcore_mode"))
+        except Exception:
+            self.hardcore[table_file] = False
+
+        if isinstance(tables, dict):
+            self.magazines.extend(m for m in (tables.get("magazines", []) or []) if isinstance(m, dict))
+
+        max_id = 0
+        for subtable_name, items in tables.items():
+            if not isinstance(items, list):
+                continue
+            for idx, item in enumerate(items):
+                if not isinstance(item, dict):
+                    continue
+                if "id" in item:
+                    item_id = item["id"]
+                    loc = (table_file, subtable_name, item.get("name") or f"index_{idx}")
+                    self.id_locations.setdefault(item_id, []).append(loc)
+                    self.ids.append(item_id)
+                    self.first_locs.setdefault(item_id, loc)
+                    self.id_map[item_id] = item
+                    self.id_subtable[item_id] = subtable_name
+                    try:
+                        max_id = max(max_id, item_id)
+                    except TypeError:
+                        pass
+                self.items.append((item, table_file, subtable_name))
+
+                # collect referenced slots
+                for key in ("accessories", "subslots"):
+                    lst = item.get(key) or []
+                    if isinstance(lst, list):
+                        for entry_item in lst:
+                            if isinstance(entry_item, dict) and entry_item.get("slot"):
+                                self.referenced_slots.add(str(entry_item["slot"]).strip())
+        self.file_max_ids[table_file] = max_id
+
+    def scoped(self, entries):
+        """Restrict a list of subject items (bare dicts or (item, file, subtable)
+        tuples) to the current scope. Context lookups never go through this."""
+        if self.scope is None:
+            return entries
+        return [e for e in entries if id(e[0] if isinstance(e, tuple) else e) in self.scope]
+
+    def _cached(self, key, build):
+        if key not in self._memo:
+            self._memo[key] = build()
+        return self._memo[key]
+
+    @property
+    def firearms(self):
+        return self._cached("firearms", lambda: [(it, tf, sub) for it, tf, sub in self.items if it.get("firearm")])
+
+    @property
+    def parts(self):
+        return self._cached("parts", lambda: [it for it, tf, sub in self.items if str(sub).lower() == "parts"])
+
+    @property
+    def magazine_items(self):
+        """Non-firearm entries of the magazines subtables (clips, en-bloc clips, boxes)."""
+        return self._cached("magazine_items", lambda: [
+            it for it, tf, sub in self.items if not it.get("firearm") and str(sub).lower() == "magazines"])
+
+    @property
+    def clip_items(self):
+        return self._cached("clip_items", lambda: [it for it in self.magazine_items if it.get("clip_type")])
+
+    @property
+    def slot_tokens(self):
+        """Lower-cased string values (and string list entries) of every item,
+        i.e. everything a referenced slot name can be matched against."""
+        def build():
+            tokens = set()
+            for item, tf, sub in self.items:
+                for v in item.values():
+                    if isinstance(v, str):
+                        tokens.add(v.strip().lower())
+                    elif isinstance(v, (list, tuple)):
+                        for e in v:
+                            if isinstance(e, str):
+                                tokens.add(e.strip().lower())
+            return tokens
+        return self._cached("slot_tokens", build)
+
+    def ammo_profiles(self, firearm):
+        return self._cached(("profiles", id(firearm)), lambda: _collect_firearm_ammo_profiles(firearm, self.id_map))
+
+    def required_calibers(self, firearm):
+        def build():
+            required = set()
+            for src, names, calibers in self.ammo_profiles(firearm):
+                required |= calibers
+            return required
+        return self._cached(("required_calibers", id(firearm)), build)
+
+    def caliber_tokens(self, item):
+        return self._cached(("calibers", id(item)), lambda: _token_set(item.get("caliber")))
+
+    def platforms_compatible(self, fplat, tplat, secondary=None):
+        try:
+            return self._cached(("platform", fplat, tplat, secondary), lambda: _platforms_compatible(fplat, tplat, secondary))
+        except TypeError:
+            # Malformed (list) platform values cannot be memoized.
+            return _platforms_compatible(fplat, tplat, secondary)
+
+    def _caliber_coverage(self, items):
+        """(generic, calibers) for a candidate list: whether some item leaves its
+        caliber unspecified (fits anything) and the union of the others' calibers."""
+        generic = False
+        calibers = set()
+        for item in items:
+            tokens = self.caliber_tokens(item)
+            if tokens:
+                calibers |= tokens
+            else:
+                generic = True
+        return generic, calibers
+
+    @property
+    def part_platforms(self):
+        """[(platform, generic, calibers)]: caliber coverage of the parts grouped by platform."""
+        def build():
+            groups = {}
+            unhashable = []
+            for part_item in self.parts:
+                pplat = part_item.get("platform") or ""
+                try:
+                    groups.setdefault(pplat, []).append(part_item)
+                except TypeError:
+                    unhashable.append((pplat, [part_item]))
+            return [(pplat,) + self._caliber_coverage(group) for pplat, group in list(groups.items()) + unhashable]
+        return self._cached("part_platforms", build)
+
+    def part_caliber_coverage(self, fplat, secondary=None):
+        """Caliber coverage of the parts usable on a firearm of platform `fplat`."""
+        def build():
+            generic = False
+            calibers = set()
+            for pplat, group_generic, group_calibers in self.part_platforms:
+                if str(fplat).strip() and str(pplat).strip() and not self.platforms_compatible(fplat, pplat, secondary):
+                    continue
+                generic = generic or group_generic
+                calibers |= group_calibers
+            return generic, calibers
+        try:
+            return self._cached(("part_coverage", fplat, secondary), build)
+        except TypeError:
+            return build()
+
+    def magazines_for_systems(self, required_systems):
+        """Magazines matching any of the (token) magazine systems, in table order."""
+        return self._cached(("magazines", frozenset(required_systems)), lambda: [
+            mag for mag in self.magazines if _magazine_matches_systems(mag, required_systems)])
+
+    def magazine_caliber_coverage(self, required_systems):
+        key = ("magazine_coverage", frozenset(required_systems))
+        return self._cached(key, lambda: self._caliber_coverage(self.magazines_for_systems(required_systems)))
+
+    def item_secondary(self, item):
+        return item.get("secondary_platform") or self.secondary_platform
+
+    def summary(self):
+        """The small, picklable facts the cross-table rules need."""
+        ammo_names = set()
+        ammo_calibers = set()
+        for item, tf, sub in self.items:
+            if isinstance(sub, str) and sub.lower() in ("ammunition", "ammo"):
+                name = item.get("name")
+                if name:
+                    ammo_names.add(str(name).strip().lower())
+                ammo_calibers |= _token_set(item.get("caliber"))
+                ammo_calibers |= _token_set(item.get("musket_caliber"))
+
+        ammo_requirements = []
+        firearm_platforms = []
+        for item, tf, sub in self.firearms:
+            name = item.get("name") or "<unnamed>"
+            display = self.pretty_names.get(tf, tf)
+            for src, prof_names, prof_calibers in self.ammo_profiles(item):
+                if prof_names or prof_calibers:
+                    ammo_requirements.append((tf, item.get("id"), name, display, src, sorted(prof_names), sorted(prof_calibers)))
+            if item.get("platform") and not item.get("ignore_weaponsound_in_log"):
+                firearm_platforms.append((tf, item.get("id"), item.get("name"), item.get("platform")))
+
+        subslot_names = set()
+        equippable = []
+        for item, tf, sub in self.items:
+            for ss in (item.get("subslots") or []):
+                if isinstance(ss, dict) and ss.get("slot"):
+                    subslot_names.add(str(ss["slot"]).strip().lower())
+            if item.get("equippable") and isinstance(item.get("slot"), str) and item.get("slot"):
+                equippable.append((tf, item.get("id"), item.get("name") or f"ID {item.get('id', '?')}", self.pretty_names.get(tf, tf), item["slot"]))
+
+        return {
+            "files": self.files,
+            "owner_file": self.owner_file,
+            "pretty_names": self.pretty_names,
+            "file_max_ids": self.file_max_ids,
+            "duplicates": [(iid, locs) for iid, locs in self.id_locations.items() if len(locs) > 1],
+            "ids": list(self.id_locations),
+            "ammo_names": ammo_names,
+            "ammo_calibers": ammo_calibers,
+            "ammo_requirements": ammo_requirements,
+            "firearm_platforms": firearm_platforms,
+            "subslot_names": subslot_names,
+            "equippable": equippable,
+        }
+
+
+# ─── Rules ────────────────────────────────────────────────────────────────────
+
+# (rule_id, category, fn) — fn(index) yields Findings for one table group.
+GROUP_RULES = []
+# (rule_id, category, fn) — fn(summaries, tables_dir) yields Findings across groups.
+GLOBAL_RULES = []
+# rule_id -> RuleDeps, used by incremental validation to decide what an edit re-runs.
+RULE_DEPS = {}
+
+# What a group rule reads besides the subject item itself.
+#   table_wide: the rule reports on the table as a whole, so any matching change re-runs all of it;
+#               otherwise it reports per subject item (firearm, clip, item), and findings carry
+#               that item's id.
+#   depends:    fields of other items the rule reads. "field" = that field of any item,
+#               "subtable:field" = only items in that subtable, "ref:field" = items reached
+#               through parts/accessories/subslots "current" references (transitively).
+#               "*" in place of a field means any field.
+RuleDeps = namedtuple("RuleDeps", "table_wide depends")
+
+
+def group_rule(rule_id, category, depends=(), table_wide=False):
+    def register(fn):
+        GROUP_RULES.append((rule_id, category, fn))
+        RULE_DEPS[rule_id] = RuleDeps(table_wide, tuple(depends))
+        return fn
+    return register
+
+
+def global_rule(rule_id, category):
+    def register(fn):
+        GLOBAL_RULES.append((rule_id, category, fn))
+        return fn
+    return register
+
+
+@group_rule("load", "Load Errors", table_wide=True)
+def _rule_load(ix):
+    for table_file, msg in ix.load_errors:
+        yield Finding("load", table_file, None, ERROR, "Load Errors", msg)
+
+
+@group_rule("magazine.system", "Magazine Compatibility")
+def _rule_magazine_system(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        if str(item.get("magazinetype", "")).lower() != "detachable box":
+            continue
+        if item.get("has_magazine_in_pool") is False:
+            continue
+        if item.get("magazinesystem") is None:
+            friendly = f"Table '{ix.pretty_names.get(tf, tf)}': Firearm '{item.get('name')}' (ID {item.get('id')})"
+            yield Finding("magazine.system", tf, item.get("id"), ERROR, "Magazine Compatibility", f"{friendly} missing 'magazinesystem' field")
+
+
+@group_rule("ids.sequence", "ID Sequence", depends=("id", "name"), table_wide=True)
+def _rule_id_sequence(ix):
+    if not ix.ids:
+        yield Finding("ids.sequence", ix.owner_file, None, WARNING, "ID Sequence", f"Table '{ix.display_name}': No items with IDs found.")
+        return
+
+    file_ids = sorted(ix.ids)
+    min_id = file_ids[0]
+    max_id = file_ids[-1]
+    next_id = max_id + 1
+    expected_ids = set(range(min_id, max_id + 1))
+    actual_ids = set(file_ids)
+    if expected_ids == actual_ids:
+        return
+
+    missing_ids = sorted(expected_ids - actual_ids)
+
+    # build suggested fixes
+    try:
+        suggested_lines = []
+        new_id = min_id
+        for old_id in sorted(actual_ids):
+            _f, sub, name = ix.first_locs[old_id]
+            if old_id != new_id:
+                suggested_lines.append(f"  Change ID {old_id} ({sub}:{name}) -> {new_id}")
+            new_id += 1
+    except Exception:
+        suggested_lines = ["  Unable to build suggested ID changes."]
+
+    msg_lines = [
+        f"Table '{ix.display_name}': ID sequence broken",
+        f"  Missing IDs: {missing_ids}",
+        f"  Last ID: {max_id}",
+        f"  Next ID: {next_id}",
+    ]
+    if suggested_lines:
+        msg_lines.append("  Suggested changes:")
+        msg_lines.extend(suggested_lines)
+    yield Finding("ids.sequence", ix.owner_file, None, ERROR, "ID Sequence", "\n".join(msg_lines))
+
+
+def _part_target_id(cur):
+    if isinstance(cur, int):
+        return cur
+    if isinstance(cur, dict) and "id" in cur:
+        return cur.get("id")
+    return None
+
+
+@group_rule("hardcore.parts", "Hardcore Mode", depends=("ref:id", "ref:platform"))
+def _rule_hardcore_parts(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        if not ix.hardcore.get(tf):
+            continue
+        display = ix.pretty_names.get(tf, tf)
+        fname = item.get("name") or "<unnamed>"
+        fplat = item.get("platform") or ""
+        for p in item.get("parts") or []:
+            if not isinstance(p, dict):
+                continue
+            cur = p.get("current")
+            if cur is None:
+                continue
+            target_id = _part_target_id(cur)
+            if target_id is None or (isinstance(target_id, str) and str(target_id).strip().lower() == "null"):
+                yield Finding("hardcore.parts", tf, item.get("id"), ERROR, "Hardcore Mode",
+                              f"Table '{display}': Firearm '{fname}' has part '{p.get('name')}' with invalid 'current' id: {target_id}")
+                continue
+            if target_id not in ix.id_map:
+                yield Finding("hardcore.parts", tf, item.get("id"), ERROR, "Hardcore Mode",
+                              f"Table '{display}': Firearm '{fname}' has part '{p.get('name')}' referencing missing item ID {target_id}")
+                continue
+            tplat = ix.id_map[target_id].get("platform") or ""
+            if str(fplat).strip() and str(tplat).strip() and not ix.platforms_compatible(fplat, tplat, ix.item_secondary(item)):
+                yield Finding("hardcore.parts", tf, item.get("id"), ERROR, "Hardcore Mode",
+                              f"Table '{display}': Firearm '{fname}' part '{p.get('name')}' references item ID {target_id} with platform '{tplat}' which does not match firearm platform '{fplat}'")
+
+
+@group_rule("parts.references", "Part References", depends=("ref:id", "ref:name", "ref:platform"))
+def _rule_part_references(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        fname = item.get("name") or "<unnamed>"
+        display = ix.pretty_names.get(tf, tf)
+        firearm_platform = item.get("platform") or ""
+        for p in item.get("parts") or []:
+            if not isinstance(p, dict):
+                continue
+            cur = p.get("current")
+            if cur is None:
+                continue
+            target_id = _part_target_id(cur)
+            if target_id is None:
+                continue
+            target_item = ix.id_map.get(target_id)
+            if target_item is None:
+                # Missing IDs are reported by the Hardcore Mode check
+                continue
+
+            # The resolved item must live in the 'parts' subtable
+            resolved_sub = ix.id_subtable.get(target_id, "")
+            if str(resolved_sub).lower() != "parts":
+                yield Finding("parts.references", tf, item.get("id"), ERROR, "Part References", (
+                    f"Table '{display}': Firearm '{fname}' part slot "
+                    f"'{p.get('name', '?')}' references item ID {target_id} "
+                    f"('{target_item.get('name', '?')}') which is in subtable "
+                    f"'{resolved_sub}', not 'parts'."
+                ))
+                continue
+
+            # Platform of the referenced part must match the firearm
+            tplat = target_item.get("platform") or ""
+            if str(firearm_platform).strip() and str(tplat).strip() and not ix.platforms_compatible(firearm_platform, tplat, ix.item_secondary(item)):
+                yield Finding("parts.references", tf, item.get("id"), ERROR, "Part References", (
+                    f"Table '{display}': Firearm '{fname}' part slot "
+                    f"'{p.get('name', '?')}' references item ID {target_id} "
+                    f"('{target_item.get('name', '?')}') with platform '{tplat}', "
+                    f"incompatible with firearm platform '{firearm_platform}'."
+                ))
+
+
+@group_rule("magazine.coverage", "Magazine Compatibility",
+            depends=("magazines:magazinesystem", "magazines:caliber", "ref:*"))
+def _rule_magazine_coverage(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        if item.get("has_magazine_in_pool") is False or str(item.get("magazinetype", "")).lower() != "detachable box":
+            continue
+        name = item.get("name") or "<unnamed>"
+        display = ix.pretty_names.get(tf, tf)
+        required_systems = _token_set(item.get("magazinesystem"))
+        if item.get("dualfeed"):
+            required_systems |= _token_set(item.get("submagazinesystem"))
+
+        compatible_mags = ix.magazines_for_systems(required_systems)
+        if required_systems and not compatible_mags:
+            yield Finding("magazine.coverage", tf, item.get("id"), ERROR, "Magazine Compatibility", (
+                f"Table '{display}': Firearm '{name}' has no compatible magazine items for "
+                f"magazine systems {sorted(required_systems)}."
+            ))
+            continue
+        generic, covered = ix.magazine_caliber_coverage(required_systems)
+        missing_mag_calibers = [] if generic else [cal for cal in sorted(ix.required_calibers(item)) if cal not in covered]
+        if missing_mag_calibers:
+            yield Finding("magazine.coverage", tf, item.get("id"), ERROR, "Magazine Compatibility", (
+                f"Table '{display}': Firearm '{name}' can accept caliber(s) {missing_mag_calibers} "
+                f"across its ammo profiles, but no compatible magazine covers those caliber(s)."
+            ))
+
+
+@group_rule("ammo.parts", "Ammunition", depends=("parts:platform", "parts:caliber", "ref:*"))
+def _rule_ammo_parts(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        # If the `parts` key is explicitly present and set to null,
+        # the firearm intentionally has no wear/replaceable parts.
+        if "parts" in item and item.get("parts") is None:
+            continue
+        required_calibers = ix.required_calibers(item)
+        if not required_calibers:
+            continue
+
+        generic, covered = ix.part_caliber_coverage(item.get("platform") or "", ix.item_secondary(item))
+        if generic:
+            continue
+        # Installed parts resolve to fresh dicts, so they are not memoized.
+        installed = []
+        for p in item.get("parts") or []:
+            if not isinstance(p, dict):
+                continue
+            resolved = _resolve_current_item(p.get("current"), ix.id_map, 'parts')
+            if isinstance(resolved, dict):
+                installed.append(resolved)
+
+        missing_part_calibers = [cal for cal in sorted(required_calibers)
+                                 if cal not in covered
+                                 and not any(_caliber_supported(pc, cal) for pc in installed)]
+        if missing_part_calibers:
+            yield Finding("ammo.parts", tf, item.get("id"), ERROR, "Ammunition", (
+                f"Table '{ix.pretty_names.get(tf, tf)}': Firearm '{item.get('name') or '<unnamed>'}' can accept caliber(s) {missing_part_calibers}, "
+                f"but no compatible part supports those caliber(s)."
+            ))
+
+
+@group_rule("muzzleloaders", "Muzzleloaders")
+def _rule_muzzleloaders(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        mag_type = str(item.get("magazinetype", "") or "").strip().lower()
+        subtype = str(item.get("subtype", "") or "").strip().lower()
+        if not (subtype == "musket" or "muzzle" in mag_type):
+            continue
+        display = ix.pretty_names.get(tf, tf)
+        name = item.get("name") or "<unnamed>"
+        if not (_token_set(item.get("musket_caliber")) | _token_set(item.get("caliber"))):
+            yield Finding("muzzleloaders", tf, item.get("id"), ERROR, "Muzzleloaders", f"Table '{display}': Musket '{name}' is missing 'musket_caliber' or 'caliber'.")
+        if "muzzle" not in mag_type:
+            yield Finding("muzzleloaders", tf, item.get("id"), ERROR, "Muzzleloaders", f"Table '{display}': Musket '{name}' must use a muzzle-loading magazinetype.")
+
+
+@group_rule("clips.firearms", "Clip Compatibility",
+            depends=("magazines:firearm", "magazines:clip_type", "magazines:caliber"))
+def _rule_clip_firearms(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        if not item.get("accepts_clips"):
+            continue
+        display = ix.pretty_names.get(tf, tf)
+        name = item.get("name") or "<unnamed>"
+        mag_type = str(item.get("magazinetype", "") or "").strip().lower()
+        clip_type = str(item.get("clip_type") or "").strip()
+        if not clip_type:
+            yield Finding("clips.firearms", tf, item.get("id"), ERROR, "Clip Compatibility", f"Table '{display}': Firearm '{name}' has 'accepts_clips' but is missing 'clip_type'.")
+        # Detachable-box firearms commonly store capacity on magazines, not the firearm.
+        if "detachable box" not in mag_type and _safe_capacity(item.get("capacity")) <= 0:
+            yield Finding("clips.firearms", tf, item.get("id"), ERROR, "Clip Compatibility", f"Table '{display}': Firearm '{name}' has 'accepts_clips' but is missing a positive 'capacity'.")
+        if clip_type:
+            weapon_calibers = _token_set(item.get("musket_caliber")) | _token_set(item.get("caliber"))
+            compatible = False
+            for clip_item in ix.clip_items:
+                if str(clip_item.get("clip_type") or "").strip() != clip_type:
+                    continue
+                clip_calibers = ix.caliber_tokens(clip_item)
+                if weapon_calibers and clip_calibers and not weapon_calibers.intersection(clip_calibers):
+                    continue
+                compatible = True
+                break
+            if not compatible:
+                yield Finding("clips.firearms", tf, item.get("id"), ERROR, "Clip Compatibility",
+                              f"Table '{display}': Firearm '{name}' requires clip type '{clip_type}' but no compatible clip item exists in the magazines table.")
+
+
+@group_rule("clips.en_bloc", "En Bloc Compatibility",
+            depends=("magazines:firearm", "magazines:magazinesystem", "magazines:caliber"))
+def _rule_en_bloc(ix):
+    for item, tf, sub in ix.scoped(ix.firearms):
+        mag_type = str(item.get("magazinetype", "") or "").strip().lower()
+        if "en bloc" not in mag_type:
+            continue
+        display = ix.pretty_names.get(tf, tf)
+        name = item.get("name") or "<unnamed>"
+        required_systems = _token_set(item.get("magazinesystem"))
+        if not required_systems:
+            yield Finding("clips.en_bloc", tf, item.get("id"), ERROR, "En Bloc Compatibility", f"Table '{display}': En-bloc firearm '{name}' is missing 'magazinesystem'.")
+        if _safe_capacity(item.get("capacity")) <= 0:
+            yield Finding("clips.en_bloc", tf, item.get("id"), ERROR, "En Bloc Compatibility", f"Table '{display}': En-bloc firearm '{name}' is missing a positive 'capacity'.")
+        if "bolt_catch" not in item:
+            yield Finding("clips.en_bloc", tf, item.get("id"), ERROR, "En Bloc Compatibility", f"Table '{display}': En-bloc firearm '{name}' is missing 'bolt_catch'.")
+        if required_systems:
+            weapon_calibers = _token_set(item.get("musket_caliber")) | _token_set(item.get("caliber"))
+            compatible = False
+            for mag_item in ix.magazine_items:
+                if not _magazine_matches_systems(mag_item, required_systems):
+                    continue
+                mag_calibers = ix.caliber_tokens(mag_item)
+                if weapon_calibers and mag_calibers and not weapon_calibers.intersection(mag_calibers):
+                    continue
+                compatible = True
+                break
+            if not compatible:
+                yield Finding("clips.en_bloc", tf, item.get("id"), ERROR, "En Bloc Compatibility",
+                              f"Table '{display}': En-bloc firearm '{name}' has no compatible en-bloc clip item for magazine systems {sorted(required_systems)}.")
+
+
+@group_rule("clips.items", "Clip Compatibility")
+def _rule_clip_items(ix):
+    for clip_item in ix.scoped(ix.clip_items):
+        clip_name = clip_item.get("name") or f"ID {clip_item.get('id', '?')}"
+        if _safe_capacity(clip_item.get("capacity")) <= 0:
+            yield Finding("clips.items", ix.owner_file, clip_item.get("id"), ERROR, "Clip Compatibility",
+                          f"Table '{ix.display_name}': Clip item '{clip_name}' is missing a positive 'capacity'.")
+        if not ix.caliber_tokens(clip_item):
+            yield Finding("clips.items", ix.owner_file, clip_item.get("id"), ERROR, "Clip Compatibility",
+                          f"Table '{ix.display_name}': Clip item '{clip_name}' is missing 'caliber'.")
+
+
+@group_rule("slots.references", "Slot References", depends=("*",), table_wide=True)
+def _rule_slot_references(ix):
+    tokens = ix.slot_tokens
+    for slot in sorted(ix.referenced_slots):
+        if slot.strip().lower() == "weapon_slot":
+            continue
+        if slot.lower() not in tokens:
+            yield Finding("slots.references", ix.owner_file, None, WARNING, "Slot References",
+                          f"Table '{ix.display_name}' references slot '{slot}' but no items are available in that table to populate it.")
+
+
+@group_rule("store.categories", "Store Categories", depends=("stores:inventory",))
+def _rule_store_categories(ix):
+    store_item_ids = set()
+    store_table_names = set()
+    for store_sc, tf_sc, sub_sc in ix.items:
+        if str(sub_sc).lower() != "stores":
+            continue
+        for inv_entry in store_sc.get("inventory", []) or []:
+            if not isinstance(inv_entry, dict):
+                continue
+            if inv_entry.get("type") == "table":
+                tname = inv_entry.get("table")
+                if tname:
+                    store_table_names.add(tname)
+            elif inv_entry.get("type") == "id":
+                iid = inv_entry.get("id")
+                if iid is not None:
+                    store_item_ids.add(iid)
+    if not store_table_names and not store_item_ids:
+        return
+    for item_sc, tf_sc, sub_name in ix.scoped(ix.items):
+        in_store = sub_name in store_table_names or item_sc.get("id") in store_item_ids
+        if in_store and not item_sc.get("shop_category"):
+            item_name_sc = item_sc.get("name") or f"ID {item_sc.get('id', '?')}"
+            yield Finding("store.categories", tf_sc, item_sc.get("id"), WARNING, "Store Categories",
+                          f"Table '{ix.display_name}': Item '{item_name_sc}' in subtable '{sub_name}' is referenced by a store but missing 'shop_category' field.")
+
+
+@group_rule("categories.missing", "Missing Categories")
+def _rule_missing_categories(ix):
+    skip_subtables = {"stores", "armories", "businesses", "settings", "additional_settings"}
+    for item_cat, tf_cat, sub_cat in ix.scoped(ix.items):
+        if sub_cat and str(sub_cat).lower() in skip_subtables:
+            continue
+        if not item_cat.get("armory_category") and not item_cat.get("shop_category"):
+            item_name_cat = item_cat.get("name") or f"ID {item_cat.get('id', '?')}"
+            yield Finding("categories.missing", tf_cat, item_cat.get("id"), WARNING, "Missing Categories",
+                          f"Table '{ix.pretty_names.get(tf_cat, tf_cat)}': Item '{item_name_cat}' in subtable '{sub_cat}' is missing both 'armory_category' and 'shop_category' fields.")
+
+
+@global_rule("ammo.profiles", "Ammunition")
+def _rule_ammo_profiles(summaries, tables_dir):
+    ammo_names_present = set()
+    ammo_calibers_present = set()
+    for summary in summaries:
+        ammo_names_present |= summary["ammo_names"]
+        ammo_calibers_present |= summary["ammo_calibers"]
+    for summary in summaries:
+        for tf, item_id, name, display, src, prof_names, prof_calibers in summary["ammo_requirements"]:
+            missing_profile_ammo = sorted(set(prof_names) - ammo_names_present)
+            if missing_profile_ammo:
+                yield Finding("ammo.profiles", tf, item_id, ERROR, "Ammunition", (
+                    f"Firearm '{name}' in table '{display}' has {src} override/profile requiring ammunition "
+                    f"{missing_profile_ammo} but no matching ammunition entry found."
+                ))
+            missing_profile_calibers = sorted(set(prof_calibers) - ammo_calibers_present)
+            if missing_profile_calibers:
+                yield Finding("ammo.profiles", tf, item_id, ERROR, "Ammunition", (
+                    f"Firearm '{name}' in table '{display}' has {src} override/profile requiring caliber(s) "
+                    f"{missing_profile_calibers} but no ammunition with those caliber(s) exists."
+                ))
+
+
+@global_rule("ids.duplicates", "Duplicate IDs")
+def _rule_duplicate_ids(summaries, tables_dir):
+    all_ids = [iid for summary in summaries for iid in summary["ids"]]
+    suggestions = []
+    for summary in summaries:
+        for item_id, group_locs in summary["duplicates"]:
+            loc_str = "; ".join(f"{f}:{sub}:{name}" for f, sub, name in group_locs)
+            yield Finding("ids.duplicates", summary["owner_file"], item_id, ERROR, "Duplicate IDs",
+                          f"Duplicate ID detected: {item_id} used in: {loc_str}")
+            max_id_all = max(all_ids) if all_ids else item_id
+            for idx, (f, sub, name) in enumerate(group_locs):
+                if idx == 0:
+                    continue
+                max_id_all += 1
+                suggestions.append(f"  Change ID {item_id} ({f}:{sub}:{name}) -> {max_id_all}")
+    if suggestions:
+        # Not tied to a table, so it is always reported with the active errors.
+        yield Finding("ids.duplicates", None, None, ERROR, "Duplicate IDs", "Suggested duplicate ID fixes:\n" + "\n".join(suggestions))
+
+
+@global_rule("sounds.folders", "Weapon Sounds")
+def _rule_weapon_sounds(summaries, tables_dir):
+    sound_root = os.path.join(os.path.dirname(tables_dir), "sounds", "firearms", "weaponsounds")
+    seen_platforms = set()
+    for summary in summaries:
+        for tf, item_id, name, plat in summary["firearm_platforms"]:
+            plat_key = str(plat).strip().lower().replace('/', '_')
+            if not plat_key or plat_key in seen_platforms:
+                continue
+            seen_platforms.add(plat_key)
+            folder = os.path.join(sound_root, plat_key)
+            if not os.path.isdir(folder):
+                yield Finding("sounds.folders", tf, item_id, WARNING, "Weapon Sounds",
+                              f"Table '{summary['pretty_names'].get(tf, tf)}': Firearm '{name}' platform '{plat}' missing weaponsound folder '{folder}'")
+
+
+KNOWN_EQUIPMENT_SLOTS = {
+    "head", "face", "torso", "left wrist", "right wrist",
+    "left hand", "right hand", "legs", "feet", "neck", "chest",
+    "back", "waist", "waistband", "left shoulder", "right shoulder",
+    "left arm", "right arm", "left leg", "right leg",
+}
+
+
+@global_rule("equipment.slots", "Equipment Slots")
+def _rule_equipment_slots(summaries, tables_dir):
+    # Slot names used inside subslots[] lists belong to items designed to
+    # fill subslots (NVGs, ARC accessories, etc.), not to body slots.
+    known_subslot_names = set()
+    for summary in summaries:
+        known_subslot_names |= summary["subslot_names"]
+
+    globally_covered = set()
+    any_equippable = False
+    for summary in summaries:
+        for tf, item_id, item_name, display, slot_val in summary["equippable"]:
+            slot_norm = slot_val.strip().lower()
+            any_equippable = True
+            if slot_norm in KNOWN_EQUIPMENT_SLOTS:
+                globally_covered.add(slot_norm)
+            elif slot_norm not in known_subslot_names:
+                # Not a body slot and not a known subslot filler — likely a typo
+                yield Finding("equipment.slots", tf, item_id, WARNING, "Equipment Slots",
+                              f"Table '{display}': Equippable item '{item_name}' uses unrecognized equipment slot '{slot_val}'.")
+
+    if any_equippable:
+        for known_slot in sorted(KNOWN_EQUIPMENT_SLOTS):
+            if known_slot not in globally_covered:
+                yield Finding("equipment.slots", None, None, WARNING, "Equipment Slots",
+                              f"Equipment slot '{known_slot}' has no items available in any table.")
+
+
+# ─── Execution ────────────────────────────────────────────────────────────────
+
+def _run_rules(rules, subject, *args):
+    findings = []
+    for rule_id, category, fn in rules:
+        try:
+            findings.extend(fn(subject, *args))
+        except Exception as e:
+            findings.append(Finding(rule_id, None, None, WARNING, category, f"{rule_id} check failed: {e}"))
+    return findings
+
+
+# Worker-side index cache: rule chunks of the same group that land in the
+# same process share one loaded index.
+_index_cache = {}
+
+
+def _group_index(tables_dir, files, secondary_platform):
+    stamp = []
+    for f in files:
+        try:
+            st = os.stat(os.path.join(tables_dir, f))
+            stamp.append((f, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append((f, None, None))
+    key = (tables_dir, tuple(stamp), secondary_platform)
+    ix = _index_cache.get(key)
+    if ix is None:
+        _index_cache.clear()
+        ix = TableGroupIndex(tables_dir, files, secondary_platform)
+        _index_cache[key] = ix
+    return ix
+
+
+def _validate_group(tables_dir, files, secondary_platform, rule_ids, want_summary):
+    """Pool task: run the named group rules for one table group."""
+    ix = _group_index(tables_dir, files, secondary_platform)
+    rules = [r for r in GROUP_RULES if r[0] in rule_ids]
+    summary = ix.summary() if want_summary else None
+    return _run_rules(rules, ix), summary
+
+
+class ValidationReport:
+    def __init__(self, tables_dir, table_files, findings, summaries, elapsed):
+        self.tables_dir = tables_dir
+        self.table_files = table_files
+        self.findings = findings
+        self.summaries = summaries
+        self.elapsed = elapsed
+        self.disabled_files = {f for f in table_files if f.endswith(".disabled")}
+
+    @property
+    def errors(self):
+        return [f for f in self.findings if f.severity == ERROR]
+
+    @property
+    def warnings(self):
+        return [f for f in self.findings if f.severity == WARNING]
+
+    def is_disabled(self, finding):
+        return finding.table in self.disabled_files
+
+    def file_info(self):
+        """table_file -> (pretty name, highest item ID) for every table that loaded."""
+        info = {}
+        for summary in self.summaries:
+            for f in summary["files"]:
+                if f in summary["pretty_names"]:
+                    info[f] = (summary["pretty_names"][f], summary["file_max_ids"].get(f, 0))
+        return info
+
+    def legacy(self):
+        """(active_errors, disabled_errors, warnings) as lists of (category, message)."""
+        active = [(f.category, f.message) for f in self.errors if not self.is_disabled(f)]
+        disabled = [(f.category, f.message) for f in self.errors if self.is_disabled(f)]
+        warnings = [(f.category, f.message) for f in self.warnings]
+        return active, disabled, warnings
+
+
+def _plan(groups, workers):
+    """(files, rule_ids, want_summary) tasks: one per group, with the rules of
+    a group split into chunks when there are more workers than groups."""
+    rule_ids = [r[0] for r in GROUP_RULES]
+    chunks = max(1, min(len(rule_ids), workers // max(1, len(groups))))
+    tasks = []
+    for files in groups:
+        for n in range(chunks):
+            tasks.append((files, frozenset(rule_ids[n::chunks]), n == 0))
+    return tasks
+
+
+def run(tables_dir=None, secondary_platform=None, workers=None):
+    """Validate every table under `tables_dir` and return a ValidationReport."""
+    started = time.perf_counter()
+    tables_dir = tables_dir or TABLES_DIR
+    if not os.path.isdir(tables_dir):
+        return ValidationReport(tables_dir, [], [Finding("load", None, None, ERROR, "Load Errors", f"Tables directory '{tables_dir}' not found.")], [], 0.0)
+    table_files = list_table_files(tables_dir)
+    if not table_files:
+        return ValidationReport(tables_dir, [], [Finding("load", None, None, WARNING, "Load Errors", "No table files found to validate.")], [], 0.0)
+
+    groups = {}
+    for f in table_files:
+        groups.setdefault(_logical_table_key(f), []).append(f)
+    groups = [groups[k] for k in sorted(groups)]
+
+    workers = workers or os.cpu_count() or 1
+    tasks = _plan(groups, workers)
+    results = None
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                futures = [pool.submit(_validate_group, tables_dir, files, secondary_platform, rule_ids, want_summary)
+                           for files, rule_ids, want_summary in tasks]
+                results = [fut.result() for fut in futures]
+        except Exception as e:
+            logging.warning(f"Parallel validation unavailable ({e}); validating in-process.")
+            results = None
+    if results is None:
+        results = [_validate_group(tables_dir, files, secondary_platform, rule_ids, want_summary)
+                   for files, rule_ids, want_summary in tasks]
+        _index_cache.clear()
+
+    by_group = {}
+    summaries = []
+    for (files, rule_ids, want_summary), (findings, summary) in zip(tasks, results):
+        by_group.setdefault(tuple(files), []).extend(findings)
+        if summary is not None:
+            summaries.append(summary)
+
+    # Report in rule order within each group, whatever chunk produced it.
+    order = {r[0]: n for n, r in enumerate(GROUP_RULES)}
+    findings = []
+    for files in groups:
+        findings.extend(sorted(by_group.get(tuple(files), []), key=lambda f: order.get(f.rule, len(order))))
+    findings.extend(_run_rules(GLOBAL_RULES, summaries, tables_dir))
+    return ValidationReport(tables_dir, table_files, findings, summaries, time.perf_counter() - started)